@@ -28,6 +28,9 @@ GRID_SIZE_MIN: int = 3
 GRID_SIZE_MAX: int = 8
 GRID_SIZE_DEFAULT: int = 4
 
+GRID_COMPACT_THRESHOLD: int = 16  # 达到此尺寸的网格使用紧凑存储模式
+GRID_JOURNAL_CAPACITY: int = 1024  # 网格变更日志（环形缓冲区）的容量
+
 TILE_SIZE: int = 128  # 瓦片尺寸（像素）
 TILE_PADDING: int = 4  # 瓦片间距（像素）
 
@@ -114,6 +117,9 @@ SPRITE_PATH_VICTORY_BANNER: str = "assets/sprites/ui/victory_banner.png"
 # 特效路径
 SPRITE_PATH_GLOW: str = "assets/sprites/effects/glow.png"
 
+# 精灵图集（由 tools/build_sprite_atlas.py 生成，不存在时逐个加载 PNG）
+SPRITE_ATLAS_MAP_PATH: str = "assets/sprites/atlas.json"
+
 # 字体路径
 FONT_PATH_DEFAULT: str = "assets/fonts/default.ttf"
 
@@ -136,12 +142,12 @@ class Direction(Enum):
 
 
 # 方向向量（用于坐标计算）
-# x是行（向下增加），y是列（向右增加）
+# x是列（向右增加），y是行（向下增加），与关卡文件、生成器和渲染器一致
 DIRECTION_VECTORS: dict = {
-    Direction.NORTH: (-1, 0),  # 行减1，向上
-    Direction.EAST: (0, 1),    # 列加1，向右
-    Direction.SOUTH: (1, 0),   # 行加1，向下
-    Direction.WEST: (0, -1),   # 列减1，向左
+    Direction.NORTH: (0, -1),  # 行减1，向上
+    Direction.EAST: (1, 0),    # 列加1，向右
+    Direction.SOUTH: (0, 1),   # 行加1，向下
+    Direction.WEST: (-1, 0),   # 列减1，向左
 }
 
 
@@ -153,11 +159,20 @@ DIRECTION_VECTORS: dict = {
 TARGET_FPS: int = 60
 TARGET_STARTUP_TIME_MS: int = 2000  # 启动时间目标（毫秒）
 TARGET_LEVEL_LOAD_TIME_MS: int = 500  # 关卡加载时间目标（毫秒）
+LEVEL_PREGENERATE_COUNT: int = 3  # 无限模式下每个难度预先生成的关卡数
 TARGET_MEMORY_MB: int = 100  # 内存占用目标（MB）
 
 # 性能监控
 PERFORMANCE_LOG_INTERVAL_MS: int = 1000  # 性能日志记录间隔（毫秒）
 
+# 渲染缓存
+SPRITE_ANGLE_BUCKET_DEGREES: int = 3  # 任意角度旋转缓存的角度量化步长（度）
+SPRITE_ANGLE_CACHE_SIZE: int = 256  # 旋转缓存（直角/任意角度各自）的最大条目数（LRU）
+
+# 脏矩形提交
+DIRTY_RECT_FULL_FLIP_RATIO: float = 0.5  # 脏区域超过屏幕面积该比例时改为整屏 flip
+DIRTY_RECT_MAX_RECTS: int = 32  # 单帧脏矩形合并后的最大数量，超过则整屏 flip
+
 
 # ============================================================================
 # 调试设置
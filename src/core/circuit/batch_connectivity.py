@@ -0,0 +1,209 @@
+"""
+批量连通性评估器
+
+对同一块棋盘的大量候选旋转方案一次性计算通电状态，
+使用NumPy在预先计算的边掩码上进行前沿传播。
+
+遵循《开发规范》(docs/specifications/05_开发规范.md)
+"""
+
+from typing import Optional, Tuple
+import numpy as np
+from src.core.grid.grid_manager import GridManager
+from src.core.grid.tile import CONNECTION_MASKS_BY_CODE
+from src.core.grid.tile_type import TILE_TYPES_BY_CODE
+from src.core.circuit.connectivity_checker import NEIGHBOR_STEPS
+from src.utils.logger import GameLogger
+
+logger = GameLogger.get_logger(__name__)
+
+# (类型编码 * 4 + 旋转步数) -> 连接掩码
+_MASK_TABLE = np.frombuffer(CONNECTION_MASKS_BY_CODE, dtype=np.uint8)
+
+
+class BatchConnectivityEvaluator:
+    """
+    批量连通性评估器
+
+    棋盘布局（瓦片类型、电源和终端位置）在构造时固定，
+    evaluate()接受形状为(N, cells)的旋转步数数组，返回N个状态的通电结果。
+    格子索引与GridManager.snapshot()一致：index = y * grid_size + x。
+    与Tile.set_rotation()一致，不可旋转瓦片始终使用网格中的旋转，
+    数组中对应位置的值会被忽略。
+
+    结果与ConnectivityChecker的BFS完全一致：一个格子通电，当且仅当存在
+    从电源出发、每条边两端瓦片的出口都互相指向的路径。
+
+    Attributes:
+        grid_size: 网格大小
+        _codes: 瓦片类型编码（cells,），0表示无瓦片
+        _fixed: 不可旋转格子的布尔掩码（cells,）
+        _fixed_rotations: 不可旋转格子的旋转步数（cells,）
+        _source_index: 电源格子索引
+        _terminal_index: 终端格子索引
+
+    Example:
+        >>> evaluator = BatchConnectivityEvaluator(grid)
+        >>> rotations = np.tile(evaluator.current_rotations(grid), (1000, 1))
+        >>> reached = evaluator.terminal_reached(rotations)
+        >>> reached.shape
+        (1000,)
+    """
+
+    def __init__(self, grid: GridManager) -> None:
+        """
+        从网格构造评估器
+
+        Args:
+            grid: 提供棋盘布局的网格（只读取类型平面）
+        """
+        self.grid_size = grid.grid_size
+        cell_count = self.grid_size * self.grid_size
+
+        snapshot = grid.snapshot()
+        self._codes = np.frombuffer(snapshot, dtype=np.uint8, count=cell_count).astype(np.intp)
+        rotatable_codes = [
+            code for code, tile_type in enumerate(TILE_TYPES_BY_CODE)
+            if tile_type is not None and tile_type.is_rotatable()
+        ]
+        self._fixed = ~np.isin(self._codes, rotatable_codes)
+        self._fixed_rotations = np.frombuffer(
+            snapshot, dtype=np.uint8, count=cell_count, offset=cell_count
+        ).astype(np.intp)
+        self._source_index = self._position_to_index(grid.get_power_source())
+        self._terminal_index = self._position_to_index(grid.get_terminal())
+
+        logger.debug(
+            f"BatchConnectivityEvaluator initialized for {self.grid_size}x{self.grid_size} grid"
+        )
+
+    def _position_to_index(self, tile) -> Optional[int]:
+        """
+        将瓦片位置转换为格子索引
+
+        Args:
+            tile: 瓦片对象，可为None
+
+        Returns:
+            Optional[int]: 格子索引，瓦片不存在时返回None
+        """
+        if tile is None:
+            return None
+        return tile.y * self.grid_size + tile.x
+
+    def current_rotations(self, grid: GridManager) -> np.ndarray:
+        """
+        读取网格当前的旋转步数
+
+        Args:
+            grid: 与构造时布局相同的网格
+
+        Returns:
+            np.ndarray: 形状为(cells,)的旋转步数（0-3）
+        """
+        cell_count = self.grid_size * self.grid_size
+        return np.frombuffer(
+            grid.snapshot(), dtype=np.uint8, count=cell_count, offset=cell_count
+        ).copy()
+
+    def evaluate(self, rotations: np.ndarray) -> np.ndarray:
+        """
+        计算N个旋转方案下每个格子是否通电
+
+        Args:
+            rotations: 形状为(N, cells)或(cells,)的旋转步数数组（0-3）
+
+        Returns:
+            np.ndarray: 形状为(N, cells)的布尔数组
+
+        Raises:
+            ValueError: 数组的格子数与网格不匹配
+
+        Example:
+            >>> powered = evaluator.evaluate(rotations)
+            >>> powered[0, source_index]
+            True
+        """
+        rotations = np.atleast_2d(np.asarray(rotations))
+        n = self.grid_size
+        if rotations.shape[1] != n * n:
+            raise ValueError(
+                f"Rotations must have {n * n} cells per state, got {rotations.shape[1]}"
+            )
+
+        count = rotations.shape[0]
+        reached = np.zeros((count, n, n), dtype=bool)
+        if self._source_index is None:
+            logger.warning("Cannot evaluate connectivity: no power source")
+            return reached.reshape(count, n * n)
+
+        steps = np.where(self._fixed, self._fixed_rotations, rotations.astype(np.intp) & 3)
+        masks = _MASK_TABLE[self._codes * 4 + steps].reshape(count, n, n)
+        links = self._build_links(masks)
+
+        # 前沿传播：每轮沿所有连通边扩展一步，直到前沿为空
+        source_y, source_x = divmod(self._source_index, n)
+        reached[:, source_y, source_x] = True
+        frontier = reached.copy()
+        while frontier.any():
+            grown = np.zeros_like(reached)
+            for (dst, src), link in links:
+                grown[dst] |= frontier[src] & link
+            frontier = grown & ~reached
+            reached |= frontier
+
+        return reached.reshape(count, n * n)
+
+    def terminal_reached(self, rotations: np.ndarray) -> np.ndarray:
+        """
+        计算N个旋转方案下终端是否通电
+
+        Args:
+            rotations: 形状为(N, cells)或(cells,)的旋转步数数组（0-3）
+
+        Returns:
+            np.ndarray: 形状为(N,)的布尔数组
+        """
+        rotations = np.atleast_2d(np.asarray(rotations))
+        if self._terminal_index is None:
+            return np.zeros(rotations.shape[0], dtype=bool)
+        return self.evaluate(rotations)[:, self._terminal_index]
+
+    def _build_links(self, masks: np.ndarray) -> Tuple:
+        """
+        根据连接掩码计算四个方向上的连通边
+
+        Args:
+            masks: 形状为(N, y, x)的连接掩码
+
+        Returns:
+            Tuple: ((目标切片, 源切片), 连通边布尔数组) 的元组，
+            连通边数组与切片后的区域形状相同
+        """
+        whole = slice(None)
+        links = []
+        for exit_bit, entrance_bit, dx, dy in NEIGHBOR_STEPS:
+            # 数组轴为(N, y, x)，邻居位于(y + dy, x + dx)
+            src = (whole, self._axis_slice(dy, False), self._axis_slice(dx, False))
+            dst = (whole, self._axis_slice(dy, True), self._axis_slice(dx, True))
+            link = ((masks[src] & exit_bit) != 0) & ((masks[dst] & entrance_bit) != 0)
+            links.append(((dst, src), link))
+        return tuple(links)
+
+    @staticmethod
+    def _axis_slice(step: int, neighbor: bool) -> slice:
+        """
+        计算单个轴上源格子或邻居格子的切片
+
+        Args:
+            step: 该轴上的偏移（-1, 0, 1）
+            neighbor: True表示邻居一侧
+
+        Returns:
+            slice: 轴切片
+        """
+        if step == 0:
+            return slice(None)
+        if (step > 0) != neighbor:
+            return slice(None, -1)
+        return slice(1, None)
@@ -6,17 +6,135 @@
 遵循《开发规范》(docs/specifications/05_开发规范.md)
 """
 
-from typing import Optional, List, Set, Tuple, Deque
+from dataclasses import dataclass, field
+from typing import Optional, List, Set, Tuple, Deque, Dict, FrozenSet
 from collections import deque
 from src.core.grid.grid_manager import GridManager
-from src.core.grid.tile import Tile
+from src.core.grid.tile import (
+    Tile, DIRECTIONS_CLOCKWISE, DIRECTION_BITS, OPPOSITE_DIRECTION_BITS, CONNECTION_MASKS_BY_CODE
+)
 from src.core.grid.tile_type import TileType
-from src.config.constants import Direction
+from src.config.constants import Direction, DIRECTION_VECTORS
 from src.utils.logger import GameLogger
 from src.utils.timer import PerformanceTimer
 
 logger = GameLogger.get_logger(__name__)
 
+# BFS邻居步进表：(出口位, 邻居所需的入口位, dx, dy)
+NEIGHBOR_STEPS: Tuple[Tuple[int, int, int, int], ...] = tuple(
+    (DIRECTION_BITS[d], OPPOSITE_DIRECTION_BITS[d], DIRECTION_VECTORS[d][0], DIRECTION_VECTORS[d][1])
+    for d in DIRECTIONS_CLOCKWISE
+)
+
+# 只向正方向（x+1或y+1）的步进，用于每条边只检查一次的并查集扫描
+_FORWARD_STEPS: Tuple[Tuple[int, int, int, int], ...] = tuple(
+    step for step in NEIGHBOR_STEPS if step[2] >= 0 and step[3] >= 0
+)
+
+# 相邻偏移到(出口位, 入口位)的映射，用于判断两个相邻瓦片之间的边是否仍然连通
+_LINK_BITS: Dict[Tuple[int, int], Tuple[int, int]] = {
+    (dx, dy): (exit_bit, entrance_bit) for exit_bit, entrance_bit, dx, dy in NEIGHBOR_STEPS
+}
+
+
+@dataclass
+class ConnectivityDelta:
+    """
+    单次旋转引起的通电状态变化
+
+    Attributes:
+        powered: 新通电的瓦片坐标集合
+        unpowered: 新断电的瓦片坐标集合
+        terminal_reached: 变化后终端是否通电
+    """
+    powered: Set[Tuple[int, int]] = field(default_factory=set)
+    unpowered: Set[Tuple[int, int]] = field(default_factory=set)
+    terminal_reached: bool = False
+
+    def is_empty(self) -> bool:
+        """检查是否没有任何瓦片的通电状态发生变化"""
+        return not self.powered and not self.unpowered
+
+
+@dataclass
+class ConnectivityResult:
+    """
+    某一网格修订版本的完整连通性分析结果
+
+    一次BFS同时产生路径、父节点字典和通电集合，同一修订号内的所有查询共享该结果。
+
+    Attributes:
+        revision: 对应的网格修订号
+        path: 电源端到终端的路径坐标（不连通时为None）
+        parent: BFS父节点字典（键为所有通电坐标）
+        powered: 通电瓦片坐标集合
+        terminal_reached: 终端是否通电
+        path_positions: 路径坐标集合（用于O(1)成员判断）
+
+    Example:
+        >>> result = checker.analyze(grid)
+        >>> result.is_on_path(1, 0)
+        True
+    """
+    revision: int
+    path: Optional[List[Tuple[int, int]]]
+    parent: Dict[Tuple[int, int], Optional[Tuple[int, int]]]
+    powered: FrozenSet[Tuple[int, int]]
+    terminal_reached: bool
+    path_positions: FrozenSet[Tuple[int, int]] = frozenset()
+
+    def is_powered(self, x: int, y: int) -> bool:
+        """检查指定位置的瓦片是否通电"""
+        return (x, y) in self.powered
+
+    def is_on_path(self, x: int, y: int) -> bool:
+        """检查指定位置的瓦片是否在电源端到终端的路径上"""
+        return (x, y) in self.path_positions
+
+
+@dataclass
+class CircuitComponents:
+    """
+    某一网格修订版本的连通分量标记结果
+
+    每个格子标记为其所在连通分量的代表索引（index = y * grid_size + x），
+    无瓦片的格子标记为-1。包含任一电源端的分量即为通电分量，
+    因此多电源、多终端的判断都只是标签查找。
+
+    Attributes:
+        revision: 对应的网格修订号
+        grid_size: 网格大小
+        labels: 每个格子的分量标签
+        powered_labels: 包含电源端的分量标签集合
+        terminal_positions: 所有终端坐标
+
+    Example:
+        >>> components = checker.label_components(grid)
+        >>> components.all_terminals_powered()
+        True
+    """
+    revision: int
+    grid_size: int
+    labels: List[int]
+    powered_labels: FrozenSet[int]
+    terminal_positions: Tuple[Tuple[int, int], ...] = ()
+
+    def label_of(self, x: int, y: int) -> int:
+        """获取指定位置的分量标签（无瓦片时为-1）"""
+        return self.labels[y * self.grid_size + x]
+
+    def is_powered(self, x: int, y: int) -> bool:
+        """检查指定位置的瓦片是否与任一电源端连通"""
+        return self.labels[y * self.grid_size + x] in self.powered_labels
+
+    def get_unpowered_terminals(self) -> List[Tuple[int, int]]:
+        """获取未通电的终端坐标列表"""
+        return [(x, y) for x, y in self.terminal_positions if not self.is_powered(x, y)]
+
+    def all_terminals_powered(self) -> bool:
+        """检查是否存在终端且所有终端都已通电"""
+        return bool(self.terminal_positions) and not self.get_unpowered_terminals()
+
 
 class ConnectivityChecker:
     """
@@ -44,6 +162,18 @@ class ConnectivityChecker:
         Example:
             >>> checker = ConnectivityChecker()
         """
+        # 增量模式状态：以电源端为根的通电生成树
+        self._incremental_grid: Optional[GridManager] = None
+        self._powered: Set[Tuple[int, int]] = set()
+        self._tree_parent: Dict[Tuple[int, int], Optional[Tuple[int, int]]] = {}
+        self._tree_children: Dict[Tuple[int, int], Set[Tuple[int, int]]] = {}
+
+        # 按网格修订号缓存的分析结果
+        self._result_grid: Optional[GridManager] = None
+        self._result: Optional[ConnectivityResult] = None
+        self._components_grid: Optional[GridManager] = None
+        self._components: Optional[CircuitComponents] = None
+
         logger.debug("ConnectivityChecker initialized")
 
     def _is_valid_position(self, grid: GridManager, x: int, y: int) -> bool:
@@ -60,10 +190,163 @@ class ConnectivityChecker:
         """
         return 0 <= x < grid.grid_size and 0 <= y < grid.grid_size
 
+    def analyze(self, grid: GridManager) -> ConnectivityResult:
+        """
+        分析网格连通性（按修订号缓存）
+
+        从电源端做一次完整BFS，得到路径、父节点字典和通电集合。网格修订号
+        未变化时直接返回缓存结果，find_path、get_connected_tiles、
+        get_path_positions和is_tile_in_path共享同一个结果。
+
+        Args:
+            grid: 网格管理器
+
+        Returns:
+            ConnectivityResult: 当前修订版本的分析结果
+
+        Example:
+            >>> result = checker.analyze(grid)
+            >>> if result.terminal_reached:
+            ...     print(f"Path length: {len(result.path)}")
+        """
+        revision = grid.get_revision()
+        if (self._result is not None and self._result_grid is grid
+                and self._result.revision == revision):
+            return self._result
+
+        power_source = grid.get_power_source()
+        terminal = grid.get_terminal()
+
+        if power_source is None:
+            logger.warning("No power source found in grid")
+            result = ConnectivityResult(revision, None, {}, frozenset(), False)
+        else:
+            parent = self._traverse(grid, (power_source.x, power_source.y))
+            path = None
+
+            if terminal is None:
+                logger.warning("No terminal found in grid")
+            elif (terminal.x, terminal.y) in parent:
+                path = self._reconstruct_path(parent, power_source, terminal)
+                logger.debug(f"Path found with length {len(path)}")
+            else:
+                logger.debug("No path found from power source to terminal")
+
+            result = ConnectivityResult(
+                revision=revision,
+                path=path,
+                parent=parent,
+                powered=frozenset(parent),
+                terminal_reached=path is not None,
+                path_positions=frozenset(path) if path else frozenset()
+            )
+
+        self._result_grid = grid
+        self._result = result
+        return result
+
+    def label_components(self, grid: GridManager) -> CircuitComponents:
+        """
+        使用并查集标记网格中的所有连通分量（按修订号缓存）
+
+        对每条相邻边只检查一次，一次近线性的扫描即可得到所有分量，
+        代价与电源端和终端的数量无关。
+
+        Args:
+            grid: 网格管理器
+
+        Returns:
+            CircuitComponents: 当前修订版本的分量标记
+
+        Example:
+            >>> components = checker.label_components(grid)
+            >>> components.is_powered(2, 3)
+            True
+        """
+        revision = grid.get_revision()
+        if (self._components is not None and self._components_grid is grid
+                and self._components.revision == revision):
+            return self._components
+
+        size = grid.grid_size
+        cell_count = size * size
+        snapshot = grid.snapshot()
+        masks = [
+            CONNECTION_MASKS_BY_CODE[snapshot[index] * 4 + snapshot[cell_count + index]]
+            for index in range(cell_count)
+        ]
+
+        parent = list(range(cell_count))
+        rank = [0] * cell_count
+
+        def find(index: int) -> int:
+            # 路径减半
+            while parent[index] != index:
+                parent[index] = parent[parent[index]]
+                index = parent[index]
+            return index
+
+        for exit_bit, entrance_bit, dx, dy in _FORWARD_STEPS:
+            offset = dy * size + dx
+            for index in range(cell_count):
+                if not masks[index] & exit_bit:
+                    continue
+                if index % size + dx >= size or index // size + dy >= size:
+                    continue
+                neighbor = index + offset
+                if not masks[neighbor] & entrance_bit:
+                    continue
+
+                # 按秩合并
+                root_a, root_b = find(index), find(neighbor)
+                if root_a == root_b:
+                    continue
+                if rank[root_a] < rank[root_b]:
+                    root_a, root_b = root_b, root_a
+                parent[root_b] = root_a
+                if rank[root_a] == rank[root_b]:
+                    rank[root_a] += 1
+
+        labels = [find(index) if snapshot[index] else -1 for index in range(cell_count)]
+        powered_labels = frozenset(
+            labels[tile.y * size + tile.x] for tile in grid.get_power_sources()
+        )
+        terminal_positions = tuple((tile.x, tile.y) for tile in grid.get_terminals())
+
+        components = CircuitComponents(
+            revision=revision,
+            grid_size=size,
+            labels=labels,
+            powered_labels=powered_labels,
+            terminal_positions=terminal_positions
+        )
+        self._components_grid = grid
+        self._components = components
+        return components
+
+    def check_all_terminals_powered(self, grid: GridManager) -> bool:
+        """
+        检查所有终端是否都与至少一个电源端连通
+
+        Args:
+            grid: 网格管理器
+
+        Returns:
+            bool: 存在终端且全部通电时返回True
+
+        Example:
+            >>> checker.check_all_terminals_powered(grid)
+            True
+        """
+        return self.label_components(grid).all_terminals_powered()
+
     def check_connectivity(self, grid: GridManager) -> bool:
         """
         检查电源端到终端是否连通
 
+        网格中有多个电源端或终端时，检查所有终端是否都已通电
+        （见check_all_terminals_powered）。
+
         Args:
             grid: 网格管理器
 
@@ -78,8 +361,10 @@ class ConnectivityChecker:
             True
         """
         with PerformanceTimer("check_connectivity", grid_size=grid.grid_size):
-            path = self.find_path(grid)
-            is_connected = path is not None
+            if len(grid.get_power_sources()) > 1 or len(grid.get_terminals()) > 1:
+                is_connected = self.check_all_terminals_powered(grid)
+            else:
+                is_connected = self.analyze(grid).terminal_reached
 
             logger.info(f"Connectivity check: {is_connected} (grid size: {grid.grid_size}x{grid.grid_size})")
             return is_connected
@@ -97,7 +382,7 @@ class ConnectivityChecker:
             Optional[List[Tile]]: 路径瓦片列表，如果不连通则返回None
 
         Note:
-            路径包含电源端和终端
+            路径包含电源端和终端；结果来自按修订号缓存的analyze()
 
         Example:
             >>> checker = ConnectivityChecker()
@@ -107,67 +392,64 @@ class ConnectivityChecker:
             >>> if path:
             ...     print(f"Path length: {len(path)}")
         """
-        # 获取电源端和终端
-        power_source = grid.get_power_source()
-        terminal = grid.get_terminal()
+        path = self.analyze(grid).path
+        return list(path) if path is not None else None
 
-        if power_source is None:
-            logger.warning("No power source found in grid")
-            return None
+    def _traverse(
+        self,
+        grid: GridManager,
+        start: Tuple[int, int],
+        goal: Optional[Tuple[int, int]] = None
+    ) -> dict[Tuple[int, int], Optional[Tuple[int, int]]]:
+        """
+        从起点进行BFS遍历
+
+        相邻两个瓦片相连的条件是：当前瓦片的连接掩码包含出口方向位，
+        且邻居的连接掩码包含相反方向位。
 
-        if terminal is None:
-            logger.warning("No terminal found in grid")
-            return None
+        Args:
+            grid: 网格管理器
+            start: 起点坐标
+            goal: 可选的目标坐标，到达后立即停止
 
-        # BFS初始化
-        queue: Deque[Tile] = deque([power_source])
-        visited: Set[Tuple[int, int]] = {(power_source.x, power_source.y)}
-        parent: dict[Tuple[int, int], Optional[Tuple[int, int]]] = {
-            (power_source.x, power_source.y): None
-        }
+        Returns:
+            dict: BFS父节点字典，键为所有已访问的坐标
+
+        Note:
+            这是一个内部方法，由analyze和enable_incremental调用
+        """
+        get_mask = grid.get_connection_mask
+        queue: Deque[Tuple[int, int]] = deque([start])
+        parent: dict[Tuple[int, int], Optional[Tuple[int, int]]] = {start: None}
 
-        # BFS搜索
         while queue:
             current = queue.popleft()
+            if current == goal:
+                break
 
-            # 检查是否到达终端
-            if current.x == terminal.x and current.y == terminal.y:
-                # 重建路径
-                path = self._reconstruct_path(parent, power_source, terminal)
-                logger.debug(f"Path found with length {len(path)}")
-                return path
+            x, y = current
+            mask = get_mask(x, y)
 
             # 遍历当前瓦片的所有出口方向
-            for direction in current.get_exit_directions():
-                # 获取邻居位置
-                neighbor_pos = current.get_neighbor_position(direction)
-
-                # 检查坐标是否在网格范围内
-                if not self._is_valid_position(grid, neighbor_pos[0], neighbor_pos[1]):
+            for exit_bit, entrance_bit, dx, dy in NEIGHBOR_STEPS:
+                if not mask & exit_bit:
                     continue
 
-                neighbor_tile = grid.get_tile(*neighbor_pos)
-
-                # 检查邻居是否有效
-                if neighbor_tile is None:
-                    continue
+                neighbor_pos = (x + dx, y + dy)
 
                 # 检查是否已访问
-                if neighbor_pos in visited:
+                if neighbor_pos in parent:
                     continue
 
-                # 检查邻居是否有从当前方向进入的入口
-                if not neighbor_tile.has_entrance_from(direction):
+                # 检查邻居是否有从当前方向进入的入口（越界或空位置掩码为0）
+                if not get_mask(neighbor_pos[0], neighbor_pos[1]) & entrance_bit:
                     continue
 
                 # 标记为已访问并加入队列
-                visited.add(neighbor_pos)
-                parent[neighbor_pos] = (current.x, current.y)
-                queue.append(neighbor_tile)
+                parent[neighbor_pos] = current
+                queue.append(neighbor_pos)
 
-        # 未找到路径
-        logger.debug("No path found from power source to terminal")
-        return None
+        return parent
 
     def _reconstruct_path(
         self,
@@ -187,7 +469,7 @@ class ConnectivityChecker:
             List[Tile]: 从电源端到终端的路径
 
         Note:
-            这是一个内部方法，由find_path调用
+            这是一个内部方法，由analyze调用
         """
         path = []
         current_pos = (terminal.x, terminal.y)
@@ -220,46 +502,8 @@ class ConnectivityChecker:
             >>> connected = checker.get_connected_tiles(grid)
             >>> print(f"Connected tiles: {len(connected)}")
         """
-        power_source = grid.get_power_source()
-
-        if power_source is None:
-            logger.warning("No power source found in grid")
-            return set()
-
-        # BFS遍历所有连通的瓦片
-        queue: Deque[Tile] = deque([power_source])
-        visited: Set[Tuple[int, int]] = {(power_source.x, power_source.y)}
-        connected_tiles: Set[Tile] = {power_source}
-
-        while queue:
-            current = queue.popleft()
-
-            # 遍历当前瓦片的所有出口方向
-            for direction in current.get_exit_directions():
-                neighbor_pos = current.get_neighbor_position(direction)
-
-                # 检查坐标是否在网格范围内
-                if not self._is_valid_position(grid, neighbor_pos[0], neighbor_pos[1]):
-                    continue
-
-                neighbor_tile = grid.get_tile(*neighbor_pos)
-
-                # 检查邻居是否有效
-                if neighbor_tile is None:
-                    continue
-
-                # 检查是否已访问
-                if neighbor_pos in visited:
-                    continue
-
-                # 检查邻居是否有从当前方向进入的入口
-                if not neighbor_tile.has_entrance_from(direction):
-                    continue
-
-                # 标记为已访问并加入队列
-                visited.add(neighbor_pos)
-                connected_tiles.add(neighbor_tile)
-                queue.append(neighbor_tile)
+        powered = self.analyze(grid).powered
+        connected_tiles: Set[Tile] = {grid.get_tile(x, y) for x, y in powered}
 
         logger.debug(f"Found {len(connected_tiles)} connected tiles")
         return connected_tiles
@@ -283,12 +527,7 @@ class ConnectivityChecker:
             ...     for x, y in positions:
             ...         print(f"({x}, {y})")
         """
-        path = self.find_path(grid)
-
-        if path is None:
-            return None
-
-        return path
+        return self.find_path(grid)
 
     def is_tile_in_path(self, grid: GridManager, x: int, y: int) -> bool:
         """
@@ -302,6 +541,9 @@ class ConnectivityChecker:
         Returns:
             bool: 瓦片是否在路径中
 
+        Note:
+            网格未变化时为O(1)查询，可在渲染时对每个瓦片调用
+
         Example:
             >>> checker = ConnectivityChecker()
             >>> grid = GridManager(4)
@@ -309,9 +551,214 @@ class ConnectivityChecker:
             >>> checker.is_tile_in_path(grid, 1, 1)
             True
         """
-        path = self.find_path(grid)
+        return self.analyze(grid).is_on_path(x, y)
+
+    def enable_incremental(self, grid: GridManager) -> Set[Tuple[int, int]]:
+        """
+        启用增量连通性模式
+
+        对网格做一次完整BFS，建立以电源端为根的通电生成树。此后每次旋转
+        只需调用update_rotation修复受影响的区域，而无需重新遍历整个网格。
+
+        Args:
+            grid: 网格管理器
+
+        Returns:
+            Set[Tuple[int, int]]: 当前通电的瓦片坐标集合
+
+        Example:
+            >>> checker = ConnectivityChecker()
+            >>> powered = checker.enable_incremental(grid)
+            >>> grid.rotate_tile(1, 0)
+            >>> delta = checker.update_rotation(grid, 1, 0)
+        """
+        self._incremental_grid = grid
+        self._powered = set()
+        self._tree_parent = {}
+        self._tree_children = {}
+
+        power_source = grid.get_power_source()
+        if power_source is None:
+            logger.warning("No power source found in grid")
+            return set()
+
+        self._tree_parent = self._traverse(grid, (power_source.x, power_source.y))
+        self._powered = set(self._tree_parent)
+        for pos, parent in self._tree_parent.items():
+            if parent is not None:
+                self._tree_children.setdefault(parent, set()).add(pos)
+
+        logger.debug(f"Incremental connectivity enabled: {len(self._powered)} powered tiles")
+        return set(self._powered)
+
+    def disable_incremental(self) -> None:
+        """
+        关闭增量连通性模式并释放生成树
+        """
+        self._incremental_grid = None
+        self._powered = set()
+        self._tree_parent = {}
+        self._tree_children = {}
+
+    def is_incremental_enabled(self, grid: Optional[GridManager] = None) -> bool:
+        """
+        检查增量模式是否已启用
+
+        Args:
+            grid: 可选的网格管理器，指定时还要求增量状态属于该网格
 
-        if path is None:
+        Returns:
+            bool: 增量模式是否可用
+        """
+        if self._incremental_grid is None:
             return False
+        return grid is None or grid is self._incremental_grid
+
+    def get_powered_positions(self) -> Set[Tuple[int, int]]:
+        """
+        获取增量模式下当前通电的瓦片坐标
+
+        Returns:
+            Set[Tuple[int, int]]: 通电瓦片坐标集合（未启用增量模式时为空）
+        """
+        return set(self._powered)
+
+    def update_rotation(self, grid: GridManager, x: int, y: int) -> ConnectivityDelta:
+        """
+        在瓦片旋转后增量修复通电区域
+
+        只处理被旋转瓦片的旧边和新边：
+            1. 被旋转瓦片上不再连通的生成树边被切断，其下游子树暂时断电
+            2. 断电子树中仍与通电区域相邻连通的瓦片重新挂接
+            3. 从被旋转瓦片和重新挂接的瓦片出发，沿新边扩展通电区域
+
+        代价与受影响区域的大小成正比，与网格总大小无关。
+
+        Args:
+            grid: 网格管理器（旋转已经生效）
+            x: 被旋转瓦片的x坐标
+            y: 被旋转瓦片的y坐标
+
+        Returns:
+            ConnectivityDelta: 新通电与新断电的瓦片坐标
 
-        return (x, y) in path
+        Note:
+            如果增量模式未针对该网格启用，会先自动调用enable_incremental
+        """
+        if self._incremental_grid is not grid:
+            powered = self.enable_incremental(grid)
+            return ConnectivityDelta(
+                powered=powered,
+                terminal_reached=self._is_terminal_powered(grid)
+            )
+
+        get_mask = grid.get_connection_mask
+        powered = self._powered
+        parent = self._tree_parent
+        children = self._tree_children
+        pos = (x, y)
+
+        # 步骤1：切断被旋转瓦片上失效的生成树边
+        orphan_roots: List[Tuple[int, int]] = []
+        if pos in powered:
+            tree_parent = parent[pos]
+            if tree_parent is not None and not self._is_linked(get_mask, pos, tree_parent):
+                children[tree_parent].discard(pos)
+                orphan_roots.append(pos)
+            for child in list(children.get(pos, ())):
+                if not self._is_linked(get_mask, pos, child):
+                    children[pos].discard(child)
+                    orphan_roots.append(child)
+
+        # 收集所有断电子树
+        orphaned: Set[Tuple[int, int]] = set()
+        stack = orphan_roots
+        while stack:
+            node = stack.pop()
+            orphaned.add(node)
+            powered.discard(node)
+            del parent[node]
+            stack.extend(children.pop(node, ()))
+
+        # 步骤2：断电瓦片与被旋转瓦片尝试挂接到通电区域
+        added: Set[Tuple[int, int]] = set()
+        queue: Deque[Tuple[int, int]] = deque()
+        for seed in orphaned | {pos}:
+            if seed in powered:
+                queue.append(seed)
+                continue
+
+            sx, sy = seed
+            seed_mask = get_mask(sx, sy)
+            for exit_bit, entrance_bit, dx, dy in NEIGHBOR_STEPS:
+                if not seed_mask & exit_bit:
+                    continue
+                neighbor = (sx + dx, sy + dy)
+                if neighbor in powered and get_mask(neighbor[0], neighbor[1]) & entrance_bit:
+                    powered.add(seed)
+                    parent[seed] = neighbor
+                    children.setdefault(neighbor, set()).add(seed)
+                    added.add(seed)
+                    queue.append(seed)
+                    break
+
+        # 步骤3：沿连通边扩展通电区域
+        while queue:
+            current = queue.popleft()
+            cx, cy = current
+            current_mask = get_mask(cx, cy)
+            for exit_bit, entrance_bit, dx, dy in NEIGHBOR_STEPS:
+                if not current_mask & exit_bit:
+                    continue
+                neighbor = (cx + dx, cy + dy)
+                if neighbor in powered or not get_mask(neighbor[0], neighbor[1]) & entrance_bit:
+                    continue
+                powered.add(neighbor)
+                parent[neighbor] = current
+                children.setdefault(current, set()).add(neighbor)
+                added.add(neighbor)
+                queue.append(neighbor)
+
+        delta = ConnectivityDelta(
+            powered=added - orphaned,
+            unpowered=orphaned - powered,
+            terminal_reached=self._is_terminal_powered(grid)
+        )
+        logger.debug(
+            f"Incremental update at ({x}, {y}): "
+            f"+{len(delta.powered)} / -{len(delta.unpowered)} powered tiles"
+        )
+        return delta
+
+    def _is_linked(
+        self,
+        get_mask,
+        a: Tuple[int, int],
+        b: Tuple[int, int]
+    ) -> bool:
+        """
+        检查两个相邻瓦片之间的边是否连通
+
+        Args:
+            get_mask: 获取连接掩码的函数
+            a: 第一个瓦片坐标
+            b: 相邻的第二个瓦片坐标
+
+        Returns:
+            bool: 两个瓦片是否相连
+        """
+        exit_bit, entrance_bit = _LINK_BITS[(b[0] - a[0], b[1] - a[1])]
+        return bool(get_mask(a[0], a[1]) & exit_bit and get_mask(b[0], b[1]) & entrance_bit)
+
+    def _is_terminal_powered(self, grid: GridManager) -> bool:
+        """
+        检查增量模式下终端是否通电
+
+        Args:
+            grid: 网格管理器
+
+        Returns:
+            bool: 终端是否在通电区域中
+        """
+        terminal = grid.get_terminal()
+        return terminal is not None and (terminal.x, terminal.y) in self._powered
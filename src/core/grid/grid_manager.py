@@ -6,14 +6,92 @@
 遵循《开发规范》(docs/specifications/05_开发规范.md)
 """
 
-from typing import Optional, List, Tuple, Dict
+from array import array
+from typing import Optional, List, Tuple, Dict, Set
 from copy import deepcopy
-from src.core.grid.tile import Tile
-from src.core.grid.tile_type import TileType
+from src.config.constants import GRID_JOURNAL_CAPACITY
+from src.core.grid.tile import Tile, CONNECTION_MASKS, CONNECTION_MASKS_BY_CODE
+from src.core.grid.tile_type import TileType, TILE_TYPES_BY_CODE
 from src.utils.logger import GameLogger
 
 logger = GameLogger.get_logger(__name__)
 
+# 变更日志中每条记录占用的槽位数：(revision, x, y, old_rotation, new_rotation)
+JOURNAL_ENTRY_WIDTH = 5
+
+# 变更日志条目类型
+JournalEntry = Tuple[int, int, int, int, int]
+
+
+class TileView(Tile):
+    """
+    紧凑存储模式下的瓦片视图
+
+    不持有瓦片数据，所有属性直接读写GridManager的类型/旋转/可点击平面，
+    因此通过视图进行的修改会立即反映到网格中。
+
+    Attributes:
+        _owner: 所属的网格管理器
+        _index: 瓦片在平面中的索引（y * grid_size + x）
+
+    Example:
+        >>> manager = GridManager(4, compact=True)
+        >>> manager.set_tile(1, 1, Tile(1, 1, TileType.STRAIGHT, 0))
+        >>> view = manager.get_tile(1, 1)
+        >>> view.rotate_clockwise()
+        >>> manager.get_tile(1, 1).rotation
+        90
+    """
+
+    __slots__ = ("_owner", "_index")
+
+    def __init__(self, owner: 'GridManager', index: int) -> None:
+        """
+        初始化瓦片视图
+
+        Args:
+            owner: 所属的网格管理器（必须为紧凑模式）
+            index: 平面索引
+        """
+        self._owner = owner
+        self._index = index
+
+    @property
+    def x(self) -> int:
+        """瓦片的x坐标（只读）"""
+        return self._index % self._owner.grid_size
+
+    @property
+    def y(self) -> int:
+        """瓦片的y坐标（只读）"""
+        return self._index // self._owner.grid_size
+
+    @property
+    def tile_type(self) -> TileType:
+        """瓦片类型（只读）"""
+        return TILE_TYPES_BY_CODE[self._owner._types[self._index]]
+
+    @property
+    def rotation(self) -> int:
+        """旋转角度"""
+        return self._owner._rotations[self._index] * 90
+
+    @rotation.setter
+    def rotation(self, angle: int) -> None:
+        angle = angle % 360
+        if angle not in (0, 90, 180, 270):
+            raise ValueError(f"Invalid rotation angle: {angle}")
+        self._owner._rotations[self._index] = angle // 90
+
+    @property
+    def is_clickable(self) -> bool:
+        """是否可点击"""
+        return bool(self._owner._clickable[self._index])
+
+    @is_clickable.setter
+    def is_clickable(self, value: bool) -> None:
+        self._owner._clickable[self._index] = 1 if value else 0
+
 
 class GridManager:
     """
@@ -21,12 +99,28 @@ class GridManager:
 
     管理NxN的游戏网格，提供瓦片访问、旋转和状态管理功能。
 
+    支持两种存储模式：
+        - 默认模式：以字典保存完整的Tile对象
+        - 紧凑模式：以连续的bytearray平面（类型/旋转/可点击，索引为y*grid_size+x）
+          保存瓦片数据，get_tile返回轻量级的TileView视图，适用于64x64、128x128等大网格
+
     Attributes:
         grid_size: 网格大小（NxN）
-        _grid: 二维网格数据结构
-        _initial_state: 初始状态（用于重置）
-        _power_source_pos: 电源端位置
-        _terminal_pos: 终端位置
+        _compact: 是否使用紧凑存储模式
+        _grid: 二维网格数据结构（默认模式）
+        _types: 瓦片类型编码平面（紧凑模式，0表示无瓦片）
+        _rotations: 旋转步数平面（紧凑模式，rotation // 90）
+        _clickable: 可点击标记平面（紧凑模式）
+        _initial_snapshot: 初始状态快照（用于重置）
+        _snapshot: 最近一次生成的快照（按修订号复用）
+        _revision: 网格修订号，任何瓦片变化都会使其单调递增
+        _journal: 旋转变更日志（预分配的环形缓冲区）
+        _resync_revision: 最近一次批量修改（设置/重置/清空）后的修订号
+        _subscribers: 订阅者ID到已处理修订号的映射
+        _power_source_pos: 电源端位置（多个电源时为最近设置的一个）
+        _terminal_pos: 终端位置（多个终端时为最近设置的一个）
+        _power_source_positions: 所有电源端位置
+        _terminal_positions: 所有终端位置
 
     Example:
         >>> manager = GridManager(4)
@@ -35,12 +129,19 @@ class GridManager:
         >>> manager.rotate_tile(1, 1)
     """
 
-    def __init__(self, grid_size: int) -> None:
+    def __init__(
+        self,
+        grid_size: int,
+        compact: bool = False,
+        journal_capacity: int = GRID_JOURNAL_CAPACITY
+    ) -> None:
         """
         初始化网格管理器
 
         Args:
             grid_size: 网格大小（必须≥2）
+            compact: 是否使用紧凑存储模式
+            journal_capacity: 变更日志可保留的旋转记录条数
 
         Raises:
             ValueError: 网格大小无效
@@ -49,17 +150,191 @@ class GridManager:
             >>> manager = GridManager(4)
             >>> manager.grid_size
             4
+            >>> GridManager(128, compact=True).is_compact()
+            True
         """
         if grid_size < 2:
             raise ValueError(f"Grid size must be at least 2, got {grid_size}")
 
         self.grid_size = grid_size
+        self._compact = compact
         self._grid: Dict[Tuple[int, int], Tile] = {}
-        self._initial_state: Dict[Tuple[int, int], Tile] = {}
         self._power_source_pos: Optional[Tuple[int, int]] = None
         self._terminal_pos: Optional[Tuple[int, int]] = None
+        self._power_source_positions: Set[Tuple[int, int]] = set()
+        self._terminal_positions: Set[Tuple[int, int]] = set()
+
+        cell_count = grid_size * grid_size if compact else 0
+        self._types = bytearray(cell_count)
+        self._rotations = bytearray(cell_count)
+        self._clickable = bytearray(cell_count)
+        self._revision: int = 0
+        self._initial_snapshot: Optional[bytes] = None
+        self._snapshot: Optional[bytes] = None
+        self._snapshot_revision: int = 0
+
+        # 变更日志：每次旋转写入固定槽位，记录时不分配新对象
+        self._journal_capacity = max(1, journal_capacity)
+        self._journal = array('q', bytes(8 * JOURNAL_ENTRY_WIDTH * self._journal_capacity))
+        self._journal_count: int = 0
+        self._resync_revision: int = 0
+        self._subscribers: Dict[int, int] = {}
+        self._next_subscriber_id: int = 1
+
+        logger.info(
+            f"GridManager initialized with size {grid_size}x{grid_size}"
+            f"{' (compact)' if compact else ''}"
+        )
+
+    def is_compact(self) -> bool:
+        """
+        检查是否使用紧凑存储模式
+
+        Returns:
+            bool: 是否为紧凑模式
+        """
+        return self._compact
 
-        logger.info(f"GridManager initialized with size {grid_size}x{grid_size}")
+    def get_revision(self) -> int:
+        """
+        获取网格修订号
+
+        修订号在设置、旋转、重置或清空瓦片时单调递增，
+        可作为缓存键判断网格自上次计算以来是否发生变化。
+
+        Returns:
+            int: 当前修订号
+
+        Example:
+            >>> manager = GridManager(4)
+            >>> before = manager.get_revision()
+            >>> manager.set_tile(0, 0, Tile(0, 0, TileType.EMPTY, 0))
+            >>> manager.get_revision() > before
+            True
+        """
+        return self._revision
+
+    def notify_tile_rotated(self, x: int, y: int, old_rotation: int, new_rotation: int) -> None:
+        """
+        瓦片旋转通知（由Tile在旋转后调用）
+
+        Args:
+            x: x坐标
+            y: y坐标
+            old_rotation: 旋转前的角度
+            new_rotation: 旋转后的角度
+        """
+        self._revision += 1
+
+        journal = self._journal
+        slot = (self._journal_count % self._journal_capacity) * JOURNAL_ENTRY_WIDTH
+        journal[slot] = self._revision
+        journal[slot + 1] = x
+        journal[slot + 2] = y
+        journal[slot + 3] = old_rotation
+        journal[slot + 4] = new_rotation
+        self._journal_count += 1
+
+    def _mark_resync(self) -> None:
+        """
+        记录一次批量修改
+
+        批量修改（设置、重置、清空瓦片）不写入变更日志，
+        早于此修订号的订阅者需要重新读取整个网格。
+        """
+        self._revision += 1
+        self._resync_revision = self._revision
+
+    def get_changes_since(self, revision: int) -> Optional[List[JournalEntry]]:
+        """
+        获取指定修订号之后的旋转记录
+
+        Args:
+            revision: 调用方已处理到的修订号
+
+        Returns:
+            Optional[List[JournalEntry]]: 按时间顺序排列的
+            (revision, x, y, old_rotation, new_rotation) 记录；
+            如果期间发生过批量修改或记录已被环形缓冲区覆盖，返回None，
+            调用方应重新读取整个网格
+
+        Example:
+            >>> manager = GridManager(4)
+            >>> manager.set_tile(1, 1, Tile(1, 1, TileType.STRAIGHT, 0))
+            >>> since = manager.get_revision()
+            >>> manager.rotate_tile(1, 1)
+            >>> manager.get_changes_since(since)
+            [(2, 1, 1, 0, 90)]
+        """
+        if revision < self._resync_revision or revision > self._revision:
+            return None
+
+        # 批量修改之后的每个修订号恰好对应一条旋转记录
+        pending = self._revision - revision
+        if pending > self._journal_capacity:
+            return None
+
+        journal = self._journal
+        capacity = self._journal_capacity
+        changes: List[JournalEntry] = []
+        for count in range(self._journal_count - pending, self._journal_count):
+            slot = (count % capacity) * JOURNAL_ENTRY_WIDTH
+            changes.append(tuple(journal[slot:slot + JOURNAL_ENTRY_WIDTH]))
+        return changes
+
+    def subscribe(self) -> int:
+        """
+        注册变更订阅者
+
+        订阅者从当前修订号开始接收变更，之后通过drain()获取增量。
+
+        Returns:
+            int: 订阅者ID
+
+        Example:
+            >>> subscriber = manager.subscribe()
+            >>> manager.rotate_tile(1, 1)
+            >>> changes = manager.drain(subscriber)
+        """
+        subscriber_id = self._next_subscriber_id
+        self._next_subscriber_id += 1
+        self._subscribers[subscriber_id] = self._revision
+        return subscriber_id
+
+    def unsubscribe(self, subscriber_id: int) -> None:
+        """
+        注销变更订阅者
+
+        Args:
+            subscriber_id: subscribe()返回的订阅者ID
+        """
+        self._subscribers.pop(subscriber_id, None)
+
+    def drain(self, subscriber_id: int) -> Optional[List[JournalEntry]]:
+        """
+        取出订阅者自上次drain以来的所有旋转记录
+
+        Args:
+            subscriber_id: subscribe()返回的订阅者ID
+
+        Returns:
+            Optional[List[JournalEntry]]: 旋转记录列表；返回None表示
+            需要重新读取整个网格（批量修改或记录溢出）
+
+        Raises:
+            KeyError: 订阅者ID不存在
+
+        Example:
+            >>> changes = manager.drain(subscriber)
+            >>> if changes is None:
+            ...     redraw_all()
+            ... else:
+            ...     for revision, x, y, old_rotation, new_rotation in changes:
+            ...         redraw_tile(x, y)
+        """
+        since = self._subscribers[subscriber_id]
+        self._subscribers[subscriber_id] = self._revision
+        return self.get_changes_since(since)
 
     def _validate_coordinates(self, x: int, y: int) -> bool:
         """
@@ -102,6 +377,12 @@ class GridManager:
             logger.warning(f"Invalid coordinates: ({x}, {y})")
             return None
 
+        if self._compact:
+            index = y * self.grid_size + x
+            if self._types[index] == 0:
+                return None
+            return TileView(self, index)
+
         return self._grid.get((x, y))
 
     def set_tile(self, x: int, y: int, tile: Tile) -> bool:
@@ -116,6 +397,9 @@ class GridManager:
         Returns:
             bool: 是否设置成功
 
+        Note:
+            紧凑模式下只复制瓦片的数据，传入的Tile对象不会被网格持有
+
         Example:
             >>> manager = GridManager(4)
             >>> tile = Tile(0, 0, TileType.POWER_SOURCE, 0)
@@ -126,21 +410,79 @@ class GridManager:
             logger.warning(f"Cannot set tile at invalid coordinates: ({x}, {y})")
             return False
 
-        # 更新瓦片的坐标（确保一致性）
-        tile.x = x
-        tile.y = y
+        if not isinstance(tile, TileView):
+            # 更新瓦片的坐标（确保一致性）
+            tile.x = x
+            tile.y = y
 
-        # 记录特殊瓦片位置
+        # 记录特殊瓦片位置（覆盖原有特殊瓦片时先移除旧记录）
+        position = (x, y)
+        self._power_source_positions.discard(position)
+        self._terminal_positions.discard(position)
         if tile.tile_type == TileType.POWER_SOURCE:
-            self._power_source_pos = (x, y)
+            self._power_source_pos = position
+            self._power_source_positions.add(position)
             logger.debug(f"Power source set at ({x}, {y})")
         elif tile.tile_type == TileType.TERMINAL:
-            self._terminal_pos = (x, y)
+            self._terminal_pos = position
+            self._terminal_positions.add(position)
             logger.debug(f"Terminal set at ({x}, {y})")
 
-        self._grid[(x, y)] = tile
+        if self._power_source_pos == position and tile.tile_type != TileType.POWER_SOURCE:
+            self._power_source_pos = next(iter(self._power_source_positions), None)
+        if self._terminal_pos == position and tile.tile_type != TileType.TERMINAL:
+            self._terminal_pos = next(iter(self._terminal_positions), None)
+
+        if self._compact:
+            index = y * self.grid_size + x
+            self._types[index] = tile.tile_type.to_code()
+            self._rotations[index] = tile.rotation // 90
+            self._clickable[index] = 1 if tile.is_clickable else 0
+        else:
+            if isinstance(tile, TileView):
+                # 视图属于其他网格，保存一份独立的瓦片
+                tile = Tile(x, y, tile.tile_type, tile.rotation, tile.is_clickable)
+            replaced = self._grid.get((x, y))
+            if replaced is not None and replaced is not tile:
+                replaced._owner = None
+            tile._owner = self
+            self._grid[(x, y)] = tile
+
+        self._mark_resync()
         return True
 
+    def get_connection_mask(self, x: int, y: int) -> int:
+        """
+        获取指定位置瓦片的4位连接掩码
+
+        Args:
+            x: x坐标
+            y: y坐标
+
+        Returns:
+            int: 连接掩码（北=1, 东=2, 南=4, 西=8），位置无效或为空时返回0
+
+        Note:
+            位于连通性检测的热路径上，越界访问不记录日志
+
+        Example:
+            >>> manager = GridManager(4)
+            >>> manager.set_tile(1, 1, Tile(1, 1, TileType.STRAIGHT, 90))
+            >>> manager.get_connection_mask(1, 1)
+            5
+        """
+        if not (0 <= x < self.grid_size and 0 <= y < self.grid_size):
+            return 0
+
+        if self._compact:
+            index = y * self.grid_size + x
+            return CONNECTION_MASKS_BY_CODE[self._types[index] * 4 + self._rotations[index]]
+
+        tile = self._grid.get((x, y))
+        if tile is None:
+            return 0
+        return CONNECTION_MASKS[(tile.tile_type, tile.rotation)]
+
     def rotate_tile(self, x: int, y: int) -> bool:
         """
         旋转指定位置的瓦片（顺时针90度）
@@ -198,7 +540,7 @@ class GridManager:
         if self._power_source_pos is None:
             return None
 
-        return self._grid.get(self._power_source_pos)
+        return self.get_tile(*self._power_source_pos)
 
     def get_terminal(self) -> Optional[Tile]:
         """
@@ -218,7 +560,44 @@ class GridManager:
         if self._terminal_pos is None:
             return None
 
-        return self._grid.get(self._terminal_pos)
+        return self.get_tile(*self._terminal_pos)
+
+    def get_power_sources(self) -> List[Tile]:
+        """
+        获取所有电源端瓦片
+
+        Returns:
+            List[Tile]: 电源端瓦片列表，按(y, x)排序
+
+        Example:
+            >>> manager = GridManager(4)
+            >>> manager.set_tile(0, 0, Tile(0, 0, TileType.POWER_SOURCE, 0))
+            >>> manager.set_tile(3, 0, Tile(3, 0, TileType.POWER_SOURCE, 0))
+            >>> len(manager.get_power_sources())
+            2
+        """
+        return self._tiles_at(self._power_source_positions)
+
+    def get_terminals(self) -> List[Tile]:
+        """
+        获取所有终端瓦片
+
+        Returns:
+            List[Tile]: 终端瓦片列表，按(y, x)排序
+        """
+        return self._tiles_at(self._terminal_positions)
+
+    def _tiles_at(self, positions: Set[Tuple[int, int]]) -> List[Tile]:
+        """
+        按(y, x)顺序获取一组位置上的瓦片
+
+        Args:
+            positions: 位置集合
+
+        Returns:
+            List[Tile]: 瓦片列表
+        """
+        return [self.get_tile(x, y) for x, y in sorted(positions, key=lambda pos: (pos[1], pos[0]))]
 
     def get_all_tiles(self) -> List[Tile]:
         """
@@ -233,6 +612,9 @@ class GridManager:
             >>> len(manager.get_all_tiles())
             1
         """
+        if self._compact:
+            return [TileView(self, index) for index, code in enumerate(self._types) if code]
+
         return list(self._grid.values())
 
     def save_initial_state(self) -> None:
@@ -252,17 +634,7 @@ class GridManager:
             >>> manager.get_tile(0, 0).rotation
             90
         """
-        self._initial_state = {}
-        for pos, tile in self._grid.items():
-            # 深拷贝瓦片以保存状态
-            self._initial_state[pos] = Tile(
-                tile.x,
-                tile.y,
-                tile.tile_type,
-                tile.rotation,
-                tile.is_clickable
-            )
-
+        self._initial_snapshot = self.snapshot()
         logger.info("Initial grid state saved")
 
     def reset_grid(self) -> None:
@@ -270,7 +642,8 @@ class GridManager:
         重置网格到初始状态
 
         Note:
-            需要先调用save_initial_state()保存初始状态
+            需要先调用save_initial_state()保存初始状态。
+            重置是原地进行的，已获取的瓦片对象保持有效。
 
         Example:
             >>> manager = GridManager(4)
@@ -282,22 +655,163 @@ class GridManager:
             >>> manager.get_tile(0, 0).rotation
             0
         """
-        if not self._initial_state:
+        if self._initial_snapshot is None:
             logger.warning("Cannot reset: no initial state saved")
             return
 
-        self._grid = {}
-        for pos, tile in self._initial_state.items():
-            # 深拷贝以避免修改初始状态
-            self._grid[pos] = Tile(
-                tile.x,
-                tile.y,
-                tile.tile_type,
-                tile.rotation,
-                tile.is_clickable
+        self.restore(self._initial_snapshot)
+        logger.info("Grid reset to initial state")
+
+    def snapshot(self) -> bytes:
+        """
+        生成网格快照
+
+        快照是不可变的字节串，格式与state_bytes()相同。网格未变化时直接返回
+        上一次的快照；只有旋转变化时，在上一次快照的副本上应用变更日志，
+        因此每一步都生成快照的开销很小。
+
+        Returns:
+            bytes: 长度为3*grid_size*grid_size的快照
+
+        Note:
+            直接给rotation属性赋值不会被记录，请使用rotate_tile()或set_rotation()
+
+        Example:
+            >>> manager = GridManager(4)
+            >>> manager.set_tile(1, 1, Tile(1, 1, TileType.STRAIGHT, 0))
+            >>> before = manager.snapshot()
+            >>> manager.rotate_tile(1, 1)
+            >>> manager.restore(before)
+            >>> manager.get_tile(1, 1).rotation
+            0
+        """
+        if self._snapshot is not None and self._snapshot_revision == self._revision:
+            return self._snapshot
+
+        if self._compact:
+            packed = bytes(self._types) + bytes(self._rotations) + bytes(self._clickable)
+        else:
+            changes = None
+            if self._snapshot is not None:
+                changes = self.get_changes_since(self._snapshot_revision)
+
+            if changes is None:
+                packed = self._pack_tiles()
+            else:
+                buffer = bytearray(self._snapshot)
+                offset = self.grid_size * self.grid_size
+                for _, x, y, _, new_rotation in changes:
+                    buffer[offset + y * self.grid_size + x] = new_rotation // 90
+                packed = bytes(buffer)
+
+        self._snapshot = packed
+        self._snapshot_revision = self._revision
+        return packed
+
+    def restore(self, snapshot: bytes) -> None:
+        """
+        从快照恢复网格
+
+        紧凑模式下为三次缓冲区拷贝；默认模式下只修改与快照不同的格子，
+        同类型的瓦片在原对象上更新，已获取的瓦片对象保持有效。
+
+        Args:
+            snapshot: snapshot()或state_bytes()返回的字节串
+
+        Raises:
+            ValueError: 快照长度与网格尺寸不匹配
+
+        Example:
+            >>> saved = manager.snapshot()
+            >>> manager.rotate_tile(1, 1)
+            >>> manager.restore(saved)
+        """
+        cell_count = self.grid_size * self.grid_size
+        if len(snapshot) != 3 * cell_count:
+            raise ValueError(
+                f"Snapshot size {len(snapshot)} does not match grid size {self.grid_size}"
             )
+        snapshot = bytes(snapshot)
+
+        if self._compact:
+            view = memoryview(snapshot)
+            self._types[:] = view[:cell_count]
+            self._rotations[:] = view[cell_count:2 * cell_count]
+            self._clickable[:] = view[2 * cell_count:]
+        else:
+            current = self.snapshot()
+            if current != snapshot:
+                self._restore_tiles(current, snapshot)
+
+        self._power_source_positions = self._find_type_positions(snapshot, TileType.POWER_SOURCE)
+        self._terminal_positions = self._find_type_positions(snapshot, TileType.TERMINAL)
+        if self._power_source_pos not in self._power_source_positions:
+            self._power_source_pos = min(self._power_source_positions, default=None,
+                                         key=lambda pos: (pos[1], pos[0]))
+        if self._terminal_pos not in self._terminal_positions:
+            self._terminal_pos = min(self._terminal_positions, default=None,
+                                     key=lambda pos: (pos[1], pos[0]))
+
+        self._mark_resync()
+        self._snapshot = snapshot
+        self._snapshot_revision = self._revision
+
+    def _restore_tiles(self, current: bytes, target: bytes) -> None:
+        """
+        按快照差异更新默认模式下的瓦片字典
 
-        logger.info("Grid reset to initial state")
+        Args:
+            current: 当前状态快照
+            target: 目标状态快照
+        """
+        cell_count = self.grid_size * self.grid_size
+        for index in range(cell_count):
+            code = target[index]
+            rotation_step = target[cell_count + index]
+            clickable = target[2 * cell_count + index]
+            if (current[index] == code
+                    and current[cell_count + index] == rotation_step
+                    and current[2 * cell_count + index] == clickable):
+                continue
+
+            x = index % self.grid_size
+            y = index // self.grid_size
+            tile = self._grid.get((x, y))
+
+            if code == 0:
+                if tile is not None:
+                    tile._owner = None
+                    del self._grid[(x, y)]
+            elif tile is not None and current[index] == code:
+                # 同类型瓦片原地更新
+                tile.rotation = rotation_step * 90
+                tile.is_clickable = bool(clickable)
+            else:
+                if tile is not None:
+                    tile._owner = None
+                restored = Tile(x, y, TILE_TYPES_BY_CODE[code], rotation_step * 90, bool(clickable))
+                restored._owner = self
+                self._grid[(x, y)] = restored
+
+    def _find_type_positions(self, snapshot: bytes, tile_type: TileType) -> Set[Tuple[int, int]]:
+        """
+        在快照的类型平面中查找指定类型瓦片的所有位置
+
+        Args:
+            snapshot: 网格快照
+            tile_type: 瓦片类型
+
+        Returns:
+            Set[Tuple[int, int]]: 所有匹配瓦片的坐标
+        """
+        code = bytes((tile_type.to_code(),))
+        cell_count = self.grid_size * self.grid_size
+        positions: Set[Tuple[int, int]] = set()
+        index = snapshot.find(code, 0, cell_count)
+        while index >= 0:
+            positions.add((index % self.grid_size, index // self.grid_size))
+            index = snapshot.find(code, index + 1, cell_count)
+        return positions
 
     def clear_grid(self) -> None:
         """
@@ -310,10 +824,20 @@ class GridManager:
             >>> len(manager.get_all_tiles())
             0
         """
+        for tile in self._grid.values():
+            tile._owner = None
         self._grid.clear()
-        self._initial_state.clear()
+        self._initial_snapshot = None
+        if self._compact:
+            cell_count = len(self._types)
+            self._types[:] = bytes(cell_count)
+            self._rotations[:] = bytes(cell_count)
+            self._clickable[:] = bytes(cell_count)
         self._power_source_pos = None
         self._terminal_pos = None
+        self._power_source_positions.clear()
+        self._terminal_positions.clear()
+        self._mark_resync()
         logger.info("Grid cleared")
 
     def get_tile_count(self) -> int:
@@ -329,6 +853,9 @@ class GridManager:
             >>> manager.get_tile_count()
             1
         """
+        if self._compact:
+            return len(self._types) - self._types.count(0)
+
         return len(self._grid)
 
     def is_position_empty(self, x: int, y: int) -> bool:
@@ -350,8 +877,48 @@ class GridManager:
         if not self._validate_coordinates(x, y):
             return False
 
+        if self._compact:
+            return self._types[y * self.grid_size + x] == 0
+
         return (x, y) not in self._grid
 
+    def state_bytes(self) -> bytes:
+        """
+        获取网格状态的紧凑字节表示
+
+        依次拼接类型、旋转、可点击三个平面（索引为y*grid_size+x），
+        可直接用于整网格的哈希与比较。两种存储模式的结果一致。
+
+        Returns:
+            bytes: 长度为3*grid_size*grid_size的状态字节串
+
+        Example:
+            >>> a = GridManager(4)
+            >>> b = GridManager(4, compact=True)
+            >>> a.state_bytes() == b.state_bytes()
+            True
+        """
+        return self.snapshot()
+
+    def _pack_tiles(self) -> bytes:
+        """
+        将默认模式的瓦片字典打包为状态字节串
+
+        Returns:
+            bytes: 与state_bytes()格式相同的字节串
+        """
+        cell_count = self.grid_size * self.grid_size
+        types = bytearray(cell_count)
+        rotations = bytearray(cell_count)
+        clickable = bytearray(cell_count)
+        for (x, y), tile in self._grid.items():
+            index = y * self.grid_size + x
+            types[index] = tile.tile_type.to_code()
+            rotations[index] = tile.rotation // 90
+            clickable[index] = 1 if tile.is_clickable else 0
+
+        return bytes(types) + bytes(rotations) + bytes(clickable)
+
     def __str__(self) -> str:
         """返回网格的字符串表示"""
         return f"GridManager({self.grid_size}x{self.grid_size}, {self.get_tile_count()} tiles)"
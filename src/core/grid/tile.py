@@ -7,11 +7,78 @@
 """
 
 from dataclasses import dataclass
-from typing import List, Tuple
-from src.core.grid.tile_type import TileType
+from typing import Dict, List, Tuple
+from src.core.grid.tile_type import TileType, TILE_TYPES_BY_CODE
 from src.config.constants import Direction, DIRECTION_VECTORS
 
 
+# ============================================================================
+# 连接掩码表
+# ============================================================================
+
+# 方向顺序：北 -> 东 -> 南 -> 西（顺时针旋转90度即在此顺序中前进一步）
+DIRECTIONS_CLOCKWISE: Tuple[Direction, ...] = (
+    Direction.NORTH, Direction.EAST, Direction.SOUTH, Direction.WEST
+)
+
+# 方向位：北=1, 东=2, 南=4, 西=8
+DIRECTION_BITS: Dict[Direction, int] = {
+    direction: 1 << step for step, direction in enumerate(DIRECTIONS_CLOCKWISE)
+}
+
+# 相反方向位（用于判断邻居是否有对应入口）
+OPPOSITE_DIRECTION_BITS: Dict[Direction, int] = {
+    direction: 1 << ((step + 2) % 4) for step, direction in enumerate(DIRECTIONS_CLOCKWISE)
+}
+
+# 0度旋转时的基础出口方向
+BASE_EXIT_DIRECTIONS: Dict[TileType, Tuple[Direction, ...]] = {
+    TileType.EMPTY: (),
+    TileType.POWER_SOURCE: (Direction.EAST,),
+    TileType.TERMINAL: (Direction.WEST,),
+    TileType.STRAIGHT: (Direction.EAST, Direction.WEST),
+    TileType.CORNER: (Direction.NORTH, Direction.EAST),
+}
+
+
+def _build_exit_tables() -> Tuple[
+    Dict[Tuple[TileType, int], Tuple[Direction, ...]],
+    Dict[Tuple[TileType, int], int],
+    bytes
+]:
+    """
+    构建(瓦片类型, 旋转角度)到出口方向和4位连接掩码的查找表
+
+    Returns:
+        Tuple: (出口方向表, 连接掩码表, 按类型编码索引的掩码字节表)
+
+    Note:
+        掩码字节表的索引为 type_code * 4 + rotation // 90，编码0（无瓦片）对应掩码0
+    """
+    exits: Dict[Tuple[TileType, int], Tuple[Direction, ...]] = {}
+    masks: Dict[Tuple[TileType, int], int] = {}
+    masks_by_code = bytearray(len(TILE_TYPES_BY_CODE) * 4)
+
+    for tile_type, base_exits in BASE_EXIT_DIRECTIONS.items():
+        for step in range(4):
+            rotated = tuple(
+                DIRECTIONS_CLOCKWISE[(DIRECTIONS_CLOCKWISE.index(d) + step) % 4]
+                for d in base_exits
+            )
+            mask = 0
+            for d in rotated:
+                mask |= DIRECTION_BITS[d]
+
+            exits[(tile_type, step * 90)] = rotated
+            masks[(tile_type, step * 90)] = mask
+            masks_by_code[tile_type.to_code() * 4 + step] = mask
+
+    return exits, masks, bytes(masks_by_code)
+
+
+EXIT_DIRECTIONS, CONNECTION_MASKS, CONNECTION_MASKS_BY_CODE = _build_exit_tables()
+
+
 @dataclass
 class Tile:
     """
@@ -25,6 +92,11 @@ class Tile:
         tile_type: 瓦片类型
         rotation: 旋转角度（0, 90, 180, 270）
         is_clickable: 是否可点击（用于UI）
+        _owner: 持有该瓦片的网格管理器（由GridManager.set_tile设置，非数据字段）
+
+    Note:
+        通过rotate_clockwise/rotate_counterclockwise/set_rotation进行的旋转会通知
+        所属网格；直接给rotation属性赋值不会被网格感知
 
     Example:
         >>> tile = Tile(0, 0, TileType.POWER_SOURCE, 0)
@@ -39,6 +111,9 @@ class Tile:
     rotation: int = 0
     is_clickable: bool = False
 
+    # 所属网格（类属性默认值，不参与dataclass字段）
+    _owner = None
+
     def __post_init__(self) -> None:
         """初始化后验证"""
         # 标准化旋转角度
@@ -62,7 +137,9 @@ class Tile:
             90
         """
         if self.is_rotatable():
-            self.rotation = (self.rotation + 90) % 360
+            old_rotation = self.rotation
+            self.rotation = (old_rotation + 90) % 360
+            self._notify_rotated(old_rotation)
 
     def rotate_counterclockwise(self) -> None:
         """
@@ -75,7 +152,9 @@ class Tile:
             0
         """
         if self.is_rotatable():
-            self.rotation = (self.rotation - 90) % 360
+            old_rotation = self.rotation
+            self.rotation = (old_rotation - 90) % 360
+            self._notify_rotated(old_rotation)
 
     def set_rotation(self, angle: int) -> None:
         """
@@ -98,7 +177,19 @@ class Tile:
             raise ValueError(f"Invalid rotation angle: {angle}")
 
         if self.is_rotatable():
+            old_rotation = self.rotation
             self.rotation = angle
+            self._notify_rotated(old_rotation)
+
+    def _notify_rotated(self, old_rotation: int) -> None:
+        """
+        通知所属网格旋转角度已改变
+
+        Args:
+            old_rotation: 旋转前的角度
+        """
+        if self._owner is not None and old_rotation != self.rotation:
+            self._owner.notify_tile_rotated(self.x, self.y, old_rotation, self.rotation)
 
     def is_rotatable(self) -> bool:
         """
@@ -134,11 +225,25 @@ class Tile:
             >>> tile.get_exit_directions()
             [Direction.EAST, Direction.WEST]
         """
-        # 获取基础出口方向（0度时）
-        base_exits = self._get_base_exit_directions()
+        return list(EXIT_DIRECTIONS[(self.tile_type, self.rotation)])
+
+    def get_connection_mask(self) -> int:
+        """
+        获取当前旋转角度下的4位连接掩码
 
-        # 根据旋转角度调整方向
-        return [self._rotate_direction(d, self.rotation) for d in base_exits]
+        Returns:
+            int: 出口方向位的组合（北=1, 东=2, 南=4, 西=8）
+
+        Note:
+            查表实现，相邻两个瓦片是否相连可通过位与判断
+
+        Example:
+            >>> Tile(0, 0, TileType.STRAIGHT, 0).get_connection_mask()
+            10
+            >>> Tile(0, 0, TileType.CORNER, 90).get_connection_mask()
+            6
+        """
+        return CONNECTION_MASKS[(self.tile_type, self.rotation)]
 
     def _get_base_exit_directions(self) -> List[Direction]:
         """
@@ -152,24 +257,11 @@ class Tile:
             Straight tile at 90° or 270°: vertical line (NORTH-SOUTH, connects up-down)
             Corner tile at 0°: connects NORTH and EAST (L shape, opening right-up)
 
-            Coordinate system: (x, y) where x=row, y=column
-            - Same y value = same column = vertical arrangement = need vertical line (90°)
-            - Same x value = same row = horizontal arrangement = need horizontal line (0°)
+            Coordinate system: (x, y) where x=column, y=row (screen coordinates)
+            - Same x value = same column = vertical arrangement = need vertical line (90°)
+            - Same y value = same row = horizontal arrangement = need horizontal line (0°)
         """
-        if self.tile_type == TileType.EMPTY:
-            return []
-        elif self.tile_type == TileType.POWER_SOURCE:
-            return [Direction.EAST]
-        elif self.tile_type == TileType.TERMINAL:
-            return [Direction.WEST]
-        elif self.tile_type == TileType.STRAIGHT:
-            # 0° straight: horizontal line (EAST-WEST, connects left-right)
-            return [Direction.EAST, Direction.WEST]
-        elif self.tile_type == TileType.CORNER:
-            # 0° corner: connects NORTH and EAST (L shape, opening right-up)
-            return [Direction.NORTH, Direction.EAST]
-        else:
-            return []
+        return list(BASE_EXIT_DIRECTIONS.get(self.tile_type, ()))
 
     def _rotate_direction(self, direction: Direction, angle: int) -> Direction:
         """
@@ -215,10 +307,8 @@ class Tile:
             >>> tile.has_entrance_from(Direction.WEST)
             True
         """
-        exits = self.get_exit_directions()
         # 入口是出口的相反方向
-        opposite = self._get_opposite_direction(direction)
-        return opposite in exits
+        return bool(self.get_connection_mask() & OPPOSITE_DIRECTION_BITS[direction])
 
     def _get_opposite_direction(self, direction: Direction) -> Direction:
         """
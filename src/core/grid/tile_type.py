@@ -85,3 +85,55 @@ class TileType(Enum):
             True
         """
         return self != TileType.EMPTY
+
+    def to_code(self) -> int:
+        """
+        获取瓦片类型的紧凑编码
+
+        Returns:
+            int: 1字节编码（1-5），0保留表示"无瓦片"
+
+        Note:
+            用于紧凑存储模式与二进制格式，编码值一经发布不可更改
+
+        Example:
+            >>> TileType.STRAIGHT.to_code()
+            4
+        """
+        return _TILE_TYPE_CODES[self]
+
+    @classmethod
+    def from_code(cls, code: int) -> 'TileType':
+        """
+        从紧凑编码创建TileType
+
+        Args:
+            code: 瓦片类型编码（1-5）
+
+        Returns:
+            TileType: 对应的瓦片类型
+
+        Raises:
+            ValueError: 无效的编码
+
+        Example:
+            >>> TileType.from_code(2)
+            TileType.POWER_SOURCE
+        """
+        if 0 < code < len(TILE_TYPES_BY_CODE):
+            return TILE_TYPES_BY_CODE[code]
+        raise ValueError(f"Invalid tile type code: {code}")
+
+
+# 紧凑编码表（0保留表示"无瓦片"）
+TILE_TYPES_BY_CODE = (
+    None,
+    TileType.EMPTY,
+    TileType.POWER_SOURCE,
+    TileType.TERMINAL,
+    TileType.STRAIGHT,
+    TileType.CORNER,
+)
+_TILE_TYPE_CODES = {
+    tile_type: code for code, tile_type in enumerate(TILE_TYPES_BY_CODE) if tile_type is not None
+}
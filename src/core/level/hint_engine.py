@@ -0,0 +1,245 @@
+"""
+Hint Engine Module
+
+This module provides the HintEngine class, which answers "which tile should
+I rotate next?" for the current grid state.
+
+The engine keeps the move solver's per-tile state (see move_solver) alive
+between queries. It subscribes to the grid change journal and only
+re-evaluates tiles that were rotated since the last query. Mismatched tiles
+wait in a heap ordered by their distance from the power source, so a hint
+extends the part of the circuit nearest the source first. A query costs
+O(k log n) for k rotations since the previous one, independent of the
+board size.
+
+Classes:
+    Hint: A suggested rotation
+    HintEngine: Incremental hint solver for one grid
+
+Author: Circuit Repair Game Team
+Date: 2026-01-20
+"""
+
+import heapq
+from array import array
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Dict, List, Optional
+
+from src.core.grid.grid_manager import GridManager
+from src.core.grid.tile_type import TileType
+from src.core.level.move_solver import accepted_rotation_mask, clicks_to_accept, UNREACHABLE
+
+# Rank of solution cells not reachable from a power source
+_UNRANKED = 1 << 30
+
+
+@dataclass(frozen=True)
+class Hint:
+    """
+    A suggested rotation.
+
+    Attributes:
+        x: X coordinate of the tile to rotate
+        y: Y coordinate of the tile to rotate
+        target_rotation: Nearest accepted rotation (clockwise)
+        clicks: Clockwise clicks needed to reach target_rotation
+    """
+    x: int
+    y: int
+    target_rotation: int
+    clicks: int
+
+
+class HintEngine:
+    """
+    Incremental hint solver for one grid.
+
+    Every checked cell (a clickable solution tile) has an accepted-rotation
+    mask. Tiles are independent under the rotation-match win rule, so the
+    best next move is always a click on some mismatched tile. Among those
+    the engine picks the one closest to a power source.
+
+    Attributes:
+        _grid: Grid the hints are computed for
+        _masks: Per-cell accepted-rotation mask (0 for unchecked cells)
+        _ranks: Per-cell BFS distance from a power source through solution cells
+        _heap: (rank, index) of cells that may be mismatched
+        _queued: Per-cell flag, set while the cell is in _heap
+        _remaining_moves: Clicks still needed by all rotatable checked cells
+        _subscriber: Grid change subscription
+
+    Example:
+        >>> engine = HintEngine(grid, level_data.solution_tiles)
+        >>> hint = engine.get_hint()
+        >>> for _ in range(hint.clicks):
+        ...     grid.rotate_tile(hint.x, hint.y)
+    """
+
+    def __init__(self, grid: GridManager, solution_tiles: List[Dict[str, Any]]) -> None:
+        """
+        Initialize the engine and solve the current grid state.
+
+        Args:
+            grid: Grid to compute hints for
+            solution_tiles: Solution tile dicts of the level
+        """
+        size = grid.grid_size
+        self._grid = grid
+        self._masks = bytearray(size * size)
+        self._ranks = array('i', [_UNRANKED]) * (size * size)
+        self._heap: List[tuple] = []
+        self._queued = bytearray(size * size)
+        self._remaining_moves: int = 0
+
+        sources = []
+        solution_cells = bytearray(size * size)
+        for tile_data in solution_tiles:
+            x = tile_data.get('x')
+            y = tile_data.get('y')
+            if x is None or y is None or not (0 <= x < size and 0 <= y < size):
+                continue
+            index = y * size + x
+            solution_cells[index] = 1
+            if tile_data.get('type') == TileType.POWER_SOURCE.value:
+                sources.append(index)
+            if tile_data.get('is_clickable', False):
+                self._masks[index] = accepted_rotation_mask(tile_data)
+
+        self._rank_cells(sources, solution_cells)
+        self._subscriber = grid.subscribe()
+        self._rebuild()
+
+    def _rank_cells(self, sources: List[int], solution_cells: bytearray) -> None:
+        """
+        Rank solution cells by their distance from the nearest power source.
+
+        Args:
+            sources: Cell indices of power sources
+            solution_cells: Per-cell flag, set for cells holding a solution tile
+        """
+        size = self._grid.grid_size
+        ranks = self._ranks
+        queue = deque(sources)
+        for index in sources:
+            ranks[index] = 0
+
+        while queue:
+            index = queue.popleft()
+            y, x = divmod(index, size)
+            for nx, ny in ((x + 1, y), (x - 1, y), (x, y + 1), (x, y - 1)):
+                if 0 <= nx < size and 0 <= ny < size:
+                    neighbor = ny * size + nx
+                    if solution_cells[neighbor] and ranks[neighbor] == _UNRANKED:
+                        ranks[neighbor] = ranks[index] + 1
+                        queue.append(neighbor)
+
+    def _clicks_at(self, index: int) -> int:
+        """
+        Get the clicks needed by a checked cell in the current grid.
+
+        Args:
+            index: Cell index (y * grid_size + x)
+
+        Returns:
+            Clicks (0-3), or UNREACHABLE for a missing or non-rotatable
+            tile that is not accepted
+        """
+        size = self._grid.grid_size
+        tile = self._grid.get_tile(index % size, index // size)
+        if tile is None:
+            return UNREACHABLE
+        clicks = clicks_to_accept(tile.rotation, self._masks[index])
+        if clicks and not tile.is_rotatable():
+            return UNREACHABLE
+        return clicks
+
+    def _push(self, index: int) -> None:
+        """Queue a cell that may be mismatched."""
+        if not self._queued[index]:
+            self._queued[index] = 1
+            heapq.heappush(self._heap, (self._ranks[index], index))
+
+    def _rebuild(self) -> None:
+        """
+        Re-solve every checked cell (used at start and after bulk changes).
+        """
+        self._heap = []
+        self._queued = bytearray(len(self._masks))
+        self._remaining_moves = 0
+        for index, mask in enumerate(self._masks):
+            if not mask:
+                continue
+            clicks = self._clicks_at(index)
+            if clicks and clicks != UNREACHABLE:
+                self._remaining_moves += clicks
+                self._queued[index] = 1
+                self._heap.append((self._ranks[index], index))
+        heapq.heapify(self._heap)
+
+    def _sync(self) -> None:
+        """
+        Apply rotations recorded in the grid journal since the last query.
+
+        Falls back to a full rebuild when the journal cannot cover the gap
+        (reset, restore or overflow).
+        """
+        changes = self._grid.drain(self._subscriber)
+        if changes is None:
+            self._rebuild()
+            return
+
+        size = self._grid.grid_size
+        masks = self._masks
+        for _, x, y, old_rotation, new_rotation in changes:
+            index = y * size + x
+            mask = masks[index]
+            if not mask:
+                continue
+            # Journalled rotations only happen on rotatable tiles
+            old_clicks = clicks_to_accept(old_rotation, mask)
+            new_clicks = clicks_to_accept(new_rotation, mask)
+            self._remaining_moves += new_clicks - old_clicks
+            if new_clicks:
+                self._push(index)
+
+    def get_hint(self) -> Optional[Hint]:
+        """
+        Get the next tile to rotate.
+
+        Returns:
+            Hint for the mismatched tile nearest a power source, or None if
+            every rotatable checked tile is at an accepted rotation
+
+        Example:
+            >>> hint = engine.get_hint()
+            >>> print(f"Rotate ({hint.x}, {hint.y}) to {hint.target_rotation}°")
+        """
+        self._sync()
+
+        size = self._grid.grid_size
+        heap = self._heap
+        while heap:
+            index = heap[0][1]
+            clicks = self._clicks_at(index)
+            if clicks and clicks != UNREACHABLE:
+                x, y = index % size, index // size
+                target = (self._grid.get_tile(x, y).rotation + clicks * 90) % 360
+                return Hint(x, y, target, clicks)
+            heapq.heappop(heap)
+            self._queued[index] = 0
+        return None
+
+    def get_remaining_moves(self) -> int:
+        """
+        Get the minimum number of clicks that solves the current grid state.
+
+        Returns:
+            Remaining clicks over all rotatable checked tiles
+        """
+        self._sync()
+        return self._remaining_moves
+
+    def close(self) -> None:
+        """Stop following grid changes."""
+        self._grid.unsubscribe(self._subscriber)
@@ -0,0 +1,181 @@
+"""
+Level Cache Module
+
+Disk-backed cache of generated levels. A LevelGeneratorV3 level is fully
+determined by (generator version, difficulty, grid size, seed), so a level
+generated once can be served again from disk without rerunning the
+generator.
+
+Classes:
+    LevelCache: JSON file cache of LevelGeneratorV3 output
+
+Author: Circuit Repair Game Team
+Date: 2026-01-23
+"""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Dict, Optional
+
+from src.core.level.level_generator_v3 import LevelGeneratorV3
+from src.core.level.level_seed import LevelSeed
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+
+class LevelCache:
+    """
+    Disk-backed cache of generated levels.
+
+    Each level is stored as one JSON file named after its cache key. Bumping
+    LevelGeneratorV3.GENERATOR_VERSION makes old entries unreachable, so a
+    cache never serves levels from an older algorithm.
+
+    Attributes:
+        _cache_dir: Directory holding the cached level files
+        _hits: Number of levels served from disk
+        _misses: Number of levels that had to be generated
+
+    Example:
+        >>> cache = LevelCache()
+        >>> level_seed = LevelSeed(DifficultyLevel.HARD, 6, 42)
+        >>> generated = cache.get_or_generate(level_seed)  # generates
+        >>> generated = cache.get_or_generate(level_seed)  # read from disk
+    """
+
+    DEFAULT_CACHE_DIR = "data/cache/levels"
+
+    def __init__(self, cache_dir: Optional[str] = None) -> None:
+        """
+        Initialize LevelCache.
+
+        Args:
+            cache_dir: Directory for cached levels (default: data/cache/levels)
+        """
+        self._cache_dir = Path(cache_dir or self.DEFAULT_CACHE_DIR)
+        self._cache_dir.mkdir(parents=True, exist_ok=True)
+        self._hits = 0
+        self._misses = 0
+
+        logger.debug(f"LevelCache initialized: {self._cache_dir}")
+
+    @staticmethod
+    def cache_key(level_seed: LevelSeed) -> str:
+        """
+        Get the cache key of a level.
+
+        Args:
+            level_seed: Level identity
+
+        Returns:
+            Key combining generator version, difficulty, grid size and seed
+        """
+        return (
+            f"v{LevelGeneratorV3.GENERATOR_VERSION}_{level_seed.difficulty.value}_"
+            f"{level_seed.grid_size}_{level_seed.seed}"
+        )
+
+    def _path_for(self, level_seed: LevelSeed) -> Path:
+        """Get the cache file path of a level."""
+        return self._cache_dir / f"{self.cache_key(level_seed)}.json"
+
+    def get(self, level_seed: LevelSeed) -> Optional[Dict]:
+        """
+        Get a cached level.
+
+        Args:
+            level_seed: Level identity
+
+        Returns:
+            Generated level dict, or None if not cached (or unreadable)
+        """
+        path = self._path_for(level_seed)
+        if not path.exists():
+            return None
+
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                generated = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            logger.warning(f"Ignoring unreadable cached level {path}: {e}")
+            return None
+
+        # JSON has no tuples: restore path positions
+        generated['path'] = [tuple(pos) for pos in generated['path']]
+        return generated
+
+    def put(self, level_seed: LevelSeed, generated: Dict) -> None:
+        """
+        Store a generated level.
+
+        The file is written to a temporary name and then renamed, so a
+        concurrent reader never sees a partial level.
+
+        Args:
+            level_seed: Level identity
+            generated: Level dict returned by LevelGeneratorV3.generate()
+        """
+        path = self._path_for(level_seed)
+        temp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        try:
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                json.dump(generated, f, separators=(',', ':'))
+            os.replace(temp_path, path)
+        except OSError as e:
+            logger.error(f"Failed to cache level {path}: {e}")
+
+    def get_or_generate(self, level_seed: LevelSeed) -> Dict:
+        """
+        Get a cached level, generating and caching it on a miss.
+
+        Args:
+            level_seed: Level identity
+
+        Returns:
+            Generated level dict
+
+        Raises:
+            RuntimeError: If generation fails
+        """
+        generated = self.get(level_seed)
+        if generated is not None:
+            self._hits += 1
+            logger.debug(f"Level cache hit: {level_seed}")
+            return generated
+
+        self._misses += 1
+        generated = LevelGeneratorV3(
+            difficulty=level_seed.difficulty,
+            grid_size=level_seed.grid_size,
+            seed=level_seed.seed
+        ).generate()
+        self.put(level_seed, generated)
+        return generated
+
+    def clear(self) -> int:
+        """
+        Remove every cached level.
+
+        Returns:
+            Number of files removed
+        """
+        removed = 0
+        for path in self._cache_dir.glob("*.json"):
+            try:
+                path.unlink()
+                removed += 1
+            except OSError as e:
+                logger.warning(f"Failed to remove cached level {path}: {e}")
+        return removed
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get hit/miss counters.
+
+        Returns:
+            Dict with 'hits' and 'misses'
+        """
+        return {'hits': self._hits, 'misses': self._misses}
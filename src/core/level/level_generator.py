@@ -50,16 +50,25 @@ class LevelGenerator:
         >>> print(f"Generated level with {len(level_data['path'])} tiles")
     """
 
-    def __init__(self, grid_size: int = 4, min_path_length: int = 5):
+    def __init__(
+        self,
+        grid_size: int = 4,
+        min_path_length: int = 5,
+        seed: Optional[int] = None
+    ):
         """
         Initialize the level generator.
 
         Args:
             grid_size: Size of the grid (N for NxN grid)
             min_path_length: Minimum number of movable tiles in path
+            seed: Optional seed for reproducible generation
         """
         self.grid_size = grid_size
         self.min_path_length = min_path_length
+        self.seed = seed if seed is not None else random.getrandbits(32)
+        self._rng = random.Random(self.seed)
+        self.generation_attempts = 0  # Attempts made by all generate() calls
 
         logger.info(
             f"LevelGenerator initialized: grid_size={grid_size}, "
@@ -84,6 +93,7 @@ class LevelGenerator:
             4
         """
         logger.info("Generating new level...")
+        self.generation_attempts += 1
 
         # Step 1: Choose random start and end positions
         power_pos, terminal_pos = self._choose_endpoints()
@@ -127,15 +137,15 @@ class LevelGenerator:
         """
         # Choose random positions
         power_pos = (
-            random.randint(0, self.grid_size - 1),
-            random.randint(0, self.grid_size - 1)
+            self._rng.randint(0, self.grid_size - 1),
+            self._rng.randint(0, self.grid_size - 1)
         )
 
         # Choose terminal position (not adjacent to power)
         while True:
             terminal_pos = (
-                random.randint(0, self.grid_size - 1),
-                random.randint(0, self.grid_size - 1)
+                self._rng.randint(0, self.grid_size - 1),
+                self._rng.randint(0, self.grid_size - 1)
             )
 
             # Check if positions are different and not adjacent
@@ -181,7 +191,7 @@ class LevelGenerator:
             neighbors = self._get_neighbors(pos)
 
             # Sort neighbors: prefer continuing in same direction (70% chance)
-            if prev_dir and random.random() < 0.7:
+            if prev_dir and self._rng.random() < 0.7:
                 # Try to continue in same direction first
                 dx, dy = prev_dir.value
                 straight_pos = (pos[0] + dx, pos[1] + dy)
@@ -191,7 +201,7 @@ class LevelGenerator:
                         return True
 
             # Otherwise try random neighbors
-            random.shuffle(neighbors)
+            self._rng.shuffle(neighbors)
             for next_pos in neighbors:
                 if next_pos not in visited:
                     # Calculate direction to next position
@@ -489,15 +499,15 @@ class LevelGenerator:
         for tile in solution_tiles:
             if tile['is_clickable']:
                 # Randomly rotate (0, 90, 180, 270)
-                random_rotation = random.choice([0, 90, 180, 270])
+                random_rotation = self._rng.choice([0, 90, 180, 270])
 
                 # Ensure it's different from solution (at least 50% of the time)
-                if random.random() < 0.7:  # 70% chance to scramble
+                if self._rng.random() < 0.7:  # 70% chance to scramble
                     accepted = tile.get('accepted_rotations', [tile['rotation']])
                     # Choose a rotation NOT in accepted list
                     invalid_rotations = [r for r in [0, 90, 180, 270] if r not in accepted]
                     if invalid_rotations:
-                        random_rotation = random.choice(invalid_rotations)
+                        random_rotation = self._rng.choice(invalid_rotations)
 
                 scrambled.append({
                     'x': tile['x'],
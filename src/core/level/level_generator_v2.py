@@ -60,7 +60,8 @@ class LevelGeneratorV2:
         self,
         difficulty: DifficultyLevel = DifficultyLevel.NORMAL,
         grid_size: Optional[int] = None,
-        max_retries: int = 50
+        max_retries: int = 50,
+        seed: Optional[int] = None
     ):
         """
         Initialize the level generator.
@@ -69,17 +70,21 @@ class LevelGeneratorV2:
             difficulty: Difficulty level
             grid_size: Optional fixed grid size (overrides difficulty config)
             max_retries: Maximum number of generation attempts
+            seed: Optional seed for reproducible generation
         """
         self.difficulty = difficulty
         self.config = DifficultyConfig.get_config(difficulty)
         self.max_retries = max_retries
+        self.seed = seed if seed is not None else random.getrandbits(32)
+        self._rng = random.Random(self.seed)
+        self.generation_attempts = 0  # Attempts made by all generate() calls
 
         # Use provided grid_size or random from difficulty range
         if grid_size is not None:
             self.grid_size = grid_size
         else:
             min_size, max_size = self.config.grid_size_range
-            self.grid_size = random.randint(min_size, max_size)
+            self.grid_size = self._rng.randint(min_size, max_size)
 
         logger.info(
             f"LevelGeneratorV2 initialized: difficulty={difficulty.value}, "
@@ -112,6 +117,7 @@ class LevelGeneratorV2:
         logger.info(f"Generating new level (difficulty: {self.difficulty.value})...")
 
         for attempt in range(self.max_retries):
+            self.generation_attempts += 1
             try:
                 # Step 1: Choose random start and end positions
                 power_pos, terminal_pos = self._choose_endpoints()
@@ -186,8 +192,8 @@ class LevelGeneratorV2:
         """
         # Choose random power source position
         power_pos = (
-            random.randint(0, self.grid_size - 1),
-            random.randint(0, self.grid_size - 1)
+            self._rng.randint(0, self.grid_size - 1),
+            self._rng.randint(0, self.grid_size - 1)
         )
 
         # Choose terminal position (not adjacent, minimum distance based on difficulty)
@@ -195,8 +201,8 @@ class LevelGeneratorV2:
 
         while True:
             terminal_pos = (
-                random.randint(0, self.grid_size - 1),
-                random.randint(0, self.grid_size - 1)
+                self._rng.randint(0, self.grid_size - 1),
+                self._rng.randint(0, self.grid_size - 1)
             )
 
             # Check Manhattan distance
@@ -244,7 +250,7 @@ class LevelGeneratorV2:
             neighbors = self._get_valid_neighbors(pos, visited)
 
             # Randomize neighbor order for variety
-            random.shuffle(neighbors)
+            self._rng.shuffle(neighbors)
 
             # Try each neighbor
             for next_pos in neighbors:
@@ -619,7 +625,7 @@ class LevelGeneratorV2:
 
         # Randomly select tiles to scramble
         tiles_to_scramble_set = set(
-            random.sample(range(len(clickable_tiles)), min(tiles_to_scramble, len(clickable_tiles)))
+            self._rng.sample(range(len(clickable_tiles)), min(tiles_to_scramble, len(clickable_tiles)))
         )
 
         logger.debug(
@@ -634,10 +640,10 @@ class LevelGeneratorV2:
                 invalid_rotations = [r for r in [0, 90, 180, 270] if r not in accepted]
 
                 if invalid_rotations:
-                    random_rotation = random.choice(invalid_rotations)
+                    random_rotation = self._rng.choice(invalid_rotations)
                 else:
                     # Fallback: just rotate randomly
-                    random_rotation = random.choice([0, 90, 180, 270])
+                    random_rotation = self._rng.choice([0, 90, 180, 270])
             else:
                 # Keep correct rotation
                 random_rotation = tile['rotation']
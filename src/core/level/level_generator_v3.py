@@ -4,7 +4,8 @@ Level Generator V3 - Based on User's Algorithm
 Completely rewritten based on user's detailed algorithm specification.
 
 Key Points:
-1. Use BFS/DFS to find a path from power source to terminal
+1. Synthesize a path from power source to terminal iteratively, steering
+   its length and corner count toward the difficulty budgets
 2. For each tile in the path, determine sprite and rotation based on:
    - Previous tile position (where we came from)
    - Next tile position (where we're going to)
@@ -30,6 +31,7 @@ import logging
 from typing import List, Dict, Tuple, Optional, Set
 from enum import Enum
 from src.core.level.difficulty_config import DifficultyLevel, DifficultyConfig
+from src.core.level.uniqueness_verifier import UniquenessVerifier
 
 logger = logging.getLogger(__name__)
 
@@ -47,16 +49,29 @@ class LevelGeneratorV3:
     Level generator V3 - implements user's algorithm specification.
 
     Generates levels by:
-    1. Selecting random power source and terminal positions
-    2. Finding a path between them using DFS
+    1. Synthesizing a path whose length and corner count are steered
+       toward the DifficultyConfig budgets while it is built
+    2. Placing the power source and terminal at the path ends
     3. Assigning correct sprites and rotations based on path geometry
     4. Scrambling tiles according to difficulty settings
     """
 
+    # Bump when a change alters the levels produced for a given seed
+    GENERATOR_VERSION = "3.1"
+
+    # Path synthesis: walks per attempt and expansions allowed per path move
+    WALK_RESTARTS = 32
+    WALK_BUDGET_PER_MOVE = 4
+
+    # Distractor placement: draws per distractor count before halving it
+    DISTRACTOR_DRAWS = 4
+
     def __init__(
         self,
         difficulty: DifficultyLevel = DifficultyLevel.NORMAL,
-        grid_size: Optional[int] = None
+        grid_size: Optional[int] = None,
+        seed: Optional[int] = None,
+        distractor_ratio: float = 0.0
     ):
         """
         Initialize level generator.
@@ -64,21 +79,29 @@ class LevelGeneratorV3:
         Args:
             difficulty: Difficulty level
             grid_size: Optional fixed grid size (overrides difficulty config)
+            seed: Optional seed; the same (difficulty, grid_size, seed)
+                always produces the same level. A random seed is drawn
+                when omitted.
+            distractor_ratio: Fraction of off-path cells to fill with
+                rotatable distractor tiles (0 keeps them empty). Distractors
+                never create a second power-to-terminal route.
         """
         self.difficulty = difficulty
+        self.distractor_ratio = distractor_ratio
         self.config = DifficultyConfig.get_config(difficulty)
+        self.seed = seed if seed is not None else random.getrandbits(32)
+        self._rng = random.Random(self.seed)
+        self.generation_attempts = 0  # Attempts made by all generate() calls
 
-        # Determine grid size
-        if grid_size is not None:
-            self.grid_size = grid_size
-        else:
-            # Random size within difficulty range
-            min_size, max_size = self.config.grid_size_range
-            self.grid_size = random.randint(min_size, max_size)
+        # Determine grid size. The random size is always drawn so that a
+        # seed produces the same level whether its size is given or not.
+        min_size, max_size = self.config.grid_size_range
+        random_size = self._rng.randint(min_size, max_size)
+        self.grid_size = grid_size if grid_size is not None else random_size
 
         logger.info(
             f"Initialized LevelGeneratorV3: "
-            f"difficulty={difficulty.value}, grid_size={self.grid_size}"
+            f"difficulty={difficulty.value}, grid_size={self.grid_size}, seed={self.seed}"
         )
 
     def generate(self) -> Dict:
@@ -93,6 +116,7 @@ class LevelGeneratorV3:
                 - path: List of (x, y) positions in the path
                 - movable_count: Number of movable tiles
                 - corner_count: Number of corner tiles
+                - seed: Seed the level was generated from
 
         Raises:
             RuntimeError: If failed to generate valid level after max attempts
@@ -100,18 +124,17 @@ class LevelGeneratorV3:
         max_attempts = 50
 
         for attempt in range(1, max_attempts + 1):
+            self.generation_attempts += 1
             try:
                 logger.debug(f"Generation attempt {attempt}/{max_attempts}")
 
-                # Step 1: Select power source and terminal positions
-                power_pos, terminal_pos = self._select_endpoints()
-
-                # Step 2: Find a path from power to terminal
-                path = self._find_path(power_pos, terminal_pos)
+                # Steps 1-2: Build a path within the difficulty budgets
+                # (its ends become the power source and terminal)
+                path = self._synthesize_path()
 
                 if path is None or len(path) < 3:
                     # Path too short (need at least power + 1 middle + terminal)
-                    logger.debug(f"Path too short: {len(path) if path else 0} tiles")
+                    logger.debug(f"Path synthesis failed: {len(path) if path else 0} tiles")
                     continue
 
                 # Step 3: Assign sprites and rotations based on path geometry
@@ -131,16 +154,26 @@ class LevelGeneratorV3:
                 # Step 5: Create scrambled initial state
                 initial_state = self._create_scrambled_state(solution_tiles, movable_count)
 
-                # Step 6: Add empty tiles for all non-path positions
-                solution_tiles_with_empty = self._add_empty_tiles(solution_tiles, path)
-                initial_state_with_empty = self._add_empty_tiles(initial_state, path)
+                # Step 6: Fill some off-path cells with distractor tiles
+                distractors = self._place_distractors(solution_tiles, path)
+                solution_tiles.extend(distractors)
+                initial_state.extend(
+                    {'x': t['x'], 'y': t['y'], 'rotation': self._rng.choice([0, 90, 180, 270])}
+                    for t in distractors
+                )
+
+                # Step 7: Add empty tiles for all remaining positions
+                occupied = path + [(t['x'], t['y']) for t in distractors]
+                solution_tiles_with_empty = self._add_empty_tiles(solution_tiles, occupied)
+                initial_state_with_empty = self._add_empty_tiles(initial_state, occupied)
 
                 logger.info(
                     f"Level generated successfully: "
                     f"grid={self.grid_size}x{self.grid_size}, "
                     f"path_length={len(path)}, "
                     f"movable={movable_count}, "
-                    f"corners={corner_count}"
+                    f"corners={corner_count}, "
+                    f"distractors={len(distractors)}"
                 )
 
                 return {
@@ -149,7 +182,8 @@ class LevelGeneratorV3:
                     'initial_state': initial_state_with_empty,
                     'path': path,
                     'movable_count': movable_count,
-                    'corner_count': corner_count
+                    'corner_count': corner_count,
+                    'seed': self.seed
                 }
 
             except Exception as e:
@@ -161,91 +195,203 @@ class LevelGeneratorV3:
             f"Try adjusting difficulty settings or grid size."
         )
 
-    def _select_endpoints(self) -> Tuple[Tuple[int, int], Tuple[int, int]]:
+    def _synthesize_path(self) -> Optional[List[Tuple[int, int]]]:
         """
-        Select random positions for power source and terminal.
+        Build a path iteratively, steering it toward the difficulty budgets.
 
-        Ensures they are not adjacent (need at least 1 tile between them).
+        Picks a target movable-tile count and corner count inside the
+        DifficultyConfig windows, then runs short budgeted walks
+        (see _walk_path) from random starts until one reaches the target.
+        Walks either finish in about one pass or trap themselves, so
+        restarting is much cheaper than backtracking out of a trap.
 
         Returns:
-            Tuple of (power_pos, terminal_pos) where each is (x, y)
+            List of (x, y) positions (power source first, terminal last),
+            or None if every walk ran out of budget
         """
-        while True:
-            power_x = random.randint(0, self.grid_size - 1)
-            power_y = random.randint(0, self.grid_size - 1)
-
-            terminal_x = random.randint(0, self.grid_size - 1)
-            terminal_y = random.randint(0, self.grid_size - 1)
+        cell_count = self.grid_size * self.grid_size
+        max_movable = min(self.config.max_movable_tiles, cell_count - 2)
+        min_movable = min(self.config.min_movable_tiles, max_movable)
+        movable_target = self._rng.randint(min_movable, max_movable)
+
+        min_corners = self.config.min_corners
+        max_corners = min(self.config.max_corners, movable_target)
+        if min_corners > max_corners:
+            logger.debug(
+                f"Corner window {min_corners}-{self.config.max_corners} does not fit "
+                f"{movable_target} movable tiles"
+            )
+            return None
+        corner_target = self._rng.randint(min_corners, max_corners)
 
-            # Check Manhattan distance (must be at least 2 to have 1 tile between)
-            distance = abs(power_x - terminal_x) + abs(power_y - terminal_y)
+        for _ in range(self.WALK_RESTARTS):
+            path = self._walk_path(movable_target + 1, corner_target, (min_corners, max_corners))
+            if path is not None:
+                return path
 
-            if distance >= 2:
-                return (power_x, power_y), (terminal_x, terminal_y)
+        logger.debug(
+            f"Path synthesis failed after {self.WALK_RESTARTS} walks "
+            f"(movable={movable_target}, corners={corner_target})"
+        )
+        return None
 
-    def _find_path(
+    def _walk_path(
         self,
-        start: Tuple[int, int],
-        end: Tuple[int, int]
+        edge_count: int,
+        corner_target: int,
+        corner_window: Tuple[int, int]
     ) -> Optional[List[Tuple[int, int]]]:
         """
-        Find a path from start to end using DFS.
+        Walk a self-avoiding path of a fixed number of moves from a random start.
 
-        Does NOT find shortest path - finds any valid path.
-        This creates more interesting puzzles.
+        At every middle tile the walk turns with probability (corners still
+        needed) / (middle tiles still to place), and never makes a choice that
+        would push the final corner count outside the window. Dead ends are
+        undone with an explicit stack (no recursion), bounded by
+        WALK_BUDGET_PER_MOVE expansions per move.
 
         Args:
-            start: Starting position (x, y)
-            end: Ending position (x, y)
+            edge_count: Number of moves (path length - 1)
+            corner_target: Corner count the walk is steered toward
+            corner_window: (min_corners, max_corners) the path must satisfy
 
         Returns:
-            List of (x, y) positions forming the path, or None if no path found
+            List of (x, y) positions, or None if the walk ran out of budget
         """
-        visited: Set[Tuple[int, int]] = set()
-        path: List[Tuple[int, int]] = []
+        budget = self.WALK_BUDGET_PER_MOVE * edge_count
 
-        def dfs(pos: Tuple[int, int]) -> bool:
-            """DFS helper function."""
-            if pos == end:
-                path.append(pos)
-                return True
+        start = (self._rng.randrange(self.grid_size), self._rng.randrange(self.grid_size))
+        path: List[Tuple[int, int]] = [start]
+        moves: List[Direction] = []
+        visited: Set[Tuple[int, int]] = {start}
+        corners = 0
 
-            if pos in visited:
-                return False
+        stack: List[List[Direction]] = [
+            self._rank_moves(path, moves, visited, corners, corner_target, corner_window, edge_count)
+        ]
+        expansions = 0
+
+        while stack:
+            candidates = stack[-1]
+            if not candidates:
+                # Dead end: undo the last move
+                stack.pop()
+                if not moves:
+                    return None
+                visited.discard(path.pop())
+                if len(moves) >= 2 and moves[-1] != moves[-2]:
+                    corners -= 1
+                moves.pop()
+                continue
 
-            visited.add(pos)
-            path.append(pos)
+            expansions += 1
+            if expansions > budget:
+                return None
+
+            direction = candidates.pop()
+            dx, dy = direction.value
+            next_pos = (path[-1][0] + dx, path[-1][1] + dy)
+            if moves and direction != moves[-1]:
+                corners += 1
+            moves.append(direction)
+            path.append(next_pos)
+            visited.add(next_pos)
+
+            if len(moves) == edge_count:
+                # Power source and terminal must not be adjacent
+                if abs(path[0][0] - next_pos[0]) + abs(path[0][1] - next_pos[1]) >= 2:
+                    return path
+                stack.append([])
+                continue
 
-            # Try all four directions in random order
-            directions = list(Direction)
-            random.shuffle(directions)
+            stack.append(
+                self._rank_moves(path, moves, visited, corners, corner_target, corner_window, edge_count)
+            )
 
-            for direction in directions:
-                dx, dy = direction.value
-                next_x = pos[0] + dx
-                next_y = pos[1] + dy
-                next_pos = (next_x, next_y)
+        return None
 
-                # Check bounds
-                if not (0 <= next_x < self.grid_size and 0 <= next_y < self.grid_size):
-                    continue
+    def _rank_moves(
+        self,
+        path: List[Tuple[int, int]],
+        moves: List[Direction],
+        visited: Set[Tuple[int, int]],
+        corners: int,
+        corner_target: int,
+        corner_window: Tuple[int, int],
+        edge_count: int
+    ) -> List[Direction]:
+        """
+        Rank the next moves of a partial path (best move last).
 
-                # Check not visited
-                if next_pos in visited:
-                    continue
+        Args:
+            path: Positions placed so far
+            moves: Directions taken so far
+            visited: Set of positions in the path
+            corners: Corners placed so far
+            corner_target: Corner count the walk is steered toward
+            corner_window: (min_corners, max_corners) the final path must satisfy
+            edge_count: Total number of moves in the finished path
+
+        Returns:
+            Feasible directions, ordered so that list.pop() yields the preferred one
+        """
+        x, y = path[-1]
+        is_last = len(moves) + 1 == edge_count
+        # Middle tiles whose turn/straight choice is still open after this move
+        undecided = edge_count - len(moves) - 1
+
+        straight: List[Tuple[int, float, Direction]] = []
+        turns: List[Tuple[int, float, Direction]] = []
+        for direction in Direction:
+            dx, dy = direction.value
+            next_pos = (x + dx, y + dy)
+            if not (0 <= next_pos[0] < self.grid_size and 0 <= next_pos[1] < self.grid_size):
+                continue
+            if next_pos in visited:
+                continue
+            free_neighbors = self._count_free_neighbors(next_pos, visited)
+            if not is_last and free_neighbors == 0:
+                continue
 
-                # Recursively explore
-                if dfs(next_pos):
-                    return True
+            is_turn = bool(moves) and direction != moves[-1]
+            corners_after = corners + (1 if is_turn else 0)
+            if corners_after > corner_window[1] or corners_after + undecided < corner_window[0]:
+                continue
 
-            # Backtrack
-            path.pop()
-            return False
+            (turns if is_turn else straight).append((free_neighbors, self._rng.random(), direction))
 
-        if dfs(start):
-            return path
-        else:
-            return None
+        # Within each group prefer cells with fewer free neighbors (Warnsdorff's
+        # rule): hugging walls and the path itself avoids sealing off regions
+        turns = [move[2] for move in sorted(turns, reverse=True)]
+        straight = [move[2] for move in sorted(straight, reverse=True)]
+
+        # Turn with probability (corners still needed) / (open middle tiles)
+        remaining = corner_target - corners
+        turn_probability = remaining / (undecided + 1) if moves else 0.5
+        if self._rng.random() < turn_probability:
+            return straight + turns
+        return turns + straight
+
+    def _count_free_neighbors(self, pos: Tuple[int, int], visited: Set[Tuple[int, int]]) -> int:
+        """
+        Count in-bounds neighbors of a position that are not yet in the path.
+
+        Args:
+            pos: Position (x, y)
+            visited: Set of positions in the path
+
+        Returns:
+            Number of cells the walk could continue to from pos
+        """
+        count = 0
+        for direction in Direction:
+            dx, dy = direction.value
+            next_x = pos[0] + dx
+            next_y = pos[1] + dy
+            if (0 <= next_x < self.grid_size and 0 <= next_y < self.grid_size
+                    and (next_x, next_y) not in visited):
+                count += 1
+        return count
 
     def _create_solution_tiles(self, path: List[Tuple[int, int]]) -> List[Dict]:
         """
@@ -516,7 +662,7 @@ class LevelGeneratorV3:
 
         # Randomly select which tiles to scramble
         num_to_scramble = min(min_scrambled, len(clickable_tiles))
-        scramble_indices = set(random.sample(range(len(clickable_tiles)), num_to_scramble))
+        scramble_indices = set(self._rng.sample(range(len(clickable_tiles)), num_to_scramble))
 
         for i, tile in enumerate(clickable_tiles):
             if i in scramble_indices:
@@ -531,7 +677,7 @@ class LevelGeneratorV3:
 
                 if invalid_rotations:
                     # Choose a random invalid rotation
-                    rotation = random.choice(invalid_rotations)
+                    rotation = self._rng.choice(invalid_rotations)
                 else:
                     # If all rotations are valid (shouldn't happen), just rotate 90°
                     rotation = (tile['rotation'] + 90) % 360
@@ -547,17 +693,70 @@ class LevelGeneratorV3:
 
         return scrambled
 
+    def _place_distractors(
+        self,
+        solution_tiles: List[Dict],
+        path: List[Tuple[int, int]]
+    ) -> List[Dict]:
+        """
+        Create rotatable distractor tiles on off-path cells.
+
+        Each draw is checked with UniquenessVerifier so the intended path
+        stays the only power-to-terminal route. After DISTRACTOR_DRAWS
+        failed draws the distractor count is halved.
+
+        Args:
+            solution_tiles: Solution tiles of the path
+            path: List of (x, y) positions in the path
+
+        Returns:
+            Distractor tile configurations (empty when distractor_ratio is 0
+            or no valid placement was found)
+        """
+        if self.distractor_ratio <= 0:
+            return []
+
+        path_positions = set(path)
+        free = [
+            (x, y)
+            for x in range(self.grid_size)
+            for y in range(self.grid_size)
+            if (x, y) not in path_positions
+        ]
+        count = min(len(free), round(len(free) * self.distractor_ratio))
+
+        while count > 0:
+            for _ in range(self.DISTRACTOR_DRAWS):
+                distractors = [
+                    {
+                        'x': x,
+                        'y': y,
+                        'type': self._rng.choice(['straight', 'corner']),
+                        'rotation': 0,
+                        'is_clickable': True,
+                        'accepted_rotations': [0, 90, 180, 270]
+                    }
+                    for x, y in self._rng.sample(free, count)
+                ]
+                verifier = UniquenessVerifier(self.grid_size, solution_tiles + distractors)
+                if verifier.verify(path):
+                    return distractors
+            count //= 2
+
+        logger.debug("No distractor placement kept the solution unique")
+        return []
+
     def _add_empty_tiles(
         self,
         tiles: List[Dict],
         path: List[Tuple[int, int]]
     ) -> List[Dict]:
         """
-        Add empty tiles for all non-path positions in the grid.
+        Add empty tiles for all unoccupied positions in the grid.
 
         Args:
             tiles: List of existing tile configurations
-            path: List of (x, y) positions in the path
+            path: List of occupied (x, y) positions (path and distractors)
 
         Returns:
             List of tile configurations including empty tiles
@@ -7,13 +7,18 @@
 """
 
 import json
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, TYPE_CHECKING
 from pathlib import Path
 from src.core.grid.grid_manager import GridManager
 from src.core.grid.tile import Tile
 from src.core.grid.tile_type import TileType
+from src.core.level.move_solver import compute_optimal_moves
+from src.config.constants import GRID_COMPACT_THRESHOLD
 from src.utils.logger import GameLogger
 
+if TYPE_CHECKING:
+    from src.core.level.level_pack_binary import BinaryLevelPack
+
 logger = GameLogger.get_logger(__name__)
 
 
@@ -31,6 +36,7 @@ class LevelData:
         grid_size: 网格大小
         solution_tiles: 正确解法的瓦片列表
         rotated_tiles: 初始错误旋转的瓦片列表
+        optimal_moves: 最少点击次数（无解时为None），创建时计算
 
     Example:
         >>> data = LevelData(
@@ -76,6 +82,7 @@ class LevelData:
         self.grid_size = grid_size
         self.solution_tiles = solution_tiles
         self.rotated_tiles = rotated_tiles
+        self.optimal_moves = compute_optimal_moves(grid_size, solution_tiles, rotated_tiles)
 
     def __repr__(self) -> str:
         """返回关卡数据的详细表示"""
@@ -89,7 +96,8 @@ class LevelLoader:
     """
     关卡加载器类
 
-    从JSON文件加载关卡数据并创建游戏网格。
+    从JSON文件加载关卡数据并创建游戏网格，也可以从内存映射的
+    二进制关卡包中按索引解码单个关卡。
 
     Example:
         >>> loader = LevelLoader()
@@ -188,6 +196,64 @@ class LevelLoader:
             logger.error(f"Failed to get level data from {filepath}: {e}")
             return None
 
+    def open_pack(self, filepath: str) -> Optional['BinaryLevelPack']:
+        """
+        打开二进制关卡包（内存映射，只读取文件头）
+
+        Args:
+            filepath: 关卡包文件路径
+
+        Returns:
+            Optional[BinaryLevelPack]: 打开的关卡包，失败返回None
+
+        Example:
+            >>> pack = loader.open_pack("data/packs/levels.pack")
+            >>> grid = loader.load_pack_level(pack, 0)
+        """
+        from src.core.level.level_pack_binary import BinaryLevelPack
+
+        try:
+            pack = BinaryLevelPack(filepath)
+        except (OSError, ValueError) as e:
+            logger.error(f"Failed to open level pack {filepath}: {e}")
+            return None
+
+        logger.info(f"Level pack opened: {filepath} ({len(pack)} levels)")
+        return pack
+
+    def get_pack_level_data(self, pack: 'BinaryLevelPack', index: int) -> Optional[LevelData]:
+        """
+        从关卡包解码单个关卡的数据（不创建网格）
+
+        Args:
+            pack: open_pack()返回的关卡包
+            index: 关卡在包中的索引（从0开始）
+
+        Returns:
+            Optional[LevelData]: 关卡数据，失败返回None
+        """
+        try:
+            return pack.get_level_data(index)
+        except (IndexError, ValueError) as e:
+            logger.error(f"Failed to read level {index} from {pack.filepath}: {e}")
+            return None
+
+    def load_pack_level(self, pack: 'BinaryLevelPack', index: int) -> Optional[GridManager]:
+        """
+        从关卡包加载单个关卡
+
+        Args:
+            pack: open_pack()返回的关卡包
+            index: 关卡在包中的索引（从0开始）
+
+        Returns:
+            Optional[GridManager]: 加载的网格管理器，失败返回None
+        """
+        level_data = self.get_pack_level_data(pack, index)
+        if level_data is None:
+            return None
+        return self._create_grid(level_data)
+
     def _load_json(self, filepath: str) -> Optional[Dict[str, Any]]:
         """
         加载JSON文件
@@ -288,9 +354,15 @@ class LevelLoader:
 
         Returns:
             GridManager: 创建的网格管理器
+
+        Note:
+            尺寸达到GRID_COMPACT_THRESHOLD的网格使用紧凑存储模式
         """
         # 创建网格
-        grid = GridManager(level_data.grid_size)
+        grid = GridManager(
+            level_data.grid_size,
+            compact=level_data.grid_size >= GRID_COMPACT_THRESHOLD
+        )
 
         # 放置正确解法的瓦片
         for tile_data in level_data.solution_tiles:
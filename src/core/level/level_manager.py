@@ -16,12 +16,22 @@ import logging
 
 from src.core.grid.grid_manager import GridManager
 from src.core.grid.tile import Tile
-from src.core.circuit.connectivity_checker import ConnectivityChecker
+from src.core.circuit.connectivity_checker import ConnectivityChecker, ConnectivityDelta
 from src.core.level.level_loader import LevelLoader, LevelData
+from src.core.level.move_journal import MoveJournal
+from src.core.level.hint_engine import HintEngine, Hint
+from src.core.level.level_seed import LevelSeed
+from src.core.level.level_cache import LevelCache
+from src.core.level.level_pack_binary import BinaryLevelPack
+from src.core.level.difficulty_config import DifficultyLevel
 
 # Configure logger
 logger = logging.getLogger(__name__)
 
+# Flag bit marking a cell as checked by the win condition; bits 0-3 mark
+# accepted rotations (bit k accepts k * 90 degrees)
+_WIN_CELL_FLAG = 0x10
+
 
 class LevelManager:
     """
@@ -36,10 +46,18 @@ class LevelManager:
         _current_level_id: ID of currently loaded level
         _current_filepath: Filepath of currently loaded level
         _grid: GridManager instance for current level
-        _connectivity_checker: ConnectivityChecker instance
+        _connectivity_checker: ConnectivityChecker instance (incremental mode)
+        _last_connectivity_delta: Powered/unpowered tiles changed by the last rotation
         _move_count: Number of moves made in current level
+        _move_journal: Packed record of moves, used for undo/redo and replay
+        _accepted_masks: Per-cell accepted-rotation bitmask (index y * grid_size + x)
+        _mismatch_count: Number of checked cells not at an accepted rotation
+        _missing_solution_tiles: Checked solution tiles absent from the grid
+        _grid_subscriber: Grid change subscription used to keep the count in sync
+        _hint_engine: Incremental solver answering get_hint()
         _is_completed: Whether current level is completed
         _level_data: Parsed level data
+        _level_seed: Seed identity of the current generated level (None otherwise)
 
     Example:
         >>> loader = LevelLoader()
@@ -72,9 +90,17 @@ class LevelManager:
         self._current_filepath: Optional[str] = None
         self._grid: Optional[GridManager] = None
         self._connectivity_checker: Optional[ConnectivityChecker] = None
+        self._last_connectivity_delta: ConnectivityDelta = ConnectivityDelta()
         self._move_count: int = 0
+        self._move_journal: MoveJournal = MoveJournal()
+        self._accepted_masks: bytearray = bytearray()
+        self._mismatch_count: int = 0
+        self._missing_solution_tiles: int = 0
+        self._grid_subscriber: Optional[int] = None
+        self._hint_engine: Optional[HintEngine] = None
         self._is_completed: bool = False
         self._level_data: Optional[LevelData] = None
+        self._level_seed: Optional[LevelSeed] = None
 
         logger.info("LevelManager initialized")
 
@@ -110,14 +136,7 @@ class LevelManager:
             logger.error(f"Failed to create grid from level data: {filepath}")
             return False
 
-        # Initialize components
-        self._level_data = level_data
-        self._current_level_id = level_data.level_id
-        self._current_filepath = filepath
-        self._grid = grid
-        self._connectivity_checker = ConnectivityChecker()
-        self._move_count = 0
-        self._is_completed = False
+        self._start_level(level_data, grid, filepath)
 
         logger.info(
             f"Level loaded successfully: {level_data.name} "
@@ -130,7 +149,8 @@ class LevelManager:
         self,
         difficulty: str = "normal",
         grid_size: Optional[int] = None,
-        level_number: int = 1
+        level_number: int = 1,
+        seed: Optional[int] = None
     ) -> bool:
         """
         Load a procedurally generated level with difficulty support.
@@ -141,6 +161,7 @@ class LevelManager:
             difficulty: Difficulty level ("easy", "normal", "hard", "hell")
             grid_size: Optional fixed grid size (overrides difficulty config)
             level_number: Level number for display purposes
+            seed: Optional generator seed (random if omitted)
 
         Returns:
             True if level generated and loaded successfully
@@ -152,7 +173,6 @@ class LevelManager:
             True
         """
         from src.core.level.level_generator_v3 import LevelGeneratorV3
-        from src.core.level.difficulty_config import DifficultyLevel
 
         # Convert string to DifficultyLevel enum
         try:
@@ -169,7 +189,8 @@ class LevelManager:
         # Generate level using V3 generator (implements user's algorithm)
         generator = LevelGeneratorV3(
             difficulty=difficulty_enum,
-            grid_size=grid_size
+            grid_size=grid_size,
+            seed=seed
         )
 
         try:
@@ -178,6 +199,74 @@ class LevelManager:
             logger.error(f"Failed to generate level: {e}")
             return False
 
+        return self.load_generated_data(generated, difficulty_enum, level_number)
+
+    def load_seeded_level(
+        self,
+        level_seed: LevelSeed,
+        level_number: int = 1,
+        cache: Optional[LevelCache] = None
+    ) -> bool:
+        """
+        Load the level identified by a LevelSeed (e.g. a daily challenge or
+        a seed code copied from a log line).
+
+        Args:
+            level_seed: Level identity
+            level_number: Level number for display purposes
+            cache: Optional LevelCache to serve the level from
+
+        Returns:
+            True if level generated (or read from cache) and loaded successfully
+
+        Example:
+            >>> manager.load_seeded_level(LevelSeed.from_code("3KQ9Z-T1A0C"))
+            True
+        """
+        from src.core.level.level_generator_v3 import LevelGeneratorV3
+
+        logger.info(f"Loading seeded level #{level_number}: {level_seed}")
+
+        try:
+            if cache is not None:
+                generated = cache.get_or_generate(level_seed)
+            else:
+                generated = LevelGeneratorV3(
+                    difficulty=level_seed.difficulty,
+                    grid_size=level_seed.grid_size,
+                    seed=level_seed.seed
+                ).generate()
+        except RuntimeError as e:
+            logger.error(f"Failed to generate level {level_seed}: {e}")
+            return False
+
+        return self.load_generated_data(generated, level_seed.difficulty, level_number)
+
+    def load_generated_data(
+        self,
+        generated: Dict[str, Any],
+        difficulty: 'DifficultyLevel',
+        level_number: int = 1
+    ) -> bool:
+        """
+        Load a level that was already produced by LevelGeneratorV3.
+
+        Lets callers generate levels ahead of time (e.g. LevelPipeline)
+        and only pay for building the grid when the level is shown.
+
+        Args:
+            generated: Level dict returned by LevelGeneratorV3.generate()
+            difficulty: Difficulty the level was generated for
+            level_number: Level number for display purposes
+
+        Returns:
+            True if level loaded successfully
+
+        Example:
+            >>> generated = LevelGeneratorV3(DifficultyLevel.HARD).generate()
+            >>> manager.load_generated_data(generated, DifficultyLevel.HARD, 3)
+            True
+        """
         # Create LevelData from generated data
         difficulty_names = {
             "easy": "简单",
@@ -185,13 +274,13 @@ class LevelManager:
             "hard": "困难",
             "hell": "地狱"
         }
-        difficulty_display = difficulty_names.get(difficulty_enum.value, difficulty_enum.value)
+        difficulty_display = difficulty_names.get(difficulty.value, difficulty.value)
 
         level_data = LevelData(
             level_id=f"generated_{level_number}",
             version="1.0",
             name=f"关卡 #{level_number} ({difficulty_display})",
-            difficulty=list(DifficultyLevel).index(difficulty_enum) + 1,
+            difficulty=list(DifficultyLevel).index(difficulty) + 1,
             grid_size=generated['grid_size'],
             solution_tiles=generated['solution'],
             rotated_tiles=generated['initial_state']
@@ -203,25 +292,92 @@ class LevelManager:
             logger.error("Failed to create grid from generated level")
             return False
 
-        # Initialize components
-        self._level_data = level_data
-        self._current_level_id = level_data.level_id
-        self._current_filepath = None  # No file for generated levels
-        self._grid = grid
-        self._connectivity_checker = ConnectivityChecker()
-        self._move_count = 0
-        self._is_completed = False
+        # No file for generated levels
+        self._start_level(level_data, grid, None)
+        if 'seed' in generated:
+            self._level_seed = LevelSeed(difficulty, generated['grid_size'], generated['seed'])
 
         logger.info(
             f"Generated level loaded: {level_data.name} "
             f"(Grid: {generated['grid_size']}x{generated['grid_size']}, "
             f"Path length: {len(generated['path'])}, "
             f"Movable: {generated['movable_count']}, "
-            f"Corners: {generated['corner_count']})"
+            f"Corners: {generated['corner_count']}, "
+            f"Seed: {self._level_seed or 'unknown'})"
         )
 
         return True
 
+    def load_pack_level(self, pack: BinaryLevelPack, index: int) -> bool:
+        """
+        Load a level from an open binary level pack.
+
+        Only the requested record is decoded, so this is as cheap for a
+        catalog of 100k levels as for a single file.
+
+        Args:
+            pack: Pack returned by LevelLoader.open_pack()
+            index: Level index in the pack (0-based)
+
+        Returns:
+            True if level loaded successfully, False otherwise
+
+        Example:
+            >>> pack = loader.open_pack("data/packs/levels.pack")
+            >>> manager.load_pack_level(pack, 42)
+            True
+        """
+        level_data = self._level_loader.get_pack_level_data(pack, index)
+        if level_data is None:
+            logger.error(f"Failed to load level {index} from pack")
+            return False
+
+        grid = self._level_loader._create_grid(level_data)
+        self._start_level(level_data, grid, None)
+
+        seed = pack.get_seed(index)
+        difficulty_levels = list(DifficultyLevel)
+        if seed is not None and 1 <= level_data.difficulty <= len(difficulty_levels):
+            self._level_seed = LevelSeed(
+                difficulty_levels[level_data.difficulty - 1], level_data.grid_size, seed
+            )
+
+        logger.info(
+            f"Pack level loaded: {level_data.name} "
+            f"(index: {index}, Size: {level_data.grid_size}x{level_data.grid_size})"
+        )
+        return True
+
+    def _start_level(
+        self,
+        level_data: LevelData,
+        grid: GridManager,
+        filepath: Optional[str]
+    ) -> None:
+        """
+        Make a freshly built level the current one.
+
+        Args:
+            level_data: Parsed level data
+            grid: Grid created from level_data
+            filepath: Level file path (None for generated and pack levels)
+        """
+        self._level_data = level_data
+        self._current_level_id = level_data.level_id
+        self._current_filepath = filepath
+        self._level_seed = None
+        self._grid = grid
+        self._connectivity_checker = ConnectivityChecker()
+        self._connectivity_checker.enable_incremental(grid)
+        self._last_connectivity_delta = ConnectivityDelta()
+        self._move_count = 0
+        self._move_journal = MoveJournal()
+        self._is_completed = False
+        self._init_win_state()
+        if self._hint_engine is not None:
+            self._hint_engine.close()
+        self._hint_engine = HintEngine(grid, level_data.solution_tiles)
+
     def reset_level(self) -> bool:
         """
         Reset current level to initial state.
@@ -248,6 +404,12 @@ class LevelManager:
 
         self._grid.reset_grid()
         self._move_count = 0
+        self._move_journal.clear()
+
+        # Reset replaces many tiles at once: rebuild the powered tree
+        if self._connectivity_checker is not None:
+            self._connectivity_checker.enable_incremental(self._grid)
+        self._last_connectivity_delta = ConnectivityDelta()
 
         logger.info(f"Level reset successfully: {self._current_level_id}")
 
@@ -286,20 +448,195 @@ class LevelManager:
 
         if success:
             self._move_count += 1
+            self._move_journal.record(x, y, 1)
+            self._sync_win_state()
+            if self._connectivity_checker is not None:
+                self._last_connectivity_delta = self._connectivity_checker.update_rotation(
+                    self._grid, x, y
+                )
             logger.debug(f"Tile rotated at ({x}, {y}), move count: {self._move_count}")
         else:
             logger.debug(f"Failed to rotate tile at ({x}, {y})")
 
         return success
 
+    def undo_move(self) -> bool:
+        """
+        Undo the last move.
+
+        Applies the inverse rotation delta of the last journal entry, so the
+        cost does not depend on the grid size. Decrements the move count.
+        If the recorded tile no longer exists, nothing changes.
+
+        Returns:
+            True if a move was undone, False otherwise
+
+        Example:
+            >>> manager.rotate_tile(1, 0)
+            >>> manager.undo_move()
+            True
+            >>> manager.get_move_count()
+            0
+        """
+        if self._grid is None or self._is_completed:
+            logger.warning("Cannot undo: no level loaded or level already completed")
+            return False
+
+        move = self._move_journal.peek_undo()
+        if move is None:
+            return False
+
+        x, y, delta_steps = move
+        if not self._apply_rotation_steps(x, y, -delta_steps):
+            return False
+
+        self._move_journal.undo()
+        self._move_count -= 1
+        logger.debug(f"Undid move at ({x}, {y}), move count: {self._move_count}")
+        return True
+
+    def redo_move(self) -> bool:
+        """
+        Redo the last undone move.
+
+        If the recorded tile no longer exists, nothing changes.
+
+        Returns:
+            True if a move was redone, False otherwise
+
+        Example:
+            >>> manager.undo_move()
+            >>> manager.redo_move()
+            True
+        """
+        if self._grid is None or self._is_completed:
+            logger.warning("Cannot redo: no level loaded or level already completed")
+            return False
+
+        move = self._move_journal.peek_redo()
+        if move is None:
+            return False
+
+        x, y, delta_steps = move
+        if not self._apply_rotation_steps(x, y, delta_steps):
+            return False
+
+        self._move_journal.redo()
+        self._move_count += 1
+        logger.debug(f"Redid move at ({x}, {y}), move count: {self._move_count}")
+        return True
+
+    def can_undo(self) -> bool:
+        """
+        Check if there is a move to undo.
+
+        Returns:
+            True if undo_move() would succeed
+        """
+        return self._grid is not None and not self._is_completed and self._move_journal.can_undo()
+
+    def can_redo(self) -> bool:
+        """
+        Check if there is an undone move to redo.
+
+        Returns:
+            True if redo_move() would succeed
+        """
+        return self._grid is not None and not self._is_completed and self._move_journal.can_redo()
+
+    def get_move_journal(self) -> MoveJournal:
+        """
+        Get the journal of moves made in the current level.
+
+        Returns:
+            MoveJournal (serialize with to_bytes() to store a session)
+
+        Example:
+            >>> recording = manager.get_move_journal().to_bytes()
+        """
+        return self._move_journal
+
+    def replay_moves(self, journal: MoveJournal) -> int:
+        """
+        Reset the current level and re-apply a recorded journal.
+
+        Moves are applied directly to the grid without rendering or
+        per-move connectivity updates; connectivity is rebuilt once at the
+        end. Replay stops at the first move that targets a missing or
+        non-rotatable tile.
+
+        Args:
+            journal: Recorded moves (e.g. MoveJournal(saved_bytes))
+
+        Returns:
+            Number of moves applied
+
+        Example:
+            >>> manager.load_level("data/levels/level_001.json")
+            >>> manager.replay_moves(MoveJournal(recording))
+            12
+            >>> manager.check_win_condition()
+            True
+        """
+        if self._grid is None:
+            logger.warning("Cannot replay moves: no level loaded")
+            return 0
+
+        # Copy first: the journal may be this level's own, which reset clears
+        moves = list(journal)
+        self.reset_level()
+        self._is_completed = False
+
+        applied = 0
+        for x, y, delta_steps in moves:
+            tile = self._grid.get_tile(x, y)
+            if tile is None or not tile.is_rotatable():
+                logger.warning(f"Replay stopped at move {applied}: cannot rotate ({x}, {y})")
+                break
+            tile.set_rotation((tile.rotation + delta_steps * 90) % 360)
+            self._move_journal.record(x, y, delta_steps)
+            applied += 1
+
+        self._move_count = applied
+        if self._connectivity_checker is not None:
+            self._connectivity_checker.enable_incremental(self._grid)
+        self._last_connectivity_delta = ConnectivityDelta()
+
+        logger.info(f"Replayed {applied} moves on level {self._current_level_id}")
+        return applied
+
+    def _apply_rotation_steps(self, x: int, y: int, delta_steps: int) -> bool:
+        """
+        Rotate a tile by a number of clockwise steps and update connectivity.
+
+        Args:
+            x: X coordinate of tile
+            y: Y coordinate of tile
+            delta_steps: Clockwise 90° steps (negative for counterclockwise)
+
+        Returns:
+            True if the tile was rotated, False if there is no tile at (x, y)
+        """
+        tile = self._grid.get_tile(x, y)
+        if tile is None:
+            logger.warning(f"Cannot apply rotation: no tile at ({x}, {y})")
+            return False
+
+        tile.set_rotation((tile.rotation + delta_steps * 90) % 360)
+        if self._connectivity_checker is not None:
+            self._last_connectivity_delta = self._connectivity_checker.update_rotation(
+                self._grid, x, y
+            )
+        return True
+
     def check_win_condition(self) -> bool:
         """
         Check if current level is completed.
 
-        A level is completed when all clickable tiles match their solution
-        rotation angles. For straight tiles, equivalent rotations are accepted:
-        - 0° is equivalent to 180°
-        - 90° is equivalent to 270°
+        A level is completed when all clickable tiles are at one of their
+        accepted rotations (see _init_win_state). The number of mismatched
+        tiles is maintained incrementally from the grid change journal, so
+        this check costs the same on any grid size.
 
         Returns:
             True if level is completed, False otherwise
@@ -328,76 +665,130 @@ class LevelManager:
 
         return is_match
 
-    def _check_rotation_match(self) -> bool:
+    def get_hint(self) -> Optional[Hint]:
         """
-        Check if all clickable tiles match their accepted rotations.
+        Get the next tile to rotate and its target rotation.
 
-        Each tile in the solution can have an accepted_rotations list that
-        defines which rotation angles are considered correct. This allows
-        level designers full flexibility in defining puzzle solutions.
+        The hint engine follows the grid change journal, so a hint only
+        re-solves the tiles rotated since the previous one. When several
+        rotations are accepted the target is the nearest one clockwise.
 
         Returns:
-            True if all rotations match, False otherwise
-        """
-        if self._grid is None or self._level_data is None:
-            return False
+            Hint, or None if no level is loaded, the level is completed or
+            no rotatable tile is mismatched
 
-        # Build solution map: (x, y) -> accepted_rotations
-        solution_map: Dict[tuple, list] = {}
-        for tile_data in self._level_data.solution_tiles:
-            x = tile_data.get('x')
-            y = tile_data.get('y')
-            is_clickable = tile_data.get('is_clickable', False)
-            accepted_rotations = tile_data.get('accepted_rotations')
+        Example:
+            >>> hint = manager.get_hint()
+            >>> if hint:
+            ...     print(f"Rotate ({hint.x}, {hint.y}) to {hint.target_rotation}°")
+        """
+        if self._hint_engine is None or self._is_completed:
+            return None
+        return self._hint_engine.get_hint()
 
-            if is_clickable and x is not None and y is not None:
-                # If accepted_rotations not specified, default to single rotation
-                if accepted_rotations is None:
-                    accepted_rotations = [tile_data.get('rotation', 0)]
-                solution_map[(x, y)] = accepted_rotations
+    def get_mismatch_count(self) -> int:
+        """
+        Get the number of clickable tiles not at an accepted rotation.
 
-        # Check each clickable tile
-        for pos, accepted_rotations in solution_map.items():
-            x, y = pos
-            tile = self._grid.get_tile(x, y)
+        Returns:
+            Number of mismatched tiles (0 if no level loaded)
 
-            if tile is None:
-                logger.debug(f"Tile at ({x}, {y}) not found")
-                return False
+        Example:
+            >>> manager.get_mismatch_count()
+            2
+        """
+        if self._grid is None:
+            return 0
+        self._sync_win_state()
+        return self._mismatch_count
 
-            current_rotation = tile.rotation
+    def _check_rotation_match(self) -> bool:
+        """
+        Check if all clickable tiles match their accepted rotations.
 
-            # Check if current rotation is in accepted list
-            if not self._is_rotation_accepted(current_rotation, accepted_rotations):
-                logger.debug(
-                    f"Tile at ({x}, {y}) rotation mismatch: "
-                    f"current={current_rotation}°, accepted={accepted_rotations}"
-                )
-                return False
+        Returns:
+            True if all rotations match, False otherwise
+        """
+        if self._grid is None or self._level_data is None:
+            return False
 
-        logger.debug("All tiles match accepted rotations")
-        return True
+        self._sync_win_state()
+        return self._mismatch_count == 0
 
-    def _is_rotation_accepted(self, current: int, accepted_rotations: list) -> bool:
+    def _init_win_state(self) -> None:
         """
-        Check if current rotation is in the list of accepted rotations.
+        Precompute accepted-rotation bitmasks and the mismatch count.
 
-        Args:
-            current: Current rotation angle
-            accepted_rotations: List of accepted rotation angles
-
-        Returns:
-            True if current rotation is accepted, False otherwise
+        Each tile in the solution can have an accepted_rotations list that
+        defines which rotation angles are considered correct (defaulting to
+        its solution rotation). This allows level designers full flexibility
+        in defining puzzle solutions. Clickable solution tiles become checked
+        cells; a checked cell without a tile in the grid never matches.
         """
-        # Normalize current angle to 0-359 range
-        current = current % 360
+        size = self._grid.grid_size
+        self._accepted_masks = bytearray(size * size)
+        self._missing_solution_tiles = 0
 
-        # Check if current rotation is in accepted list
-        for accepted in accepted_rotations:
-            if current == (accepted % 360):
-                return True
+        for tile_data in self._level_data.solution_tiles:
+            x = tile_data.get('x')
+            y = tile_data.get('y')
+            if not tile_data.get('is_clickable', False) or x is None or y is None:
+                continue
 
-        return False
+            accepted_rotations = tile_data.get('accepted_rotations')
+            if accepted_rotations is None:
+                accepted_rotations = [tile_data.get('rotation', 0)]
+
+            if not (0 <= x < size and 0 <= y < size):
+                logger.debug(f"Solution tile at ({x}, {y}) is outside the grid")
+                self._missing_solution_tiles += 1
+                continue
+
+            mask = _WIN_CELL_FLAG
+            for accepted in accepted_rotations:
+                accepted = accepted % 360
+                if accepted % 90 == 0:
+                    mask |= 1 << (accepted // 90)
+            self._accepted_masks[y * size + x] = mask
+
+        self._grid_subscriber = self._grid.subscribe()
+        self._recount_mismatches()
+
+    def _recount_mismatches(self) -> None:
+        """
+        Recount mismatched cells from scratch (used at load and after bulk changes).
+        """
+        size = self._grid.grid_size
+        mismatches = self._missing_solution_tiles
+        for index, mask in enumerate(self._accepted_masks):
+            if not mask:
+                continue
+            tile = self._grid.get_tile(index % size, index // size)
+            if tile is None or not mask & (1 << (tile.rotation % 360 // 90)):
+                mismatches += 1
+        self._mismatch_count = mismatches
+
+    def _sync_win_state(self) -> None:
+        """
+        Apply rotations recorded in the grid journal to the mismatch count.
+
+        Each rotation adjusts the count in O(1); rotations made directly on
+        tile objects are picked up too. Falls back to a full recount when the
+        journal cannot cover the gap (bulk change or overflow).
+        """
+        changes = self._grid.drain(self._grid_subscriber)
+        if changes is None:
+            self._recount_mismatches()
+            return
+
+        masks = self._accepted_masks
+        size = self._grid.grid_size
+        for _, x, y, old_rotation, new_rotation in changes:
+            mask = masks[y * size + x]
+            if mask:
+                was_accepted = (mask >> (old_rotation // 90)) & 1
+                is_accepted = (mask >> (new_rotation // 90)) & 1
+                self._mismatch_count += was_accepted - is_accepted
 
     def get_move_count(self) -> int:
         """
@@ -412,6 +803,25 @@ class LevelManager:
         """
         return self._move_count
 
+    def get_optimal_moves(self) -> Optional[int]:
+        """
+        Get the minimum number of clicks that solves the current level.
+
+        Computed once when the level data is created (see move_solver), so
+        it is cheap enough to read for every level in infinite mode.
+
+        Returns:
+            Minimum clicks from the initial state, or None if no level is
+            loaded or the level cannot be solved
+
+        Example:
+            >>> manager.get_optimal_moves()
+            7
+        """
+        if self._level_data is None:
+            return None
+        return self._level_data.optimal_moves
+
     def is_level_completed(self) -> bool:
         """
         Check if level is marked as completed.
@@ -457,6 +867,39 @@ class LevelManager:
 
         return self._connectivity_checker.find_path(self._grid)
 
+    def get_last_connectivity_delta(self) -> ConnectivityDelta:
+        """
+        Get the tiles whose powered state changed with the last rotation.
+
+        Maintained incrementally by the connectivity checker, so reading it
+        never triggers a traversal of the grid.
+
+        Returns:
+            ConnectivityDelta with newly powered and unpowered positions
+
+        Example:
+            >>> manager.rotate_tile(1, 0)
+            >>> delta = manager.get_last_connectivity_delta()
+            >>> for pos in delta.powered:
+            ...     print(f"Powered: {pos}")
+        """
+        return self._last_connectivity_delta
+
+    def get_powered_positions(self) -> set:
+        """
+        Get positions of all tiles currently connected to the power source.
+
+        Returns:
+            Set of (x, y) positions (empty if no level loaded)
+
+        Example:
+            >>> (0, 0) in manager.get_powered_positions()
+            True
+        """
+        if self._connectivity_checker is None:
+            return set()
+        return self._connectivity_checker.get_powered_positions()
+
     def get_current_level_id(self) -> Optional[str]:
         """
         Get current level ID.
@@ -484,6 +927,20 @@ class LevelManager:
         """
         return self._level_data
 
+    def get_level_seed(self) -> Optional[LevelSeed]:
+        """
+        Get the seed identity of the current generated level.
+
+        Returns:
+            LevelSeed if the current level was generated from a known seed,
+            None otherwise
+
+        Example:
+            >>> manager.get_level_seed().to_code()
+            '3KQ9Z-T1A0C'
+        """
+        return self._level_seed
+
     def get_grid_size(self) -> Optional[int]:
         """
         Get current grid size.
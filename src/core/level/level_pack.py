@@ -0,0 +1,190 @@
+"""
+Level Pack Module
+
+Helpers for building level packs: many generated levels stored in a single
+file with an index, so curated content can ship without one JSON file per
+level.
+
+A pack is a JSON document:
+    format, version:     pack identification
+    generator_version:   LevelGeneratorV3.GENERATOR_VERSION used to build it
+    index:               one entry per level (level_id, difficulty, grid_size, seed)
+    levels:              level dicts in the data/levels/*.json schema
+
+Functions:
+    canonical_path: Symmetry-independent form of a level's circuit
+    to_level_file_data: Convert LevelGeneratorV3 output to the level file schema
+    build_level_pack: Assemble a pack document
+    save_level_pack: Write a pack document to disk
+    load_level_pack: Read a pack document from disk
+
+Author: Circuit Repair Game Team
+Date: 2026-01-23
+"""
+
+import json
+import logging
+from pathlib import Path
+from typing import Any, Dict, List, Tuple
+
+from src.core.level.difficulty_config import DifficultyLevel
+from src.core.level.level_generator_v3 import LevelGeneratorV3
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+PACK_FORMAT = "circuit-level-pack"
+PACK_VERSION = 1
+
+Position = Tuple[int, int]
+
+
+def _symmetries(grid_size: int):
+    """
+    Build the 8 coordinate transforms of the square (dihedral group D4).
+
+    Args:
+        grid_size: Grid dimensions
+
+    Returns:
+        List of functions mapping (x, y) to (x, y)
+    """
+    last = grid_size - 1
+    return [
+        lambda x, y: (x, y),
+        lambda x, y: (last - y, x),
+        lambda x, y: (last - x, last - y),
+        lambda x, y: (y, last - x),
+        lambda x, y: (last - x, y),
+        lambda x, y: (y, x),
+        lambda x, y: (x, last - y),
+        lambda x, y: (last - y, last - x),
+    ]
+
+
+def canonical_path(path: List[Position], grid_size: int) -> Tuple[Position, ...]:
+    """
+    Get the canonical form of a level's circuit under the 8 rotations and
+    reflections of the board.
+
+    The path (power source first, terminal last) fully determines which
+    tiles are on the board and how they connect, so two levels whose paths
+    map onto each other under a symmetry are the same puzzle seen from a
+    different side. Path direction is kept: swapping the power source and
+    the terminal gives a different level.
+
+    Args:
+        path: Positions from power source to terminal
+        grid_size: Grid dimensions
+
+    Returns:
+        Smallest transformed path; equal for all symmetric variants
+
+    Example:
+        >>> canonical_path([(0, 0), (0, 1), (1, 1)], 3) == \\
+        ...     canonical_path([(2, 2), (2, 1), (1, 1)], 3)
+        True
+    """
+    return min(
+        tuple(transform(x, y) for x, y in path)
+        for transform in _symmetries(grid_size)
+    )
+
+
+def to_level_file_data(
+    generated: Dict[str, Any],
+    difficulty: DifficultyLevel,
+    level_id: str
+) -> Dict[str, Any]:
+    """
+    Convert LevelGeneratorV3 output to the level file schema.
+
+    Args:
+        generated: Level dict returned by LevelGeneratorV3.generate()
+        difficulty: Difficulty the level was generated for
+        level_id: ID of the level in the pack
+
+    Returns:
+        Level dict accepted by LevelLoader
+    """
+    return {
+        'level_id': level_id,
+        'version': "1.0",
+        'name': level_id,
+        'difficulty': list(DifficultyLevel).index(difficulty) + 1,
+        'grid_size': generated['grid_size'],
+        'seed': generated.get('seed'),
+        'solution': {'tiles': generated['solution']},
+        'initial_state': {'rotated_tiles': generated['initial_state']},
+    }
+
+
+def build_level_pack(levels: List[Tuple[DifficultyLevel, Dict[str, Any]]]) -> Dict[str, Any]:
+    """
+    Assemble a pack document.
+
+    Args:
+        levels: (difficulty, LevelGeneratorV3 output) pairs in pack order
+
+    Returns:
+        Pack document with index and levels
+    """
+    counters: Dict[DifficultyLevel, int] = {}
+    index = []
+    entries = []
+    for difficulty, generated in levels:
+        number = counters.get(difficulty, 0) + 1
+        counters[difficulty] = number
+        level_id = f"{difficulty.value}_{number:05d}"
+
+        index.append({
+            'level_id': level_id,
+            'difficulty': difficulty.value,
+            'grid_size': generated['grid_size'],
+            'seed': generated.get('seed'),
+        })
+        entries.append(to_level_file_data(generated, difficulty, level_id))
+
+    return {
+        'format': PACK_FORMAT,
+        'version': PACK_VERSION,
+        'generator_version': LevelGeneratorV3.GENERATOR_VERSION,
+        'index': index,
+        'levels': entries,
+    }
+
+
+def save_level_pack(filepath: str, pack: Dict[str, Any]) -> None:
+    """
+    Write a pack document to disk.
+
+    Args:
+        filepath: Output file path
+        pack: Pack document from build_level_pack()
+    """
+    path = Path(filepath)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(pack, f, ensure_ascii=False, separators=(',', ':'))
+    logger.info(f"Level pack written: {path} ({len(pack['index'])} levels)")
+
+
+def load_level_pack(filepath: str) -> Dict[str, Any]:
+    """
+    Read a pack document from disk.
+
+    Args:
+        filepath: Pack file path
+
+    Returns:
+        Pack document
+
+    Raises:
+        ValueError: If the file is not a supported level pack
+    """
+    with open(filepath, 'r', encoding='utf-8') as f:
+        pack = json.load(f)
+
+    if pack.get('format') != PACK_FORMAT or pack.get('version') != PACK_VERSION:
+        raise ValueError(f"Not a supported level pack: {filepath}")
+    return pack
@@ -0,0 +1,309 @@
+"""
+Binary Level Pack Module
+
+Compact binary container for large level catalogs. The file is opened with
+mmap and only the header is read up front, so opening a pack costs the same
+for 10 levels or 100k; each level is decoded on demand from its record.
+
+File layout (little-endian):
+    header:  magic "CRLP", format version (u16), reserved (u16),
+             level count (u32), reserved (u32)                      16 bytes
+    index:   level count + 1 record offsets (u64); record i spans
+             offsets[i]..offsets[i + 1]
+    records: record header + one fixed-width cell per grid position
+
+Record header: grid size (u8), difficulty (u8), flags (u16), level
+number (u32), seed (u32). Flag bit 0 marks a valid seed.
+
+Cells are stored row by row (index y * grid_size + x), 2 bytes each:
+    byte 0: bits 0-2 tile type code (0 = no tile), bit 3 clickable,
+            bits 4-5 solution rotation step, bits 6-7 initial rotation step
+    byte 1: bits 0-3 accepted rotation mask (bit k accepts k * 90 degrees),
+            bit 4 set if the tile lists accepted rotations
+
+Classes:
+    BinaryLevelPack: Memory-mapped read-only access to a pack file
+
+Functions:
+    write_binary_level_pack: Write levels in the level file schema to a pack
+
+Author: Circuit Repair Game Team
+Date: 2026-01-23
+"""
+
+import mmap
+import struct
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from src.core.grid.tile_type import TileType, TILE_TYPES_BY_CODE
+from src.core.level.difficulty_config import DifficultyLevel
+from src.core.level.level_loader import LevelData
+
+PACK_MAGIC = b"CRLP"
+BINARY_PACK_VERSION = 1
+
+_HEADER = struct.Struct("<4sHHII")
+_OFFSET = struct.Struct("<Q")
+_RECORD_HEADER = struct.Struct("<BBHII")
+
+_FLAG_HAS_SEED = 0x1
+_CELL_CLICKABLE = 0x08
+_CELL_HAS_ACCEPTED = 0x10
+
+# Decoded byte 0 of a cell: (type name, clickable, solution rotation, initial rotation)
+_CELL_TABLE = tuple(
+    (
+        TILE_TYPES_BY_CODE[value & 0x7].value if 0 < (value & 0x7) < len(TILE_TYPES_BY_CODE) else None,
+        bool(value & _CELL_CLICKABLE),
+        ((value >> 4) & 0x3) * 90,
+        ((value >> 6) & 0x3) * 90,
+    )
+    for value in range(256)
+)
+# Accepted rotation mask -> rotations in degrees
+_ACCEPTED_TABLE = tuple(
+    tuple(step * 90 for step in range(4) if mask & (1 << step))
+    for mask in range(16)
+)
+
+
+def _rotation_step(rotation: int) -> int:
+    """
+    Convert a rotation in degrees to a step.
+
+    Raises:
+        ValueError: If the rotation is not a multiple of 90
+    """
+    if rotation % 90 != 0:
+        raise ValueError(f"Rotation must be a multiple of 90: {rotation}")
+    return (rotation // 90) % 4
+
+
+def _level_id(difficulty: int, number: int) -> str:
+    """Build the level ID used by level packs (see level_pack.build_level_pack)."""
+    levels = list(DifficultyLevel)
+    if 1 <= difficulty <= len(levels):
+        return f"{levels[difficulty - 1].value}_{number:05d}"
+    return f"level_{number:05d}"
+
+
+def _encode_level(level: Dict[str, Any], number: int) -> bytes:
+    """
+    Encode one level (level file schema) as a record.
+
+    Args:
+        level: Level dict with grid_size, difficulty, solution and initial_state
+        number: Level number within its difficulty
+
+    Returns:
+        Encoded record
+
+    Raises:
+        ValueError: If the level does not fit the format
+    """
+    grid_size = level['grid_size']
+    if not 1 <= grid_size <= 255:
+        raise ValueError(f"Grid size out of range: {grid_size}")
+
+    cells = bytearray(2 * grid_size * grid_size)
+    for tile in level['solution']['tiles']:
+        index = 2 * (tile['y'] * grid_size + tile['x'])
+        tile_type = TileType.from_string(tile['type'])
+        clickable = tile.get(
+            'is_clickable',
+            tile_type not in (TileType.POWER_SOURCE, TileType.TERMINAL, TileType.EMPTY)
+        )
+        step = _rotation_step(tile['rotation'])
+        cells[index] = tile_type.to_code() | (_CELL_CLICKABLE if clickable else 0) | (step << 4) | (step << 6)
+
+        if 'accepted_rotations' in tile:
+            mask = 0
+            for rotation in tile['accepted_rotations']:
+                mask |= 1 << _rotation_step(rotation)
+            cells[index + 1] = mask | _CELL_HAS_ACCEPTED
+
+    for tile in level['initial_state']['rotated_tiles']:
+        index = 2 * (tile['y'] * grid_size + tile['x'])
+        cells[index] = (cells[index] & 0x3F) | (_rotation_step(tile['rotation']) << 6)
+
+    seed = level.get('seed')
+    header = _RECORD_HEADER.pack(
+        grid_size,
+        level['difficulty'],
+        _FLAG_HAS_SEED if seed is not None else 0,
+        number,
+        seed if seed is not None else 0
+    )
+    return header + bytes(cells)
+
+
+def write_binary_level_pack(filepath: str, levels: List[Dict[str, Any]]) -> None:
+    """
+    Write levels to a binary pack.
+
+    Levels are numbered per difficulty in order, matching the IDs that
+    level_pack.build_level_pack() assigns.
+
+    Args:
+        filepath: Output file path
+        levels: Level dicts in the level file schema (e.g. pack['levels'])
+
+    Raises:
+        ValueError: If a level does not fit the format
+    """
+    counters: Dict[int, int] = {}
+    records = []
+    for level in levels:
+        number = counters.get(level['difficulty'], 0) + 1
+        counters[level['difficulty']] = number
+        records.append(_encode_level(level, number))
+
+    offset = _HEADER.size + _OFFSET.size * (len(records) + 1)
+    offsets = [offset]
+    for record in records:
+        offset += len(record)
+        offsets.append(offset)
+
+    path = Path(filepath)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with open(path, 'wb') as f:
+        f.write(_HEADER.pack(PACK_MAGIC, BINARY_PACK_VERSION, 0, len(records), 0))
+        f.write(struct.pack(f"<{len(offsets)}Q", *offsets))
+        for record in records:
+            f.write(record)
+
+
+class BinaryLevelPack:
+    """
+    Memory-mapped read-only view of a binary level pack.
+
+    Opening reads only the 16-byte header; get_level_data() reads one index
+    entry pair and one record.
+
+    Attributes:
+        filepath: Path of the pack file
+        _file: Open file object
+        _map: Memory map of the file
+        _count: Number of levels
+
+    Example:
+        >>> with BinaryLevelPack("data/packs/levels.pack") as pack:
+        ...     level_data = pack.get_level_data(12345)
+    """
+
+    def __init__(self, filepath: str) -> None:
+        """
+        Open a pack file.
+
+        Args:
+            filepath: Pack file path
+
+        Raises:
+            OSError: If the file cannot be opened
+            ValueError: If the file is not a supported binary pack
+        """
+        self.filepath = filepath
+        self._file = open(filepath, 'rb')
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # mmap rejects empty files
+            self._file.close()
+            raise ValueError(f"Not a binary level pack: {filepath}")
+
+        if len(self._map) < _HEADER.size:
+            self.close()
+            raise ValueError(f"Not a binary level pack: {filepath}")
+        magic, version, _, count, _ = _HEADER.unpack_from(self._map, 0)
+        if magic != PACK_MAGIC or version != BINARY_PACK_VERSION:
+            self.close()
+            raise ValueError(f"Not a binary level pack: {filepath}")
+        self._count = count
+
+    def __len__(self) -> int:
+        """Return the number of levels."""
+        return self._count
+
+    def _record_span(self, index: int):
+        """Get (start, end) of a record."""
+        if not 0 <= index < self._count:
+            raise IndexError(f"Level index out of range: {index}")
+        position = _HEADER.size + index * _OFFSET.size
+        return struct.unpack_from("<QQ", self._map, position)
+
+    def get_level_data(self, index: int) -> LevelData:
+        """
+        Decode one level.
+
+        Args:
+            index: Level index in the pack (0-based)
+
+        Returns:
+            LevelData of the level
+
+        Raises:
+            IndexError: If index is out of range
+        """
+        start, end = self._record_span(index)
+        grid_size, difficulty, _, number, _ = _RECORD_HEADER.unpack_from(self._map, start)
+        cells = self._map[start + _RECORD_HEADER.size:end]
+
+        cell_table = _CELL_TABLE
+        solution_tiles = []
+        rotated_tiles = []
+        for cell in range(grid_size * grid_size):
+            tile_type, clickable, rotation, initial_rotation = cell_table[cells[2 * cell]]
+            if tile_type is None:
+                continue
+            y, x = divmod(cell, grid_size)
+            tile = {'x': x, 'y': y, 'type': tile_type, 'rotation': rotation, 'is_clickable': clickable}
+            extra = cells[2 * cell + 1]
+            if extra & _CELL_HAS_ACCEPTED:
+                tile['accepted_rotations'] = list(_ACCEPTED_TABLE[extra & 0xF])
+            solution_tiles.append(tile)
+            if initial_rotation != rotation:
+                rotated_tiles.append({'x': x, 'y': y, 'rotation': initial_rotation})
+
+        level_id = _level_id(difficulty, number)
+        return LevelData(
+            level_id=level_id,
+            version="1.0",
+            name=level_id,
+            difficulty=difficulty,
+            grid_size=grid_size,
+            solution_tiles=solution_tiles,
+            rotated_tiles=rotated_tiles
+        )
+
+    def get_seed(self, index: int) -> Optional[int]:
+        """
+        Get the generator seed of a level.
+
+        Args:
+            index: Level index in the pack
+
+        Returns:
+            Seed, or None if the level has no recorded seed
+        """
+        start, _ = self._record_span(index)
+        _, _, flags, _, seed = _RECORD_HEADER.unpack_from(self._map, start)
+        return seed if flags & _FLAG_HAS_SEED else None
+
+    def close(self) -> None:
+        """Close the memory map and the file."""
+        if getattr(self, '_map', None) is not None:
+            self._map.close()
+            self._map = None
+        if not self._file.closed:
+            self._file.close()
+
+    def __enter__(self) -> 'BinaryLevelPack':
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def __repr__(self) -> str:
+        """Return detailed representation of the pack."""
+        return f"BinaryLevelPack({self.filepath!r}, levels={self._count})"
@@ -0,0 +1,209 @@
+"""
+Level Pipeline Module
+
+This module provides the LevelPipeline class, which keeps generated levels
+ready ahead of time for infinite mode. A background worker thread fills a
+bounded queue per difficulty while the current level is being played, so
+moving to the next level only pops an already generated level.
+
+Classes:
+    LevelPipeline: Background pre-generation of LevelGeneratorV3 levels
+
+Author: Circuit Repair Game Team
+Date: 2026-01-23
+"""
+
+import logging
+import queue
+import threading
+from typing import Dict, Optional
+
+from src.config.constants import LEVEL_PREGENERATE_COUNT
+from src.core.level.difficulty_config import DifficultyLevel
+from src.core.level.level_generator_v3 import LevelGeneratorV3
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+
+class LevelPipeline:
+    """
+    Background pre-generation queue for infinite mode.
+
+    Keeps up to `depth` generated levels ready for every difficulty. The
+    worker always tops up the active difficulty first, then the others, and
+    sleeps while every queue is full. get() never waits for the worker: if
+    no level is ready it generates one on the calling thread.
+
+    Attributes:
+        _depth: Number of levels kept ready per difficulty
+        _queues: Bounded queue of generated levels per difficulty
+        _active: Difficulty the worker fills first
+        _wakeup: Event set when a queue has room or the pipeline stops
+        _stopping: Event set to stop the worker
+        _worker: Worker thread (None while stopped)
+
+    Example:
+        >>> pipeline = LevelPipeline()
+        >>> pipeline.start(DifficultyLevel.HARD)
+        >>> generated = pipeline.get(DifficultyLevel.HARD)
+        >>> generated['grid_size']
+        6
+        >>> pipeline.stop()
+    """
+
+    def __init__(self, depth: int = LEVEL_PREGENERATE_COUNT) -> None:
+        """
+        Initialize LevelPipeline.
+
+        Args:
+            depth: Number of levels kept ready per difficulty
+
+        Raises:
+            ValueError: If depth is less than 1
+        """
+        if depth < 1:
+            raise ValueError(f"Pipeline depth must be at least 1, got {depth}")
+
+        self._depth = depth
+        self._queues: Dict[DifficultyLevel, queue.Queue] = {
+            difficulty: queue.Queue(maxsize=depth) for difficulty in DifficultyLevel
+        }
+        self._active: DifficultyLevel = DifficultyLevel.NORMAL
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+
+        logger.info(f"LevelPipeline initialized: depth={depth}")
+
+    def start(self, difficulty: Optional[DifficultyLevel] = None) -> None:
+        """
+        Start the worker thread (no-op if already running).
+
+        Args:
+            difficulty: Optional difficulty to fill first
+        """
+        if difficulty is not None:
+            self.set_difficulty(difficulty)
+
+        if self.is_running():
+            return
+
+        self._stopping.clear()
+        self._worker = threading.Thread(
+            target=self._run, name="LevelPipelineWorker", daemon=True
+        )
+        self._worker.start()
+        logger.info(f"LevelPipeline worker started (active: {self._active.value})")
+
+    def stop(self, timeout: Optional[float] = 1.0) -> None:
+        """
+        Stop the worker thread. Levels already generated stay queued.
+
+        Args:
+            timeout: Seconds to wait for the worker to finish
+        """
+        if self._worker is None:
+            return
+
+        self._stopping.set()
+        self._wakeup.set()
+        self._worker.join(timeout)
+        self._worker = None
+        logger.info("LevelPipeline worker stopped")
+
+    def is_running(self) -> bool:
+        """
+        Check if the worker thread is running.
+
+        Returns:
+            True if the worker is alive
+        """
+        return self._worker is not None and self._worker.is_alive()
+
+    def set_difficulty(self, difficulty: DifficultyLevel) -> None:
+        """
+        Set the difficulty the worker fills first.
+
+        Args:
+            difficulty: Active difficulty
+        """
+        self._active = difficulty
+        self._wakeup.set()
+
+    def get(self, difficulty: DifficultyLevel) -> Dict:
+        """
+        Get the next generated level for a difficulty.
+
+        Pops a ready level if one is queued; otherwise generates one on the
+        calling thread.
+
+        Args:
+            difficulty: Difficulty of the level
+
+        Returns:
+            Generated level dict (see LevelGeneratorV3.generate)
+
+        Raises:
+            RuntimeError: If synchronous generation fails
+        """
+        try:
+            generated = self._queues[difficulty].get_nowait()
+        except queue.Empty:
+            logger.info(f"No pre-generated {difficulty.value} level ready, generating now")
+            generated = LevelGeneratorV3(difficulty=difficulty).generate()
+        else:
+            logger.debug(f"Using pre-generated {difficulty.value} level")
+
+        # A slot was freed: let the worker refill it
+        self._wakeup.set()
+        return generated
+
+    def get_ready_count(self, difficulty: DifficultyLevel) -> int:
+        """
+        Get the number of levels ready for a difficulty.
+
+        Args:
+            difficulty: Difficulty to query
+
+        Returns:
+            Number of queued levels
+        """
+        return self._queues[difficulty].qsize()
+
+    def _next_difficulty_to_fill(self) -> Optional[DifficultyLevel]:
+        """
+        Pick the difficulty the worker should generate for next.
+
+        Returns:
+            Active difficulty if its queue has room, otherwise the first
+            other difficulty with room, or None if every queue is full
+        """
+        if not self._queues[self._active].full():
+            return self._active
+        for difficulty in DifficultyLevel:
+            if not self._queues[difficulty].full():
+                return difficulty
+        return None
+
+    def _run(self) -> None:
+        """Worker loop: generate levels until every queue is full, then sleep."""
+        while not self._stopping.is_set():
+            difficulty = self._next_difficulty_to_fill()
+            if difficulty is None:
+                self._wakeup.wait()
+                self._wakeup.clear()
+                continue
+
+            try:
+                generated = LevelGeneratorV3(difficulty=difficulty).generate()
+            except RuntimeError as e:
+                logger.error(f"Background generation failed for {difficulty.value}: {e}")
+                self._stopping.wait(0.1)
+                continue
+
+            try:
+                self._queues[difficulty].put_nowait(generated)
+            except queue.Full:
+                # Only the worker fills queues; this cannot normally happen
+                continue
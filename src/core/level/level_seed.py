@@ -0,0 +1,158 @@
+"""
+Level Seed Module
+
+Defines LevelSeed, the (difficulty, grid size, seed) triple that fully
+determines a LevelGeneratorV3 level, and its compact shareable code.
+
+Seed code layout (10 base32 characters shown as "XXXXX-XXXXX"):
+    bits 0-1:   difficulty index (order of DifficultyLevel)
+    bits 2-9:   grid size
+    bits 10-41: 32-bit generator seed
+
+The 42 payload bits fill the first nine characters; the last one is a
+checksum that catches mistyped codes.
+
+The alphabet is Crockford's base32, so codes are case-insensitive and the
+easily confused letters I, L and O are read as 1, 1 and 0.
+
+Classes:
+    LevelSeed: Reproducible level identity with seed code conversion
+
+Author: Circuit Repair Game Team
+Date: 2026-01-23
+"""
+
+import random
+import zlib
+from dataclasses import dataclass
+from datetime import date
+
+from src.core.level.difficulty_config import DifficultyLevel, DifficultyConfig
+
+# Crockford base32 alphabet (no I, L, O, U)
+_ALPHABET = "0123456789ABCDEFGHJKMNPQRSTVWXYZ"
+_DECODE = {char: value for value, char in enumerate(_ALPHABET)}
+_DECODE.update({'I': 1, 'L': 1, 'O': 0})
+
+_PAYLOAD_CHARS = 9
+MAX_SEED = (1 << 32) - 1
+MAX_GRID_SIZE = (1 << 8) - 1
+
+
+def _checksum(values) -> int:
+    """Position-weighted checksum of base32 digit values."""
+    return sum((index + 1) * value for index, value in enumerate(values)) % 32
+
+
+@dataclass(frozen=True)
+class LevelSeed:
+    """
+    Identity of a reproducible generated level.
+
+    Attributes:
+        difficulty: Difficulty the level is generated for
+        grid_size: Grid dimensions
+        seed: 32-bit generator seed
+
+    Example:
+        >>> level_seed = LevelSeed(DifficultyLevel.HARD, 6, 123456789)
+        >>> code = level_seed.to_code()
+        >>> LevelSeed.from_code(code) == level_seed
+        True
+    """
+    difficulty: DifficultyLevel
+    grid_size: int
+    seed: int
+
+    def __post_init__(self) -> None:
+        """
+        Validate field ranges.
+
+        Raises:
+            ValueError: If the grid size or seed does not fit in a seed code
+        """
+        if not 1 <= self.grid_size <= MAX_GRID_SIZE:
+            raise ValueError(f"Grid size out of range: {self.grid_size}")
+        if not 0 <= self.seed <= MAX_SEED:
+            raise ValueError(f"Seed out of range: {self.seed}")
+
+    @staticmethod
+    def daily(difficulty: DifficultyLevel, day: date) -> 'LevelSeed':
+        """
+        Get the daily challenge seed for a difficulty.
+
+        Every player gets the same level for the same day and difficulty.
+
+        Args:
+            difficulty: Difficulty level
+            day: Challenge date
+
+        Returns:
+            LevelSeed for that day
+        """
+        seed = zlib.crc32(f"{day.isoformat()}/{difficulty.value}".encode('ascii'))
+        min_size, max_size = DifficultyConfig.get_config(difficulty).grid_size_range
+        grid_size = random.Random(seed).randint(min_size, max_size)
+        return LevelSeed(difficulty, grid_size, seed)
+
+    def to_code(self) -> str:
+        """
+        Encode as a compact seed code.
+
+        Returns:
+            Seed code, e.g. "3KQ9Z-T1A0C"
+        """
+        difficulty_index = list(DifficultyLevel).index(self.difficulty)
+        packed = (self.seed << 10) | (self.grid_size << 2) | difficulty_index
+
+        digits = []
+        for _ in range(_PAYLOAD_CHARS):
+            digits.append(packed & 31)
+            packed >>= 5
+        digits.reverse()
+        digits.append(_checksum(digits))
+
+        chars = ''.join(_ALPHABET[value] for value in digits)
+        return f"{chars[:5]}-{chars[5:]}"
+
+    @staticmethod
+    def from_code(code: str) -> 'LevelSeed':
+        """
+        Decode a seed code produced by to_code().
+
+        Hyphens, spaces and letter case are ignored.
+
+        Args:
+            code: Seed code
+
+        Returns:
+            Decoded LevelSeed
+
+        Raises:
+            ValueError: If the code is malformed or its checksum does not match
+        """
+        chars = code.replace('-', '').replace(' ', '').upper()
+        if len(chars) != _PAYLOAD_CHARS + 1:
+            raise ValueError(f"Seed code must have {_PAYLOAD_CHARS + 1} characters: {code!r}")
+
+        try:
+            digits = [_DECODE[char] for char in chars]
+        except KeyError as e:
+            raise ValueError(f"Invalid character {e.args[0]!r} in seed code {code!r}") from None
+
+        payload, check = digits[:-1], digits[-1]
+        if _checksum(payload) != check:
+            raise ValueError(f"Seed code checksum mismatch: {code!r}")
+
+        packed = 0
+        for value in payload:
+            packed = (packed << 5) | value
+
+        difficulty_index = packed & 0x3
+        grid_size = (packed >> 2) & MAX_GRID_SIZE
+        seed = packed >> 10
+        return LevelSeed(list(DifficultyLevel)[difficulty_index], grid_size, seed)
+
+    def __str__(self) -> str:
+        """Return the seed code."""
+        return self.to_code()
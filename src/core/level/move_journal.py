@@ -0,0 +1,203 @@
+"""
+Move Journal Module
+
+This module provides the MoveJournal class, a compact record of the moves
+made in a level. Each move is packed into a single unsigned 32-bit integer
+so thousands of recorded sessions can be stored and replayed cheaply.
+
+Packed layout (low bits first):
+    bits 0-1:   rotation delta in clockwise 90° steps (1 = clockwise, 3 = counterclockwise)
+    bits 4-17:  y coordinate
+    bits 18-31: x coordinate
+
+Classes:
+    MoveJournal: Append-only move record with an undo/redo cursor
+
+Author: Circuit Repair Game Team
+Date: 2026-01-20
+"""
+
+import sys
+from array import array
+from typing import Iterator, Optional, Tuple
+
+# Maximum coordinate that fits in a packed move
+MAX_MOVE_COORDINATE = (1 << 14) - 1
+
+# A single unpacked move: (x, y, rotation delta in clockwise steps)
+Move = Tuple[int, int, int]
+
+
+def pack_move(x: int, y: int, delta_steps: int) -> int:
+    """
+    Pack a move into a single integer.
+
+    Args:
+        x: X coordinate of the rotated tile
+        y: Y coordinate of the rotated tile
+        delta_steps: Rotation delta in clockwise 90° steps
+
+    Returns:
+        Packed move
+
+    Raises:
+        ValueError: If a coordinate does not fit in the packed layout
+
+    Example:
+        >>> unpack_move(pack_move(3, 5, 1))
+        (3, 5, 1)
+    """
+    if not (0 <= x <= MAX_MOVE_COORDINATE and 0 <= y <= MAX_MOVE_COORDINATE):
+        raise ValueError(f"Move coordinates out of range: ({x}, {y})")
+    return (x << 18) | (y << 4) | (delta_steps % 4)
+
+
+def unpack_move(packed: int) -> Move:
+    """
+    Unpack a move produced by pack_move().
+
+    Args:
+        packed: Packed move
+
+    Returns:
+        (x, y, delta_steps) tuple
+    """
+    return (packed >> 18, (packed >> 4) & MAX_MOVE_COORDINATE, packed & 0x3)
+
+
+class MoveJournal:
+    """
+    Compact record of the moves made in a level.
+
+    Moves are stored in an array of unsigned 32-bit integers (4 bytes per
+    move). A cursor separates applied moves from undone ones: undo() and
+    redo() only move the cursor, and recording a new move after an undo
+    discards the undone tail.
+
+    Attributes:
+        _moves: Packed moves
+        _cursor: Number of currently applied moves
+
+    Example:
+        >>> journal = MoveJournal()
+        >>> journal.record(1, 0, 1)
+        >>> journal.undo()
+        (1, 0, 1)
+        >>> journal.redo()
+        (1, 0, 1)
+        >>> len(journal)
+        1
+    """
+
+    def __init__(self, data: bytes = b"") -> None:
+        """
+        Initialize MoveJournal.
+
+        Args:
+            data: Serialized moves from to_bytes() (all treated as applied)
+        """
+        self._moves = array('I')
+        if data:
+            self._moves.frombytes(data)
+            if sys.byteorder == 'big':
+                self._moves.byteswap()
+        self._cursor: int = len(self._moves)
+
+    def record(self, x: int, y: int, delta_steps: int = 1) -> None:
+        """
+        Record a move, discarding any undone moves.
+
+        Args:
+            x: X coordinate of the rotated tile
+            y: Y coordinate of the rotated tile
+            delta_steps: Rotation delta in clockwise 90° steps
+        """
+        if self._cursor < len(self._moves):
+            del self._moves[self._cursor:]
+        self._moves.append(pack_move(x, y, delta_steps))
+        self._cursor += 1
+
+    def peek_undo(self) -> Optional[Move]:
+        """
+        Get the move undo() would step back over, without moving the cursor.
+
+        Returns:
+            The last applied move, or None if there is nothing to undo
+        """
+        if self._cursor == 0:
+            return None
+        return unpack_move(self._moves[self._cursor - 1])
+
+    def peek_redo(self) -> Optional[Move]:
+        """
+        Get the move redo() would step forward over, without moving the cursor.
+
+        Returns:
+            The next undone move, or None if there is nothing to redo
+        """
+        if self._cursor == len(self._moves):
+            return None
+        return unpack_move(self._moves[self._cursor])
+
+    def undo(self) -> Optional[Move]:
+        """
+        Step the cursor back over the last applied move.
+
+        Returns:
+            The undone move, or None if there is nothing to undo
+        """
+        if self._cursor == 0:
+            return None
+        self._cursor -= 1
+        return unpack_move(self._moves[self._cursor])
+
+    def redo(self) -> Optional[Move]:
+        """
+        Step the cursor forward over the next undone move.
+
+        Returns:
+            The redone move, or None if there is nothing to redo
+        """
+        if self._cursor == len(self._moves):
+            return None
+        move = unpack_move(self._moves[self._cursor])
+        self._cursor += 1
+        return move
+
+    def can_undo(self) -> bool:
+        """Check if there is a move to undo."""
+        return self._cursor > 0
+
+    def can_redo(self) -> bool:
+        """Check if there is a move to redo."""
+        return self._cursor < len(self._moves)
+
+    def clear(self) -> None:
+        """Remove all moves."""
+        del self._moves[:]
+        self._cursor = 0
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize the applied moves (little-endian, 4 bytes per move).
+
+        Returns:
+            Serialized moves, accepted by MoveJournal(data)
+        """
+        applied = self._moves[:self._cursor]
+        if sys.byteorder == 'big':
+            applied.byteswap()
+        return applied.tobytes()
+
+    def __len__(self) -> int:
+        """Return the number of applied moves."""
+        return self._cursor
+
+    def __iter__(self) -> Iterator[Move]:
+        """Iterate over the applied moves in order."""
+        for index in range(self._cursor):
+            yield unpack_move(self._moves[index])
+
+    def __repr__(self) -> str:
+        """Return detailed representation of the journal."""
+        return f"MoveJournal(applied={self._cursor}, total={len(self._moves)})"
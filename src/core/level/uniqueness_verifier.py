@@ -0,0 +1,298 @@
+"""
+Uniqueness Verifier Module
+
+Checks whether a board has exactly one power-to-terminal route, so rotatable
+distractor tiles can be placed off the solution path without creating an
+alternative solution.
+
+Every tile has at most two ports, so a powered route is a simple chain:
+power source -> rotatable tiles -> terminal. On such a chain a straight tile
+must continue straight and a corner tile must turn, so the search only
+branches at corners. Before searching, edge-compatibility propagation
+removes every port mask that cannot be matched by a neighbour (arc
+consistency); cells left without masks can never be on a route, and the
+search is further pruned by a reachability check at each branch.
+
+Coordinates follow LevelGeneratorV3's screen convention: x is the column
+(increasing to the right) and y is the row (increasing downward). Port masks
+use the Tile tables (N=1, E=2, S=4, W=8, clockwise rotation), which match
+the V3 sprite definitions.
+
+Classes:
+    UniquenessVerifier: Route enumeration with constraint propagation
+
+Author: Circuit Repair Game Team
+Date: 2026-01-23
+"""
+
+import logging
+from collections import deque
+from typing import Dict, List, Optional, Set, Tuple
+
+from src.core.grid.tile import CONNECTION_MASKS_BY_CODE
+from src.core.grid.tile_type import TileType
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+Position = Tuple[int, int]
+
+# Port bit -> (dx, dy) in screen coordinates
+_PORT_STEPS: Tuple[Tuple[int, int, int], ...] = (
+    (1, 0, -1),   # N: up
+    (2, 1, 0),    # E: right
+    (4, 0, 1),    # S: down
+    (8, -1, 0),   # W: left
+)
+_OPPOSITE = {1: 4, 2: 8, 4: 1, 8: 2}
+
+
+class UniquenessVerifier:
+    """
+    Enumerates the power-to-terminal routes of a board.
+
+    A route is a chain of cells from the power source to the terminal in
+    which every pair of consecutive cells has facing ports. Rotations that
+    give the same ports (e.g. a straight at 0 or 180 degrees) are the same
+    route, so a board with exactly one route has a unique solution.
+
+    Attributes:
+        grid_size: Grid dimensions
+        _domains: Candidate port masks per cell (index y * grid_size + x)
+        _power: Power source cell index
+        _terminal: Terminal cell index
+
+    Example:
+        >>> verifier = UniquenessVerifier(level['grid_size'], level['solution'])
+        >>> verifier.is_unique()
+        True
+        >>> verifier.verify(level['path'])
+        True
+    """
+
+    def __init__(self, grid_size: int, tiles: List[Dict]) -> None:
+        """
+        Build the verifier from tile dicts.
+
+        Args:
+            grid_size: Grid dimensions
+            tiles: Tile dicts with x, y, type and rotation (the rotation of
+                rotatable tiles is ignored)
+
+        Raises:
+            ValueError: If the board does not have exactly one power source
+                and one terminal
+        """
+        self.grid_size = grid_size
+        self._domains: List[Set[int]] = [set() for _ in range(grid_size * grid_size)]
+        power = []
+        terminal = []
+
+        for tile in tiles:
+            tile_type = TileType.from_string(tile['type'])
+            index = tile['y'] * grid_size + tile['x']
+            code = tile_type.to_code()
+            if tile_type.is_rotatable():
+                self._domains[index] = {CONNECTION_MASKS_BY_CODE[code * 4 + step] for step in range(4)}
+            elif tile_type.has_circuit():
+                mask = CONNECTION_MASKS_BY_CODE[code * 4 + (tile['rotation'] // 90) % 4]
+                self._domains[index] = {mask}
+                (power if tile_type == TileType.POWER_SOURCE else terminal).append(index)
+
+        if len(power) != 1 or len(terminal) != 1:
+            raise ValueError(
+                f"Board needs one power source and one terminal, "
+                f"got {len(power)} and {len(terminal)}"
+            )
+        self._power = power[0]
+        self._terminal = terminal[0]
+        self._propagate()
+
+    def _neighbor(self, index: int, port: int) -> Optional[int]:
+        """
+        Get the cell across a port.
+
+        Args:
+            index: Cell index
+            port: Port bit
+
+        Returns:
+            Neighbour cell index, or None at the board edge
+        """
+        for bit, dx, dy in _PORT_STEPS:
+            if bit == port:
+                y, x = divmod(index, self.grid_size)
+                nx, ny = x + dx, y + dy
+                if 0 <= nx < self.grid_size and 0 <= ny < self.grid_size:
+                    return ny * self.grid_size + nx
+                return None
+        return None
+
+    def _supported(self, index: int, mask: int) -> bool:
+        """Check that every port of mask faces a neighbour that can return it."""
+        for bit, _, _ in _PORT_STEPS:
+            if mask & bit:
+                neighbor = self._neighbor(index, bit)
+                if neighbor is None:
+                    return False
+                opposite = _OPPOSITE[bit]
+                if not any(m & opposite for m in self._domains[neighbor]):
+                    return False
+        return True
+
+    def _propagate(self) -> None:
+        """Remove unsupported port masks until the domains are arc consistent."""
+        queue = deque(index for index, domain in enumerate(self._domains) if domain)
+        queued = set(queue)
+        removed = 0
+
+        while queue:
+            index = queue.popleft()
+            queued.discard(index)
+            domain = self._domains[index]
+            unsupported = {mask for mask in domain if not self._supported(index, mask)}
+            if not unsupported:
+                continue
+
+            domain -= unsupported
+            removed += len(unsupported)
+            for bit, _, _ in _PORT_STEPS:
+                neighbor = self._neighbor(index, bit)
+                if neighbor is not None and self._domains[neighbor] and neighbor not in queued:
+                    queue.append(neighbor)
+                    queued.add(neighbor)
+
+        logger.debug(f"Propagation removed {removed} port masks")
+
+    def _can_reach_terminal(self, start: int, visited: Set[int]) -> bool:
+        """
+        Check that the terminal is reachable from a cell through unvisited
+        cells over edges both sides can use.
+
+        Args:
+            start: Cell index to search from
+            visited: Cells already on the partial route
+
+        Returns:
+            True if the terminal may still be reached
+        """
+        seen = {start}
+        frontier = [start]
+        while frontier:
+            index = frontier.pop()
+            for bit, _, _ in _PORT_STEPS:
+                if not any(m & bit for m in self._domains[index]):
+                    continue
+                neighbor = self._neighbor(index, bit)
+                if neighbor is None or neighbor in seen:
+                    continue
+                if neighbor == self._terminal:
+                    if any(m & _OPPOSITE[bit] for m in self._domains[neighbor]):
+                        return True
+                    continue
+                if neighbor in visited:
+                    continue
+                if any(m & _OPPOSITE[bit] for m in self._domains[neighbor]):
+                    seen.add(neighbor)
+                    frontier.append(neighbor)
+        return False
+
+    def find_routes(self, limit: int = 2) -> List[List[Position]]:
+        """
+        Enumerate routes from the power source to the terminal.
+
+        Args:
+            limit: Stop after this many routes (2 is enough to decide uniqueness)
+
+        Returns:
+            Routes as (x, y) position lists from power source to terminal
+        """
+        routes: List[List[Position]] = []
+        if not self._domains[self._power] or not self._domains[self._terminal]:
+            return routes
+
+        (power_mask,) = self._domains[self._power]
+        first = self._neighbor(self._power, power_mask)
+        if first is None:
+            return routes
+
+        # Explicit stack of (cell, entry port, route so far, candidate exits)
+        route = [self._power]
+        visited = {self._power}
+        stack = [(first, _OPPOSITE[power_mask], None)]
+
+        while stack:
+            index, entry, exits = stack.pop()
+            if exits is None:
+                # First visit: enter the cell
+                if index == self._terminal:
+                    if entry in self._domains[index]:
+                        routes.append([self._position(i) for i in route + [index]])
+                        if len(routes) >= limit:
+                            break
+                    continue
+                if index in visited:
+                    continue
+                exits = [mask & ~entry for mask in self._domains[index] if mask & entry]
+                if len(exits) > 1:
+                    route.append(index)
+                    visited.add(index)
+                    reachable = self._can_reach_terminal(index, visited)
+                    route.pop()
+                    visited.discard(index)
+                    if not reachable:
+                        continue
+                route.append(index)
+                visited.add(index)
+            if not exits:
+                # All exits tried: leave the cell
+                route.pop()
+                visited.discard(index)
+                continue
+
+            exit_port = exits.pop()
+            stack.append((index, entry, exits))
+            neighbor = self._neighbor(index, exit_port)
+            if neighbor is not None:
+                stack.append((neighbor, _OPPOSITE[exit_port], None))
+
+        return routes
+
+    def count_routes(self, limit: int = 2) -> int:
+        """
+        Count routes, stopping at limit.
+
+        Args:
+            limit: Maximum number of routes to count
+
+        Returns:
+            Number of routes found (at most limit)
+        """
+        return len(self.find_routes(limit))
+
+    def is_unique(self) -> bool:
+        """
+        Check that the board has exactly one route.
+
+        Returns:
+            True if exactly one route exists
+        """
+        return self.count_routes(2) == 1
+
+    def verify(self, path: List[Position]) -> bool:
+        """
+        Check that the intended path is the only route.
+
+        Args:
+            path: Intended (x, y) positions from power source to terminal
+
+        Returns:
+            True if the board has exactly one route and it is path
+        """
+        routes = self.find_routes(2)
+        return len(routes) == 1 and routes[0] == [tuple(p) for p in path]
+
+    def _position(self, index: int) -> Position:
+        """Convert a cell index to an (x, y) position."""
+        y, x = divmod(index, self.grid_size)
+        return (x, y)
@@ -11,6 +11,7 @@ Updated: 2026-01-25 - Added scene system integration
 from typing import Optional, List, Callable, Dict, Any
 import pygame
 from src.scenes.scene_manager import SceneManager
+from src.rendering.dirty_rects import DirtyRectTracker
 from src.scenes.main_menu_scene import MainMenuScene
 from src.integration.game_loop import GameLoop
 from src.core.game_state.game_state import GameState
@@ -169,6 +170,7 @@ class GameAPI:
 
         self._game_loop.start()
         clock = pygame.time.Clock()
+        dirty_rects = DirtyRectTracker(self._screen.get_size())
 
         while self._game_loop.is_running():
             # Get delta time
@@ -202,8 +204,9 @@ class GameAPI:
                 # Draw current scene
                 self._scene_manager.draw(self._screen)
 
-                # Update display
-                pygame.display.flip()
+                # Update display (only the changed areas when they are small)
+                dirty_rects.add_all(self._scene_manager.get_dirty_rects())
+                dirty_rects.present()
 
             # Cap frame rate
             clock.tick(self._game_loop.get_target_fps())
@@ -8,11 +8,17 @@ Date: 2026-01-20
 """
 
 import pygame
-from typing import Optional, List
+from typing import Optional, List, Dict, Tuple
+from src.core.grid.tile import Tile
+from src.core.grid.tile_type import TileType
 from src.core.level.level_manager import LevelManager
-from src.core.level.level_loader import LevelLoader
+from src.core.level.level_loader import LevelLoader, LevelData
+from src.core.level.level_pipeline import LevelPipeline
+from src.core.level.difficulty_config import DifficultyLevel
 from src.core.game_state.state_machine import StateMachine, GameState
 from src.rendering.renderer import Renderer
+from src.rendering.board_cache import BoardRenderCache
+from src.rendering.font_registry import FontRegistry
 from src.audio.audio_manager import AudioManager
 from src.audio.sound_player import SoundPlayer
 from src.audio.bgm_controller import BGMController
@@ -24,6 +30,11 @@ from src.integration.scene_manager import SceneManager, SceneType
 from src.utils.logger import GameLogger
 from src.config.config_manager import ConfigManager
 
+# Sprite path for each tile type
+_TILE_SPRITE_PATHS = {
+    tile_type: f"assets/sprites/tiles/tile_{tile_type.value}.png" for tile_type in TileType
+}
+
 
 class GameController:
     """
@@ -33,6 +44,7 @@ class GameController:
 
     Attributes:
         _level_manager (LevelManager): Level manager
+        _level_pipeline (LevelPipeline): Background pre-generation of levels
         _state_machine (StateMachine): Game state machine
         _renderer (Renderer): Renderer
         _audio_manager (AudioManager): Audio manager
@@ -43,6 +55,7 @@ class GameController:
         _input_manager (InputManager): Input manager
         _mouse_handler (MouseHandler): Mouse handler
         _scene_manager (SceneManager): Scene manager
+        _board_cache (BoardRenderCache): Offscreen board, redrawn per changed tile
         _current_level_index (int): Current level index
         _level_ids (List[str]): List of level IDs to play
         _logger (GameLogger): Logger instance
@@ -52,6 +65,7 @@ class GameController:
         """Initialize the game controller."""
         self._level_loader: LevelLoader = LevelLoader()
         self._level_manager: LevelManager = LevelManager(self._level_loader)
+        self._level_pipeline: LevelPipeline = LevelPipeline()
         self._state_machine: StateMachine = StateMachine()
         self._renderer: Renderer = Renderer()
         self._audio_manager: AudioManager = AudioManager()
@@ -72,6 +86,17 @@ class GameController:
         # Debug settings
         self._show_debug_info: bool = False  # Toggle for showing rotation debug info (default: OFF)
 
+        # Board rendering
+        self._board_cache: BoardRenderCache = BoardRenderCache(self._draw_tile)
+        self._accepted_rotations_source: Optional[LevelData] = None
+        self._accepted_rotations: Dict[Tuple[int, int], List[int]] = {}
+
+        # Dirty-rect presentation: glow areas of the last two frames and
+        # what was on screen last frame (a change forces a full flip)
+        self._glow_rects: List[pygame.Rect] = []
+        self._glow_dirty_rects: List[pygame.Rect] = []
+        self._presented_frame: Optional[tuple] = None
+
     def initialize(self, width: int = 800, height: int = 600) -> bool:
         """
         Initialize all game systems.
@@ -104,6 +129,7 @@ class GameController:
 
     def shutdown(self) -> None:
         """Shutdown all game systems."""
+        self._level_pipeline.stop()
         self._renderer.shutdown()
         self._audio_manager.shutdown()
         self._logger.info("Game controller shutdown")
@@ -135,6 +161,7 @@ class GameController:
             difficulty: Difficulty level ("easy", "normal", "hard", "hell")
         """
         self._difficulty = difficulty.lower()
+        self._level_pipeline.set_difficulty(self._get_difficulty_level())
         self._logger.info(f"Difficulty set to: {self._difficulty}")
 
     def get_difficulty(self) -> str:
@@ -146,6 +173,19 @@ class GameController:
         """
         return self._difficulty
 
+    def _get_difficulty_level(self) -> DifficultyLevel:
+        """
+        Get the current difficulty as a DifficultyLevel.
+
+        Returns:
+            DifficultyLevel: Current difficulty (NORMAL if unknown)
+        """
+        try:
+            return DifficultyLevel(self._difficulty)
+        except ValueError:
+            self._logger.error(f"Invalid difficulty: {self._difficulty}, defaulting to NORMAL")
+            return DifficultyLevel.NORMAL
+
     def get_move_count(self) -> int:
         """
         Get the current move count.
@@ -155,6 +195,16 @@ class GameController:
         """
         return self._level_manager.get_move_count()
 
+    def get_optimal_moves(self) -> Optional[int]:
+        """
+        Get the minimum number of moves that solves the current level.
+
+        Returns:
+            Optional[int]: Optimal move count, or None if no level is loaded
+            or the level cannot be solved
+        """
+        return self._level_manager.get_optimal_moves()
+
     def is_game_over(self) -> bool:
         """
         Check if the game is over.
@@ -227,7 +277,11 @@ class GameController:
 
     def _load_next_generated_level(self) -> bool:
         """
-        Generate and load the next level.
+        Load the next generated level.
+
+        Levels are taken from the background pipeline, so this normally
+        only builds the grid; it generates synchronously only when no level
+        is ready yet (e.g. the very first level of a session).
 
         Returns:
             bool: True if successful, False otherwise
@@ -239,12 +293,21 @@ class GameController:
 
         self._state_machine.transition_to(GameState.LOADING)
 
-        # Generate level with current difficulty
-        if not self._level_manager.load_generated_level(
-            difficulty=self._difficulty,
+        # Take a pre-generated level and keep the pipeline filling behind it
+        difficulty = self._get_difficulty_level()
+        self._level_pipeline.start(difficulty)
+        try:
+            generated = self._level_pipeline.get(difficulty)
+        except RuntimeError as e:
+            self._logger.error(f"Failed to generate level #{self._current_level_number}: {e}")
+            return False
+
+        if not self._level_manager.load_generated_data(
+            generated,
+            difficulty,
             level_number=self._current_level_number
         ):
-            self._logger.error(f"Failed to generate level #{self._current_level_number}")
+            self._logger.error(f"Failed to load level #{self._current_level_number}")
             return False
 
         # Log level details
@@ -427,90 +490,65 @@ class GameController:
         # Draw scene
         self._scene_manager.draw(self._renderer)
 
-        # Present
-        self._renderer.present()
+        # Present: the bare board reports what changed; menus, overlays and
+        # state changes flip the whole frame
+        current_scene = self._scene_manager.get_current_scene()
+        frame = (current_state, current_scene)
+        tracked = (
+            frame == self._presented_frame
+            and current_state == GameState.PLAYING
+            and (current_scene is None or current_scene.scene_type == SceneType.GAME)
+        )
+        self._presented_frame = frame
+        self._renderer.present(self.get_dirty_rects() if tracked else None)
+
+    def get_dirty_rects(self) -> List[pygame.Rect]:
+        """
+        Get the screen rects changed by the last _draw_game() and particle draw.
+
+        Returns:
+            List[pygame.Rect]: Changed board tiles, glow and particle areas
+        """
+        rects = self._board_cache.get_dirty_rects()
+        rects.extend(self._glow_dirty_rects)
+        particle_rect = self._particle_system.get_dirty_rect()
+        if particle_rect is not None:
+            rects.append(particle_rect)
+        return rects
 
     def _draw_game(self) -> None:
-        """Draw game elements."""
+        """
+        Draw game elements.
+
+        The board comes from the board render cache: one blit per frame,
+        with only the tiles rotated since the last frame redrawn.
+        """
         grid = self._level_manager.get_grid()
-        if not grid:
+        surface = self._renderer._screen
+        if not grid or not surface:
             return
 
-        # Draw grid tiles
-        rows = grid.grid_size
-        cols = grid.grid_size
         tile_size, tile_padding = self._mouse_handler.get_tile_size()
+        self._board_cache.draw(
+            surface,
+            grid,
+            self._mouse_handler.grid_to_screen(0, 0),
+            tile_size,
+            tile_padding,
+            style_key=self._show_debug_info
+        )
 
-        for row in range(rows):
-            for col in range(cols):
-                tile = grid.get_tile(row, col)
-                if tile:
-                    screen_pos = self._mouse_handler.grid_to_screen(row, col)
-                    if screen_pos:
-                        surface = self._renderer._screen
-                        if surface:
-                            # Draw background based on tile type
-                            tile_rect = pygame.Rect(screen_pos[0], screen_pos[1], tile_size, tile_size)
-
-                            if tile.tile_type.value == "empty":
-                                # Draw light gray background for empty tiles to show grid structure
-                                pygame.draw.rect(surface, (60, 60, 60), tile_rect)
-                                # Draw subtle border
-                                pygame.draw.rect(surface, (80, 80, 80), tile_rect, 1)
-                            elif tile.is_clickable:
-                                # Draw black background for clickable tiles
-                                pygame.draw.rect(surface, (30, 30, 30), tile_rect)
-                                # Draw border to make it more visible
-                                pygame.draw.rect(surface, (100, 100, 100), tile_rect, 2)
-
-                        # Load and draw tile sprite (skip empty tiles)
-                        if tile.tile_type.value != "empty":
-                            sprite_path = f"assets/sprites/tiles/tile_{tile.tile_type.value}.png"
-                            # Load sprite with dynamic size
-                            sprite = self._renderer._sprite_manager.load_sprite(sprite_path, size=(tile_size, tile_size))
-                            if sprite:
-                                # Rotate sprite if needed
-                                if tile.rotation != 0:
-                                    sprite = self._renderer._sprite_manager.get_rotated_sprite(sprite, tile.rotation)
-                                self._renderer.draw_sprite(sprite, screen_pos)
-
-                            # Draw debug info: current rotation and target rotation
-                            if tile.is_clickable and self._show_debug_info:
-                                # Get accepted rotations from level data
-                                level_data = self._level_manager.get_level_data()
-                                accepted_rotations = []
-                                if level_data:
-                                    for tile_data in level_data.solution_tiles:
-                                        if tile_data.get('x') == row and tile_data.get('y') == col:
-                                            accepted_rotations = tile_data.get('accepted_rotations', [tile_data.get('rotation', 0)])
-                                            break
-
-                                # Format accepted rotations
-                                if accepted_rotations:
-                                    target_text = "/".join([f"{r}°" for r in accepted_rotations])
-                                else:
-                                    target_text = "?"
-
-                                # Draw current rotation (yellow)
-                                current_text = f"Current: {tile.rotation}°"
-                                self._renderer.draw_text(current_text,
-                                                        (screen_pos[0] + 5, screen_pos[1] + 5),
-                                                        font_size=14,
-                                                        color=(255, 255, 0))
-
-                                # Draw target rotation (green)
-                                target_display = f"Target: {target_text}"
-                                self._renderer.draw_text(target_display,
-                                                        (screen_pos[0] + 5, screen_pos[1] + 25),
-                                                        font_size=14,
-                                                        color=(0, 255, 0))
-
-                        # Draw glow on terminal if connected
-                        if tile.tile_type.value == "terminal" and self._level_manager.is_level_completed():
-                            surface = self._renderer._screen
-                            if surface:
-                                self._glow_effect.draw_glow_circle(surface, screen_pos[0], screen_pos[1],
-                                                                   radius=32, glow_radius=15)
+        # Draw glow on terminals if connected (animated, so not cached)
+        glow_rects = []
+        if self._level_manager.is_level_completed():
+            for terminal in grid.get_terminals():
+                screen_pos = self._mouse_handler.grid_to_screen(terminal.x, terminal.y)
+                self._glow_effect.draw_glow_circle(surface, screen_pos[0], screen_pos[1],
+                                                   radius=32, glow_radius=15)
+                # Outermost glow layer: radius + glow_radius, plus 1px margin
+                glow_rects.append(pygame.Rect(screen_pos[0] - 48, screen_pos[1] - 48, 96, 96))
+        self._glow_dirty_rects = self._glow_rects + glow_rects
+        self._glow_rects = glow_rects
 
         # NOTE: HUD rendering is now handled by HUDLayer in the scene system
         # The following HUD code is commented out to avoid duplicate rendering
@@ -532,6 +570,78 @@ class GameController:
         # if self._state_machine.get_current_state() == GameState.VICTORY:
         #     self._renderer.draw_text("VICTORY!", (300, 250), font_size=48, color=(255, 215, 0))
 
+    def _draw_tile(self, surface: pygame.Surface, tile: Tile, tile_rect: pygame.Rect) -> None:
+        """
+        Draw one tile onto the board cache surface.
+
+        Args:
+            surface: Board surface
+            tile: Tile to draw
+            tile_rect: Tile rect on the board surface
+        """
+        if tile.tile_type == TileType.EMPTY:
+            # Draw light gray background for empty tiles to show grid structure
+            pygame.draw.rect(surface, (60, 60, 60), tile_rect)
+            # Draw subtle border
+            pygame.draw.rect(surface, (80, 80, 80), tile_rect, 1)
+            return
+
+        if tile.is_clickable:
+            # Draw black background for clickable tiles
+            pygame.draw.rect(surface, (30, 30, 30), tile_rect)
+            # Draw border to make it more visible
+            pygame.draw.rect(surface, (100, 100, 100), tile_rect, 2)
+
+        # Scaled, pre-rotated sprite (no transform work after the first draw)
+        sprite = self._renderer._sprite_manager.get_tile_sprite(
+            _TILE_SPRITE_PATHS[tile.tile_type], tile_rect.size, tile.rotation
+        )
+        if sprite:
+            surface.blit(sprite, tile_rect.topleft)
+
+        # Draw debug info: current rotation and target rotation
+        if tile.is_clickable and self._show_debug_info:
+            accepted_rotations = self._get_accepted_rotations(tile.x, tile.y)
+
+            # Format accepted rotations
+            if accepted_rotations:
+                target_text = "/".join([f"{r}°" for r in accepted_rotations])
+            else:
+                target_text = "?"
+
+            # Draw current rotation (yellow)
+            surface.blit(FontRegistry.render_text(f"Current: {tile.rotation}°", 14, (255, 255, 0)),
+                         (tile_rect.x + 5, tile_rect.y + 5))
+
+            # Draw target rotation (green)
+            surface.blit(FontRegistry.render_text(f"Target: {target_text}", 14, (0, 255, 0)),
+                         (tile_rect.x + 5, tile_rect.y + 25))
+
+    def _get_accepted_rotations(self, x: int, y: int) -> List[int]:
+        """
+        Get the accepted rotations of a solution tile (for the debug overlay).
+
+        Args:
+            x: X coordinate of the tile
+            y: Y coordinate of the tile
+
+        Returns:
+            List[int]: Accepted rotations (empty if unknown)
+        """
+        level_data = self._level_manager.get_level_data()
+        if level_data is None:
+            return []
+
+        # Index the solution once per level instead of scanning it per tile
+        if self._accepted_rotations_source is not level_data:
+            self._accepted_rotations_source = level_data
+            self._accepted_rotations = {
+                (tile_data.get('x'), tile_data.get('y')):
+                    tile_data.get('accepted_rotations', [tile_data.get('rotation', 0)])
+                for tile_data in level_data.solution_tiles
+            }
+        return self._accepted_rotations.get((x, y), [])
+
     def get_state(self) -> GameState:
         """
         Get current game state.
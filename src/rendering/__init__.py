@@ -7,6 +7,9 @@ sprite management, rendering pipeline, and visual effects.
 Classes:
     Renderer: Main rendering engine
     SpriteManager: Sprite loading and caching
+    FontRegistry: Shared font and rendered-text cache
+    DirtyRectTracker: Dirty-rect frame presentation
+    SpriteAtlas: Shared texture atlas
 
 Author: Circuit Repair Game Team
 Date: 2026-01-20
@@ -14,8 +17,14 @@ Date: 2026-01-20
 
 from src.rendering.renderer import Renderer
 from src.rendering.sprite_manager import SpriteManager
+from src.rendering.font_registry import FontRegistry
+from src.rendering.dirty_rects import DirtyRectTracker
+from src.rendering.sprite_atlas import SpriteAtlas
 
 __all__ = [
     "Renderer",
     "SpriteManager",
+    "FontRegistry",
+    "DirtyRectTracker",
+    "SpriteAtlas",
 ]
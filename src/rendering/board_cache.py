@@ -0,0 +1,213 @@
+"""
+Board Cache Module
+
+This module provides the BoardRenderCache class, an offscreen surface
+holding the fully drawn game board.
+
+The board only changes when a tile is rotated, so redrawing every cell
+every frame is wasted work. The cache draws all tiles once per layout
+(grid, tile size, padding and style) and afterwards follows the grid
+change journal: only tiles reported by GridManager.drain() are redrawn.
+A static board costs a single blit per frame regardless of grid size.
+The screen rects changed by the last draw are kept for dirty-rect
+presentation.
+
+Classes:
+    BoardRenderCache: Offscreen board surface with per-tile dirty redraw
+
+Author: Circuit Repair Game Team
+Date: 2026-01-20
+"""
+
+import logging
+from typing import Any, Callable, List, Optional, Tuple
+import pygame
+
+from src.core.grid.grid_manager import GridManager
+from src.core.grid.tile import Tile
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+# Callback drawing one tile: (board surface, tile, tile rect on the board)
+TileDrawer = Callable[[pygame.Surface, Tile, pygame.Rect], None]
+
+
+class BoardRenderCache:
+    """
+    Offscreen board surface with per-tile dirty redraw.
+
+    Tile (x, y) is drawn at (x * (tile_size + padding), y * (tile_size + padding))
+    on the board surface, matching MouseHandler.grid_to_screen() relative
+    to the board origin. The surface is transparent outside the tiles.
+
+    Attributes:
+        _draw_tile: Callback drawing one tile onto the board surface
+        _surface: Offscreen board surface (None until first draw)
+        _grid: Grid the surface was drawn from
+        _subscriber: Grid change subscription for that grid
+        _layout: (grid_size, tile_size, tile_padding, style_key) of the surface
+        _board_rect: Screen rect of the board at the last draw
+        _dirty_rects: Rects changed by the last draw (board, then screen coordinates)
+        _tiles_redrawn: Tiles drawn since creation (for profiling and tests)
+
+    Example:
+        >>> cache = BoardRenderCache(draw_tile)
+        >>> cache.draw(screen, grid, origin=(100, 80), tile_size=96, tile_padding=4)
+    """
+
+    def __init__(self, draw_tile: TileDrawer) -> None:
+        """
+        Initialize the cache.
+
+        Args:
+            draw_tile: Callback drawing one tile onto the board surface
+        """
+        self._draw_tile = draw_tile
+        self._surface: Optional[pygame.Surface] = None
+        self._grid: Optional[GridManager] = None
+        self._subscriber: Optional[int] = None
+        self._layout: Optional[Tuple[int, int, int, Any]] = None
+        self._board_rect: Optional[pygame.Rect] = None
+        self._dirty_rects: List[pygame.Rect] = []
+        self._tiles_redrawn: int = 0
+
+    def draw(
+        self,
+        target: pygame.Surface,
+        grid: GridManager,
+        origin: Tuple[int, int],
+        tile_size: int,
+        tile_padding: int,
+        style_key: Any = None
+    ) -> None:
+        """
+        Bring the board surface up to date and blit it.
+
+        Args:
+            target: Surface to draw the board onto
+            grid: Grid to draw
+            origin: Screen position of tile (0, 0)
+            tile_size: Tile size in pixels
+            tile_padding: Gap between tiles in pixels
+            style_key: Anything else the tile drawing depends on (e.g. the
+                debug overlay flag); a change rebuilds the board
+
+        Example:
+            >>> cache.draw(screen, grid, (100, 80), 96, 4, style_key=show_debug)
+        """
+        self._dirty_rects = []
+        layout = (grid.grid_size, tile_size, tile_padding, style_key)
+        if grid is not self._grid or layout != self._layout or self._surface is None:
+            self._rebuild(grid, layout)
+        else:
+            self._redraw_changed()
+
+        board_rect = target.blit(self._surface, origin)
+        if board_rect != self._board_rect:
+            # Moved or resized: both the old and the new area changed
+            self._dirty_rects = [board_rect]
+            if self._board_rect is not None:
+                self._dirty_rects.append(self._board_rect)
+        else:
+            self._dirty_rects = [rect.move(origin) for rect in self._dirty_rects]
+        self._board_rect = board_rect
+
+    def invalidate(self) -> None:
+        """
+        Force a full redraw on the next draw() (e.g. after a sprite reload).
+        """
+        self._layout = None
+
+    def get_dirty_rects(self) -> List[pygame.Rect]:
+        """
+        Get the screen rects changed by the last draw().
+
+        Returns:
+            Changed rects in target coordinates (empty for a static board)
+        """
+        return list(self._dirty_rects)
+
+    def get_tiles_redrawn(self) -> int:
+        """
+        Get the number of tiles drawn since the cache was created.
+
+        Returns:
+            Tile draw count
+        """
+        return self._tiles_redrawn
+
+    def _rebuild(self, grid: GridManager, layout: Tuple[int, int, int, Any]) -> None:
+        """
+        Create the board surface for a new layout and draw every tile.
+
+        Args:
+            grid: Grid to draw
+            layout: (grid_size, tile_size, tile_padding, style_key)
+        """
+        if self._grid is not None and self._subscriber is not None:
+            self._grid.unsubscribe(self._subscriber)
+
+        grid_size, tile_size, tile_padding, _ = layout
+        board_size = grid_size * (tile_size + tile_padding) - tile_padding
+        surface = pygame.Surface((board_size, board_size), pygame.SRCALPHA)
+        if pygame.display.get_surface() is not None:
+            surface = surface.convert_alpha()
+
+        self._surface = surface
+        self._grid = grid
+        self._subscriber = grid.subscribe()
+        self._layout = layout
+        self._redraw_all()
+
+        logger.debug(f"Board cache rebuilt: {grid_size}x{grid_size}, tile_size={tile_size}px")
+
+    def _redraw_changed(self) -> None:
+        """
+        Redraw the tiles rotated since the last draw.
+        """
+        changes = self._grid.drain(self._subscriber)
+        if changes is None:
+            self._redraw_all()
+            return
+
+        dirty = {(x, y) for _, x, y, _, _ in changes}
+        for x, y in dirty:
+            self._dirty_rects.append(self._redraw_tile(x, y))
+
+    def _redraw_all(self) -> None:
+        """
+        Clear the board surface and draw every tile.
+        """
+        self._surface.fill((0, 0, 0, 0))
+        self._dirty_rects = [self._surface.get_rect()]
+        for x in range(self._grid.grid_size):
+            for y in range(self._grid.grid_size):
+                self._redraw_tile(x, y, clear=False)
+
+    def _redraw_tile(self, x: int, y: int, clear: bool = True) -> pygame.Rect:
+        """
+        Redraw one tile rect.
+
+        Args:
+            x: X coordinate of the tile
+            y: Y coordinate of the tile
+            clear: Whether to clear the rect first
+
+        Returns:
+            Tile rect on the board surface
+        """
+        _, tile_size, tile_padding, _ = self._layout
+        step = tile_size + tile_padding
+        rect = pygame.Rect(x * step, y * step, tile_size, tile_size)
+        if clear:
+            self._surface.fill((0, 0, 0, 0), rect)
+
+        tile = self._grid.get_tile(x, y)
+        if tile is not None:
+            # Clip so overlays (e.g. debug text) cannot leave pixels outside the rect
+            self._surface.set_clip(rect)
+            self._draw_tile(self._surface, tile, rect)
+            self._surface.set_clip(None)
+            self._tiles_redrawn += 1
+        return rect
@@ -0,0 +1,190 @@
+"""
+Dirty Rects Module
+
+This module provides the DirtyRectTracker class, which decides how a
+finished frame is pushed to the display.
+
+Scenes still draw the whole frame into the screen surface, but copying
+that surface to the window is what costs a core on software-rendered
+displays. Layers and UI components report the screen rects they changed;
+the tracker merges overlapping rects and calls pygame.display.update()
+with just those. When the merged area exceeds a share of the screen, or
+there are too many rects, a single pygame.display.flip() is cheaper and
+is used instead.
+
+Classes:
+    DirtyRectTracker: Collects dirty rects and presents the frame
+
+Author: Circuit Repair Game Team
+Date: 2026-01-20
+"""
+
+import logging
+from typing import Iterable, List, Optional, Tuple
+import pygame
+
+from src.config.constants import DIRTY_RECT_FULL_FLIP_RATIO, DIRTY_RECT_MAX_RECTS
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+
+class DirtyRectTracker:
+    """
+    Collects the screen rects changed in a frame and presents the frame.
+
+    A tracker starts in full mode, so the first frame is always flipped.
+    Passing None to add_all() means "the caller does not know what changed"
+    and also forces a full flip.
+
+    Attributes:
+        _screen_rect: Screen bounds used for clipping and the area threshold
+        _full_flip_ratio: Dirty area share of the screen that triggers a flip
+        _max_rects: Merged rect count that triggers a flip
+        _rects: Rects reported for the current frame
+        _full: Whether the current frame needs a full flip
+        _full_flips: Frames presented with a full flip
+        _partial_updates: Frames presented with display.update(rects)
+
+    Example:
+        >>> tracker = DirtyRectTracker(screen.get_size())
+        >>> tracker.add_all(scene_manager.get_dirty_rects())
+        >>> tracker.present()
+    """
+
+    def __init__(
+        self,
+        screen_size: Tuple[int, int],
+        full_flip_ratio: float = DIRTY_RECT_FULL_FLIP_RATIO,
+        max_rects: int = DIRTY_RECT_MAX_RECTS
+    ) -> None:
+        """
+        Initialize the tracker.
+
+        Args:
+            screen_size: (width, height) of the display surface
+            full_flip_ratio: Dirty area share of the screen that triggers a flip
+            max_rects: Merged rect count that triggers a flip
+        """
+        self._screen_rect = pygame.Rect((0, 0), screen_size)
+        self._full_flip_ratio = full_flip_ratio
+        self._max_rects = max_rects
+        self._rects: List[pygame.Rect] = []
+        self._full = True
+        self._full_flips = 0
+        self._partial_updates = 0
+
+    def add(self, rect) -> None:
+        """
+        Report a changed screen rect.
+
+        Args:
+            rect: pygame.Rect or (x, y, width, height)
+        """
+        if not self._full:
+            self._rects.append(pygame.Rect(rect))
+
+    def add_all(self, rects: Optional[Iterable]) -> None:
+        """
+        Report several changed rects.
+
+        Args:
+            rects: Rects to add, or None to force a full flip
+        """
+        if rects is None:
+            self.mark_full()
+            return
+
+        for rect in rects:
+            self.add(rect)
+
+    def mark_full(self) -> None:
+        """
+        Force a full flip for the current frame.
+        """
+        self._full = True
+        self._rects.clear()
+
+    def set_screen_size(self, screen_size: Tuple[int, int]) -> None:
+        """
+        Update the screen size (e.g. after a resize) and force a full flip.
+
+        Args:
+            screen_size: (width, height) of the display surface
+        """
+        self._screen_rect = pygame.Rect((0, 0), screen_size)
+        self.mark_full()
+
+    def get_update_rects(self) -> Optional[List[pygame.Rect]]:
+        """
+        Merge the reported rects for presentation.
+
+        Rects are clipped to the screen and overlapping rects are replaced
+        by their union until none overlap.
+
+        Returns:
+            Merged rects (empty if nothing changed), or None for a full flip
+        """
+        if self._full:
+            return None
+
+        merged: List[pygame.Rect] = []
+        for rect in self._rects:
+            rect = rect.clip(self._screen_rect)
+            if rect.width <= 0 or rect.height <= 0:
+                continue
+
+            # Absorb every merged rect the new one overlaps; the union can
+            # reach further rects, so repeat until nothing collides
+            index = rect.collidelist(merged)
+            while index != -1:
+                rect.union_ip(merged.pop(index))
+                index = rect.collidelist(merged)
+            merged.append(rect)
+
+        if len(merged) > self._max_rects:
+            return None
+
+        dirty_area = sum(rect.width * rect.height for rect in merged)
+        screen_area = self._screen_rect.width * self._screen_rect.height
+        if dirty_area > screen_area * self._full_flip_ratio:
+            return None
+
+        return merged
+
+    def present(self) -> None:
+        """
+        Push the frame to the display and start the next frame.
+
+        Uses pygame.display.update() with the merged rects, or
+        pygame.display.flip() when the frame needs a full flip. Nothing is
+        pushed if no rect was reported.
+        """
+        rects = self.get_update_rects()
+        if rects is None:
+            pygame.display.flip()
+            self._full_flips += 1
+        elif rects:
+            pygame.display.update(rects)
+            self._partial_updates += 1
+
+        self._rects.clear()
+        self._full = False
+
+    def get_full_flip_count(self) -> int:
+        """
+        Get the number of frames presented with a full flip.
+
+        Returns:
+            Full flip count
+        """
+        return self._full_flips
+
+    def get_partial_update_count(self) -> int:
+        """
+        Get the number of frames presented with dirty rects only.
+
+        Returns:
+            Partial update count
+        """
+        return self._partial_updates
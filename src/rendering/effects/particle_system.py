@@ -87,15 +87,18 @@ class Particle:
 
         return True
 
-    def draw(self, surface: pygame.Surface) -> None:
+    def draw(self, surface: pygame.Surface) -> Optional[pygame.Rect]:
         """
         Draw the particle.
 
         Args:
             surface: Pygame surface to draw on
+
+        Returns:
+            Optional[pygame.Rect]: Area drawn, or None if nothing was drawn
         """
         if self.alpha <= 0:
-            return
+            return None
 
         # Create color with alpha
         color_with_alpha = (*self.color, self.alpha)
@@ -106,10 +109,10 @@ class Particle:
             temp_surface = pygame.Surface((int(self.size * 2), int(self.size * 2)), pygame.SRCALPHA)
             pygame.draw.circle(temp_surface, color_with_alpha,
                              (int(self.size), int(self.size)), int(self.size))
-            surface.blit(temp_surface, (int(self.x - self.size), int(self.y - self.size)))
+            return surface.blit(temp_surface, (int(self.x - self.size), int(self.y - self.size)))
         except (ValueError, TypeError):
             # Fallback to simple circle without alpha
-            pygame.draw.circle(surface, self.color, (int(self.x), int(self.y)), int(self.size))
+            return pygame.draw.circle(surface, self.color, (int(self.x), int(self.y)), int(self.size))
 
 
 class ParticleSystem:
@@ -121,6 +124,8 @@ class ParticleSystem:
     Attributes:
         _particles (List[Particle]): Active particles
         _gravity (float): Gravity acceleration
+        _drawn_rect (Optional[pygame.Rect]): Area covered by the last draw
+        _dirty_rect (Optional[pygame.Rect]): Area changed by the last draw
         _logger (GameLogger): Logger instance
     """
 
@@ -133,6 +138,8 @@ class ParticleSystem:
         """
         self._particles: List[Particle] = []
         self._gravity: float = gravity
+        self._drawn_rect: Optional[pygame.Rect] = None
+        self._dirty_rect: Optional[pygame.Rect] = None
         self._logger: GameLogger = GameLogger.get_logger(__name__)
 
     def emit_burst(self, x: float, y: float, count: int,
@@ -281,8 +288,29 @@ class ParticleSystem:
         Args:
             surface: Pygame surface to draw on
         """
+        drawn_rect = None
         for particle in self._particles:
-            particle.draw(surface)
+            rect = particle.draw(surface)
+            if rect is not None:
+                drawn_rect = rect if drawn_rect is None else drawn_rect.union(rect)
+
+        # Particles that moved or died leave their old area to repaint
+        if self._drawn_rect is None or drawn_rect is None:
+            self._dirty_rect = drawn_rect or self._drawn_rect
+        else:
+            self._dirty_rect = drawn_rect.union(self._drawn_rect)
+        self._drawn_rect = drawn_rect
+
+    def get_dirty_rect(self) -> Optional[pygame.Rect]:
+        """
+        Get the screen area changed by the last draw.
+
+        Covers the particles drawn in the last frame and the frame before.
+
+        Returns:
+            Optional[pygame.Rect]: Changed area, or None if no particles were drawn
+        """
+        return self._dirty_rect
 
     def clear(self) -> None:
         """Clear all particles."""
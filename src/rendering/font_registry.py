@@ -0,0 +1,243 @@
+"""
+Font Registry Module
+
+This module provides the FontRegistry class, a process-wide cache of fonts
+and rendered text.
+
+Creating a pygame Font opens and parses the font file, and rendering text
+rasterizes every glyph. Both used to happen on every Renderer.draw_text()
+call, and a missing Windows font path cost a second Font per call on other
+platforms. The registry resolves a CJK-capable font once per process,
+keeps Font objects by (name, size), and keeps rendered text surfaces in a
+bounded LRU cache keyed by (text, name, size, color).
+
+Font objects die with pygame's font module, so both caches are dropped
+on pygame.quit() (via pygame.register_quit) and whenever the font module
+is found uninitialised.
+
+Classes:
+    FontRegistry: Shared font and rendered-text cache
+
+Author: Circuit Repair Game Team
+Date: 2026-01-20
+"""
+
+import os
+import sys
+import logging
+from collections import OrderedDict
+from typing import Dict, Optional, Tuple
+import pygame
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+# Font files with Chinese glyphs, tried in order for each platform
+_CJK_FONT_PATHS: Dict[str, Tuple[str, ...]] = {
+    'win32': (
+        "C:/WINDOWS/fonts/msyh.ttc",
+        "C:/WINDOWS/fonts/simhei.ttf",
+        "C:/WINDOWS/fonts/simsun.ttc",
+    ),
+    'darwin': (
+        "/System/Library/Fonts/PingFang.ttc",
+        "/System/Library/Fonts/STHeiti Medium.ttc",
+        "/Library/Fonts/Arial Unicode.ttf",
+    ),
+    'linux': (
+        "/usr/share/fonts/opentype/noto/NotoSansCJK-Regular.ttc",
+        "/usr/share/fonts/noto-cjk/NotoSansCJK-Regular.ttc",
+        "/usr/share/fonts/google-noto-cjk/NotoSansCJK-Regular.ttc",
+        "/usr/share/fonts/truetype/wqy/wqy-microhei.ttc",
+        "/usr/share/fonts/wenquanyi/wqy-microhei/wqy-microhei.ttc",
+    ),
+}
+
+# System font names passed to pygame.font.match_font() if no path exists
+_CJK_FONT_NAMES: Tuple[str, ...] = (
+    "microsoftyahei", "notosanscjksc", "notosanscjk", "wenquanyimicrohei",
+    "pingfangsc", "simhei", "arialunicodems",
+)
+
+# Maximum number of rendered text surfaces kept in the cache
+TEXT_CACHE_SIZE = 512
+
+
+class FontRegistry:
+    """
+    Process-wide cache of fonts and rendered text.
+
+    All state is held on the class so every renderer, layer and UI
+    component shares the same fonts. Font name None selects the default
+    CJK-capable font; if a font cannot be opened, pygame's built-in font
+    is used and cached under the requested key, so failures are not retried
+    every frame.
+
+    Attributes:
+        _default_font_path: Resolved CJK font path (None for pygame's default)
+        _default_resolved: Whether the default font path has been resolved
+        _fonts: (name, size) -> pygame.font.Font
+        _text_cache: (text, name, size, color) -> rendered Surface, in LRU order
+        _quit_registered: Whether clear() is registered to run on pygame.quit()
+
+    Example:
+        >>> font = FontRegistry.get_font(None, 24)
+        >>> surface = FontRegistry.render_text("移动次数: 5", 24, (255, 255, 255))
+    """
+
+    _default_font_path: Optional[str] = None
+    _default_resolved: bool = False
+    _fonts: Dict[Tuple[Optional[str], int], pygame.font.Font] = {}
+    _text_cache: 'OrderedDict[Tuple[str, Optional[str], int, Tuple[int, ...]], pygame.Surface]' = OrderedDict()
+    _quit_registered: bool = False
+
+    @classmethod
+    def get_default_font_path(cls) -> Optional[str]:
+        """
+        Get the CJK-capable font for this platform, resolving it once.
+
+        Returns:
+            Font file path, or None to use pygame's built-in font
+        """
+        if not cls._default_resolved:
+            cls._default_resolved = True
+            cls._default_font_path = cls._find_cjk_font()
+            if cls._default_font_path:
+                logger.info(f"Default font: {cls._default_font_path}")
+            else:
+                logger.warning("No CJK font found, using pygame default font")
+        return cls._default_font_path
+
+    @staticmethod
+    def _find_cjk_font() -> Optional[str]:
+        """
+        Look for a font with Chinese glyphs.
+
+        Returns:
+            Font file path, or None if none is installed
+        """
+        platform = 'linux' if sys.platform.startswith('linux') else sys.platform
+        for path in _CJK_FONT_PATHS.get(platform, ()):
+            if os.path.exists(path):
+                return path
+
+        try:
+            return pygame.font.match_font(_CJK_FONT_NAMES)
+        except Exception as e:
+            logger.debug(f"System font lookup failed: {e}")
+            return None
+
+    @classmethod
+    def get_font(cls, name: Optional[str], size: int) -> pygame.font.Font:
+        """
+        Get a font, opening it on first use.
+
+        Args:
+            name: Font file path (None for the default CJK font)
+            size: Font size in pixels
+
+        Returns:
+            pygame.font.Font (pygame's default font if the file cannot be opened)
+
+        Example:
+            >>> font = FontRegistry.get_font(None, 14)
+        """
+        cls._ensure_font_init()
+        key = (name, size)
+        font = cls._fonts.get(key)
+        if font is not None:
+            return font
+
+        path = name if name is not None else cls.get_default_font_path()
+        try:
+            font = pygame.font.Font(path, size)
+        except Exception as e:
+            logger.warning(f"Failed to load font {path}, using default: {e}")
+            font = pygame.font.Font(None, size)
+
+        cls._fonts[key] = font
+        return font
+
+    @classmethod
+    def render_text(
+        cls,
+        text: str,
+        size: int,
+        color: Tuple[int, ...],
+        name: Optional[str] = None
+    ) -> pygame.Surface:
+        """
+        Render antialiased text, reusing the surface for repeated requests.
+
+        Args:
+            text: Text to render
+            size: Font size in pixels
+            color: RGB(A) color tuple
+            name: Font file path (None for the default CJK font)
+
+        Returns:
+            Rendered pygame.Surface (shared, do not draw onto it)
+
+        Example:
+            >>> surface = FontRegistry.render_text("Current: 90°", 14, (255, 255, 0))
+            >>> screen.blit(surface, (10, 10))
+        """
+        cls._ensure_font_init()
+        key = (text, name, size, tuple(color))
+        surface = cls._text_cache.get(key)
+        if surface is not None:
+            cls._text_cache.move_to_end(key)
+            return surface
+
+        surface = cls.get_font(name, size).render(text, True, color)
+        cls._text_cache[key] = surface
+        if len(cls._text_cache) > TEXT_CACHE_SIZE:
+            cls._text_cache.popitem(last=False)
+        return surface
+
+    @classmethod
+    def _ensure_font_init(cls) -> None:
+        """
+        Initialise pygame's font module, dropping fonts from an earlier init.
+
+        pygame.register_quit() callbacks are discarded once they run, so
+        clear() is registered again for every init cycle.
+        """
+        if not pygame.font.get_init():
+            # Fonts opened before pygame.font.quit() are no longer usable
+            cls.clear()
+            pygame.font.init()
+
+        if not cls._quit_registered:
+            pygame.register_quit(cls._on_pygame_quit)
+            cls._quit_registered = True
+
+    @classmethod
+    def _on_pygame_quit(cls) -> None:
+        """
+        Drop all fonts when pygame quits (registered with pygame.register_quit).
+        """
+        cls._quit_registered = False
+        cls.clear()
+
+    @classmethod
+    def get_text_cache_size(cls) -> int:
+        """
+        Get the number of cached text surfaces.
+
+        Returns:
+            Number of entries in the text cache
+        """
+        return len(cls._text_cache)
+
+    @classmethod
+    def clear(cls) -> None:
+        """
+        Drop all fonts and rendered text (call before pygame.quit()).
+
+        Example:
+            >>> FontRegistry.clear()
+        """
+        cls._fonts.clear()
+        cls._text_cache.clear()
+        logger.debug("Font registry cleared")
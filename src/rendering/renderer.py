@@ -12,7 +12,7 @@ Date: 2026-01-20
 """
 
 import logging
-from typing import Optional, Tuple
+from typing import Iterable, Optional, Tuple
 import pygame
 
 from src.config.config_manager import ConfigManager
@@ -21,6 +21,9 @@ from src.config.constants import (
     COLOR_BACKGROUND, COLOR_WHITE
 )
 from src.rendering.sprite_manager import SpriteManager
+from src.rendering.font_registry import FontRegistry
+from src.rendering.dirty_rects import DirtyRectTracker
+from src.rendering.sprite_atlas import SpriteAtlas
 from src.utils.timer import FPSCounter
 
 # Configure logger
@@ -39,6 +42,7 @@ class Renderer:
         _clock: Pygame clock for FPS control
         _sprite_manager: SpriteManager instance for sprite loading
         _fps_counter: FPSCounter for performance monitoring
+        _dirty_rects: DirtyRectTracker deciding between flip and partial update
         _config: ConfigManager instance
         _window_size: (width, height) of the window
         _target_fps: Target frames per second
@@ -75,6 +79,7 @@ class Renderer:
         # Pygame objects (initialized later)
         self._screen: Optional[pygame.Surface] = None
         self._clock: Optional[pygame.time.Clock] = None
+        self._dirty_rects: Optional[DirtyRectTracker] = None
         self._is_initialized: bool = False
 
         logger.info("Renderer created")
@@ -107,6 +112,11 @@ class Renderer:
 
             # Create clock
             self._clock = pygame.time.Clock()
+            self._dirty_rects = DirtyRectTracker(self._window_size)
+
+            # Serve packed sprites from the atlas (converted for this display)
+            if not SpriteAtlas.is_loaded():
+                self._sprite_manager.load_atlas()
 
             self._is_initialized = True
             logger.info("Renderer initialized successfully")
@@ -129,6 +139,8 @@ class Renderer:
         if not self._is_initialized:
             return
 
+        FontRegistry.clear()
+        SpriteAtlas.unload()
         pygame.quit()
         self._is_initialized = False
         logger.info("Renderer shutdown")
@@ -151,22 +163,31 @@ class Renderer:
         fill_color = color or COLOR_BACKGROUND
         self._screen.fill(fill_color)
 
-    def present(self) -> None:
+    def present(self, dirty_rects: Optional[Iterable] = None) -> None:
         """
         Present the rendered frame to the screen and update FPS.
 
         This should be called once per frame after all drawing is complete.
+        With dirty_rects only those screen areas are pushed to the display,
+        unless they cover too much of the screen, in which case the whole
+        frame is flipped.
+
+        Args:
+            dirty_rects: Screen rects changed since the last frame
+                (None flips the whole frame)
 
         Example:
             >>> renderer.clear()
             >>> # ... draw everything ...
             >>> renderer.present()
+            >>> renderer.present([pygame.Rect(10, 10, 200, 40)])
         """
         if not self._is_initialized:
             logger.warning("Cannot present: Renderer not initialized")
             return
 
-        pygame.display.flip()
+        self._dirty_rects.add_all(dirty_rects)
+        self._dirty_rects.present()
 
         # Update FPS counter
         if self._clock:
@@ -213,6 +234,9 @@ class Renderer:
         """
         Draw text at the specified position.
 
+        Fonts and rendered text come from FontRegistry, so drawing the same
+        text again neither opens a font nor rasterizes glyphs.
+
         Args:
             text: Text string to draw
             position: (x, y) position (top-left corner)
@@ -229,22 +253,10 @@ class Renderer:
             return
 
         try:
-            # Use Microsoft YaHei for Chinese support if no font specified
-            if font_name is None:
-                font_name = "C:/WINDOWS/fonts/msyh.ttc"
-
-            font = pygame.font.Font(font_name, font_size)
-            text_surface = font.render(text, True, color)
+            text_surface = FontRegistry.render_text(text, font_size, color, font_name)
             self._screen.blit(text_surface, position)
         except Exception as e:
             logger.error(f"Failed to draw text: {e}")
-            # Fallback to default font
-            try:
-                font = pygame.font.Font(None, font_size)
-                text_surface = font.render(text, True, color)
-                self._screen.blit(text_surface, position)
-            except Exception as e2:
-                logger.error(f"Failed to draw text with fallback font: {e2}")
 
     def draw_rect(
         self,
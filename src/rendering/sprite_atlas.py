@@ -0,0 +1,202 @@
+"""
+Sprite Atlas Module
+
+This module provides the SpriteAtlas class, a process-wide texture atlas
+built offline by tools/build_sprite_atlas.py.
+
+Loading every sprite as its own PNG costs one file open, one decode and one
+convert per sprite at startup, and spreads the pixels over dozens of
+surfaces. The atlas ships all small sprites in one image: it is decoded
+and converted once, and each sprite is served as a subsurface of it.
+
+Frame map format (JSON, written next to the atlas image):
+    {
+        "version": 1,
+        "image": "atlas.png",
+        "size": [width, height],
+        "frames": {"assets/sprites/tiles/tile_corner.png": [x, y, w, h], ...}
+    }
+
+Frame keys are the sprite paths relative to the project root, the same
+paths passed to SpriteManager.load_sprite().
+
+Classes:
+    SpriteAtlas: Shared atlas surface and frame lookup
+
+Author: Circuit Repair Game Team
+Date: 2026-01-20
+"""
+
+import os
+import json
+import logging
+from pathlib import Path
+from typing import Dict, Optional
+import pygame
+
+from src.config.constants import SPRITE_ATLAS_MAP_PATH
+from src.utils.file_utils import get_project_root, safe_join_path
+
+# Configure logger
+logger = logging.getLogger(__name__)
+
+# Frame map format version written by tools/build_sprite_atlas.py
+ATLAS_FORMAT_VERSION = 1
+
+
+class SpriteAtlas:
+    """
+    Process-wide texture atlas.
+
+    All state is held on the class so SpriteManager, ResourcePreloader and
+    the UI components share one atlas surface. While no atlas is loaded,
+    get_frame() returns None and callers load the PNG files as before.
+
+    Attributes:
+        _surface: Converted atlas surface (None if not loaded)
+        _frames: Project-relative sprite path -> frame rect in the atlas
+        _subsurfaces: Project-relative sprite path -> subsurface, created on demand
+
+    Example:
+        >>> SpriteAtlas.load()
+        >>> sprite = SpriteAtlas.get_frame("assets/sprites/tiles/tile_corner.png")
+    """
+
+    _surface: Optional[pygame.Surface] = None
+    _frames: Dict[str, pygame.Rect] = {}
+    _subsurfaces: Dict[str, pygame.Surface] = {}
+
+    @classmethod
+    def load(cls, map_path: str = SPRITE_ATLAS_MAP_PATH) -> int:
+        """
+        Load an atlas, replacing the current one.
+
+        The atlas image is converted for the display if one exists, so
+        call after pygame.display.set_mode().
+
+        Args:
+            map_path: Frame map path relative to the project root
+
+        Returns:
+            Number of frames loaded (0 if the atlas is missing or invalid)
+
+        Example:
+            >>> count = SpriteAtlas.load()
+        """
+        cls.unload()
+
+        project_root = get_project_root()
+        full_map_path = safe_join_path(project_root, map_path)
+        if not os.path.exists(full_map_path):
+            logger.info(f"No sprite atlas at {map_path}, loading sprites individually")
+            return 0
+
+        try:
+            with open(full_map_path, 'r', encoding='utf-8') as f:
+                frame_map = json.load(f)
+
+            if frame_map.get("version") != ATLAS_FORMAT_VERSION:
+                logger.error(f"Unsupported sprite atlas version: {frame_map.get('version')}")
+                return 0
+
+            image_path = os.path.join(os.path.dirname(full_map_path), frame_map["image"])
+            surface = pygame.image.load(image_path)
+            if pygame.display.get_surface() is not None:
+                surface = surface.convert_alpha()
+
+            bounds = surface.get_rect()
+            frames = {}
+            for path, rect in frame_map["frames"].items():
+                rect = pygame.Rect(rect)
+                if not bounds.contains(rect):
+                    logger.error(f"Atlas frame outside the atlas image: {path} {rect}")
+                    return 0
+                frames[path] = rect
+
+        except (OSError, ValueError, KeyError, TypeError, pygame.error) as e:
+            logger.error(f"Failed to load sprite atlas {map_path}: {e}")
+            return 0
+
+        cls._surface = surface
+        cls._frames = frames
+        logger.info(f"Sprite atlas loaded: {len(frames)} frames, {bounds.width}x{bounds.height}")
+        return len(frames)
+
+    @classmethod
+    def get_frame(cls, path: str) -> Optional[pygame.Surface]:
+        """
+        Get a sprite from the atlas.
+
+        Args:
+            path: Sprite path, relative to the project root or absolute
+
+        Returns:
+            Subsurface of the atlas (shared, do not draw onto it), or None
+            if the sprite is not in the atlas
+
+        Example:
+            >>> sprite = SpriteAtlas.get_frame("assets/sprites/effects/particle.png")
+        """
+        if cls._surface is None:
+            return None
+
+        key = cls._frame_key(path)
+        sprite = cls._subsurfaces.get(key)
+        if sprite is None:
+            rect = cls._frames.get(key)
+            if rect is None:
+                return None
+            sprite = cls._surface.subsurface(rect)
+            cls._subsurfaces[key] = sprite
+        return sprite
+
+    @staticmethod
+    def _frame_key(path: str) -> str:
+        """
+        Normalize a sprite path to a frame map key.
+
+        Args:
+            path: Sprite path, relative to the project root or absolute
+
+        Returns:
+            Project-relative path with forward slashes
+        """
+        sprite_path = Path(os.path.normpath(path))
+        if sprite_path.is_absolute():
+            try:
+                sprite_path = sprite_path.relative_to(Path(get_project_root()).resolve())
+            except ValueError:
+                pass
+        return sprite_path.as_posix()
+
+    @classmethod
+    def is_loaded(cls) -> bool:
+        """
+        Check whether an atlas is loaded.
+
+        Returns:
+            True if an atlas is loaded
+        """
+        return cls._surface is not None
+
+    @classmethod
+    def get_frame_count(cls) -> int:
+        """
+        Get the number of frames in the loaded atlas.
+
+        Returns:
+            Number of frames (0 if no atlas is loaded)
+        """
+        return len(cls._frames)
+
+    @classmethod
+    def unload(cls) -> None:
+        """
+        Drop the atlas (call before pygame.quit()).
+
+        Example:
+            >>> SpriteAtlas.unload()
+        """
+        cls._surface = None
+        cls._frames = {}
+        cls._subsurfaces = {}
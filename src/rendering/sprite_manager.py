@@ -14,9 +14,14 @@ Date: 2026-01-20
 
 import os
 import logging
+from collections import OrderedDict
 from typing import Dict, Optional, Tuple
 import pygame
 
+from src.config.constants import (
+    SPRITE_ANGLE_BUCKET_DEGREES, SPRITE_ANGLE_CACHE_SIZE, SPRITE_ATLAS_MAP_PATH
+)
+from src.rendering.sprite_atlas import SpriteAtlas
 from src.utils.file_utils import get_project_root, safe_join_path
 
 # Configure logger
@@ -30,9 +35,23 @@ class SpriteManager:
     Provides centralized sprite management with automatic caching to avoid
     redundant file I/O. Supports sprite loading, scaling, and rotation.
 
+    Rotations are cached too: the four right-angle variants of a sprite are
+    produced once, and arbitrary angles (e.g. rotation animations) are
+    quantized to SPRITE_ANGLE_BUCKET_DEGREES. Both caches are LRU caches
+    bounded by SPRITE_ANGLE_CACHE_SIZE, since callers may pass in any
+    surface, not only sprites loaded here.
+
+    In atlas mode (after load_atlas()), sprites packed into the atlas are
+    served as subsurfaces of the single atlas surface; sprites missing from
+    the atlas are still loaded from their own files.
+
     Attributes:
         _cache: Dictionary mapping file paths to loaded pygame.Surface objects
         _project_root: Project root directory path
+        _right_angle_cache: Sprite -> its 0/90/180/270 degree variants, in LRU order
+        _angle_cache: (sprite, angle bucket) -> rotated sprite, in LRU order
+        _tile_sprites: (path, size) -> right-angle variants of a tile sprite
+        _tile_size: Size the tile sprites are currently cached at
 
     Example:
         >>> manager = SpriteManager()
@@ -45,6 +64,10 @@ class SpriteManager:
         """Initialize the SpriteManager with empty cache."""
         self._cache: Dict[str, pygame.Surface] = {}
         self._project_root: str = get_project_root()
+        self._right_angle_cache: 'OrderedDict[pygame.Surface, Tuple[pygame.Surface, ...]]' = OrderedDict()
+        self._angle_cache: 'OrderedDict[Tuple[pygame.Surface, int], pygame.Surface]' = OrderedDict()
+        self._tile_sprites: Dict[Tuple[str, Tuple[int, int]], Tuple[pygame.Surface, ...]] = {}
+        self._tile_size: Optional[Tuple[int, int]] = None
         logger.info("SpriteManager initialized")
 
     def load_sprite(
@@ -76,6 +99,15 @@ class SpriteManager:
             logger.debug(f"Sprite loaded from cache: {relative_path}")
             return self._cache[cache_key]
 
+        # Serve from the atlas if the sprite was packed into it
+        atlas_sprite = SpriteAtlas.get_frame(relative_path)
+        if atlas_sprite is not None:
+            sprite = pygame.transform.scale(atlas_sprite, size) if size else atlas_sprite
+            if use_cache:
+                self._cache[cache_key] = sprite
+            logger.debug(f"Sprite loaded from atlas: {relative_path}")
+            return sprite
+
         # Construct full path
         full_path = safe_join_path(self._project_root, relative_path)
 
@@ -115,12 +147,17 @@ class SpriteManager:
         """
         Get a rotated version of a sprite.
 
+        Right angles are served from the sprite's cached variants. Other
+        angles are rounded to the nearest SPRITE_ANGLE_BUCKET_DEGREES and
+        cached in a bounded LRU cache, so an animation sweeping through the
+        same angles every rotation only transforms each bucket once.
+
         Args:
             sprite: Original pygame.Surface to rotate
             angle: Rotation angle in degrees (clockwise)
 
         Returns:
-            Rotated pygame.Surface
+            Rotated pygame.Surface (shared, do not draw onto it)
 
         Note:
             Pygame rotates counter-clockwise, so we negate the angle
@@ -130,8 +167,100 @@ class SpriteManager:
             >>> original = manager.load_sprite("assets/sprites/tiles/line.png")
             >>> rotated_90 = manager.get_rotated_sprite(original, 90)
         """
+        angle = angle % 360
+        if angle % 90 == 0:
+            return self._get_right_angle_variants(sprite)[int(angle) // 90]
+
+        bucket = round(angle / SPRITE_ANGLE_BUCKET_DEGREES) % (360 // SPRITE_ANGLE_BUCKET_DEGREES)
+        key = (sprite, bucket)
+        rotated = self._angle_cache.get(key)
+        if rotated is not None:
+            self._angle_cache.move_to_end(key)
+            return rotated
+
+        # Pygame rotates counter-clockwise, negate for clockwise rotation
+        rotated = pygame.transform.rotate(sprite, -bucket * SPRITE_ANGLE_BUCKET_DEGREES)
+        self._angle_cache[key] = rotated
+        if len(self._angle_cache) > SPRITE_ANGLE_CACHE_SIZE:
+            self._angle_cache.popitem(last=False)
+        return rotated
+
+    def _get_right_angle_variants(self, sprite: pygame.Surface) -> Tuple[pygame.Surface, ...]:
+        """
+        Get the 0/90/180/270 degree variants of a sprite, building them once.
+
+        Args:
+            sprite: Original pygame.Surface
+
+        Returns:
+            Tuple of four surfaces indexed by rotation // 90
+        """
+        variants = self._right_angle_cache.get(sprite)
+        if variants is not None:
+            self._right_angle_cache.move_to_end(sprite)
+            return variants
+
         # Pygame rotates counter-clockwise, negate for clockwise rotation
-        return pygame.transform.rotate(sprite, -angle)
+        variants = (sprite,) + tuple(
+            pygame.transform.rotate(sprite, -angle) for angle in (90, 180, 270)
+        )
+        self._right_angle_cache[sprite] = variants
+        if len(self._right_angle_cache) > SPRITE_ANGLE_CACHE_SIZE:
+            self._right_angle_cache.popitem(last=False)
+        return variants
+
+    def get_tile_sprite(
+        self,
+        relative_path: str,
+        size: Tuple[int, int],
+        rotation: int
+    ) -> Optional[pygame.Surface]:
+        """
+        Get a scaled tile sprite at a right-angle rotation.
+
+        The scaled sprite and its rotations are produced once per
+        (sprite, size); after that this is a single dictionary lookup.
+        Requesting a new size (e.g. a board with a different grid size)
+        evicts the sprites cached for the previous size.
+
+        Args:
+            relative_path: Path relative to project root
+            size: (width, height) the sprite is scaled to
+            rotation: Rotation in degrees (multiple of 90)
+
+        Returns:
+            Rotated pygame.Surface or None if loading fails
+
+        Example:
+            >>> sprite = manager.get_tile_sprite("assets/sprites/tiles/tile_corner.png", (96, 96), 270)
+        """
+        variants = self._tile_sprites.get((relative_path, size))
+        if variants is None:
+            if size != self._tile_size:
+                self._evict_tile_sprites()
+                self._tile_size = size
+
+            sprite = self.load_sprite(relative_path, size=size)
+            if sprite is None:
+                return None
+            variants = self._get_right_angle_variants(sprite)
+            self._tile_sprites[(relative_path, size)] = variants
+
+        return variants[rotation % 360 // 90]
+
+    def _evict_tile_sprites(self) -> None:
+        """
+        Drop the tile sprites cached for the current tile size.
+        """
+        for relative_path, size in self._tile_sprites:
+            sprite = self._cache.pop(f"{relative_path}_{size}", None)
+            self._right_angle_cache.pop(sprite, None)
+            for key in [key for key in self._angle_cache if key[0] is sprite]:
+                del self._angle_cache[key]
+
+        if self._tile_sprites:
+            logger.debug(f"Evicted {len(self._tile_sprites)} tile sprites of size {self._tile_size}")
+        self._tile_sprites.clear()
 
     def create_placeholder_sprite(
         self,
@@ -156,6 +285,33 @@ class SpriteManager:
         logger.warning(f"Created placeholder sprite of size {size}")
         return surface
 
+    def load_atlas(self, map_path: str = SPRITE_ATLAS_MAP_PATH) -> int:
+        """
+        Switch to atlas mode by loading a sprite atlas.
+
+        Sprites already cached keep their current surfaces; call
+        clear_cache() first to move them onto the atlas.
+
+        Args:
+            map_path: Atlas frame map path relative to project root
+
+        Returns:
+            Number of sprites in the atlas (0 if it is missing or invalid)
+
+        Example:
+            >>> count = manager.load_atlas()
+        """
+        return SpriteAtlas.load(map_path)
+
+    def is_atlas_mode(self) -> bool:
+        """
+        Check whether sprites are served from an atlas.
+
+        Returns:
+            True if an atlas is loaded
+        """
+        return SpriteAtlas.is_loaded()
+
     def preload_sprites(self, sprite_paths: list[str]) -> int:
         """
         Preload multiple sprites into cache.
@@ -189,6 +345,10 @@ class SpriteManager:
         """
         cache_size = len(self._cache)
         self._cache.clear()
+        self._right_angle_cache.clear()
+        self._angle_cache.clear()
+        self._tile_sprites.clear()
+        self._tile_size = None
         logger.info(f"Sprite cache cleared ({cache_size} sprites removed)")
 
     def get_cache_size(self) -> int:
@@ -203,6 +363,19 @@ class SpriteManager:
         """
         return len(self._cache)
 
+    def get_rotation_cache_size(self) -> int:
+        """
+        Get the number of cached rotated sprites.
+
+        Returns:
+            Number of right-angle variants (excluding originals) plus
+            arbitrary-angle entries
+
+        Example:
+            >>> size = manager.get_rotation_cache_size()
+        """
+        return 3 * len(self._right_angle_cache) + len(self._angle_cache)
+
     def get_sprite_size(self, sprite: pygame.Surface) -> Tuple[int, int]:
         """
         Get the size of a sprite.
@@ -16,6 +16,7 @@ from typing import Optional, Dict, Any
 import pygame
 
 from src.rendering.ui.ui_component import UIComponent
+from src.rendering.font_registry import FontRegistry
 from src.config.constants import COLOR_TEXT, COLOR_BACKGROUND
 
 # Configure logger
@@ -72,17 +73,7 @@ class HUD(UIComponent):
         self._data: Dict[str, Any] = {}
 
         # Font
-        try:
-            # Use Microsoft YaHei for Chinese support
-            chinese_font = "C:/WINDOWS/fonts/msyh.ttc"
-            self._font = pygame.font.Font(chinese_font, font_size)
-        except Exception as e:
-            logger.warning(f"Failed to load Chinese font, using default: {e}")
-            try:
-                self._font = pygame.font.Font(None, font_size)
-            except Exception as e2:
-                logger.error(f"Failed to create font: {e2}")
-                self._font = pygame.font.Font(None, 20)
+        self._font = FontRegistry.get_font(None, font_size)
 
         logger.debug(f"HUD created at ({x}, {y})")
 
@@ -16,6 +16,7 @@ from src.scenes.layers.hud_layer import HUDLayer
 from src.scenes.layers.debug_layer import DebugLayer
 from src.scenes.layers.layer_base import LayerBase
 from src.core.timer.game_timer import GameTimer
+from src.core.scoring.star_rating import StarRating
 from src.integration.game_controller import GameController
 from src.utils.logger import GameLogger
 
@@ -207,6 +208,24 @@ class GameplayScene(SceneBase):
             if layer.is_visible():
                 layer.draw(surface)
 
+    def get_dirty_rects(self) -> Optional[List[pygame.Rect]]:
+        """
+        Get the screen rects changed by the last draw(), from all layers.
+
+        Returns:
+            Optional[List[pygame.Rect]]: Changed rects, or None if the whole
+            screen must be presented
+        """
+        rects: Optional[List[pygame.Rect]] = []
+        for layer in self._layers:
+            # Collect every layer so each one starts the next frame clean
+            layer_rects = layer.collect_dirty_rects()
+            if layer_rects is None:
+                rects = None
+            elif rects is not None:
+                rects.extend(layer_rects)
+        return rects
+
     def handle_event(self, event: pygame.event.Event) -> bool:
         """
         Handle pygame event.
@@ -346,13 +365,28 @@ class GameplayScene(SceneBase):
         if self._game_timer:
             self._game_timer.stop()
 
+        time_taken = self._game_timer.get_elapsed_time() if self._game_timer else 0.0
+        moves = self._game_controller.get_move_count() if self._game_controller else 0
+
+        # Rate the win against the level's solver-computed optimal move count.
+        # Without one (no solvable level data) stars stay 0, as before.
+        stars = 0
+        optimal_moves = self._game_controller.get_optimal_moves() if self._game_controller else None
+        if victory and optimal_moves is not None:
+            stars = StarRating().calculate_stars(
+                time_taken=time_taken,
+                time_limit=self._time_limit,
+                moves=moves,
+                optimal_moves=optimal_moves
+            )
+
         # Prepare result data
         result_data = {
             'victory': victory,
             'level': self._level,
-            'time_taken': self._game_timer.get_elapsed_time() if self._game_timer else 0.0,
-            'moves': self._game_controller.get_move_count() if self._game_controller else 0,
-            'stars': 0,  # Will be calculated by ResultScene
+            'time_taken': time_taken,
+            'moves': moves,
+            'stars': stars,
             'difficulty': self._difficulty,
             'screen_width': self._screen_width,
             'screen_height': self._screen_height
@@ -67,6 +67,7 @@ class BackgroundLayer(LayerBase):
         # Update parallax scrolling if enabled
         if self._parallax_speed != 0:
             self._parallax_offset += self._parallax_speed * (delta_ms / 1000.0)
+            self.mark_dirty()
 
     def draw(self, surface: pygame.Surface) -> None:
         """
@@ -106,6 +107,7 @@ class BackgroundLayer(LayerBase):
             color: RGB color tuple
         """
         self._background_color = color
+        self.mark_dirty()
 
     def set_background_image(self, image: pygame.Surface) -> None:
         """
@@ -115,6 +117,7 @@ class BackgroundLayer(LayerBase):
             image: Background image surface
         """
         self._background_image = image
+        self.mark_dirty()
 
     def set_parallax_speed(self, speed: float) -> None:
         """
@@ -50,6 +50,7 @@ class DebugLayer(LayerBase):
         self._debug_values: Dict[str, Any] = {}
         self._font: Optional[pygame.font.Font] = None
         self._visible = False  # Hidden by default
+        self._drawn_rect: Optional[pygame.Rect] = None
 
         # Try to load font
         try:
@@ -82,7 +83,7 @@ class DebugLayer(LayerBase):
         # Draw semi-transparent background
         debug_surface = pygame.Surface((300, 200), pygame.SRCALPHA)
         debug_surface.fill((0, 0, 0, 180))
-        surface.blit(debug_surface, (10, 70))
+        drawn_rect = surface.blit(debug_surface, (10, 70))
 
         # Draw debug values
         y_offset = 80
@@ -90,16 +91,22 @@ class DebugLayer(LayerBase):
 
         # Title
         title_text = self._font.render("Debug Info", True, (255, 255, 0))
-        surface.blit(title_text, (20, y_offset))
+        drawn_rect.union_ip(surface.blit(title_text, (20, y_offset)))
         y_offset += line_height
 
         # Draw each debug value
         for key, value in self._debug_values.items():
             text = f"{key}: {value}"
             debug_text = self._font.render(text, True, (200, 200, 200))
-            surface.blit(debug_text, (20, y_offset))
+            drawn_rect.union_ip(surface.blit(debug_text, (20, y_offset)))
             y_offset += line_height
 
+        # Values change every frame; also cover text left by a longer value
+        self.mark_dirty(drawn_rect)
+        if self._drawn_rect is not None:
+            self.mark_dirty(self._drawn_rect)
+        self._drawn_rect = drawn_rect
+
     def handle_event(self, event: pygame.event.Event) -> bool:
         """
         Handle pygame event.
@@ -145,6 +152,9 @@ class DebugLayer(LayerBase):
     def toggle_visibility(self) -> None:
         """Toggle debug layer visibility."""
         self._visible = not self._visible
+        if self._drawn_rect is not None:
+            self.mark_dirty(self._drawn_rect)
+            self._drawn_rect = None
         logger.debug(f"Debug layer visibility: {self._visible}")
 
     def get_debug_values(self) -> Dict[str, Any]:
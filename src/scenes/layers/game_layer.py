@@ -103,6 +103,9 @@ class GameLayer(LayerBase):
             # Draw particles on our surface
             self._game_controller._particle_system.draw(surface)
 
+            for rect in self._game_controller.get_dirty_rects():
+                self.mark_dirty(rect)
+
         finally:
             # Restore original screen
             renderer._screen = original_screen
@@ -132,6 +135,7 @@ class GameLayer(LayerBase):
         """
         self._game_controller = controller
         self._game_surface = pygame.Surface((self._screen_width, self._screen_height))
+        self.mark_dirty()
         logger.debug("Game controller set")
 
     def get_game_controller(self) -> Optional[GameController]:
@@ -216,25 +216,19 @@ class HUDLayer(LayerBase):
 
         logger.debug(f"HUD drawing - visible={self._visible}, enabled={self._enabled}")
 
-        # Draw HUD panel
-        if self._hud_panel:
-            self._hud_panel.draw(surface)
-
-        # Draw labels
-        if self._level_label:
-            self._level_label.draw(surface)
-        if self._timer_label:
-            self._timer_label.draw(surface)
-        if self._moves_label:
-            self._moves_label.draw(surface)
-
-        # Draw buttons
-        if self._debug_button:
-            self._debug_button.draw(surface)
-        if self._exit_button:
-            self._exit_button.draw(surface)
-        if self._pause_button:
-            self._pause_button.draw(surface)
+        # Panel first, then labels, then buttons
+        components = (
+            self._hud_panel,
+            self._level_label, self._timer_label, self._moves_label,
+            self._debug_button, self._exit_button, self._pause_button
+        )
+        for component in components:
+            if component:
+                component.draw(surface)
+                # Report what changed (e.g. the timer label once a second)
+                dirty_rect = component.consume_dirty_rect()
+                if dirty_rect is not None:
+                    self.mark_dirty(dirty_rect)
 
     def handle_event(self, event: pygame.event.Event) -> bool:
         """
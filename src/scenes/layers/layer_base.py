@@ -8,7 +8,7 @@ Date: 2026-01-23
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional
+from typing import List, Optional
 import pygame
 from src.utils.logger import GameLogger
 
@@ -27,6 +27,11 @@ class LayerBase(ABC):
     3. HUD Layer
     4. Debug Layer (top)
 
+    Layers draw their full content every frame, but report the screen
+    rects that actually changed through mark_dirty() so the frame can be
+    presented with pygame.display.update(rects). A new layer reports the
+    whole screen on its first frame.
+
     Example:
         >>> class MyLayer(LayerBase):
         ...     def update(self, delta_ms):
@@ -49,6 +54,8 @@ class LayerBase(ABC):
         self._screen_height = screen_height
         self._visible = True
         self._enabled = True
+        self._dirty_rects: List[pygame.Rect] = []
+        self._full_redraw = True
 
         logger.debug(f"{self.__class__.__name__} initialized")
 
@@ -85,6 +92,35 @@ class LayerBase(ABC):
         """
         pass
 
+    def mark_dirty(self, rect: Optional[pygame.Rect] = None) -> None:
+        """
+        Report a screen area changed by this layer.
+
+        Args:
+            rect: Changed screen area (None for the whole screen)
+        """
+        if rect is None:
+            self._full_redraw = True
+            self._dirty_rects.clear()
+        elif not self._full_redraw:
+            self._dirty_rects.append(pygame.Rect(rect))
+
+    def collect_dirty_rects(self) -> Optional[List[pygame.Rect]]:
+        """
+        Get and reset the screen areas changed since the last call.
+
+        Returns:
+            Optional[List[pygame.Rect]]: Changed rects, or None if the whole
+            screen changed
+        """
+        if self._full_redraw:
+            self._full_redraw = False
+            return None
+
+        rects = self._dirty_rects
+        self._dirty_rects = []
+        return rects
+
     def on_enter(self) -> None:
         """Called when the layer becomes active."""
         logger.debug(f"{self.__class__.__name__} entered")
@@ -104,6 +140,7 @@ class LayerBase(ABC):
             logger.warning(f"{self.__class__.__name__} visibility changed: {self._visible} -> {visible}")
             import traceback
             logger.warning(f"Visibility change stack trace:\n{''.join(traceback.format_stack())}")
+            self.mark_dirty()
         self._visible = visible
 
     def is_visible(self) -> bool:
@@ -8,7 +8,7 @@ Date: 2026-01-23
 """
 
 from abc import ABC, abstractmethod
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List
 import pygame
 from src.utils.logger import GameLogger
 
@@ -119,6 +119,19 @@ class SceneBase(ABC):
         """
         pass
 
+    def get_dirty_rects(self) -> Optional[List[pygame.Rect]]:
+        """
+        Get the screen rects changed by the last draw().
+
+        Called once per frame after draw(). Scenes that track what they
+        change override this; the default reports the whole screen.
+
+        Returns:
+            Optional[List[pygame.Rect]]: Changed rects, or None if the whole
+            screen must be presented
+        """
+        return None
+
     def get_transition_data(self, key: str, default: Any = None) -> Any:
         """
         Get data from the transition data dictionary.
@@ -42,6 +42,11 @@ class SceneManager:
         self._transition_type = 'fade'
         self._transition_surface: Optional[pygame.Surface] = None
         self._pending_scene_change: Optional[tuple] = None
+
+        # Dirty-rect presentation state
+        self._presented_scene: Optional[SceneBase] = None
+        self._transition_drawn = False
+        self._transition_presented = False
         logger.info("SceneManager initialized")
 
     def push_scene(
@@ -179,6 +184,7 @@ class SceneManager:
         Args:
             surface: Pygame surface to draw on
         """
+        self._transition_drawn = False
         if not self._scene_stack:
             return
 
@@ -189,6 +195,30 @@ class SceneManager:
         # Draw transition overlay
         if self._transition_active and self._transition_surface:
             self._draw_transition(surface)
+            self._transition_drawn = True
+
+    def get_dirty_rects(self) -> Optional[List[pygame.Rect]]:
+        """
+        Get the screen rects changed by the last draw().
+
+        Call once per frame after draw(). The whole screen is reported when
+        the current scene changed, while a transition overlay is drawn and
+        on the frame after it, or when the scene does not track its changes.
+
+        Returns:
+            Optional[List[pygame.Rect]]: Changed rects, or None if the whole
+            screen must be presented
+        """
+        current_scene = self.get_current_scene()
+        rects = current_scene.get_dirty_rects() if current_scene else None
+
+        if (current_scene is not self._presented_scene
+                or self._transition_drawn or self._transition_presented):
+            rects = None
+
+        self._presented_scene = current_scene
+        self._transition_presented = self._transition_drawn
+        return rects
 
     def handle_event(self, event: pygame.event.Event) -> bool:
         """
@@ -10,6 +10,7 @@ Date: 2026-01-23
 from typing import Optional, Callable, Dict, Tuple
 import pygame
 from src.ui.components.ui_component import UIComponent
+from src.rendering.font_registry import FontRegistry
 from src.utils.logger import GameLogger
 
 logger = GameLogger.get_logger(__name__)
@@ -83,11 +84,7 @@ class Button(UIComponent):
         self._is_pressed = False
 
         # Load font
-        try:
-            self._font = pygame.font.Font("C:/WINDOWS/fonts/msyh.ttc", font_size)
-        except Exception:
-            logger.warning("Failed to load Chinese font, using default")
-            self._font = pygame.font.Font(None, font_size)
+        self._font = FontRegistry.get_font(None, font_size)
 
         logger.debug(f"Button '{label}' created at ({x}, {y})")
 
@@ -142,17 +139,17 @@ class Button(UIComponent):
             # Update hover state
             if self.contains_point(event.pos[0], event.pos[1]):
                 if not self._is_pressed:
-                    self._state = self.STATE_HOVER
+                    self._change_state(self.STATE_HOVER)
                 return True
             else:
                 if not self._is_pressed:
-                    self._state = self.STATE_NORMAL
+                    self._change_state(self.STATE_NORMAL)
                 return False
 
         elif event.type == pygame.MOUSEBUTTONDOWN:
             if event.button == 1:  # Left click
                 if self.contains_point(event.pos[0], event.pos[1]):
-                    self._state = self.STATE_PRESSED
+                    self._change_state(self.STATE_PRESSED)
                     self._is_pressed = True
                     logger.debug(f"Button '{self.label}' pressed")
                     return True
@@ -163,13 +160,13 @@ class Button(UIComponent):
                 self._is_pressed = False
 
                 if self.contains_point(event.pos[0], event.pos[1]):
-                    self._state = self.STATE_HOVER
+                    self._change_state(self.STATE_HOVER)
                     if was_pressed and self.on_click:
                         logger.info(f"Button '{self.label}' clicked")
                         self.on_click()
                     return True
                 else:
-                    self._state = self.STATE_NORMAL
+                    self._change_state(self.STATE_NORMAL)
 
         return False
 
@@ -181,10 +178,21 @@ class Button(UIComponent):
             state: Button state (normal/hover/pressed/disabled)
         """
         if state in [self.STATE_NORMAL, self.STATE_HOVER, self.STATE_PRESSED, self.STATE_DISABLED]:
-            self._state = state
+            self._change_state(state)
         else:
             logger.warning(f"Invalid button state: {state}")
 
+    def _change_state(self, state: str) -> None:
+        """
+        Switch the visual state, marking the button dirty if it changed.
+
+        Args:
+            state: New button state
+        """
+        if state != self._state:
+            self._state = state
+            self.mark_dirty()
+
     def get_state(self) -> str:
         """
         Get the current button state.
@@ -201,7 +209,9 @@ class Button(UIComponent):
         Args:
             label: New label text
         """
-        self.label = label
+        if label != self.label:
+            self.label = label
+            self.mark_dirty()
 
     def set_sprites(self, sprites: Dict[str, pygame.Surface]) -> None:
         """
@@ -211,6 +221,7 @@ class Button(UIComponent):
             sprites: Dictionary of state sprites {state: surface}
         """
         self._sprites = sprites
+        self.mark_dirty()
 
     def set_colors(self, colors: Dict[str, Tuple[int, int, int]]) -> None:
         """
@@ -220,3 +231,4 @@ class Button(UIComponent):
             colors: Dictionary of state colors {state: (r, g, b)}
         """
         self._colors = colors
+        self.mark_dirty()
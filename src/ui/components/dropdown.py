@@ -10,6 +10,7 @@ Date: 2026-01-26
 from typing import Optional, Callable, List, Tuple
 import pygame
 from src.ui.components.ui_component import UIComponent
+from src.rendering.font_registry import FontRegistry
 from src.utils.logger import GameLogger
 
 logger = GameLogger.get_logger(__name__)
@@ -80,11 +81,7 @@ class Dropdown(UIComponent):
         self._hover_index = -1
 
         # Load font
-        try:
-            self._font = pygame.font.Font("C:/WINDOWS/fonts/msyh.ttc", font_size)
-        except Exception:
-            logger.warning("Failed to load Chinese font, using default")
-            self._font = pygame.font.Font(None, font_size)
+        self._font = FontRegistry.get_font(None, font_size)
 
         logger.debug(f"Dropdown created at ({x}, {y}) with {len(options)} options")
 
@@ -10,6 +10,7 @@ Date: 2026-01-23
 from typing import Optional, Tuple
 import pygame
 from src.ui.components.ui_component import UIComponent
+from src.rendering.sprite_atlas import SpriteAtlas
 from src.utils.logger import GameLogger
 
 logger = GameLogger.get_logger(__name__)
@@ -248,7 +249,9 @@ class Image(UIComponent):
             bool: True if successful, False otherwise
         """
         try:
-            image = pygame.image.load(file_path)
+            image = SpriteAtlas.get_frame(file_path)
+            if image is None:
+                image = pygame.image.load(file_path)
             self.set_image(image)
             logger.info(f"Image loaded from {file_path}")
             return True
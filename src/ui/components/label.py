@@ -10,6 +10,7 @@ Date: 2026-01-23
 from typing import Optional, Tuple, List
 import pygame
 from src.ui.components.ui_component import UIComponent
+from src.rendering.font_registry import FontRegistry
 from src.utils.logger import GameLogger
 
 logger = GameLogger.get_logger(__name__)
@@ -75,16 +76,15 @@ class Label(UIComponent):
         self._word_wrap = word_wrap
 
         # Load font
-        try:
-            self._font = pygame.font.Font("C:/WINDOWS/fonts/msyh.ttc", font_size)
-        except Exception:
-            logger.warning("Failed to load Chinese font, using default")
-            self._font = pygame.font.Font(None, font_size)
+        self._font = FontRegistry.get_font(None, font_size)
 
         # Cache rendered lines
         self._rendered_lines: List[pygame.Surface] = []
         self._render_text()
 
+        # Screen area covered by the last draw (text may overflow the label)
+        self._drawn_rect: Optional[pygame.Rect] = None
+
         logger.debug(f"Label created at ({x}, {y}) with text: '{text[:20]}...'")
 
     def _render_text(self) -> None:
@@ -135,6 +135,7 @@ class Label(UIComponent):
 
         current_y = self.y
         line_height = self._font.get_height()
+        drawn_rect = self.get_rect()
 
         for line_surface in self._rendered_lines:
             # Calculate x position based on alignment
@@ -146,13 +147,29 @@ class Label(UIComponent):
                 line_x = self.x
 
             # Draw the line
-            surface.blit(line_surface, (line_x, current_y))
+            drawn_rect.union_ip(surface.blit(line_surface, (line_x, current_y)))
             current_y += line_height + self._line_spacing
 
             # Stop if we exceed the label height
             if current_y > self.y + self.height:
                 break
 
+        # Overflowing text must be repainted along with the label
+        if self._dirty_rect is not None:
+            self.mark_dirty(drawn_rect)
+        self._drawn_rect = drawn_rect
+
+    def mark_dirty(self, rect: Optional[pygame.Rect] = None) -> None:
+        """
+        Record that the label must be redrawn, including overflowing text.
+
+        Args:
+            rect: Changed screen area (defaults to the label rect)
+        """
+        super().mark_dirty(rect)
+        if rect is None and self._drawn_rect is not None:
+            super().mark_dirty(self._drawn_rect)
+
     def handle_event(self, event: pygame.event.Event) -> bool:
         """
         Handle pygame event (labels don't handle events by default).
@@ -172,8 +189,11 @@ class Label(UIComponent):
         Args:
             text: New text content
         """
+        if text == self._text:
+            return
         self._text = text
         self._render_text()
+        self.mark_dirty()
 
     def get_text(self) -> str:
         """
@@ -193,6 +213,7 @@ class Label(UIComponent):
         """
         self._text_color = color
         self._render_text()
+        self.mark_dirty()
 
     def set_alignment(self, alignment: str) -> None:
         """
@@ -203,6 +224,7 @@ class Label(UIComponent):
         """
         if alignment in [self.ALIGN_LEFT, self.ALIGN_CENTER, self.ALIGN_RIGHT]:
             self._alignment = alignment
+            self.mark_dirty()
         else:
             logger.warning(f"Invalid alignment: {alignment}")
 
@@ -214,8 +236,6 @@ class Label(UIComponent):
             font_size: Font size in pixels
         """
         self._font_size = font_size
-        try:
-            self._font = pygame.font.Font("C:/WINDOWS/fonts/msyh.ttc", font_size)
-        except Exception:
-            self._font = pygame.font.Font(None, font_size)
+        self._font = FontRegistry.get_font(None, font_size)
         self._render_text()
+        self.mark_dirty()
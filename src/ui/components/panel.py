@@ -153,6 +153,7 @@ class Panel(UIComponent):
             color: Background color (r, g, b)
         """
         self._background_color = color
+        self.mark_dirty()
 
     def set_background_image(self, image: pygame.Surface) -> None:
         """
@@ -162,6 +163,7 @@ class Panel(UIComponent):
             image: Background image surface
         """
         self._background_image = image
+        self.mark_dirty()
 
     def set_border(self, color: Tuple[int, int, int], width: int) -> None:
         """
@@ -173,6 +175,7 @@ class Panel(UIComponent):
         """
         self._border_color = color
         self._border_width = width
+        self.mark_dirty()
 
     def set_alpha(self, alpha: int) -> None:
         """
@@ -187,3 +190,4 @@ class Panel(UIComponent):
             self._surface = pygame.Surface((self.width, self.height), pygame.SRCALPHA)
         elif self._alpha == 255:
             self._surface = None
+        self.mark_dirty()
@@ -10,6 +10,7 @@ Date: 2026-01-23
 from typing import Optional, Tuple
 import pygame
 from src.ui.components.ui_component import UIComponent
+from src.rendering.font_registry import FontRegistry
 from src.utils.logger import GameLogger
 
 logger = GameLogger.get_logger(__name__)
@@ -77,11 +78,7 @@ class ProgressBar(UIComponent):
         self._max_progress = 1.0
 
         # Load font for percentage text
-        try:
-            self._font = pygame.font.Font("C:/WINDOWS/fonts/msyh.ttc", 16)
-        except Exception:
-            logger.warning("Failed to load Chinese font, using default")
-            self._font = pygame.font.Font(None, 16)
+        self._font = FontRegistry.get_font(None, 16)
 
         logger.debug(f"ProgressBar created at ({x}, {y}) with size ({width}, {height})")
 
@@ -107,6 +104,7 @@ class ProgressBar(UIComponent):
                     self._current_progress - progress_change,
                     self._target_progress
                 )
+            self.mark_dirty()
 
     def draw(self, surface: pygame.Surface) -> None:
         """
@@ -184,6 +182,7 @@ class ProgressBar(UIComponent):
         """
         self._target_progress = max(self._min_progress, min(self._max_progress, progress))
         self._current_progress = self._target_progress
+        self.mark_dirty()
 
     def get_progress(self) -> float:
         """
@@ -223,6 +222,7 @@ class ProgressBar(UIComponent):
             self._background_color = background_color
         if border_color is not None:
             self._border_color = border_color
+        self.mark_dirty()
 
     def set_show_percentage(self, show: bool) -> None:
         """
@@ -232,8 +232,10 @@ class ProgressBar(UIComponent):
             show: True to show percentage, False to hide
         """
         self._show_percentage = show
+        self.mark_dirty()
 
     def reset(self) -> None:
         """Reset progress to 0."""
         self._target_progress = 0.0
         self._current_progress = 0.0
+        self.mark_dirty()
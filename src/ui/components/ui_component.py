@@ -25,6 +25,8 @@ class UIComponent(ABC):
         height (int): Height of the component
         visible (bool): Whether the component is visible
         enabled (bool): Whether the component is enabled for interaction
+        _dirty_rect (Optional[pygame.Rect]): Screen area changed since the
+            last consume_dirty_rect() call (None if unchanged)
 
     Example:
         >>> class MyButton(UIComponent):
@@ -50,6 +52,7 @@ class UIComponent(ABC):
         self.height = height
         self.visible = True
         self.enabled = True
+        self._dirty_rect: Optional[pygame.Rect] = self.get_rect()
 
     @abstractmethod
     def draw(self, surface: pygame.Surface) -> None:
@@ -105,6 +108,34 @@ class UIComponent(ABC):
         """
         return self.get_rect().collidepoint(x, y)
 
+    def mark_dirty(self, rect: Optional[pygame.Rect] = None) -> None:
+        """
+        Record that part of the component must be redrawn on screen.
+
+        Subclasses call this whenever their appearance changes.
+
+        Args:
+            rect: Changed screen area (defaults to the component rect)
+        """
+        rect = self.get_rect() if rect is None else pygame.Rect(rect)
+        if self._dirty_rect is None:
+            self._dirty_rect = rect
+        else:
+            self._dirty_rect.union_ip(rect)
+
+    def consume_dirty_rect(self) -> Optional[pygame.Rect]:
+        """
+        Get and reset the screen area changed since the last call.
+
+        Call after draw() so the rect covers what was just drawn.
+
+        Returns:
+            pygame.Rect: Changed area, or None if the component is unchanged
+        """
+        rect = self._dirty_rect
+        self._dirty_rect = None
+        return rect
+
     def set_position(self, x: int, y: int) -> None:
         """
         Set the component's position.
@@ -113,8 +144,10 @@ class UIComponent(ABC):
             x: New X position
             y: New Y position
         """
+        self.mark_dirty()
         self.x = x
         self.y = y
+        self.mark_dirty()
 
     def set_size(self, width: int, height: int) -> None:
         """
@@ -124,21 +157,31 @@ class UIComponent(ABC):
             width: New width
             height: New height
         """
+        self.mark_dirty()
         self.width = width
         self.height = height
+        self.mark_dirty()
 
     def show(self) -> None:
         """Make the component visible."""
-        self.visible = True
+        if not self.visible:
+            self.visible = True
+            self.mark_dirty()
 
     def hide(self) -> None:
         """Hide the component."""
-        self.visible = False
+        if self.visible:
+            self.visible = False
+            self.mark_dirty()
 
     def enable(self) -> None:
         """Enable the component for interaction."""
-        self.enabled = True
+        if not self.enabled:
+            self.enabled = True
+            self.mark_dirty()
 
     def disable(self) -> None:
         """Disable the component for interaction."""
-        self.enabled = False
+        if self.enabled:
+            self.enabled = False
+            self.mark_dirty()
@@ -11,6 +11,7 @@ from typing import Dict, List, Callable, Optional, Any
 from enum import Enum
 import pygame
 from pathlib import Path
+from src.rendering.sprite_atlas import SpriteAtlas
 from src.utils.logger import GameLogger
 
 logger = GameLogger.get_logger(__name__)
@@ -157,6 +158,13 @@ class ResourcePreloader:
             name: Resource name
             path: Path to image file
         """
+        # Packed sprites come from the atlas without opening the file
+        atlas_image = SpriteAtlas.get_frame(path)
+        if atlas_image is not None:
+            self._resources[name] = atlas_image
+            logger.debug(f"Loaded image from atlas: {name}")
+            return
+
         if not Path(path).exists():
             raise FileNotFoundError(f"Image file not found: {path}")
 
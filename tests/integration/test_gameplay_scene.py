@@ -42,6 +42,7 @@ def game_controller():
     controller.get_move_count = Mock(return_value=0)
     controller.is_game_over = Mock(return_value=False)
     controller.is_victory = Mock(return_value=False)
+    controller.get_optimal_moves = Mock(return_value=4)
     return controller
 
 
@@ -296,6 +297,21 @@ class TestGameplaySceneGameOver:
         assert result_data['moves'] == 15
         assert result_data['victory'] is True
 
+    def test_unsolvable_level_gets_no_stars(self, pygame_init, scene_manager, game_controller):
+        """Test that a win without an optimal move count is not rated."""
+        scene = GameplayScene(scene_manager)
+        scene.on_enter({'game_controller': game_controller})
+
+        game_controller.get_optimal_moves.return_value = None
+        game_controller.is_game_over.return_value = True
+        game_controller.is_victory.return_value = True
+        game_controller.get_move_count.return_value = 15
+
+        scene.update(16.67)
+
+        result_data = scene_manager.replace_scene.call_args[0][1]
+        assert result_data['stars'] == 0
+
 
 class TestGameplayScenePause:
     """Test pause functionality."""
@@ -0,0 +1,100 @@
+"""
+批量连通性评估器单元测试
+
+测试BatchConnectivityEvaluator与ConnectivityChecker的结果一致性。
+"""
+
+import unittest
+import random
+import numpy as np
+from src.core.circuit.batch_connectivity import BatchConnectivityEvaluator
+from src.core.circuit.connectivity_checker import ConnectivityChecker
+from src.core.grid.grid_manager import GridManager
+from src.core.grid.tile import Tile
+from src.core.grid.tile_type import TileType
+
+
+class TestBatchConnectivityEvaluator(unittest.TestCase):
+    """测试批量连通性评估"""
+
+    def setUp(self):
+        """设置测试环境：电源 -> 直线 -> 直线 -> 终端"""
+        self.grid = GridManager(4)
+        self.grid.set_tile(0, 0, Tile(0, 0, TileType.POWER_SOURCE, 0))
+        self.grid.set_tile(0, 1, Tile(0, 1, TileType.STRAIGHT, 0))
+        self.grid.set_tile(0, 2, Tile(0, 2, TileType.STRAIGHT, 0))
+        self.grid.set_tile(0, 3, Tile(0, 3, TileType.TERMINAL, 0))
+        self.evaluator = BatchConnectivityEvaluator(self.grid)
+
+    def test_current_state(self):
+        """测试当前旋转状态"""
+        rotations = self.evaluator.current_rotations(self.grid)
+        powered = self.evaluator.evaluate(rotations)
+
+        self.assertEqual(powered.shape, (1, 16))
+        self.assertEqual(
+            set(np.flatnonzero(powered[0])),
+            {y * 4 + 0 for y in range(4)}
+        )
+        self.assertTrue(self.evaluator.terminal_reached(rotations)[0])
+
+    def test_batch_states(self):
+        """测试多个旋转方案"""
+        base = self.evaluator.current_rotations(self.grid)
+        rotations = np.tile(base, (4, 1))
+        rotations[1, 1 * 4 + 0] = 1  # (0, 1) 旋转90度，断开
+        rotations[2, 2 * 4 + 0] = 2  # (0, 2) 旋转180度，仍然连通
+        rotations[3, 3 * 4 + 0] = 1  # 终端不可旋转，忽略
+
+        reached = self.evaluator.terminal_reached(rotations)
+        self.assertEqual(reached.tolist(), [True, False, True, True])
+
+    def test_invalid_shape(self):
+        """测试格子数不匹配"""
+        with self.assertRaises(ValueError):
+            self.evaluator.evaluate(np.zeros((2, 9), dtype=np.uint8))
+
+    def test_no_power_source(self):
+        """测试没有电源时全部不通电"""
+        evaluator = BatchConnectivityEvaluator(GridManager(3))
+        self.assertFalse(evaluator.evaluate(np.zeros((2, 9), dtype=np.uint8)).any())
+        self.assertFalse(evaluator.terminal_reached(np.zeros((2, 9), dtype=np.uint8)).any())
+
+    def test_matches_scalar_bfs(self):
+        """测试随机棋盘与随机旋转下与标量BFS完全一致"""
+        rng = random.Random(20260126)
+        tile_types = [TileType.STRAIGHT, TileType.CORNER, TileType.CORNER, TileType.EMPTY]
+
+        for _ in range(10):
+            size = rng.randint(3, 9)
+            grid = GridManager(size, compact=rng.random() < 0.5)
+            for x in range(size):
+                for y in range(size):
+                    if rng.random() < 0.9:
+                        grid.set_tile(x, y, Tile(x, y, rng.choice(tile_types), 0))
+            grid.set_tile(rng.randrange(size), rng.randrange(size), Tile(0, 0, TileType.POWER_SOURCE, 0))
+            grid.set_tile(size - 1, 0, Tile(0, 0, TileType.TERMINAL, 0))
+
+            evaluator = BatchConnectivityEvaluator(grid)
+            rotations = np.array(
+                [[rng.randrange(4) for _ in range(size * size)] for _ in range(30)],
+                dtype=np.uint8
+            )
+            powered = evaluator.evaluate(rotations)
+            reached = evaluator.terminal_reached(rotations)
+
+            checker = ConnectivityChecker()
+            for state in range(len(rotations)):
+                for index in range(size * size):
+                    tile = grid.get_tile(index % size, index // size)
+                    if tile is not None:
+                        tile.set_rotation(int(rotations[state, index]) * 90)
+
+                result = checker.analyze(grid)
+                expected = {y * size + x for x, y in result.powered}
+                self.assertEqual(set(np.flatnonzero(powered[state]).tolist()), expected)
+                self.assertEqual(bool(reached[state]), result.terminal_reached)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,108 @@
+"""
+Unit tests for BoardRenderCache
+
+Tests full rebuilds on layout changes and per-tile redraw on rotation.
+
+Author: Circuit Repair Game Team
+Date: 2026-01-20
+"""
+
+import pytest
+import pygame
+
+from src.core.grid.grid_manager import GridManager
+from src.core.grid.tile import Tile
+from src.core.grid.tile_type import TileType
+from src.rendering.board_cache import BoardRenderCache
+
+
+@pytest.fixture
+def grid():
+    """Create a 4x4 grid with a row of rotatable tiles."""
+    grid = GridManager(4)
+    for x in range(4):
+        grid.set_tile(x, 0, Tile(x, 0, TileType.STRAIGHT, 0, True))
+    grid.save_initial_state()
+    return grid
+
+
+@pytest.fixture
+def drawn():
+    """Record the tiles passed to the draw callback."""
+    return []
+
+
+@pytest.fixture
+def cache(drawn):
+    """Create a cache whose tiles are drawn as solid squares."""
+    def draw_tile(surface, tile, rect):
+        drawn.append((tile.x, tile.y, tile.rotation))
+        surface.fill((255, 0, 0, 255), rect)
+
+    pygame.init()
+    cache = BoardRenderCache(draw_tile)
+    yield cache
+    pygame.quit()
+
+
+class TestBoardRenderCache:
+    """Test BoardRenderCache redraw behaviour."""
+
+    def test_first_draw_draws_every_tile(self, cache, grid, drawn):
+        """Test that the first draw renders every tile once."""
+        target = pygame.Surface((400, 400))
+        cache.draw(target, grid, (10, 10), 48, 4)
+
+        assert len(drawn) == 4
+        assert target.get_at((10, 10))[:3] == (255, 0, 0)
+        assert target.get_at((10 + 52 * 3, 10))[:3] == (255, 0, 0)
+
+    def test_static_board_draws_no_tiles(self, cache, grid, drawn):
+        """Test that a static board is only blitted."""
+        target = pygame.Surface((400, 400))
+        cache.draw(target, grid, (0, 0), 48, 4)
+        drawn.clear()
+
+        for _ in range(10):
+            cache.draw(target, grid, (0, 0), 48, 4)
+
+        assert drawn == []
+
+    def test_rotation_redraws_only_that_tile(self, cache, grid, drawn):
+        """Test that a rotation redraws only the rotated tile."""
+        target = pygame.Surface((400, 400))
+        cache.draw(target, grid, (0, 0), 48, 4)
+        drawn.clear()
+
+        grid.rotate_tile(2, 0)
+        grid.rotate_tile(2, 0)
+        cache.draw(target, grid, (0, 0), 48, 4)
+
+        assert drawn == [(2, 0, 180)]
+
+    def test_layout_change_rebuilds(self, cache, grid, drawn):
+        """Test that tile size, style or grid changes redraw the whole board."""
+        target = pygame.Surface((400, 400))
+        cache.draw(target, grid, (0, 0), 48, 4)
+        cache.draw(target, grid, (0, 0), 64, 4)
+        cache.draw(target, grid, (0, 0), 64, 4, style_key=True)
+
+        assert len(drawn) == 12
+
+        grid.reset_grid()
+        cache.draw(target, grid, (0, 0), 64, 4, style_key=True)
+
+        assert len(drawn) == 16
+
+    def test_dirty_rects_in_screen_coordinates(self, cache, grid):
+        """Test that only the rotated tile is reported, offset by the origin."""
+        target = pygame.Surface((400, 400))
+        cache.draw(target, grid, (10, 20), 48, 4)
+        assert cache.get_dirty_rects() == [pygame.Rect(10, 20, 204, 204)]
+
+        cache.draw(target, grid, (10, 20), 48, 4)
+        assert cache.get_dirty_rects() == []
+
+        grid.rotate_tile(1, 0)
+        cache.draw(target, grid, (10, 20), 48, 4)
+        assert cache.get_dirty_rects() == [pygame.Rect(10 + 52, 20, 48, 48)]
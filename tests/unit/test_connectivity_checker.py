@@ -5,6 +5,7 @@
 """
 
 import unittest
+import random
 import time
 from src.core.circuit.connectivity_checker import ConnectivityChecker
 from src.core.grid.grid_manager import GridManager
@@ -336,6 +337,193 @@ class TestConnectivityCheckerUtilities(unittest.TestCase):
         self.assertFalse(self.checker.is_tile_in_path(self.grid, 0, 0))
 
 
+class TestConnectivityCheckerResultCache(unittest.TestCase):
+    """测试按修订号缓存的分析结果"""
+
+    def setUp(self):
+        """设置测试环境"""
+        self.checker = ConnectivityChecker()
+        self.grid = GridManager(4)
+        self.grid.set_tile(0, 0, Tile(0, 0, TileType.POWER_SOURCE, 0))
+        self.grid.set_tile(1, 0, Tile(1, 0, TileType.STRAIGHT, 0))
+        self.grid.set_tile(2, 0, Tile(2, 0, TileType.TERMINAL, 0))
+
+    def test_analyze_result(self):
+        """测试分析结果内容"""
+        result = self.checker.analyze(self.grid)
+
+        self.assertTrue(result.terminal_reached)
+        self.assertEqual(result.path, [(0, 0), (1, 0), (2, 0)])
+        self.assertEqual(result.powered, {(0, 0), (1, 0), (2, 0)})
+        self.assertIsNone(result.parent[(0, 0)])
+        self.assertTrue(result.is_on_path(1, 0))
+        self.assertFalse(result.is_on_path(1, 1))
+
+    def test_result_reused_for_same_revision(self):
+        """测试同一修订号复用同一结果"""
+        first = self.checker.analyze(self.grid)
+        self.checker.find_path(self.grid)
+        self.checker.is_tile_in_path(self.grid, 1, 0)
+        self.assertIs(self.checker.analyze(self.grid), first)
+
+    def test_result_invalidated_by_rotation(self):
+        """测试旋转后结果失效"""
+        first = self.checker.analyze(self.grid)
+        self.grid.rotate_tile(1, 0)
+
+        second = self.checker.analyze(self.grid)
+        self.assertIsNot(second, first)
+        self.assertFalse(second.terminal_reached)
+        self.assertFalse(self.checker.is_tile_in_path(self.grid, 1, 0))
+
+    def test_path_copy_is_independent(self):
+        """测试返回的路径是独立副本"""
+        path = self.checker.find_path(self.grid)
+        path.clear()
+        self.assertEqual(len(self.checker.find_path(self.grid)), 3)
+
+
+class TestConnectivityCheckerComponents(unittest.TestCase):
+    """测试并查集连通分量标记"""
+
+    def setUp(self):
+        """设置测试环境：两个电源端，各自连到一个终端"""
+        self.checker = ConnectivityChecker()
+        self.grid = GridManager(4)
+        for y in (0, 2):
+            self.grid.set_tile(0, y, Tile(0, y, TileType.POWER_SOURCE, 0))
+            self.grid.set_tile(1, y, Tile(1, y, TileType.STRAIGHT, 0))
+            self.grid.set_tile(2, y, Tile(2, y, TileType.TERMINAL, 0))
+
+    def test_labels(self):
+        """测试分量标签"""
+        components = self.checker.label_components(self.grid)
+
+        self.assertEqual(components.label_of(0, 0), components.label_of(2, 0))
+        self.assertNotEqual(components.label_of(0, 0), components.label_of(0, 2))
+        self.assertEqual(components.label_of(3, 3), -1)
+        self.assertTrue(components.all_terminals_powered())
+
+    def test_unpowered_terminal(self):
+        """测试一个终端断开"""
+        self.grid.rotate_tile(1, 2)
+
+        components = self.checker.label_components(self.grid)
+        self.assertEqual(components.get_unpowered_terminals(), [(2, 2)])
+        self.assertFalse(self.checker.check_all_terminals_powered(self.grid))
+        self.assertFalse(self.checker.check_connectivity(self.grid))
+
+    def test_check_connectivity_multiple_terminals(self):
+        """测试多终端时check_connectivity检查所有终端"""
+        self.assertTrue(self.checker.check_connectivity(self.grid))
+
+    def test_no_terminal(self):
+        """测试没有终端时不视为全部通电"""
+        self.assertFalse(self.checker.check_all_terminals_powered(GridManager(3)))
+
+    def test_cached_per_revision(self):
+        """测试按修订号缓存"""
+        first = self.checker.label_components(self.grid)
+        self.assertIs(self.checker.label_components(self.grid), first)
+        self.grid.rotate_tile(1, 0)
+        self.assertIsNot(self.checker.label_components(self.grid), first)
+
+    def test_matches_bfs(self):
+        """测试随机网格下通电判断与BFS一致"""
+        rng = random.Random(20260127)
+        tile_types = [TileType.STRAIGHT, TileType.CORNER, TileType.CORNER, TileType.EMPTY]
+
+        for _ in range(20):
+            size = rng.randint(3, 8)
+            grid = GridManager(size, compact=rng.random() < 0.5)
+            for x in range(size):
+                for y in range(size):
+                    if rng.random() < 0.9:
+                        grid.set_tile(x, y, Tile(x, y, rng.choice(tile_types), rng.choice([0, 90, 180, 270])))
+            grid.set_tile(rng.randrange(size), rng.randrange(size), Tile(0, 0, TileType.POWER_SOURCE, 0))
+
+            components = self.checker.label_components(grid)
+            powered = self.checker.analyze(grid).powered
+            for x in range(size):
+                for y in range(size):
+                    if grid.get_tile(x, y) is not None:
+                        self.assertEqual(components.is_powered(x, y), (x, y) in powered)
+
+
+class TestConnectivityCheckerIncremental(unittest.TestCase):
+    """测试增量连通性模式"""
+
+    def setUp(self):
+        """设置测试环境"""
+        self.checker = ConnectivityChecker()
+        self.grid = GridManager(4)
+        # 电源端(0,0)向东 -> (1,0) -> (2,0) -> 终端(3,0)
+        self.grid.set_tile(0, 0, Tile(0, 0, TileType.POWER_SOURCE, 0))
+        self.grid.set_tile(1, 0, Tile(1, 0, TileType.STRAIGHT, 0))
+        self.grid.set_tile(2, 0, Tile(2, 0, TileType.STRAIGHT, 90))
+        self.grid.set_tile(3, 0, Tile(3, 0, TileType.TERMINAL, 0))
+
+    def test_enable_incremental(self):
+        """测试启用增量模式"""
+        powered = self.checker.enable_incremental(self.grid)
+        self.assertEqual(powered, {(0, 0), (1, 0)})
+        self.assertTrue(self.checker.is_incremental_enabled(self.grid))
+
+        self.checker.disable_incremental()
+        self.assertFalse(self.checker.is_incremental_enabled())
+
+    def test_rotation_powers_downstream(self):
+        """测试旋转接通后下游瓦片通电"""
+        self.checker.enable_incremental(self.grid)
+
+        self.grid.rotate_tile(2, 0)
+        delta = self.checker.update_rotation(self.grid, 2, 0)
+
+        self.assertEqual(delta.powered, {(2, 0), (3, 0)})
+        self.assertEqual(delta.unpowered, set())
+        self.assertTrue(delta.terminal_reached)
+
+    def test_rotation_unpowers_subtree(self):
+        """测试旋转断开后整个下游子树断电"""
+        self.grid.rotate_tile(2, 0)
+        self.checker.enable_incremental(self.grid)
+
+        self.grid.rotate_tile(1, 0)
+        delta = self.checker.update_rotation(self.grid, 1, 0)
+
+        self.assertEqual(delta.unpowered, {(1, 0), (2, 0), (3, 0)})
+        self.assertFalse(delta.terminal_reached)
+        self.assertEqual(self.checker.get_powered_positions(), {(0, 0)})
+
+    def test_matches_full_traversal(self):
+        """测试随机旋转序列下与完整BFS结果一致"""
+        rng = random.Random(20260125)
+        tile_types = [TileType.STRAIGHT, TileType.CORNER, TileType.CORNER, TileType.EMPTY]
+
+        for _ in range(20):
+            size = rng.randint(3, 8)
+            grid = GridManager(size, compact=rng.random() < 0.5)
+            for x in range(size):
+                for y in range(size):
+                    grid.set_tile(x, y, Tile(x, y, rng.choice(tile_types), rng.choice([0, 90, 180, 270])))
+            grid.set_tile(0, 0, Tile(0, 0, TileType.POWER_SOURCE, rng.choice([0, 90, 180, 270])))
+            grid.set_tile(size - 1, size - 1, Tile(0, 0, TileType.TERMINAL, 0))
+
+            checker = ConnectivityChecker()
+            previous = checker.enable_incremental(grid)
+            for _ in range(40):
+                x, y = rng.randrange(size), rng.randrange(size)
+                grid.rotate_tile(x, y)
+                delta = checker.update_rotation(grid, x, y)
+
+                expected = {(t.x, t.y) for t in self.checker.get_connected_tiles(grid)}
+                current = checker.get_powered_positions()
+                self.assertEqual(current, expected)
+                self.assertEqual(delta.powered, current - previous)
+                self.assertEqual(delta.unpowered, previous - current)
+                previous = current
+
+
 class TestConnectivityCheckerPerformance(unittest.TestCase):
     """测试性能要求"""
 
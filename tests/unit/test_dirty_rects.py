@@ -0,0 +1,125 @@
+"""
+Unit tests for DirtyRectTracker
+
+Tests rect merging, the full-flip fallback and change reporting by
+layers and UI components.
+
+Author: Circuit Repair Game Team
+Date: 2026-01-20
+"""
+
+import pytest
+import pygame
+from unittest.mock import patch
+
+from src.rendering.dirty_rects import DirtyRectTracker
+from src.scenes.layers.layer_base import LayerBase
+from src.ui.components.label import Label
+
+
+class _StaticLayer(LayerBase):
+    """Layer that draws nothing and changes nothing."""
+
+    def update(self, delta_ms):
+        pass
+
+    def draw(self, surface):
+        pass
+
+    def handle_event(self, event):
+        return False
+
+
+@pytest.fixture
+def tracker():
+    """Create a tracker for an 800x600 screen, past its first frame."""
+    tracker = DirtyRectTracker((800, 600))
+    with patch('pygame.display.flip'):
+        tracker.present()
+    return tracker
+
+
+class TestDirtyRectTracker:
+    """Test rect merging and presentation."""
+
+    def test_first_frame_flips(self):
+        """Test that a new tracker flips the whole first frame."""
+        tracker = DirtyRectTracker((800, 600))
+        tracker.add((0, 0, 10, 10))
+
+        assert tracker.get_update_rects() is None
+
+    def test_overlapping_rects_merge(self, tracker):
+        """Test that overlapping rects are replaced by their union."""
+        tracker.add((0, 0, 20, 20))
+        tracker.add((100, 100, 10, 10))
+        tracker.add((10, 10, 20, 20))
+
+        rects = tracker.get_update_rects()
+
+        assert sorted(map(tuple, rects)) == [(0, 0, 30, 30), (100, 100, 10, 10)]
+
+    def test_rects_clipped_to_screen(self, tracker):
+        """Test that rects are clipped and offscreen rects dropped."""
+        tracker.add((-10, -10, 20, 20))
+        tracker.add((900, 700, 10, 10))
+
+        assert [tuple(r) for r in tracker.get_update_rects()] == [(0, 0, 10, 10)]
+
+    def test_large_area_falls_back_to_flip(self, tracker):
+        """Test that a dirty area over the threshold flips the frame."""
+        tracker.add((0, 0, 800, 400))
+
+        assert tracker.get_update_rects() is None
+
+    def test_none_forces_flip(self, tracker):
+        """Test that an unknown change forces a full flip."""
+        tracker.add((0, 0, 10, 10))
+        tracker.add_all(None)
+        tracker.add((20, 20, 10, 10))
+
+        assert tracker.get_update_rects() is None
+
+    def test_present_updates_only_dirty_rects(self, tracker):
+        """Test that present() updates the dirty rects, or nothing."""
+        tracker.add((300, 10, 200, 40))
+        with patch('pygame.display.update') as mock_update, \
+                patch('pygame.display.flip') as mock_flip:
+            tracker.present()
+            tracker.present()
+
+        mock_flip.assert_not_called()
+        mock_update.assert_called_once_with([pygame.Rect(300, 10, 200, 40)])
+        assert tracker.get_partial_update_count() == 1
+        assert tracker.get_full_flip_count() == 1
+
+
+class TestChangeReporting:
+    """Test dirty rect reporting by layers and UI components."""
+
+    def test_layer_reports_full_screen_once(self):
+        """Test that a layer reports the whole screen only on its first frame."""
+        layer = _StaticLayer(800, 600)
+
+        assert layer.collect_dirty_rects() is None
+        assert layer.collect_dirty_rects() == []
+
+        layer.mark_dirty(pygame.Rect(10, 10, 5, 5))
+        assert layer.collect_dirty_rects() == [pygame.Rect(10, 10, 5, 5)]
+
+    def test_label_reports_text_change(self):
+        """Test that a label is dirty only after its text changes."""
+        pygame.init()
+        label = Label(300, 10, 200, 40, "00:59", font_size=28)
+        surface = pygame.Surface((800, 600))
+        label.draw(surface)
+        label.consume_dirty_rect()
+
+        label.set_text("00:59")
+        label.draw(surface)
+        assert label.consume_dirty_rect() is None
+
+        label.set_text("00:58")
+        label.draw(surface)
+        assert label.consume_dirty_rect().contains(label.get_rect())
+        pygame.quit()
@@ -5,7 +5,7 @@
 """
 
 import unittest
-from src.core.grid.grid_manager import GridManager
+from src.core.grid.grid_manager import GridManager, TileView
 from src.core.grid.tile import Tile
 from src.core.grid.tile_type import TileType
 
@@ -146,6 +146,18 @@ class TestGridManagerRotation(unittest.TestCase):
         """测试旋转空位置"""
         self.assertFalse(self.manager.rotate_tile(0, 0))
 
+    def test_connection_mask(self):
+        """测试获取连接掩码"""
+        self.manager.set_tile(1, 1, Tile(1, 1, TileType.CORNER, 0))
+        self.assertEqual(self.manager.get_connection_mask(1, 1), 3)
+
+        self.manager.rotate_tile(1, 1)
+        self.assertEqual(self.manager.get_connection_mask(1, 1), 6)
+
+        # 空位置与越界位置没有连接
+        self.assertEqual(self.manager.get_connection_mask(0, 0), 0)
+        self.assertEqual(self.manager.get_connection_mask(-1, 0), 0)
+
     def test_rotate_invalid_coordinates(self):
         """测试旋转无效坐标"""
         self.assertFalse(self.manager.rotate_tile(-1, 0))
@@ -203,6 +215,37 @@ class TestGridManagerSpecialTiles(unittest.TestCase):
         self.assertEqual(retrieved.x, 1)
         self.assertEqual(retrieved.y, 1)
 
+    def test_multiple_power_sources_and_terminals(self):
+        """测试多个电源端和终端"""
+        self.manager.set_tile(2, 0, Tile(2, 0, TileType.POWER_SOURCE, 0))
+        self.manager.set_tile(0, 1, Tile(0, 1, TileType.POWER_SOURCE, 0))
+        self.manager.set_tile(3, 3, Tile(3, 3, TileType.TERMINAL, 0))
+        self.manager.set_tile(3, 2, Tile(3, 2, TileType.TERMINAL, 0))
+
+        self.assertEqual([(t.x, t.y) for t in self.manager.get_power_sources()], [(2, 0), (0, 1)])
+        self.assertEqual([(t.x, t.y) for t in self.manager.get_terminals()], [(3, 2), (3, 3)])
+
+    def test_overwrite_special_tile(self):
+        """测试覆盖特殊瓦片后不再记录其位置"""
+        self.manager.set_tile(0, 0, Tile(0, 0, TileType.POWER_SOURCE, 0))
+        self.manager.set_tile(3, 3, Tile(3, 3, TileType.TERMINAL, 0))
+        self.manager.set_tile(0, 0, Tile(0, 0, TileType.STRAIGHT, 0))
+
+        self.assertIsNone(self.manager.get_power_source())
+        self.assertEqual(self.manager.get_power_sources(), [])
+        self.assertEqual(len(self.manager.get_terminals()), 1)
+
+    def test_restore_recomputes_special_tiles(self):
+        """测试快照恢复后重新计算特殊瓦片位置"""
+        self.manager.set_tile(0, 0, Tile(0, 0, TileType.POWER_SOURCE, 0))
+        self.manager.set_tile(1, 0, Tile(1, 0, TileType.POWER_SOURCE, 0))
+        saved = self.manager.snapshot()
+
+        self.manager.clear_grid()
+        self.manager.restore(saved)
+        self.assertEqual(len(self.manager.get_power_sources()), 2)
+        self.assertIsNotNone(self.manager.get_power_source())
+
 
 class TestGridManagerState(unittest.TestCase):
     """测试网格状态管理"""
@@ -280,6 +323,209 @@ class TestGridManagerState(unittest.TestCase):
         self.assertIsNotNone(self.manager.get_terminal())
         self.assertEqual(self.manager.get_tile(1, 1).rotation, 0)
 
+    def test_reset_keeps_tile_references(self):
+        """测试重置后已获取的瓦片对象仍然有效"""
+        tile = Tile(1, 1, TileType.STRAIGHT, 0)
+        self.manager.set_tile(1, 1, tile)
+        self.manager.save_initial_state()
+
+        self.manager.rotate_tile(1, 1)
+        self.manager.reset_grid()
+
+        self.assertIs(self.manager.get_tile(1, 1), tile)
+        self.assertEqual(tile.rotation, 0)
+        tile.rotate_clockwise()
+        self.assertEqual(self.manager.get_tile(1, 1).rotation, 90)
+
+
+class TestGridManagerSnapshot(unittest.TestCase):
+    """测试网格快照"""
+
+    def _build(self, compact):
+        manager = GridManager(4, compact=compact)
+        manager.set_tile(0, 0, Tile(0, 0, TileType.POWER_SOURCE, 0))
+        manager.set_tile(1, 1, Tile(1, 1, TileType.STRAIGHT, 0, True))
+        manager.set_tile(2, 2, Tile(2, 2, TileType.CORNER, 90, True))
+        return manager
+
+    def test_snapshot_reused_when_unchanged(self):
+        """测试网格未变化时复用快照"""
+        manager = self._build(False)
+        self.assertIs(manager.snapshot(), manager.snapshot())
+
+    def test_incremental_snapshot_matches_full_pack(self):
+        """测试增量生成的快照与完整打包一致"""
+        dict_manager = self._build(False)
+        compact_manager = self._build(True)
+        for manager in (dict_manager, compact_manager):
+            manager.snapshot()
+            manager.rotate_tile(1, 1)
+            manager.get_tile(2, 2).set_rotation(0)
+
+        self.assertEqual(dict_manager.snapshot(), dict_manager._pack_tiles())
+        self.assertEqual(dict_manager.snapshot(), compact_manager.snapshot())
+
+    def test_restore_round_trip(self):
+        """测试从快照恢复"""
+        for compact in (False, True):
+            manager = self._build(compact)
+            saved = manager.snapshot()
+            manager.rotate_tile(1, 1)
+            manager.rotate_tile(2, 2)
+
+            manager.restore(saved)
+            self.assertEqual(manager.snapshot(), saved)
+            self.assertEqual(manager.get_tile(1, 1).rotation, 0)
+            self.assertEqual(manager.get_tile(2, 2).rotation, 90)
+
+    def test_restore_tile_layout(self):
+        """测试快照恢复增删瓦片和特殊瓦片位置"""
+        manager = self._build(False)
+        saved = manager.snapshot()
+
+        manager.clear_grid()
+        manager.set_tile(3, 3, Tile(3, 3, TileType.TERMINAL, 0))
+        manager.restore(saved)
+
+        self.assertIsNone(manager.get_tile(3, 3))
+        self.assertIsNone(manager.get_terminal())
+        self.assertEqual(manager.get_power_source().tile_type, TileType.POWER_SOURCE)
+        self.assertTrue(manager.get_tile(1, 1).is_clickable)
+
+    def test_restore_invalid_size(self):
+        """测试尺寸不匹配的快照"""
+        manager = self._build(False)
+        with self.assertRaises(ValueError):
+            manager.restore(GridManager(5).snapshot())
+
+
+class TestGridManagerRevision(unittest.TestCase):
+    """测试网格修订号"""
+
+    def setUp(self):
+        """设置测试环境"""
+        self.manager = GridManager(4)
+        self.tile = Tile(1, 1, TileType.STRAIGHT, 0)
+        self.manager.set_tile(1, 1, self.tile)
+
+    def test_revision_increases_on_changes(self):
+        """测试各种修改都会增加修订号"""
+        revisions = [self.manager.get_revision()]
+
+        self.manager.save_initial_state()
+        self.assertEqual(self.manager.get_revision(), revisions[-1])
+
+        self.manager.rotate_tile(1, 1)
+        revisions.append(self.manager.get_revision())
+
+        self.manager.reset_grid()
+        revisions.append(self.manager.get_revision())
+
+        self.manager.clear_grid()
+        revisions.append(self.manager.get_revision())
+
+        self.assertEqual(revisions, sorted(set(revisions)))
+
+    def test_direct_tile_rotation_increases_revision(self):
+        """测试直接旋转瓦片对象也会增加修订号"""
+        before = self.manager.get_revision()
+        self.manager.get_tile(1, 1).set_rotation(90)
+        self.assertGreater(self.manager.get_revision(), before)
+
+    def test_failed_rotation_keeps_revision(self):
+        """测试无效旋转不改变修订号"""
+        before = self.manager.get_revision()
+        self.manager.rotate_tile(0, 0)
+        self.assertEqual(self.manager.get_revision(), before)
+
+    def test_replaced_tile_detached(self):
+        """测试被覆盖的瓦片不再影响网格"""
+        self.manager.set_tile(1, 1, Tile(1, 1, TileType.CORNER, 0))
+        before = self.manager.get_revision()
+        self.tile.rotate_clockwise()
+        self.assertEqual(self.manager.get_revision(), before)
+
+    def test_compact_revision(self):
+        """测试紧凑模式下的修订号"""
+        manager = GridManager(4, compact=True)
+        manager.set_tile(1, 1, Tile(1, 1, TileType.STRAIGHT, 0))
+        before = manager.get_revision()
+        manager.get_tile(1, 1).rotate_clockwise()
+        self.assertGreater(manager.get_revision(), before)
+
+
+class TestGridManagerJournal(unittest.TestCase):
+    """测试网格变更日志"""
+
+    def setUp(self):
+        """设置测试环境"""
+        self.manager = GridManager(4, journal_capacity=4)
+        self.manager.set_tile(1, 1, Tile(1, 1, TileType.STRAIGHT, 0))
+        self.manager.set_tile(2, 2, Tile(2, 2, TileType.CORNER, 90))
+
+    def test_changes_since(self):
+        """测试获取指定修订号之后的记录"""
+        since = self.manager.get_revision()
+        self.manager.rotate_tile(1, 1)
+        self.manager.get_tile(2, 2).set_rotation(270)
+
+        changes = self.manager.get_changes_since(since)
+        self.assertEqual(changes, [
+            (since + 1, 1, 1, 0, 90),
+            (since + 2, 2, 2, 90, 270),
+        ])
+        self.assertEqual(self.manager.get_changes_since(self.manager.get_revision()), [])
+
+    def test_drain_advances_cursor(self):
+        """测试drain只返回新的记录"""
+        subscriber = self.manager.subscribe()
+        self.manager.rotate_tile(1, 1)
+        self.assertEqual(len(self.manager.drain(subscriber)), 1)
+        self.assertEqual(self.manager.drain(subscriber), [])
+
+        self.manager.rotate_tile(2, 2)
+        changes = self.manager.drain(subscriber)
+        self.assertEqual([(x, y) for _, x, y, _, _ in changes], [(2, 2)])
+
+    def test_bulk_change_requires_resync(self):
+        """测试批量修改后需要重新读取整个网格"""
+        subscriber = self.manager.subscribe()
+        self.manager.save_initial_state()
+        self.manager.rotate_tile(1, 1)
+        self.manager.reset_grid()
+
+        self.assertIsNone(self.manager.drain(subscriber))
+        self.manager.rotate_tile(1, 1)
+        self.assertEqual(len(self.manager.drain(subscriber)), 1)
+
+    def test_overflow_requires_resync(self):
+        """测试记录被覆盖后需要重新读取整个网格"""
+        subscriber = self.manager.subscribe()
+        for _ in range(5):
+            self.manager.rotate_tile(1, 1)
+        self.assertIsNone(self.manager.drain(subscriber))
+
+        for _ in range(4):
+            self.manager.rotate_tile(1, 1)
+        changes = self.manager.drain(subscriber)
+        self.assertEqual(len(changes), 4)
+        self.assertEqual(changes[-1][0], self.manager.get_revision())
+
+    def test_unsubscribe(self):
+        """测试注销订阅者"""
+        subscriber = self.manager.subscribe()
+        self.manager.unsubscribe(subscriber)
+        with self.assertRaises(KeyError):
+            self.manager.drain(subscriber)
+
+    def test_compact_journal(self):
+        """测试紧凑模式下的变更日志"""
+        manager = GridManager(4, compact=True)
+        manager.set_tile(1, 1, Tile(1, 1, TileType.CORNER, 0))
+        subscriber = manager.subscribe()
+        manager.rotate_tile(1, 1)
+        self.assertEqual(manager.drain(subscriber)[0][1:], (1, 1, 0, 90))
+
 
 class TestGridManagerUtilities(unittest.TestCase):
     """测试网格工具方法"""
@@ -408,5 +654,98 @@ class TestGridManagerEdgeCases(unittest.TestCase):
         self.assertEqual(manager.get_tile(1, 1).rotation, 0)
 
 
+class TestGridManagerCompactStorage(unittest.TestCase):
+    """测试紧凑存储模式"""
+
+    def setUp(self):
+        """设置测试环境"""
+        self.manager = GridManager(4, compact=True)
+
+    def test_compact_flag(self):
+        """测试紧凑模式标记"""
+        self.assertTrue(self.manager.is_compact())
+        self.assertFalse(GridManager(4).is_compact())
+
+    def test_set_and_get_tile_view(self):
+        """测试紧凑模式下设置和获取瓦片视图"""
+        self.manager.set_tile(1, 2, Tile(0, 0, TileType.CORNER, 180, True))
+
+        view = self.manager.get_tile(1, 2)
+        self.assertIsInstance(view, TileView)
+        self.assertEqual(view.x, 1)
+        self.assertEqual(view.y, 2)
+        self.assertEqual(view.tile_type, TileType.CORNER)
+        self.assertEqual(view.rotation, 180)
+        self.assertTrue(view.is_clickable)
+        self.assertIsNone(self.manager.get_tile(2, 1))
+
+    def test_view_writes_through(self):
+        """测试通过视图修改会反映到网格"""
+        self.manager.set_tile(1, 1, Tile(1, 1, TileType.STRAIGHT, 0))
+        view = self.manager.get_tile(1, 1)
+
+        view.rotate_clockwise()
+        self.assertEqual(self.manager.get_tile(1, 1).rotation, 90)
+
+        self.assertTrue(self.manager.rotate_tile(1, 1))
+        self.assertEqual(view.rotation, 180)
+
+    def test_view_equals_tile(self):
+        """测试视图与普通瓦片的相等性"""
+        self.manager.set_tile(1, 1, Tile(1, 1, TileType.STRAIGHT, 90))
+        self.assertEqual(self.manager.get_tile(1, 1), Tile(1, 1, TileType.STRAIGHT, 90))
+
+    def test_connection_mask_compact(self):
+        """测试紧凑模式下的连接掩码"""
+        self.manager.set_tile(2, 1, Tile(2, 1, TileType.STRAIGHT, 90))
+        self.assertEqual(self.manager.get_connection_mask(2, 1),
+                         self.manager.get_tile(2, 1).get_connection_mask())
+        self.assertEqual(self.manager.get_connection_mask(1, 2), 0)
+
+    def test_reset_keeps_views_valid(self):
+        """测试重置后视图仍然有效"""
+        self.manager.set_tile(1, 1, Tile(1, 1, TileType.STRAIGHT, 0))
+        self.manager.save_initial_state()
+        view = self.manager.get_tile(1, 1)
+
+        self.manager.rotate_tile(1, 1)
+        self.manager.reset_grid()
+        self.assertEqual(view.rotation, 0)
+
+    def test_special_tiles_and_count(self):
+        """测试特殊瓦片与瓦片数量"""
+        self.manager.set_tile(0, 0, Tile(0, 0, TileType.POWER_SOURCE, 0))
+        self.manager.set_tile(3, 3, Tile(3, 3, TileType.TERMINAL, 0))
+
+        self.assertEqual(self.manager.get_power_source().tile_type, TileType.POWER_SOURCE)
+        self.assertEqual(self.manager.get_terminal().tile_type, TileType.TERMINAL)
+        self.assertEqual(self.manager.get_tile_count(), 2)
+        self.assertEqual(len(self.manager.get_all_tiles()), 2)
+        self.assertFalse(self.manager.is_position_empty(0, 0))
+
+        self.manager.clear_grid()
+        self.assertEqual(self.manager.get_tile_count(), 0)
+        self.assertIsNone(self.manager.get_power_source())
+
+    def test_state_bytes_matches_dict_mode(self):
+        """测试两种存储模式的状态字节一致"""
+        regular = GridManager(4)
+        for manager in (self.manager, regular):
+            manager.set_tile(0, 1, Tile(0, 1, TileType.POWER_SOURCE, 0))
+            manager.set_tile(1, 1, Tile(1, 1, TileType.CORNER, 270, True))
+
+        self.assertEqual(self.manager.state_bytes(), regular.state_bytes())
+
+        self.manager.rotate_tile(1, 1)
+        self.assertNotEqual(self.manager.state_bytes(), regular.state_bytes())
+
+    def test_large_compact_grid(self):
+        """测试大尺寸紧凑网格"""
+        manager = GridManager(128, compact=True)
+        manager.set_tile(127, 127, Tile(0, 0, TileType.STRAIGHT, 0))
+        self.assertEqual(manager.get_tile(127, 127).x, 127)
+        self.assertEqual(len(manager.state_bytes()), 3 * 128 * 128)
+
+
 if __name__ == '__main__':
     unittest.main()
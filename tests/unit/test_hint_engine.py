@@ -0,0 +1,114 @@
+"""
+Unit tests for HintEngine
+
+Tests hint ordering, accepted rotations, incremental updates and
+LevelManager integration.
+
+Author: Circuit Repair Game Team
+Date: 2026-01-20
+"""
+
+import time
+import unittest
+
+from src.core.grid.grid_manager import GridManager
+from src.core.grid.tile import Tile
+from src.core.grid.tile_type import TileType
+from src.core.level.hint_engine import HintEngine, Hint
+from src.core.level.level_generator_v3 import LevelGeneratorV3
+from src.core.level.level_loader import LevelLoader
+from src.core.level.level_manager import LevelManager
+from src.core.level.difficulty_config import DifficultyLevel
+
+
+def _build(solution_tiles, scrambled, size=5):
+    grid = GridManager(size)
+    for tile_data in solution_tiles:
+        grid.set_tile(tile_data['x'], tile_data['y'], Tile(
+            tile_data['x'], tile_data['y'], TileType.from_string(tile_data['type']),
+            tile_data['rotation'], tile_data.get('is_clickable', False)
+        ))
+    for (x, y), rotation in scrambled.items():
+        grid.get_tile(x, y).set_rotation(rotation)
+    grid.save_initial_state()
+    return grid
+
+
+class TestHintEngine(unittest.TestCase):
+    """Test HintEngine on a hand-built row"""
+
+    def setUp(self):
+        self.solution = [
+            {'x': 0, 'y': 0, 'type': 'power_source', 'rotation': 0},
+            {'x': 1, 'y': 0, 'type': 'straight', 'rotation': 0, 'is_clickable': True},
+            {'x': 2, 'y': 0, 'type': 'straight', 'rotation': 0, 'is_clickable': True,
+             'accepted_rotations': [0, 180]},
+            {'x': 3, 'y': 0, 'type': 'corner', 'rotation': 270, 'is_clickable': True},
+            {'x': 4, 'y': 0, 'type': 'terminal', 'rotation': 0},
+        ]
+        self.grid = _build(self.solution, {(1, 0): 0, (2, 0): 90, (3, 0): 0})
+        self.engine = HintEngine(self.grid, self.solution)
+
+    def test_hint_nearest_power_first(self):
+        """测试优先提示离电源最近的错误瓦片"""
+        self.assertEqual(self.engine.get_hint(), Hint(2, 0, 180, 1))
+        self.assertEqual(self.engine.get_remaining_moves(), 4)
+
+    def test_hint_follows_rotations(self):
+        """测试旋转后提示增量更新"""
+        self.grid.rotate_tile(2, 0)
+        self.assertEqual(self.engine.get_hint(), Hint(3, 0, 270, 3))
+        self.grid.rotate_tile(1, 0)
+        self.assertEqual(self.engine.get_hint(), Hint(1, 0, 0, 3))
+        self.assertEqual(self.engine.get_remaining_moves(), 6)
+
+        for _ in range(3):
+            self.grid.rotate_tile(1, 0)
+            self.grid.rotate_tile(3, 0)
+        self.assertIsNone(self.engine.get_hint())
+        self.assertEqual(self.engine.get_remaining_moves(), 0)
+
+    def test_hint_after_reset(self):
+        """测试重置网格后重新求解"""
+        self.grid.rotate_tile(2, 0)
+        self.engine.get_hint()
+        self.grid.reset_grid()
+        self.assertEqual(self.engine.get_hint(), Hint(2, 0, 180, 1))
+
+
+class TestLevelManagerHints(unittest.TestCase):
+    """Test LevelManager.get_hint on generated levels"""
+
+    def test_following_hints_wins_in_optimal_moves(self):
+        """测试按提示操作以最少步数获胜"""
+        manager = LevelManager(LevelLoader())
+        for seed in range(5):
+            generated = LevelGeneratorV3(DifficultyLevel.HELL, seed=seed).generate()
+            self.assertTrue(manager.load_generated_data(generated, DifficultyLevel.HELL))
+
+            while not manager.check_win_condition():
+                hint = manager.get_hint()
+                self.assertIsNotNone(hint)
+                manager.rotate_tile(hint.x, hint.y)
+
+            self.assertEqual(manager.get_move_count(), manager.get_optimal_moves())
+            self.assertIsNone(manager.get_hint())
+
+    def test_hint_is_fast(self):
+        """测试大网格上提示耗时低于1毫秒"""
+        manager = LevelManager(LevelLoader())
+        generated = LevelGeneratorV3(DifficultyLevel.HELL, grid_size=16, seed=3).generate()
+        manager.load_generated_data(generated, DifficultyLevel.HELL)
+
+        start = time.perf_counter()
+        moves = 0
+        while moves < 50 and not manager.check_win_condition():
+            hint = manager.get_hint()
+            manager.rotate_tile(hint.x, hint.y)
+            moves += 1
+        hint_time = time.perf_counter() - start
+        self.assertLess(hint_time / max(moves, 1), 0.001)
+
+
+if __name__ == '__main__':
+    unittest.main()
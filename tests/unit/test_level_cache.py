@@ -0,0 +1,81 @@
+"""
+Unit tests for LevelCache
+
+Tests disk caching of seeded levels.
+
+Author: Circuit Repair Game Team
+Date: 2026-01-23
+"""
+
+import shutil
+import tempfile
+import unittest
+from unittest.mock import patch
+
+from src.core.level.level_cache import LevelCache
+from src.core.level.level_seed import LevelSeed
+from src.core.level.level_generator_v3 import LevelGeneratorV3
+from src.core.level.level_manager import LevelManager
+from src.core.level.level_loader import LevelLoader
+from src.core.level.difficulty_config import DifficultyLevel
+
+
+class TestLevelCache(unittest.TestCase):
+    """Test LevelCache"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.cache = LevelCache(self.temp_dir)
+        self.level_seed = LevelSeed(DifficultyLevel.HARD, 6, 987654)
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_miss_then_hit(self):
+        """测试未命中时生成，命中时直接读取"""
+        generated = self.cache.get_or_generate(self.level_seed)
+
+        with patch.object(LevelGeneratorV3, 'generate') as generate:
+            cached = self.cache.get_or_generate(self.level_seed)
+            generate.assert_not_called()
+
+        self.assertEqual(cached, generated)
+        self.assertEqual(self.cache.get_stats(), {'hits': 1, 'misses': 1})
+
+    def test_cached_level_matches_generator(self):
+        """测试缓存内容与按种子重新生成的结果一致"""
+        self.cache.get_or_generate(self.level_seed)
+        fresh = LevelGeneratorV3(
+            difficulty=DifficultyLevel.HARD, grid_size=6, seed=987654
+        ).generate()
+        self.assertEqual(self.cache.get(self.level_seed), fresh)
+
+    def test_key_includes_generator_version(self):
+        """测试生成器版本变化后缓存失效"""
+        self.cache.get_or_generate(self.level_seed)
+        with patch.object(LevelGeneratorV3, 'GENERATOR_VERSION', 'test'):
+            self.assertIsNone(self.cache.get(self.level_seed))
+
+    def test_corrupted_entry_ignored(self):
+        """测试损坏的缓存文件被忽略"""
+        self.cache.get_or_generate(self.level_seed)
+        path = self.cache._path_for(self.level_seed)
+        path.write_text("{", encoding='utf-8')
+        self.assertIsNone(self.cache.get(self.level_seed))
+
+    def test_clear(self):
+        """测试清空缓存"""
+        self.cache.get_or_generate(self.level_seed)
+        self.assertEqual(self.cache.clear(), 1)
+        self.assertIsNone(self.cache.get(self.level_seed))
+
+    def test_load_seeded_level(self):
+        """测试LevelManager按种子加载关卡并记录种子"""
+        manager = LevelManager(LevelLoader())
+        self.assertTrue(manager.load_seeded_level(self.level_seed, cache=self.cache))
+        self.assertEqual(manager.get_level_seed(), self.level_seed)
+        self.assertEqual(manager.get_grid().grid_size, 6)
+
+
+if __name__ == '__main__':
+    unittest.main()
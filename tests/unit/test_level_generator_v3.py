@@ -0,0 +1,107 @@
+"""
+Unit tests for LevelGeneratorV3
+
+Tests iterative path synthesis and difficulty budgets.
+
+Author: Circuit Repair Game Team
+Date: 2026-01-23
+"""
+
+import random
+import sys
+import unittest
+
+from src.core.level.level_generator_v3 import LevelGeneratorV3
+from src.core.level.difficulty_config import DifficultyLevel, DifficultyConfig
+
+
+class TestLevelGeneratorV3PathSynthesis(unittest.TestCase):
+    """Test budget-directed path synthesis"""
+
+    def setUp(self):
+        random.seed(20260123)
+
+    def _assert_valid_path(self, generator, path):
+        self.assertEqual(len(path), len(set(path)))
+        for (x1, y1), (x2, y2) in zip(path, path[1:]):
+            self.assertEqual(abs(x1 - x2) + abs(y1 - y2), 1)
+        for x, y in path:
+            self.assertTrue(0 <= x < generator.grid_size and 0 <= y < generator.grid_size)
+        (px, py), (tx, ty) = path[0], path[-1]
+        self.assertGreaterEqual(abs(px - tx) + abs(py - ty), 2)
+
+    def test_paths_meet_difficulty_budgets(self):
+        """测试合成的路径满足各难度的预算"""
+        for difficulty in DifficultyLevel:
+            generator = LevelGeneratorV3(difficulty=difficulty)
+            for _ in range(50):
+                path = generator._synthesize_path()
+                self.assertIsNotNone(path)
+                self._assert_valid_path(generator, path)
+
+                tiles = generator._create_solution_tiles(path)
+                movable = sum(1 for t in tiles if t.get('is_clickable', False))
+                corners = sum(1 for t in tiles if t['type'] == 'corner')
+                self.assertTrue(generator._validate_difficulty(movable, corners))
+
+    def test_generate_large_grid(self):
+        """测试大网格上的长路径生成不会递归"""
+        generator = LevelGeneratorV3(difficulty=DifficultyLevel.HELL, grid_size=40)
+        generator.config = DifficultyConfig(
+            min_movable_tiles=sys.getrecursionlimit() // 4,
+            max_movable_tiles=sys.getrecursionlimit() // 4 + 50,
+            scramble_ratio=1.0,
+            min_corners=40,
+            max_corners=120,
+            grid_size_range=(40, 40)
+        )
+
+        level = generator.generate()
+
+        self._assert_valid_path(generator, level['path'])
+        self.assertTrue(generator._validate_difficulty(level['movable_count'], level['corner_count']))
+        self.assertEqual(len(level['solution']), 40 * 40)
+
+    def test_impossible_corner_window(self):
+        """测试拐角预算无法满足时返回None"""
+        generator = LevelGeneratorV3(difficulty=DifficultyLevel.HELL, grid_size=2)
+        self.assertIsNone(generator._synthesize_path())
+
+
+class TestLevelGeneratorV3Seeding(unittest.TestCase):
+    """Test reproducible generation from a seed"""
+
+    def test_same_seed_same_level(self):
+        """测试相同种子生成相同关卡"""
+        for difficulty in DifficultyLevel:
+            first = LevelGeneratorV3(difficulty=difficulty, seed=12345).generate()
+            random.random()  # 全局随机状态不影响结果
+            second = LevelGeneratorV3(difficulty=difficulty, seed=12345).generate()
+            self.assertEqual(first, second)
+            self.assertEqual(first['seed'], 12345)
+
+    def test_explicit_size_matches_drawn_size(self):
+        """测试显式指定随机抽取到的尺寸时结果一致"""
+        auto = LevelGeneratorV3(difficulty=DifficultyLevel.HARD, seed=7).generate()
+        sized = LevelGeneratorV3(
+            difficulty=DifficultyLevel.HARD, grid_size=auto['grid_size'], seed=7
+        ).generate()
+        self.assertEqual(auto, sized)
+
+    def test_generation_attempts_counted(self):
+        """测试记录生成尝试次数"""
+        generator = LevelGeneratorV3(difficulty=DifficultyLevel.NORMAL, seed=3)
+        self.assertEqual(generator.generation_attempts, 0)
+        generator.generate()
+        self.assertGreaterEqual(generator.generation_attempts, 1)
+
+    def test_random_seed_when_omitted(self):
+        """测试未指定种子时记录随机种子"""
+        generator = LevelGeneratorV3(difficulty=DifficultyLevel.EASY)
+        level = generator.generate()
+        replay = LevelGeneratorV3(difficulty=DifficultyLevel.EASY, seed=level['seed']).generate()
+        self.assertEqual(level, replay)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -13,8 +13,11 @@ import os
 import json
 from typing import Dict, Any
 
+from src.core.level.difficulty_config import DifficultyLevel
+from src.core.level.level_generator_v3 import LevelGeneratorV3
 from src.core.level.level_manager import LevelManager
 from src.core.level.level_loader import LevelLoader
+from src.core.level.move_journal import MoveJournal
 from src.core.grid.tile_type import TileType
 
 
@@ -264,6 +267,32 @@ class TestLevelManagerRotation(unittest.TestCase):
         self.assertFalse(success)
         self.assertEqual(self.manager.get_move_count(), move_count_before)
 
+    def test_rotation_reports_connectivity_delta(self):
+        """测试旋转后报告通电状态变化"""
+        level_data = self._create_simple_level_data()
+        level_data["initial_state"]["rotated_tiles"] = [
+            {"x": 1, "y": 0, "rotation": 270},
+            {"x": 2, "y": 0, "rotation": 270}
+        ]
+        filepath = self._create_temp_level("test_level.json", level_data)
+        self.manager.load_level(filepath)
+        self.assertEqual(self.manager.get_powered_positions(), {(0, 0)})
+
+        self.manager.rotate_tile(1, 0)
+        delta = self.manager.get_last_connectivity_delta()
+        self.assertEqual(delta.powered, {(1, 0)})
+        self.assertFalse(delta.terminal_reached)
+
+        self.manager.rotate_tile(2, 0)
+        delta = self.manager.get_last_connectivity_delta()
+        self.assertEqual(delta.powered, {(2, 0), (3, 0)})
+        self.assertTrue(delta.terminal_reached)
+
+        self.manager.rotate_tile(1, 0)
+        delta = self.manager.get_last_connectivity_delta()
+        self.assertEqual(delta.unpowered, {(1, 0), (2, 0), (3, 0)})
+        self.assertEqual(self.manager.get_powered_positions(), {(0, 0)})
+
 
 class TestLevelManagerReset(unittest.TestCase):
     """Test level reset functionality"""
@@ -382,6 +411,151 @@ class TestLevelManagerReset(unittest.TestCase):
         self.assertFalse(success)
 
 
+class TestLevelManagerUndoRedo(unittest.TestCase):
+    """Test move journal, undo/redo and replay"""
+
+    def setUp(self):
+        self.loader = LevelLoader()
+        self.manager = LevelManager(self.loader)
+        self.temp_dir = tempfile.mkdtemp()
+        level_data = {
+            "level_id": "test_001",
+            "version": "1.0",
+            "name": "测试关卡",
+            "difficulty": 1,
+            "grid_size": 4,
+            "solution": {
+                "tiles": [
+                    {"x": 0, "y": 0, "type": "power_source", "rotation": 0},
+                    {"x": 1, "y": 0, "type": "straight", "rotation": 0},
+                    {"x": 2, "y": 0, "type": "corner", "rotation": 0},
+                    {"x": 3, "y": 0, "type": "terminal", "rotation": 0}
+                ]
+            },
+            "initial_state": {
+                "rotated_tiles": [
+                    {"x": 1, "y": 0, "rotation": 90},
+                    {"x": 2, "y": 0, "rotation": 90}
+                ]
+            }
+        }
+        self.filepath = os.path.join(self.temp_dir, "test_level.json")
+        with open(self.filepath, 'w', encoding='utf-8') as f:
+            json.dump(level_data, f, ensure_ascii=False, indent=2)
+        self.manager.load_level(self.filepath)
+
+    def tearDown(self):
+        import shutil
+        if os.path.exists(self.temp_dir):
+            shutil.rmtree(self.temp_dir)
+
+    def _rotations(self):
+        grid = self.manager.get_grid()
+        return (grid.get_tile(1, 0).rotation, grid.get_tile(2, 0).rotation)
+
+    def test_moves_recorded(self):
+        """测试旋转被记录到移动日志"""
+        self.manager.rotate_tile(1, 0)
+        self.manager.rotate_tile(2, 0)
+        self.manager.rotate_tile(0, 0)  # Power source, not recorded
+
+        self.assertEqual(list(self.manager.get_move_journal()), [(1, 0, 1), (2, 0, 1)])
+        self.assertEqual(len(self.manager.get_move_journal().to_bytes()), 8)
+
+    def test_undo_redo(self):
+        """测试撤销和重做"""
+        self.manager.rotate_tile(1, 0)
+        self.manager.rotate_tile(2, 0)
+        self.assertEqual(self._rotations(), (180, 180))
+
+        self.assertTrue(self.manager.undo_move())
+        self.assertEqual(self._rotations(), (180, 90))
+        self.assertEqual(self.manager.get_move_count(), 1)
+        self.assertTrue(self.manager.undo_move())
+        self.assertFalse(self.manager.undo_move())
+        self.assertEqual(self._rotations(), (90, 90))
+
+        self.assertTrue(self.manager.redo_move())
+        self.assertEqual(self._rotations(), (180, 90))
+        self.assertTrue(self.manager.can_redo())
+        self.assertEqual(self.manager.get_move_count(), 1)
+
+    def test_new_move_discards_redo(self):
+        """测试撤销后新的移动会丢弃可重做的记录"""
+        self.manager.rotate_tile(1, 0)
+        self.manager.undo_move()
+        self.manager.rotate_tile(2, 0)
+
+        self.assertFalse(self.manager.can_redo())
+        self.assertEqual(list(self.manager.get_move_journal()), [(2, 0, 1)])
+
+    def test_undo_redo_missing_tile(self):
+        """测试记录位置没有瓦片时撤销/重做不改变日志和计数"""
+        self.assertIsNone(self.manager.get_grid().get_tile(3, 3))
+        self.manager.rotate_tile(1, 0)
+        journal = self.manager.get_move_journal()
+        journal.record(3, 3)
+
+        self.assertFalse(self.manager.undo_move())
+        self.assertEqual(list(journal), [(1, 0, 1), (3, 3, 1)])
+        self.assertEqual(self.manager.get_move_count(), 1)
+
+        journal.undo()
+        self.assertFalse(self.manager.redo_move())
+        self.assertEqual(list(journal), [(1, 0, 1)])
+        self.assertTrue(journal.can_redo())
+        self.assertEqual(self.manager.get_move_count(), 1)
+
+    def test_undo_updates_connectivity(self):
+        """测试撤销后通电状态同步更新"""
+        before = self.manager.get_powered_positions()
+        self.manager.rotate_tile(1, 0)
+        self.manager.undo_move()
+        self.assertEqual(self.manager.get_powered_positions(), before)
+
+    def test_replay_moves(self):
+        """测试在新关卡上回放移动日志"""
+        for _ in range(3):
+            self.manager.rotate_tile(1, 0)
+        self.manager.rotate_tile(2, 0)
+        recording = self.manager.get_move_journal().to_bytes()
+        expected = self._rotations()
+
+        replayer = LevelManager(self.loader)
+        replayer.load_level(self.filepath)
+        applied = replayer.replay_moves(MoveJournal(recording))
+
+        self.assertEqual(applied, 4)
+        self.assertEqual(replayer.get_move_count(), 4)
+        grid = replayer.get_grid()
+        self.assertEqual((grid.get_tile(1, 0).rotation, grid.get_tile(2, 0).rotation), expected)
+
+    def test_replay_own_journal(self):
+        """测试回放当前关卡自身的移动日志"""
+        self.manager.rotate_tile(1, 0)
+        self.manager.rotate_tile(2, 0)
+        expected = self._rotations()
+
+        self.assertEqual(self.manager.replay_moves(self.manager.get_move_journal()), 2)
+        self.assertEqual(self._rotations(), expected)
+
+    def test_replay_stops_at_invalid_move(self):
+        """测试回放遇到无效移动时停止"""
+        journal = MoveJournal()
+        journal.record(1, 0, 1)
+        journal.record(0, 0, 1)  # Power source
+        journal.record(2, 0, 1)
+
+        self.assertEqual(self.manager.replay_moves(journal), 1)
+        self.assertEqual(self._rotations(), (180, 90))
+
+    def test_reset_clears_journal(self):
+        """测试重置关卡清空移动日志"""
+        self.manager.rotate_tile(1, 0)
+        self.manager.reset_level()
+        self.assertFalse(self.manager.can_undo())
+
+
 class TestLevelManagerWinCondition(unittest.TestCase):
     """Test win condition checking"""
 
@@ -462,6 +636,64 @@ class TestLevelManagerWinCondition(unittest.TestCase):
 
         self.assertFalse(is_completed)
 
+    def _create_clickable_level_data(self) -> Dict[str, Any]:
+        """创建直线瓦片标记为可点击的关卡数据"""
+        level_data = self._create_simple_level_data()
+        for tile_data in level_data["solution"]["tiles"][1:3]:
+            tile_data["is_clickable"] = True
+        return level_data
+
+    def test_mismatch_count_tracks_rotations(self):
+        """测试不匹配计数随旋转增量更新"""
+        level_data = self._create_clickable_level_data()
+        level_data["solution"]["tiles"][1]["accepted_rotations"] = [0, 180]
+        filepath = self._create_temp_level("test_level.json", level_data)
+        self.manager.load_level(filepath)
+        self.assertEqual(self.manager.get_mismatch_count(), 2)
+
+        self.manager.rotate_tile(1, 0)  # 180, accepted
+        self.assertEqual(self.manager.get_mismatch_count(), 1)
+        self.manager.rotate_tile(1, 0)  # 270
+        self.assertEqual(self.manager.get_mismatch_count(), 2)
+
+        # Rotations made directly on the tile are picked up as well
+        self.manager.get_grid().get_tile(1, 0).set_rotation(0)
+        self.manager.get_grid().get_tile(2, 0).set_rotation(0)
+        self.assertEqual(self.manager.get_mismatch_count(), 0)
+        self.assertTrue(self.manager.check_win_condition())
+
+    def test_mismatch_count_after_reset_and_undo(self):
+        """测试重置和撤销后不匹配计数正确"""
+        level_data = self._create_clickable_level_data()
+        filepath = self._create_temp_level("test_level.json", level_data)
+        self.manager.load_level(filepath)
+
+        for _ in range(3):
+            self.manager.rotate_tile(1, 0)
+        self.assertEqual(self.manager.get_mismatch_count(), 1)
+
+        self.manager.undo_move()
+        self.assertEqual(self.manager.get_mismatch_count(), 2)
+
+        self.manager.redo_move()
+        self.manager.reset_level()
+        self.assertEqual(self.manager.get_mismatch_count(), 2)
+        self.assertFalse(self.manager.check_win_condition())
+
+    def test_missing_solution_tile_never_wins(self):
+        """测试解中的可点击瓦片不在网格内时不会胜利"""
+        level_data = self._create_clickable_level_data()
+        filepath = self._create_temp_level("test_level.json", level_data)
+        self.manager.load_level(filepath)
+        self.manager.get_level_data().solution_tiles.append(
+            {"x": 9, "y": 9, "type": "straight", "rotation": 0, "is_clickable": True}
+        )
+        self.manager._init_win_state()
+
+        for x in (1, 2):
+            self.manager.get_grid().get_tile(x, 0).set_rotation(0)
+        self.assertFalse(self.manager.check_win_condition())
+
     def test_get_connected_path_when_completed(self):
         """测试完成时获取连接路径"""
         level_data = self._create_simple_level_data()
@@ -491,6 +723,28 @@ class TestLevelManagerWinCondition(unittest.TestCase):
 
         self.assertIsNone(path)
 
+    def _solve_with_hints(self) -> None:
+        """按提示点击直到获胜"""
+        while not self.manager.check_win_condition():
+            hint = self.manager.get_hint()
+            self.assertIsNotNone(hint)
+            self.manager.rotate_tile(hint.x, hint.y)
+
+    def _assert_terminal_powered(self) -> None:
+        """断言终端通电且存在连接路径"""
+        terminal = self.manager.get_grid().get_terminal()
+        self.assertIn((terminal.x, terminal.y), self.manager.get_powered_positions())
+        self.assertIsNotNone(self.manager.get_connected_path())
+
+    def test_generated_levels_power_terminal_when_solved(self):
+        """测试生成关卡求解后终端通电"""
+        for seed in range(10):
+            with self.subTest(seed=seed):
+                generated = LevelGeneratorV3(difficulty=DifficultyLevel.NORMAL, seed=seed).generate()
+                self.assertTrue(self.manager.load_generated_data(generated, DifficultyLevel.NORMAL))
+                self._solve_with_hints()
+                self._assert_terminal_powered()
+
     def test_get_connected_path_no_level_loaded(self):
         """测试未加载关卡时获取连接路径"""
         path = self.manager.get_connected_path()
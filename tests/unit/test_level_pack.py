@@ -0,0 +1,105 @@
+"""
+Unit tests for level packs
+
+Tests symmetry canonicalization and pack assembly.
+
+Author: Circuit Repair Game Team
+Date: 2026-01-23
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from src.core.level.level_pack import (
+    canonical_path, build_level_pack, save_level_pack, load_level_pack, PACK_FORMAT
+)
+from src.core.level.level_generator_v3 import LevelGeneratorV3
+from src.core.level.level_loader import LevelLoader
+from src.core.level.difficulty_config import DifficultyLevel
+
+
+class TestCanonicalPath(unittest.TestCase):
+    """Test canonical_path"""
+
+    def setUp(self):
+        self.path = [(0, 0), (0, 1), (1, 1), (1, 2), (2, 2), (3, 2)]
+        self.size = 4
+
+    def _transforms(self):
+        last = self.size - 1
+        return [
+            lambda x, y: (last - y, x),
+            lambda x, y: (last - x, last - y),
+            lambda x, y: (y, last - x),
+            lambda x, y: (last - x, y),
+            lambda x, y: (y, x),
+            lambda x, y: (x, last - y),
+            lambda x, y: (last - y, last - x),
+        ]
+
+    def test_all_symmetries_share_canonical_form(self):
+        """测试8种对称变换得到相同的规范形式"""
+        expected = canonical_path(self.path, self.size)
+        for transform in self._transforms():
+            variant = [transform(x, y) for x, y in self.path]
+            self.assertEqual(canonical_path(variant, self.size), expected)
+
+    def test_reversed_path_differs(self):
+        """测试交换电源和终端视为不同关卡"""
+        self.assertNotEqual(
+            canonical_path(self.path, self.size),
+            canonical_path(list(reversed(self.path)), self.size)
+        )
+
+
+class TestLevelPack(unittest.TestCase):
+    """Test pack assembly and file round trip"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.levels = [
+            (DifficultyLevel.EASY, LevelGeneratorV3(DifficultyLevel.EASY, seed=1).generate()),
+            (DifficultyLevel.HARD, LevelGeneratorV3(DifficultyLevel.HARD, seed=2).generate()),
+            (DifficultyLevel.EASY, LevelGeneratorV3(DifficultyLevel.EASY, seed=3).generate()),
+        ]
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_index(self):
+        """测试索引条目"""
+        pack = build_level_pack(self.levels)
+        self.assertEqual(pack['format'], PACK_FORMAT)
+        self.assertEqual(
+            [entry['level_id'] for entry in pack['index']],
+            ['easy_00001', 'hard_00001', 'easy_00002']
+        )
+        self.assertEqual(pack['index'][1]['seed'], 2)
+        self.assertEqual(len(pack['levels']), 3)
+
+    def test_levels_are_loadable(self):
+        """测试关卡包中的关卡符合关卡文件格式"""
+        loader = LevelLoader()
+        pack = build_level_pack(self.levels)
+        for entry in pack['levels']:
+            self.assertTrue(loader._validate_level_data(entry))
+            grid = loader._create_grid(loader._parse_level_data(entry))
+            self.assertEqual(grid.grid_size, entry['grid_size'])
+
+    def test_save_and_load(self):
+        """测试写入和读取关卡包"""
+        filepath = os.path.join(self.temp_dir, "packs", "test.pack.json")
+        pack = build_level_pack(self.levels)
+        save_level_pack(filepath, pack)
+        self.assertEqual(load_level_pack(filepath)['index'], pack['index'])
+
+    def test_load_rejects_other_files(self):
+        """测试拒绝非关卡包文件"""
+        with self.assertRaises(ValueError):
+            load_level_pack("data/levels/level_001.json")
+
+
+if __name__ == '__main__':
+    unittest.main()
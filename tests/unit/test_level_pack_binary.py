@@ -0,0 +1,106 @@
+"""
+Unit tests for binary level packs
+
+Tests the binary format round trip and memory-mapped loading.
+
+Author: Circuit Repair Game Team
+Date: 2026-01-23
+"""
+
+import os
+import shutil
+import tempfile
+import unittest
+
+from src.core.level.level_pack import build_level_pack
+from src.core.level.level_pack_binary import BinaryLevelPack, write_binary_level_pack
+from src.core.level.level_generator_v3 import LevelGeneratorV3
+from src.core.level.level_loader import LevelLoader
+from src.core.level.level_manager import LevelManager
+from src.core.level.level_seed import LevelSeed
+from src.core.level.difficulty_config import DifficultyLevel
+
+
+class TestBinaryLevelPack(unittest.TestCase):
+    """Test binary pack writing and reading"""
+
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.filepath = os.path.join(self.temp_dir, "test.pack")
+        self.pack = build_level_pack([
+            (difficulty, LevelGeneratorV3(difficulty, seed=seed).generate())
+            for seed, difficulty in enumerate(DifficultyLevel)
+        ])
+        write_binary_level_pack(self.filepath, self.pack['levels'])
+        self.loader = LevelLoader()
+
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+
+    def test_round_trip_builds_same_grid(self):
+        """测试二进制关卡包解码后创建的网格与原关卡一致"""
+        with BinaryLevelPack(self.filepath) as pack:
+            self.assertEqual(len(pack), len(DifficultyLevel))
+            for index, level in enumerate(self.pack['levels']):
+                expected = self.loader._create_grid(self.loader._parse_level_data(level))
+                level_data = pack.get_level_data(index)
+                self.assertEqual(level_data.level_id, level['level_id'])
+                self.assertEqual(level_data.difficulty, level['difficulty'])
+                self.assertEqual(
+                    self.loader._create_grid(level_data).snapshot(), expected.snapshot()
+                )
+                self.assertEqual(pack.get_seed(index), level['seed'])
+
+    def test_accepted_rotations_preserved(self):
+        """测试可接受旋转角度被保留"""
+        with BinaryLevelPack(self.filepath) as pack:
+            level_data = pack.get_level_data(0)
+        original = {
+            (t['x'], t['y']): sorted(t['accepted_rotations'])
+            for t in self.pack['levels'][0]['solution']['tiles'] if 'accepted_rotations' in t
+        }
+        decoded = {
+            (t['x'], t['y']): t['accepted_rotations']
+            for t in level_data.solution_tiles if 'accepted_rotations' in t
+        }
+        self.assertEqual(decoded, original)
+
+    def test_index_out_of_range(self):
+        """测试索引越界"""
+        with BinaryLevelPack(self.filepath) as pack:
+            with self.assertRaises(IndexError):
+                pack.get_level_data(len(pack))
+
+    def test_rejects_other_files(self):
+        """测试拒绝非二进制关卡包"""
+        with self.assertRaises(ValueError):
+            BinaryLevelPack("data/levels/level_001.json")
+        empty = os.path.join(self.temp_dir, "empty.pack")
+        open(empty, 'wb').close()
+        with self.assertRaises(ValueError):
+            BinaryLevelPack(empty)
+
+    def test_loader_backend(self):
+        """测试LevelLoader从关卡包加载"""
+        pack = self.loader.open_pack(self.filepath)
+        self.assertIsNotNone(pack)
+        grid = self.loader.load_pack_level(pack, 1)
+        self.assertEqual(grid.grid_size, self.pack['levels'][1]['grid_size'])
+        self.assertIsNone(self.loader.load_pack_level(pack, 99))
+        self.assertIsNone(self.loader.open_pack(os.path.join(self.temp_dir, "missing.pack")))
+        pack.close()
+
+    def test_manager_loads_pack_level(self):
+        """测试LevelManager从关卡包加载并记录种子"""
+        manager = LevelManager(self.loader)
+        with BinaryLevelPack(self.filepath) as pack:
+            self.assertTrue(manager.load_pack_level(pack, 2))
+        self.assertEqual(manager.get_current_level_id(), "hard_00001")
+        self.assertEqual(manager.get_level_seed(), LevelSeed(
+            DifficultyLevel.HARD, self.pack['levels'][2]['grid_size'], 2
+        ))
+        self.assertFalse(manager.check_win_condition())
+
+
+if __name__ == '__main__':
+    unittest.main()
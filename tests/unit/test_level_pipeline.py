@@ -0,0 +1,92 @@
+"""
+Unit tests for LevelPipeline
+
+Tests background pre-generation, fill order and synchronous fallback.
+
+Author: Circuit Repair Game Team
+Date: 2026-01-23
+"""
+
+import time
+import unittest
+
+from src.core.level.level_pipeline import LevelPipeline
+from src.core.level.level_manager import LevelManager
+from src.core.level.level_loader import LevelLoader
+from src.core.level.difficulty_config import DifficultyLevel, DifficultyConfig
+
+
+class TestLevelPipeline(unittest.TestCase):
+    """Test LevelPipeline queues and worker"""
+
+    def setUp(self):
+        self.pipeline = LevelPipeline(depth=2)
+
+    def tearDown(self):
+        self.pipeline.stop()
+
+    def _wait_until(self, predicate, timeout=10.0):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if predicate():
+                return True
+            time.sleep(0.01)
+        return predicate()
+
+    def _assert_difficulty(self, generated, difficulty):
+        min_size, max_size = DifficultyConfig.get_config(difficulty).grid_size_range
+        self.assertTrue(min_size <= generated['grid_size'] <= max_size)
+
+    def test_invalid_depth(self):
+        """测试非法队列深度"""
+        with self.assertRaises(ValueError):
+            LevelPipeline(depth=0)
+
+    def test_get_without_worker_generates_synchronously(self):
+        """测试无预生成关卡时同步生成"""
+        generated = self.pipeline.get(DifficultyLevel.EASY)
+        self._assert_difficulty(generated, DifficultyLevel.EASY)
+        self.assertEqual(self.pipeline.get_ready_count(DifficultyLevel.EASY), 0)
+
+    def test_worker_fills_every_difficulty(self):
+        """测试后台线程填满所有难度的队列"""
+        self.pipeline.start(DifficultyLevel.HARD)
+        self.assertTrue(self.pipeline.is_running())
+        self.assertTrue(self._wait_until(
+            lambda: all(self.pipeline.get_ready_count(d) == 2 for d in DifficultyLevel)
+        ))
+
+    def test_get_pops_ready_level_and_refills(self):
+        """测试取出预生成关卡后自动补充"""
+        self.pipeline.start(DifficultyLevel.HELL)
+        self.assertTrue(self._wait_until(
+            lambda: self.pipeline.get_ready_count(DifficultyLevel.HELL) == 2
+        ))
+
+        generated = self.pipeline.get(DifficultyLevel.HELL)
+        self._assert_difficulty(generated, DifficultyLevel.HELL)
+        self.assertTrue(self._wait_until(
+            lambda: self.pipeline.get_ready_count(DifficultyLevel.HELL) == 2
+        ))
+
+    def test_stop_keeps_queued_levels(self):
+        """测试停止后已生成的关卡保留"""
+        self.pipeline.start(DifficultyLevel.NORMAL)
+        self.assertTrue(self._wait_until(
+            lambda: self.pipeline.get_ready_count(DifficultyLevel.NORMAL) > 0
+        ))
+        self.pipeline.stop()
+        self.assertFalse(self.pipeline.is_running())
+        self.assertGreater(self.pipeline.get_ready_count(DifficultyLevel.NORMAL), 0)
+
+    def test_pipeline_level_loads_into_manager(self):
+        """测试预生成关卡可以直接加载"""
+        generated = self.pipeline.get(DifficultyLevel.NORMAL)
+        manager = LevelManager(LevelLoader())
+        self.assertTrue(manager.load_generated_data(generated, DifficultyLevel.NORMAL, 4))
+        self.assertEqual(manager.get_level_data().level_id, "generated_4")
+        self.assertEqual(manager.get_grid().grid_size, generated['grid_size'])
+
+
+if __name__ == '__main__':
+    unittest.main()
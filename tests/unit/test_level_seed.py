@@ -0,0 +1,72 @@
+"""
+Unit tests for LevelSeed
+
+Tests seed code encoding, decoding and validation.
+
+Author: Circuit Repair Game Team
+Date: 2026-01-23
+"""
+
+import unittest
+from datetime import date
+
+from src.core.level.level_seed import LevelSeed, MAX_SEED
+from src.core.level.difficulty_config import DifficultyLevel, DifficultyConfig
+
+
+class TestLevelSeed(unittest.TestCase):
+    """Test LevelSeed seed codes"""
+
+    def test_round_trip(self):
+        """测试种子码编码和解码"""
+        for difficulty in DifficultyLevel:
+            for grid_size, seed in [(4, 0), (8, 123456789), (255, MAX_SEED)]:
+                level_seed = LevelSeed(difficulty, grid_size, seed)
+                code = level_seed.to_code()
+                self.assertEqual(len(code), 11)
+                self.assertEqual(LevelSeed.from_code(code), level_seed)
+
+    def test_code_is_case_insensitive(self):
+        """测试种子码不区分大小写并容忍易混字符"""
+        level_seed = LevelSeed(DifficultyLevel.HARD, 6, 20260123)
+        code = level_seed.to_code()
+        self.assertEqual(LevelSeed.from_code(code.lower()), level_seed)
+        self.assertEqual(LevelSeed.from_code(code.replace('-', ' ')), level_seed)
+        self.assertEqual(LevelSeed.from_code(code.replace('0', 'O').replace('1', 'I')), level_seed)
+
+    def test_checksum_detects_typo(self):
+        """测试校验位检测输入错误"""
+        code = LevelSeed(DifficultyLevel.NORMAL, 5, 42).to_code()
+        typo = ('1' if code[0] != '1' else '2') + code[1:]
+        with self.assertRaises(ValueError):
+            LevelSeed.from_code(typo)
+
+    def test_malformed_code(self):
+        """测试非法种子码"""
+        for code in ["", "ABC", "UUUUU-UUUUU", "00000-000000"]:
+            with self.assertRaises(ValueError):
+                LevelSeed.from_code(code)
+
+    def test_out_of_range(self):
+        """测试超出范围的字段"""
+        with self.assertRaises(ValueError):
+            LevelSeed(DifficultyLevel.EASY, 0, 1)
+        with self.assertRaises(ValueError):
+            LevelSeed(DifficultyLevel.EASY, 4, MAX_SEED + 1)
+
+    def test_daily_seed(self):
+        """测试每日挑战种子稳定且尺寸在难度范围内"""
+        day = date(2026, 1, 23)
+        for difficulty in DifficultyLevel:
+            level_seed = LevelSeed.daily(difficulty, day)
+            self.assertEqual(level_seed, LevelSeed.daily(difficulty, day))
+            min_size, max_size = DifficultyConfig.get_config(difficulty).grid_size_range
+            self.assertTrue(min_size <= level_seed.grid_size <= max_size)
+        self.assertNotEqual(
+            LevelSeed.daily(DifficultyLevel.HARD, day),
+            LevelSeed.daily(DifficultyLevel.HARD, date(2026, 1, 24))
+        )
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,91 @@
+"""
+Unit tests for MoveJournal
+
+Tests move packing, undo/redo cursor handling and serialization.
+
+Author: Circuit Repair Game Team
+Date: 2026-01-20
+"""
+
+import unittest
+
+from src.core.level.move_journal import MoveJournal, pack_move, unpack_move, MAX_MOVE_COORDINATE
+
+
+class TestMovePacking(unittest.TestCase):
+    """Test packing of single moves"""
+
+    def test_round_trip(self):
+        """测试打包和解包"""
+        for move in [(0, 0, 1), (3, 5, 3), (MAX_MOVE_COORDINATE, MAX_MOVE_COORDINATE, 2)]:
+            self.assertEqual(unpack_move(pack_move(*move)), move)
+
+    def test_delta_normalized(self):
+        """测试旋转增量取模"""
+        self.assertEqual(unpack_move(pack_move(1, 2, -1)), (1, 2, 3))
+
+    def test_coordinate_out_of_range(self):
+        """测试坐标越界"""
+        with self.assertRaises(ValueError):
+            pack_move(MAX_MOVE_COORDINATE + 1, 0, 1)
+        with self.assertRaises(ValueError):
+            pack_move(0, -1, 1)
+
+
+class TestMoveJournal(unittest.TestCase):
+    """Test MoveJournal cursor and serialization"""
+
+    def setUp(self):
+        self.journal = MoveJournal()
+        self.journal.record(1, 0, 1)
+        self.journal.record(2, 0, 1)
+
+    def test_undo_redo(self):
+        """测试撤销和重做游标"""
+        self.assertEqual(self.journal.undo(), (2, 0, 1))
+        self.assertEqual(len(self.journal), 1)
+        self.assertTrue(self.journal.can_redo())
+        self.assertEqual(self.journal.redo(), (2, 0, 1))
+        self.assertIsNone(self.journal.redo())
+
+        self.journal.undo()
+        self.journal.undo()
+        self.assertIsNone(self.journal.undo())
+        self.assertFalse(self.journal.can_undo())
+
+    def test_peek_keeps_cursor(self):
+        """测试预览撤销/重做不移动游标"""
+        self.assertEqual(self.journal.peek_undo(), (2, 0, 1))
+        self.assertIsNone(self.journal.peek_redo())
+        self.assertEqual(len(self.journal), 2)
+
+        self.journal.undo()
+        self.assertEqual(self.journal.peek_redo(), (2, 0, 1))
+        self.assertEqual(self.journal.peek_undo(), (1, 0, 1))
+        self.assertEqual(len(self.journal), 1)
+
+    def test_record_discards_undone(self):
+        """测试记录新移动会丢弃已撤销的移动"""
+        self.journal.undo()
+        self.journal.record(3, 3, 3)
+        self.assertEqual(list(self.journal), [(1, 0, 1), (3, 3, 3)])
+        self.assertFalse(self.journal.can_redo())
+
+    def test_serialization(self):
+        """测试序列化只包含已应用的移动"""
+        self.journal.record(4, 4, 1)
+        self.journal.undo()
+
+        data = self.journal.to_bytes()
+        self.assertEqual(len(data), 8)
+        self.assertEqual(list(MoveJournal(data)), [(1, 0, 1), (2, 0, 1)])
+
+    def test_clear(self):
+        """测试清空"""
+        self.journal.clear()
+        self.assertEqual(len(self.journal), 0)
+        self.assertEqual(self.journal.to_bytes(), b"")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+"""
+Unit tests for the move solver
+
+Tests optimal move counts against brute force and against generated levels.
+
+Author: Circuit Repair Game Team
+Date: 2026-01-20
+"""
+
+import itertools
+import time
+import unittest
+
+from src.core.level.move_solver import (
+    accepted_rotation_mask, clicks_to_accept, compute_optimal_moves, UNREACHABLE
+)
+from src.core.level.level_generator_v3 import LevelGeneratorV3
+from src.core.level.level_loader import LevelLoader, LevelData
+from src.core.level.level_manager import LevelManager
+from src.core.level.difficulty_config import DifficultyLevel
+
+
+def _tile(x, y, tile_type='straight', rotation=0, **extra):
+    tile = {'x': x, 'y': y, 'type': tile_type, 'rotation': rotation, 'is_clickable': True}
+    tile.update(extra)
+    return tile
+
+
+class TestClickTable(unittest.TestCase):
+    """Test the accepted-mask click table"""
+
+    def test_matches_brute_force(self):
+        """测试点击表与逐次旋转一致"""
+        for mask in range(16):
+            for rotation in (0, 90, 180, 270):
+                expected = UNREACHABLE
+                for clicks in range(4):
+                    if mask & (1 << ((rotation // 90 + clicks) % 4)):
+                        expected = clicks
+                        break
+                self.assertEqual(clicks_to_accept(rotation, mask), expected)
+
+    def test_accepted_mask(self):
+        """测试可接受旋转掩码"""
+        self.assertEqual(accepted_rotation_mask({'rotation': 90}), 0b0010)
+        self.assertEqual(accepted_rotation_mask({'rotation': 0, 'accepted_rotations': [0, 180]}), 0b0101)
+        self.assertEqual(accepted_rotation_mask({'rotation': 0, 'accepted_rotations': [-90, 45]}), 0b1000)
+
+
+class TestComputeOptimalMoves(unittest.TestCase):
+    """Test compute_optimal_moves"""
+
+    def test_sums_per_tile_clicks(self):
+        """测试按瓦片求和"""
+        solution = [
+            {'x': 0, 'y': 0, 'type': 'power_source', 'rotation': 0},
+            _tile(1, 0, rotation=0),
+            _tile(2, 0, 'corner', rotation=90),
+            _tile(3, 0, rotation=0, accepted_rotations=[0, 180]),
+        ]
+        scrambled = [
+            {'x': 1, 'y': 0, 'rotation': 90},    # 3 clicks to 0
+            {'x': 2, 'y': 0, 'rotation': 0},     # 1 click to 90
+            {'x': 3, 'y': 0, 'rotation': 90},    # 1 click to 180
+        ]
+        self.assertEqual(compute_optimal_moves(4, solution, scrambled), 5)
+
+    def test_unsolvable(self):
+        """测试无解关卡"""
+        fixed = [_tile(0, 0, 'power_source', rotation=0, accepted_rotations=[90])]
+        self.assertIsNone(compute_optimal_moves(4, fixed, []))
+        outside = [_tile(5, 0)]
+        self.assertIsNone(compute_optimal_moves(4, outside, []))
+
+    def test_level_data_stores_optimal_moves(self):
+        """测试LevelData保存最少步数"""
+        data = LevelData("001", "1.0", "Test", 1, 4, [_tile(1, 0)], [{'x': 1, 'y': 0, 'rotation': 180}])
+        self.assertEqual(data.optimal_moves, 2)
+        self.assertEqual(LevelData("002", "1.0", "Empty", 1, 4, [], []).optimal_moves, 0)
+
+    def test_generated_levels_replay_to_win(self):
+        """测试按最少步数点击后生成关卡获胜"""
+        manager = LevelManager(LevelLoader())
+        for seed in range(10):
+            generator = LevelGeneratorV3(DifficultyLevel.HARD, seed=seed)
+            self.assertTrue(manager.load_generated_data(generator.generate(), DifficultyLevel.HARD))
+            optimal = manager.get_optimal_moves()
+            self.assertIsNotNone(optimal)
+
+            grid = manager.get_grid()
+            masks = {
+                (tile['x'], tile['y']): accepted_rotation_mask(tile)
+                for tile in manager.get_level_data().solution_tiles
+                if tile.get('is_clickable')
+            }
+            for (x, y), mask in masks.items():
+                for _ in range(clicks_to_accept(grid.get_tile(x, y).rotation, mask)):
+                    manager.rotate_tile(x, y)
+
+            self.assertTrue(manager.check_win_condition())
+            self.assertEqual(manager.get_move_count(), optimal)
+
+    def test_brute_force_small_levels(self):
+        """测试小关卡与穷举一致"""
+        solution = [
+            _tile(0, 0, rotation=90),
+            _tile(1, 0, 'corner', rotation=180, accepted_rotations=[180, 270]),
+            _tile(2, 0, rotation=0, accepted_rotations=[0, 180]),
+        ]
+        for start in itertools.product((0, 90, 180, 270), repeat=3):
+            scrambled = [{'x': x, 'y': 0, 'rotation': r} for x, r in enumerate(start)]
+            best = min(
+                sum(clicks)
+                for clicks in itertools.product(range(4), repeat=3)
+                if all(
+                    accepted_rotation_mask(tile) & (1 << ((r // 90 + c) % 4))
+                    for tile, r, c in zip(solution, start, clicks)
+                )
+            )
+            self.assertEqual(compute_optimal_moves(3, solution, scrambled), best)
+
+    def test_fast_enough_for_infinite_mode(self):
+        """测试单关计算耗时低于1毫秒"""
+        generated = LevelGeneratorV3(DifficultyLevel.HELL, seed=7).generate()
+        start = time.perf_counter()
+        for _ in range(100):
+            compute_optimal_moves(generated['grid_size'], generated['solution'], generated['initial_state'])
+        self.assertLess((time.perf_counter() - start) / 100, 0.001)
+
+
+if __name__ == '__main__':
+    unittest.main()
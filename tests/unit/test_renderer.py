@@ -12,6 +12,7 @@ import pygame
 from unittest.mock import Mock, patch, MagicMock
 
 from src.rendering.renderer import Renderer
+from src.rendering.font_registry import FontRegistry
 from src.config.config_manager import ConfigManager
 
 
@@ -177,6 +178,42 @@ class TestDrawingOperations:
         # Should not crash, just log warning
         renderer.draw_text("Test", (100, 100))
 
+    def test_draw_text_reuses_font_and_surface(self, initialized_renderer):
+        """Test that repeated text neither opens a font nor re-renders."""
+        initialized_renderer.draw_text("Current: 90°", (10, 10), font_size=14)
+
+        with patch('pygame.font.Font') as mock_font:
+            for _ in range(3):
+                initialized_renderer.draw_text("Current: 90°", (10, 10), font_size=14)
+            mock_font.assert_not_called()
+
+        assert FontRegistry.get_text_cache_size() == 1
+
+    def test_text_cache_keyed_by_color(self, initialized_renderer):
+        """Test that different colors are cached separately."""
+        first = FontRegistry.render_text("Target: 0°", 14, (0, 255, 0))
+        second = FontRegistry.render_text("Target: 0°", 14, (255, 255, 0))
+
+        assert first is not second
+        assert FontRegistry.render_text("Target: 0°", 14, (0, 255, 0)) is first
+        assert FontRegistry.get_font(None, 14) is FontRegistry.get_font(None, 14)
+
+    def test_font_cache_survives_quit_init_cycle(self):
+        """Test that fonts from before pygame.quit() are not reused."""
+        pygame.init()
+        FontRegistry.render_text("Moves: 1", 14, (255, 255, 255))
+        old_font = FontRegistry.get_font(None, 14)
+        pygame.quit()
+
+        pygame.init()
+        surface = FontRegistry.render_text("Moves: 2", 14, (255, 255, 255))
+        assert surface.get_width() > 0
+        assert FontRegistry.get_font(None, 14) is not old_font
+
+        pygame.font.quit()
+        assert FontRegistry.render_text("Moves: 3", 14, (255, 255, 255)).get_width() > 0
+        pygame.quit()
+
     def test_draw_rect_filled(self, initialized_renderer):
         """Test drawing filled rectangle."""
         # Should not raise exception
@@ -0,0 +1,70 @@
+"""
+Unit tests for the soak autoplay tool
+
+Tests that generated levels are auto-played without issues and that the
+connectivity checker agrees with the win rule on the game board.
+
+Author: Circuit Repair Game Team
+Date: 2026-01-23
+"""
+
+import logging
+import unittest
+
+from src.core.circuit.connectivity_checker import ConnectivityChecker
+from src.core.level.difficulty_config import DifficultyLevel
+from src.core.level.level_generator_v3 import LevelGeneratorV3
+from src.core.level.level_loader import LevelLoader
+from src.core.level.level_manager import LevelManager
+from tools.soak_autoplay import play_chunk, play_level
+
+
+class TestPlayLevel(unittest.TestCase):
+    """Test auto-playing single levels."""
+
+    def setUp(self):
+        self.manager = LevelManager(LevelLoader())
+        self.checker = ConnectivityChecker()
+
+    def test_generated_levels_have_no_issues(self):
+        """Test that generated levels are solved in the optimal move count."""
+        for seed in range(5):
+            generated = LevelGeneratorV3(difficulty=DifficultyLevel.NORMAL, seed=seed).generate()
+
+            issues = play_level(self.manager, self.checker, generated, DifficultyLevel.NORMAL)
+
+            self.assertEqual(issues, [], f"seed {seed}")
+            self.assertEqual(self.manager.get_move_count(), self.manager.get_optimal_moves())
+
+    def test_checker_agrees_with_win_condition(self):
+        """Test that the game board is connected exactly when the level is won."""
+        generated = LevelGeneratorV3(difficulty=DifficultyLevel.EASY, seed=3).generate()
+        self.manager.load_generated_data(generated, DifficultyLevel.EASY)
+        grid = self.manager.get_grid()
+
+        self.assertFalse(self.checker.check_connectivity(grid))
+        while not self.manager.check_win_condition():
+            hint = self.manager.get_hint()
+            self.manager.rotate_tile(hint.x, hint.y)
+        self.assertTrue(self.checker.check_connectivity(grid))
+
+
+class TestPlayChunk(unittest.TestCase):
+    """Test playing a batch of levels in a worker."""
+
+    def tearDown(self):
+        # play_chunk silences logging for the worker process
+        logging.disable(logging.NOTSET)
+
+    def test_chunk_report(self):
+        """Test the levels, moves and issue counts of a chunk."""
+        result = play_chunk((DifficultyLevel.HARD.value, None, 10, 3))
+
+        self.assertEqual(result['levels'], 3)
+        self.assertGreater(result['moves'], 0)
+        self.assertEqual(result['issues'], [])
+        self.assertEqual(dict(result['counts']), {})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -8,11 +8,13 @@ Date: 2026-01-20
 """
 
 import os
+import json
 import pytest
 import pygame
 from unittest.mock import Mock, patch, MagicMock
 
 from src.rendering.sprite_manager import SpriteManager
+from src.rendering.sprite_atlas import SpriteAtlas
 
 
 @pytest.fixture
@@ -190,6 +192,132 @@ class TestRotateSprite:
         assert rotated is not None
         assert rotated.get_size() == mock_sprite.get_size()
 
+    def test_right_angles_rotated_once(self, sprite_manager, mock_sprite):
+        """Test that right-angle variants are produced once and reused."""
+        first = [sprite_manager.get_rotated_sprite(mock_sprite, a) for a in (0, 90, 180, 270)]
+
+        with patch('pygame.transform.rotate') as mock_rotate:
+            second = [sprite_manager.get_rotated_sprite(mock_sprite, a) for a in (0, 90, 180, 270, 360)]
+            mock_rotate.assert_not_called()
+
+        assert all(a is b for a, b in zip(first, second))
+        assert second[4] is first[0]
+        assert sprite_manager.get_rotation_cache_size() == 3
+
+    def test_right_angle_cache_bounded(self, sprite_manager, mock_sprite):
+        """Test that temporary surfaces do not grow the right-angle cache."""
+        with patch('src.rendering.sprite_manager.SPRITE_ANGLE_CACHE_SIZE', 2):
+            rotated = sprite_manager.get_rotated_sprite(mock_sprite, 90)
+            for _ in range(5):
+                sprite_manager.get_rotated_sprite(mock_sprite, 180)
+                sprite_manager.get_rotated_sprite(pygame.Surface((8, 8)), 90)
+
+            assert sprite_manager.get_rotation_cache_size() == 3 * 2
+            assert sprite_manager.get_rotated_sprite(mock_sprite, 90) is rotated
+
+    def test_arbitrary_angles_quantized(self, sprite_manager, mock_sprite):
+        """Test that arbitrary angles share a cache entry per bucket."""
+        rotated = sprite_manager.get_rotated_sprite(mock_sprite, 45)
+
+        assert sprite_manager.get_rotated_sprite(mock_sprite, 45.4) is rotated
+        assert sprite_manager.get_rotated_sprite(mock_sprite, 60) is not rotated
+
+
+class TestTileSprites:
+    """Test pre-rotated tile sprite lookup."""
+
+    @patch('pygame.image.load')
+    @patch('os.path.exists')
+    def test_tile_sprite_steady_state(self, mock_exists, mock_load, sprite_manager, mock_sprite):
+        """Test that repeated lookups do no load or transform work."""
+        mock_exists.return_value = True
+        mock_sprite_with_alpha = Mock()
+        mock_sprite_with_alpha.convert_alpha.return_value = mock_sprite
+        mock_load.return_value = mock_sprite_with_alpha
+
+        first = sprite_manager.get_tile_sprite("assets/tile.png", (64, 64), 90)
+        with patch('pygame.transform.rotate') as mock_rotate, \
+                patch('pygame.transform.scale') as mock_scale:
+            again = sprite_manager.get_tile_sprite("assets/tile.png", (64, 64), 90)
+            mock_rotate.assert_not_called()
+            mock_scale.assert_not_called()
+
+        assert again is first
+        assert first.get_size() == (64, 64)
+        assert mock_load.call_count == 1
+
+    @patch('pygame.image.load')
+    @patch('os.path.exists')
+    def test_tile_size_change_evicts(self, mock_exists, mock_load, sprite_manager, mock_sprite):
+        """Test that a new tile size evicts sprites cached at the old size."""
+        mock_exists.return_value = True
+        mock_sprite_with_alpha = Mock()
+        mock_sprite_with_alpha.convert_alpha.return_value = mock_sprite
+        mock_load.return_value = mock_sprite_with_alpha
+
+        sprite_manager.get_tile_sprite("assets/tile.png", (64, 64), 0)
+        sprite_manager.get_tile_sprite("assets/tile.png", (48, 48), 0)
+
+        assert sprite_manager.get_cache_size() == 1
+        assert sprite_manager.get_rotation_cache_size() == 3
+
+
+@pytest.fixture
+def atlas_root(tmp_path):
+    """Write a two-frame atlas (red, blue) under a temporary project root."""
+    atlas = pygame.Surface((66, 32), pygame.SRCALPHA)
+    atlas.fill((255, 0, 0, 255), (0, 0, 32, 32))
+    atlas.fill((0, 0, 255, 255), (34, 0, 32, 32))
+    sprite_dir = tmp_path / "assets" / "sprites"
+    sprite_dir.mkdir(parents=True)
+    pygame.image.save(atlas, str(sprite_dir / "atlas.png"))
+    with open(sprite_dir / "atlas.json", "w", encoding="utf-8") as f:
+        json.dump({
+            "version": 1,
+            "image": "atlas.png",
+            "size": [66, 32],
+            "frames": {
+                "assets/sprites/tiles/red.png": [0, 0, 32, 32],
+                "assets/sprites/tiles/blue.png": [34, 0, 32, 32],
+            },
+        }, f)
+
+    with patch('src.rendering.sprite_atlas.get_project_root', return_value=tmp_path):
+        yield tmp_path
+    SpriteAtlas.unload()
+
+
+class TestAtlasMode:
+    """Test serving sprites from a texture atlas."""
+
+    def test_load_sprite_from_atlas(self, sprite_manager, atlas_root):
+        """Test that packed sprites are atlas subsurfaces, with no file load."""
+        assert sprite_manager.load_atlas() == 2
+        assert sprite_manager.is_atlas_mode()
+
+        with patch('pygame.image.load') as mock_load:
+            blue = sprite_manager.load_sprite("assets/sprites/tiles/blue.png")
+            scaled = sprite_manager.load_sprite("assets/sprites/tiles/red.png", size=(64, 64))
+            mock_load.assert_not_called()
+
+        assert blue.get_parent() is not None
+        assert blue.get_size() == (32, 32)
+        assert blue.get_at((0, 0)) == (0, 0, 255, 255)
+        assert scaled.get_size() == (64, 64)
+        assert sprite_manager.load_sprite("assets/sprites/tiles/blue.png") is blue
+
+    def test_unpacked_sprite_falls_back_to_file(self, sprite_manager, atlas_root):
+        """Test that sprites missing from the atlas are loaded from disk."""
+        sprite_manager.load_atlas()
+
+        with patch('os.path.exists', return_value=False):
+            assert sprite_manager.load_sprite("assets/sprites/tiles/green.png") is None
+
+    def test_missing_atlas(self, sprite_manager, atlas_root):
+        """Test that a missing atlas leaves atlas mode off."""
+        assert sprite_manager.load_atlas("assets/sprites/missing.json") == 0
+        assert not sprite_manager.is_atlas_mode()
+
 
 class TestPlaceholderSprite:
     """Test placeholder sprite creation."""
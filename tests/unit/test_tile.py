@@ -6,7 +6,9 @@
 
 import unittest
 from src.core.grid.tile_type import TileType
-from src.core.grid.tile import Tile
+from src.core.grid.tile import (
+    Tile, DIRECTION_BITS, CONNECTION_MASKS, CONNECTION_MASKS_BY_CODE
+)
 from src.config.constants import Direction
 
 
@@ -220,6 +222,34 @@ class TestTileExitDirections(unittest.TestCase):
         self.assertIn(Direction.EAST, exits)
 
 
+class TestTileConnectionMask(unittest.TestCase):
+    """测试瓦片连接掩码"""
+
+    def test_mask_matches_exit_directions(self):
+        """测试掩码与出口方向一致"""
+        for tile_type in TileType:
+            for rotation in (0, 90, 180, 270):
+                tile = Tile(0, 0, tile_type, rotation)
+                expected = 0
+                for direction in tile.get_exit_directions():
+                    expected |= DIRECTION_BITS[direction]
+                self.assertEqual(tile.get_connection_mask(), expected)
+
+    def test_mask_values(self):
+        """测试典型掩码值"""
+        self.assertEqual(Tile(0, 0, TileType.EMPTY, 0).get_connection_mask(), 0)
+        self.assertEqual(Tile(0, 0, TileType.STRAIGHT, 0).get_connection_mask(),
+                         DIRECTION_BITS[Direction.EAST] | DIRECTION_BITS[Direction.WEST])
+        self.assertEqual(Tile(0, 0, TileType.STRAIGHT, 90).get_connection_mask(),
+                         DIRECTION_BITS[Direction.NORTH] | DIRECTION_BITS[Direction.SOUTH])
+
+    def test_mask_table_by_code(self):
+        """测试按类型编码索引的掩码表"""
+        for (tile_type, rotation), mask in CONNECTION_MASKS.items():
+            self.assertEqual(CONNECTION_MASKS_BY_CODE[tile_type.to_code() * 4 + rotation // 90], mask)
+        self.assertEqual(CONNECTION_MASKS_BY_CODE[0], 0)
+
+
 class TestTileEntrances(unittest.TestCase):
     """测试瓦片入口"""
 
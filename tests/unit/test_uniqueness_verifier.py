@@ -0,0 +1,122 @@
+"""
+Unit tests for UniquenessVerifier
+
+Tests route enumeration, propagation pruning and distractor placement.
+
+Author: Circuit Repair Game Team
+Date: 2026-01-23
+"""
+
+import time
+import unittest
+
+from src.core.level.uniqueness_verifier import UniquenessVerifier
+from src.core.level.level_generator_v3 import LevelGeneratorV3
+from src.core.level.difficulty_config import DifficultyLevel
+
+
+def _tile(x, y, tile_type, rotation=0):
+    return {'x': x, 'y': y, 'type': tile_type, 'rotation': rotation}
+
+
+class TestUniquenessVerifier(unittest.TestCase):
+    """Test UniquenessVerifier"""
+
+    def setUp(self):
+        # 电源(1,0)向下，经过右侧的转角环绕到终端(1,3)
+        self.path = [(1, 0), (1, 1), (2, 1), (2, 2), (1, 2), (1, 3)]
+        self.tiles = [
+            _tile(1, 0, 'power_source', 90),
+            _tile(1, 1, 'corner'),
+            _tile(2, 1, 'corner'),
+            _tile(2, 2, 'corner'),
+            _tile(1, 2, 'corner'),
+            _tile(1, 3, 'terminal', 90),
+        ]
+
+    def test_single_route(self):
+        """测试只有一条路线时验证通过"""
+        verifier = UniquenessVerifier(4, self.tiles)
+        self.assertEqual(verifier.find_routes(), [self.path])
+        self.assertTrue(verifier.is_unique())
+        self.assertTrue(verifier.verify(self.path))
+
+    def test_alternative_route(self):
+        """测试干扰瓦片形成第二条路线"""
+        tiles = self.tiles + [_tile(0, 1, 'corner'), _tile(0, 2, 'corner')]
+        verifier = UniquenessVerifier(4, tiles)
+        self.assertEqual(verifier.count_routes(), 2)
+        self.assertFalse(verifier.is_unique())
+        self.assertFalse(verifier.verify(self.path))
+
+    def test_propagation_prunes_dead_tiles(self):
+        """测试约束传播移除无法连接的方向"""
+        tiles = self.tiles + [_tile(3, 3, 'straight'), _tile(0, 0, 'corner')]
+        verifier = UniquenessVerifier(4, tiles)
+        # 角落的直线瓦片无论如何旋转都会伸出棋盘
+        self.assertEqual(verifier._domains[3 * 4 + 3], set())
+        # 左上角的转角只能朝右和朝下，但右侧的电源不朝向它
+        self.assertEqual(verifier._domains[0], set())
+        # 路径上的转角保留可连接的方向
+        self.assertIn(2 | 4, verifier._domains[2 * 4 + 1])
+        self.assertTrue(verifier.verify(self.path))
+
+    def test_no_route(self):
+        """测试电源无法到达终端"""
+        tiles = [_tile(0, 0, 'power_source', 0), _tile(1, 0, 'corner'), _tile(3, 3, 'terminal', 0)]
+        verifier = UniquenessVerifier(4, tiles)
+        self.assertEqual(verifier.count_routes(), 0)
+        self.assertFalse(verifier.is_unique())
+
+    def test_missing_endpoint(self):
+        """测试缺少终端时抛出异常"""
+        with self.assertRaises(ValueError):
+            UniquenessVerifier(4, self.tiles[:-1])
+
+    def test_generated_level_is_unique(self):
+        """测试生成器的关卡只有一条路线"""
+        level = LevelGeneratorV3(DifficultyLevel.NORMAL, seed=7).generate()
+        verifier = UniquenessVerifier(level['grid_size'], level['solution'])
+        self.assertTrue(verifier.verify(level['path']))
+
+
+class TestDistractorGeneration(unittest.TestCase):
+    """Test LevelGeneratorV3 distractor placement"""
+
+    def test_default_has_no_distractors(self):
+        """测试默认不放置干扰瓦片"""
+        level = LevelGeneratorV3(DifficultyLevel.NORMAL, seed=11).generate()
+        clickable = [t for t in level['solution'] if t['is_clickable']]
+        self.assertEqual(len(clickable), level['movable_count'])
+
+    def test_distractors_keep_solution_unique(self):
+        """测试12x12棋盘上的干扰瓦片不产生第二条路线"""
+        start = time.perf_counter()
+        level = LevelGeneratorV3(
+            DifficultyLevel.HARD, grid_size=12, seed=5, distractor_ratio=0.5
+        ).generate()
+        elapsed = time.perf_counter() - start
+
+        path = set(level['path'])
+        distractors = [
+            t for t in level['solution']
+            if t['is_clickable'] and (t['x'], t['y']) not in path
+        ]
+        self.assertGreater(len(distractors), 0)
+        self.assertEqual(len(level['solution']), 12 * 12)
+        self.assertEqual(len(level['initial_state']), 12 * 12 - 2)
+
+        verifier = UniquenessVerifier(level['grid_size'], level['solution'])
+        self.assertTrue(verifier.verify(level['path']))
+        self.assertLess(elapsed, 2.0)
+
+    def test_distractors_are_reproducible(self):
+        """测试相同种子生成相同的干扰瓦片"""
+        first = LevelGeneratorV3(DifficultyLevel.EASY, seed=3, distractor_ratio=0.3).generate()
+        second = LevelGeneratorV3(DifficultyLevel.EASY, seed=3, distractor_ratio=0.3).generate()
+        self.assertEqual(first['solution'], second['solution'])
+        self.assertEqual(first['initial_state'], second['initial_state'])
+
+
+if __name__ == '__main__':
+    unittest.main()
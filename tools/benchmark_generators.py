@@ -0,0 +1,408 @@
+"""
+关卡生成器基准测试工具
+
+对LevelGenerator、LevelGeneratorV2、LevelGeneratorV3按难度和网格大小逐项测量：
+    - 吞吐量（关卡/秒）
+    - 每个关卡的生成尝试次数（被拒绝的尝试 + 1）
+    - 单个关卡的生成延迟 p50/p99
+    - 路径长度、拐角数、打乱比例的直方图，以及满足DifficultyConfig预算的比例
+
+每个组合在独立的子进程中运行并受 --case-timeout 限制：LevelGenerator和
+LevelGeneratorV2的DFS在大网格上可能长时间不返回，超时的组合记为timed_out。
+
+结果以JSON输出，可保存为基线并在之后的运行中用 --baseline 对比，
+吞吐量下降或p99延迟上升超过阈值时以非零状态退出。
+
+Usage:
+    python tools/benchmark_generators.py --levels 200 --output bench.json
+    python tools/benchmark_generators.py --generator v3 --baseline bench.json
+
+Author: Circuit Repair Game Team
+Date: 2026-01-23
+"""
+
+import argparse
+import json
+import logging
+import math
+import multiprocessing
+import platform
+import sys
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+# 添加项目根目录到路径
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.level.difficulty_config import DifficultyLevel, DifficultyConfig
+from src.core.level.level_generator import LevelGenerator
+from src.core.level.level_generator_v2 import LevelGeneratorV2
+from src.core.level.level_generator_v3 import LevelGeneratorV3
+
+REPORT_SCHEMA_VERSION = 1
+SCRAMBLE_BUCKETS = 10  # 打乱比例直方图的分桶数
+
+# 生成器名称 -> 工厂函数(difficulty, grid_size, seed)
+# LevelGenerator没有难度参数：使用该难度的最少可移动瓦片数作为最短路径
+GENERATORS: Dict[str, Callable[[DifficultyLevel, int, int], Any]] = {
+    'v1': lambda difficulty, grid_size, seed: LevelGenerator(
+        grid_size=grid_size,
+        min_path_length=DifficultyConfig.get_config(difficulty).min_movable_tiles,
+        seed=seed
+    ),
+    'v2': lambda difficulty, grid_size, seed: LevelGeneratorV2(
+        difficulty=difficulty, grid_size=grid_size, seed=seed
+    ),
+    'v3': lambda difficulty, grid_size, seed: LevelGeneratorV3(
+        difficulty=difficulty, grid_size=grid_size, seed=seed
+    ),
+}
+
+
+def percentile(values: List[float], fraction: float) -> float:
+    """
+    计算百分位数（最近秩法）
+
+    Args:
+        values: 已排序的数值列表
+        fraction: 百分位（0-1）
+
+    Returns:
+        float: 百分位数，列表为空时返回0.0
+    """
+    if not values:
+        return 0.0
+    rank = max(1, math.ceil(fraction * len(values)))
+    return values[rank - 1]
+
+
+def level_shape(level: Dict) -> Dict[str, Any]:
+    """
+    计算关卡的形状指标
+
+    Args:
+        level: 生成器返回的关卡字典
+
+    Returns:
+        Dict: path_length, movable, corners, scramble_ratio
+    """
+    solution = [t for t in level['solution'] if t.get('is_clickable', False)]
+    initial = {(t['x'], t['y']): t['rotation'] for t in level['initial_state']}
+
+    scrambled = 0
+    for tile in solution:
+        accepted = tile.get('accepted_rotations', [tile['rotation']])
+        if initial.get((tile['x'], tile['y']), tile['rotation']) not in accepted:
+            scrambled += 1
+
+    return {
+        'path_length': len(level['path']),
+        'movable': len(solution),
+        'corners': sum(1 for t in level['solution'] if t.get('type') == 'corner'),
+        'scramble_ratio': scrambled / len(solution) if solution else 0.0,
+    }
+
+
+def in_budget(shape: Dict[str, Any], config: DifficultyConfig) -> bool:
+    """
+    检查关卡是否满足难度预算
+
+    Args:
+        shape: level_shape()的结果
+        config: 难度配置
+
+    Returns:
+        bool: 可移动瓦片数、拐角数和打乱比例都满足要求
+    """
+    return (
+        config.validate_path(shape['movable'], shape['corners'])
+        and shape['scramble_ratio'] + 1e-9 >= config.scramble_ratio
+    )
+
+
+def benchmark_case(
+    name: str,
+    difficulty: DifficultyLevel,
+    grid_size: int,
+    levels: int,
+    base_seed: int
+) -> Dict[str, Any]:
+    """
+    测量一个(生成器, 难度, 网格大小)组合
+
+    Args:
+        name: 生成器名称（GENERATORS的键）
+        difficulty: 难度
+        grid_size: 网格大小
+        levels: 生成的关卡数
+        base_seed: 基础种子（第i个关卡使用base_seed + i）
+
+    Returns:
+        Dict: 该组合的测量结果
+    """
+    config = DifficultyConfig.get_config(difficulty)
+    factory = GENERATORS[name]
+    latencies = []
+    attempts = []
+    shapes = []
+    failures = 0
+
+    start = time.perf_counter()
+    for index in range(levels):
+        level_start = time.perf_counter()
+        generator = factory(difficulty, grid_size, base_seed + index)
+        try:
+            level = generator.generate()
+        except (RuntimeError, RecursionError):
+            failures += 1
+            level = None
+        latencies.append((time.perf_counter() - level_start) * 1000.0)
+        attempts.append(generator.generation_attempts)
+        if level is not None:
+            shapes.append(level_shape(level))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    generated = len(shapes)
+    return {
+        'generator': name,
+        'difficulty': difficulty.value,
+        'grid_size': grid_size,
+        'levels': generated,
+        'failures': failures,
+        'levels_per_sec': generated / elapsed if elapsed > 0 else 0.0,
+        'attempts': {
+            'mean': sum(attempts) / len(attempts) if attempts else 0.0,
+            'max': max(attempts, default=0),
+            'histogram': _histogram(attempts),
+        },
+        'latency_ms': {
+            'p50': percentile(latencies, 0.50),
+            'p99': percentile(latencies, 0.99),
+            'max': latencies[-1] if latencies else 0.0,
+        },
+        'histograms': {
+            'path_length': _histogram(s['path_length'] for s in shapes),
+            'corner_count': _histogram(s['corners'] for s in shapes),
+            'scramble_ratio': _histogram(
+                min(int(s['scramble_ratio'] * SCRAMBLE_BUCKETS), SCRAMBLE_BUCKETS - 1) / SCRAMBLE_BUCKETS
+                for s in shapes
+            ),
+        },
+        'budget': {
+            'movable': [config.min_movable_tiles, config.max_movable_tiles],
+            'corners': [config.min_corners, config.max_corners],
+            'scramble_ratio': config.scramble_ratio,
+        },
+        'in_budget_ratio': (
+            sum(1 for s in shapes if in_budget(s, config)) / generated if generated else 0.0
+        ),
+    }
+
+
+def _histogram(values) -> Dict[str, int]:
+    """统计直方图（JSON对象的键必须是字符串）"""
+    counts = Counter(values)
+    return {str(key): counts[key] for key in sorted(counts)}
+
+
+def compare_to_baseline(
+    report: Dict[str, Any],
+    baseline: Dict[str, Any],
+    tolerance: float
+) -> List[str]:
+    """
+    与基线报告对比
+
+    Args:
+        report: 本次报告
+        baseline: 基线报告
+        tolerance: 允许的相对退化（如0.2表示20%）
+
+    Returns:
+        List[str]: 退化项描述，为空表示没有退化
+    """
+    regressions = []
+    for key, result in report['results'].items():
+        base = baseline.get('results', {}).get(key)
+        if base is None:
+            continue
+        if result.get('timed_out'):
+            if not base.get('timed_out'):
+                regressions.append(f"{key}: timed out (baseline finished)")
+            continue
+        if base.get('timed_out'):
+            continue
+
+        if result['levels_per_sec'] < base['levels_per_sec'] * (1.0 - tolerance):
+            regressions.append(
+                f"{key}: levels/sec {base['levels_per_sec']:.1f} -> {result['levels_per_sec']:.1f}"
+            )
+        if result['latency_ms']['p99'] > base['latency_ms']['p99'] * (1.0 + tolerance):
+            regressions.append(
+                f"{key}: p99 {base['latency_ms']['p99']:.2f}ms -> {result['latency_ms']['p99']:.2f}ms"
+            )
+        if result['in_budget_ratio'] < base['in_budget_ratio'] - tolerance:
+            regressions.append(
+                f"{key}: in-budget {base['in_budget_ratio']:.0%} -> {result['in_budget_ratio']:.0%}"
+            )
+    return regressions
+
+
+def _run_case_in_worker(job) -> Dict[str, Any]:
+    """在子进程中运行benchmark_case（子进程中同样关闭日志）"""
+    logging.disable(logging.ERROR)
+    name, difficulty_value, grid_size, levels, base_seed = job
+    return benchmark_case(name, DifficultyLevel(difficulty_value), grid_size, levels, base_seed)
+
+
+def run_case_with_timeout(
+    name: str,
+    difficulty: DifficultyLevel,
+    grid_size: int,
+    levels: int,
+    base_seed: int,
+    timeout: float
+) -> Dict[str, Any]:
+    """
+    在子进程中运行一个组合，超时则终止子进程
+
+    Args:
+        name: 生成器名称
+        difficulty: 难度
+        grid_size: 网格大小
+        levels: 生成的关卡数
+        base_seed: 基础种子
+        timeout: 超时时间（秒）
+
+    Returns:
+        Dict: 测量结果；超时时只包含组合信息和timed_out
+    """
+    pool = multiprocessing.Pool(processes=1)
+    try:
+        job = (name, difficulty.value, grid_size, levels, base_seed)
+        return pool.apply_async(_run_case_in_worker, (job,)).get(timeout)
+    except multiprocessing.TimeoutError:
+        return {
+            'generator': name,
+            'difficulty': difficulty.value,
+            'grid_size': grid_size,
+            'timed_out': True,
+            'timeout_sec': timeout,
+        }
+    finally:
+        pool.terminate()
+        pool.join()
+
+
+def run_benchmarks(
+    generators: List[str],
+    difficulties: List[DifficultyLevel],
+    levels: int,
+    base_seed: int,
+    grid_sizes: Optional[List[int]] = None,
+    case_timeout: float = 60.0
+) -> Dict[str, Any]:
+    """
+    运行所有组合并生成报告
+
+    Args:
+        generators: 生成器名称列表
+        difficulties: 难度列表
+        levels: 每个组合生成的关卡数
+        base_seed: 基础种子
+        grid_sizes: 网格大小列表（默认使用每个难度的grid_size_range）
+        case_timeout: 每个组合的超时时间（秒）
+
+    Returns:
+        Dict: 可序列化为JSON的报告
+    """
+    results = {}
+    for name in generators:
+        for difficulty in difficulties:
+            min_size, max_size = DifficultyConfig.get_config(difficulty).grid_size_range
+            for grid_size in grid_sizes or range(min_size, max_size + 1):
+                result = run_case_with_timeout(
+                    name, difficulty, grid_size, levels, base_seed, case_timeout
+                )
+                results[f"{name}/{difficulty.value}/{grid_size}"] = result
+
+    return {
+        'schema': REPORT_SCHEMA_VERSION,
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'levels_per_case': levels,
+        'seed': base_seed,
+        'case_timeout_sec': case_timeout,
+        'generator_version': LevelGeneratorV3.GENERATOR_VERSION,
+        'results': results,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """主函数"""
+    parser = argparse.ArgumentParser(description="Benchmark the level generators")
+    parser.add_argument("--generator", action="append", choices=sorted(GENERATORS),
+                        help="generator to run (repeatable, default: all)")
+    parser.add_argument("--difficulty", action="append", choices=[d.value for d in DifficultyLevel],
+                        help="difficulty to run (repeatable, default: all)")
+    parser.add_argument("--grid-size", type=int, action="append",
+                        help="grid size (repeatable, default: each difficulty's range)")
+    parser.add_argument("--levels", type=int, default=100,
+                        help="levels per case (default: 100)")
+    parser.add_argument("--seed", type=int, default=0, help="base seed (default: 0)")
+    parser.add_argument("--case-timeout", type=float, default=60.0,
+                        help="seconds allowed per case (default: 60)")
+    parser.add_argument("--output", help="write the JSON report to this file")
+    parser.add_argument("--baseline", help="baseline JSON report to compare against")
+    parser.add_argument("--tolerance", type=float, default=0.2,
+                        help="allowed relative regression (default: 0.2)")
+    args = parser.parse_args(argv)
+
+    # 生成器每个关卡都会输出日志，测量时关闭（失败次数已记录在报告中）
+    logging.disable(logging.ERROR)
+
+    report = run_benchmarks(
+        generators=args.generator or sorted(GENERATORS),
+        difficulties=[DifficultyLevel(v) for v in (args.difficulty or [d.value for d in DifficultyLevel])],
+        levels=args.levels,
+        base_seed=args.seed,
+        grid_sizes=args.grid_size,
+        case_timeout=args.case_timeout
+    )
+
+    print(f"{'case':<18} {'levels/s':>9} {'attempts':>9} {'p50 ms':>8} {'p99 ms':>8} {'in budget':>10}")
+    for key, result in report['results'].items():
+        if result.get('timed_out'):
+            print(f"{key:<18} {'timed out after ' + str(result['timeout_sec']) + 's':>47}")
+            continue
+        print(
+            f"{key:<18} {result['levels_per_sec']:>9.1f} {result['attempts']['mean']:>9.2f} "
+            f"{result['latency_ms']['p50']:>8.2f} {result['latency_ms']['p99']:>8.2f} "
+            f"{result['in_budget_ratio']:>10.0%}"
+        )
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"报告已写入: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+        regressions = compare_to_baseline(report, baseline, args.tolerance)
+        if regressions:
+            print("✗ 相对基线的退化:")
+            for line in regressions:
+                print(f"  - {line}")
+            return 1
+        print("✓ 没有相对基线的退化")
+
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,218 @@
+"""
+精灵图集打包工具
+
+将 assets/sprites 下的小尺寸 PNG（瓦片、按钮、图标、粒子等）打包为一张图集，
+并写出同名 JSON 帧表。运行时 SpriteAtlas 只需解码/转换一张图片，
+各精灵以子表面（subsurface）形式提供，帧表键为相对项目根目录的精灵路径，
+与 SpriteManager.load_sprite 使用的路径一致。
+
+打包算法为按高度降序的货架（shelf）排列：依次尝试 256~4096 的 2 的幂宽度，
+选取总面积最小的结果。精灵之间保留透明间隔，避免缩放时相邻精灵串色。
+
+全屏背景图默认不打包（体积大且每个场景只用一张），可通过 --exclude 调整。
+
+Usage:
+    python tools/build_sprite_atlas.py
+    python tools/build_sprite_atlas.py --exclude "ui/backgrounds/*" --exclude "ui/logo/*"
+    python tools/build_sprite_atlas.py --output assets/sprites/atlas.png --padding 2
+
+Author: Circuit Repair Game Team
+Date: 2026-01-23
+"""
+
+import argparse
+import fnmatch
+import json
+import os
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+import pygame
+
+# 添加项目根目录到路径
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.config.constants import SPRITE_ATLAS_MAP_PATH
+from src.rendering.sprite_atlas import ATLAS_FORMAT_VERSION
+
+# 默认不打包的精灵（相对 --source 目录）
+DEFAULT_EXCLUDES = ["ui/backgrounds/*"]
+# 图集宽度候选（2 的幂）
+ATLAS_WIDTHS = [256, 512, 1024, 2048, 4096]
+
+
+def collect_sprites(
+    source_dir: Path,
+    excludes: List[str],
+    max_sprite_size: int,
+    atlas_path: Path
+) -> Dict[str, pygame.Surface]:
+    """
+    收集需要打包的精灵
+
+    Args:
+        source_dir: 精灵根目录
+        excludes: 排除的通配模式（相对 source_dir）
+        max_sprite_size: 宽或高超过该值的精灵不打包
+        atlas_path: 图集输出路径（自身不参与打包）
+
+    Returns:
+        Dict[str, pygame.Surface]: 相对项目根目录的路径 -> 精灵表面
+    """
+    sprites = {}
+    for path in sorted(source_dir.rglob("*.png")):
+        if path.resolve() == atlas_path.resolve():
+            continue
+
+        relative = path.relative_to(source_dir).as_posix()
+        if any(fnmatch.fnmatch(relative, pattern) for pattern in excludes):
+            continue
+
+        surface = pygame.image.load(str(path))
+        width, height = surface.get_size()
+        if width > max_sprite_size or height > max_sprite_size:
+            print(f"  跳过 {relative}: {width}x{height} 超过 {max_sprite_size}px")
+            continue
+
+        key = path.resolve().relative_to(project_root.resolve()).as_posix()
+        sprites[key] = surface
+
+    return sprites
+
+
+def pack_shelves(
+    sizes: Dict[str, Tuple[int, int]],
+    atlas_width: int,
+    padding: int
+) -> Optional[Tuple[Dict[str, Tuple[int, int, int, int]], int]]:
+    """
+    按货架算法在固定宽度内排列精灵
+
+    Args:
+        sizes: 精灵路径 -> (宽, 高)
+        atlas_width: 图集宽度
+        padding: 精灵间隔（像素）
+
+    Returns:
+        (帧表 {路径: (x, y, w, h)}, 图集高度)；有精灵宽于图集时返回 None
+    """
+    # 高度降序、宽度降序，使同一货架上的精灵高度接近
+    order = sorted(sizes, key=lambda key: (-sizes[key][1], -sizes[key][0], key))
+
+    frames = {}
+    x = y = shelf_height = 0
+    for key in order:
+        width, height = sizes[key]
+        if width > atlas_width:
+            return None
+
+        if x + width > atlas_width:
+            # 换到新货架
+            y += shelf_height + padding
+            x = shelf_height = 0
+
+        frames[key] = (x, y, width, height)
+        x += width + padding
+        shelf_height = max(shelf_height, height)
+
+    return frames, y + shelf_height
+
+
+def build_atlas(
+    sprites: Dict[str, pygame.Surface],
+    padding: int
+) -> Tuple[pygame.Surface, Dict[str, Tuple[int, int, int, int]]]:
+    """
+    选择面积最小的宽度并绘制图集
+
+    Args:
+        sprites: 精灵路径 -> 精灵表面
+        padding: 精灵间隔（像素）
+
+    Returns:
+        (图集表面, 帧表)
+    """
+    sizes = {key: surface.get_size() for key, surface in sprites.items()}
+
+    best = None
+    for atlas_width in ATLAS_WIDTHS:
+        packed = pack_shelves(sizes, atlas_width, padding)
+        if packed is None:
+            continue
+        frames, atlas_height = packed
+        if best is None or atlas_width * atlas_height < best[0] * best[1]:
+            best = (atlas_width, atlas_height, frames)
+
+    if best is None:
+        raise ValueError(f"精灵宽度超过最大图集宽度 {ATLAS_WIDTHS[-1]}px")
+
+    atlas_width, atlas_height, frames = best
+    atlas = pygame.Surface((atlas_width, max(1, atlas_height)), pygame.SRCALPHA)
+    atlas.fill((0, 0, 0, 0))
+    for key, (x, y, _, _) in frames.items():
+        atlas.blit(sprites[key], (x, y))
+
+    return atlas, frames
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """主函数"""
+    parser = argparse.ArgumentParser(description="Pack sprites into a texture atlas")
+    parser.add_argument("--source", default="assets/sprites",
+                        help="sprite directory (default: assets/sprites)")
+    parser.add_argument("--output", default=os.path.splitext(SPRITE_ATLAS_MAP_PATH)[0] + ".png",
+                        help="atlas image; the frame map is written next to it as .json "
+                             "(default: assets/sprites/atlas.png)")
+    parser.add_argument("--exclude", action="append",
+                        help="glob relative to --source to leave out (repeatable, "
+                             f"default: {' '.join(DEFAULT_EXCLUDES)})")
+    parser.add_argument("--max-sprite-size", type=int, default=512,
+                        help="leave out sprites wider or taller than this (default: 512)")
+    parser.add_argument("--padding", type=int, default=2,
+                        help="transparent gap between sprites in pixels (default: 2)")
+    args = parser.parse_args(argv)
+
+    source_dir = project_root / args.source
+    atlas_path = project_root / args.output
+    map_path = atlas_path.with_suffix(".json")
+    excludes = args.exclude if args.exclude is not None else DEFAULT_EXCLUDES
+
+    print("=" * 60)
+    print("精灵图集打包工具")
+    print(f"  源目录: {args.source}")
+    print(f"  排除: {', '.join(excludes) or '无'}")
+    print("=" * 60)
+
+    sprites = collect_sprites(source_dir, excludes, args.max_sprite_size, atlas_path)
+    if not sprites:
+        print("没有可打包的精灵")
+        return 1
+
+    atlas, frames = build_atlas(sprites, args.padding)
+    atlas_width, atlas_height = atlas.get_size()
+    sprite_area = sum(w * h for _, _, w, h in frames.values())
+
+    atlas_path.parent.mkdir(parents=True, exist_ok=True)
+    pygame.image.save(atlas, str(atlas_path))
+
+    frame_map = {
+        "version": ATLAS_FORMAT_VERSION,
+        "image": atlas_path.name,
+        "size": [atlas_width, atlas_height],
+        "frames": {key: list(rect) for key, rect in sorted(frames.items())},
+    }
+    with open(map_path, 'w', encoding='utf-8') as f:
+        json.dump(frame_map, f, indent=2, ensure_ascii=False)
+
+    print(f"  精灵数: {len(frames)}")
+    print(f"  图集尺寸: {atlas_width}x{atlas_height} "
+          f"(利用率 {sprite_area / (atlas_width * atlas_height):.0%})")
+    print(f"  图集: {atlas_path.relative_to(project_root).as_posix()}")
+    print(f"  帧表: {map_path.relative_to(project_root).as_posix()}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,180 @@
+"""
+关卡包编译工具
+
+使用进程池批量运行LevelGeneratorV3，按棋盘的8种旋转/镜像对称去重，
+并将结果写入带索引的单个关卡包文件（默认二进制格式，可用LevelLoader.open_pack
+内存映射读取；--format json输出JSON格式）。
+
+每个关卡的种子由基础种子顺序派生，因此相同参数总是生成相同的关卡包，
+与进程数无关。
+
+Usage:
+    python tools/compile_level_pack.py --count 1000 --output data/packs/levels.pack
+    python tools/compile_level_pack.py --count 100 --format json --output data/packs/levels.pack.json
+    python tools/compile_level_pack.py --difficulty hard --difficulty hell --workers 8
+
+Author: Circuit Repair Game Team
+Date: 2026-01-23
+"""
+
+import argparse
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+# 添加项目根目录到路径
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.level.difficulty_config import DifficultyLevel
+from src.core.level.level_generator_v3 import LevelGeneratorV3
+from src.core.level.level_pack import build_level_pack, canonical_path, save_level_pack
+from src.core.level.level_pack_binary import write_binary_level_pack
+from src.core.level.level_seed import MAX_SEED
+
+# 每批提交的种子数 = 剩余数量 × 该系数（补偿被去重或生成失败的关卡）
+BATCH_OVERSHOOT = 1.25
+# 每个难度最多尝试的种子数 = 目标数量 × 该系数
+MAX_ATTEMPT_FACTOR = 20
+
+
+def generate_level(job: Tuple[str, Optional[int], int]) -> Optional[Dict]:
+    """
+    在工作进程中生成单个关卡
+
+    Args:
+        job: (难度值, 网格大小或None, 种子)
+
+    Returns:
+        Optional[Dict]: 生成结果，失败返回None
+    """
+    difficulty_value, grid_size, seed = job
+    try:
+        return LevelGeneratorV3(
+            difficulty=DifficultyLevel(difficulty_value),
+            grid_size=grid_size,
+            seed=seed
+        ).generate()
+    except RuntimeError:
+        return None
+
+
+def compile_difficulty(
+    executor: ProcessPoolExecutor,
+    difficulty: DifficultyLevel,
+    count: int,
+    base_seed: int,
+    workers: int,
+    grid_size: Optional[int] = None
+) -> Tuple[List[Dict], Dict[str, int]]:
+    """
+    为一个难度生成指定数量的互不对称等价的关卡
+
+    Args:
+        executor: 进程池
+        difficulty: 难度
+        count: 目标关卡数
+        base_seed: 基础种子
+        workers: 进程数（用于计算任务分块大小）
+        grid_size: 可选的固定网格大小
+
+    Returns:
+        Tuple[List[Dict], Dict[str, int]]: (关卡列表, 统计信息)
+    """
+    levels: List[Dict] = []
+    seen = set()
+    stats = {'attempted': 0, 'failed': 0, 'duplicates': 0}
+    next_offset = 0
+    max_attempts = count * MAX_ATTEMPT_FACTOR
+
+    while len(levels) < count and stats['attempted'] < max_attempts:
+        batch = max(1, int((count - len(levels)) * BATCH_OVERSHOOT))
+        batch = min(batch, max_attempts - stats['attempted'])
+        jobs = [
+            (difficulty.value, grid_size, (base_seed + next_offset + i) & MAX_SEED)
+            for i in range(batch)
+        ]
+        next_offset += batch
+        stats['attempted'] += batch
+
+        chunksize = max(1, batch // (4 * workers))
+        for generated in executor.map(generate_level, jobs, chunksize=chunksize):
+            if generated is None:
+                stats['failed'] += 1
+                continue
+            key = (generated['grid_size'], canonical_path(generated['path'], generated['grid_size']))
+            if key in seen:
+                stats['duplicates'] += 1
+                continue
+            seen.add(key)
+            if len(levels) < count:
+                levels.append(generated)
+
+    return levels, stats
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """主函数"""
+    parser = argparse.ArgumentParser(description="Compile a level pack with LevelGeneratorV3")
+    parser.add_argument("--count", type=int, default=1000,
+                        help="levels per difficulty (default: 1000)")
+    parser.add_argument("--difficulty", action="append", choices=[d.value for d in DifficultyLevel],
+                        help="difficulty to include (repeatable, default: all)")
+    parser.add_argument("--grid-size", type=int, default=None,
+                        help="fixed grid size (default: difficulty range)")
+    parser.add_argument("--seed", type=int, default=0,
+                        help="base seed (default: 0)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="worker processes (default: all cores)")
+    parser.add_argument("--format", choices=["binary", "json"], default="binary",
+                        help="pack format (default: binary)")
+    parser.add_argument("--output", default=None,
+                        help="output pack file (default: data/packs/levels.pack[.json])")
+    args = parser.parse_args(argv)
+    if args.output is None:
+        args.output = "data/packs/levels.pack" + (".json" if args.format == "json" else "")
+
+    difficulties = [DifficultyLevel(value) for value in (args.difficulty or [d.value for d in DifficultyLevel])]
+
+    print("=" * 60)
+    print("关卡包编译工具")
+    print(f"  难度: {', '.join(d.value for d in difficulties)}")
+    print(f"  每个难度: {args.count} 个关卡, 进程数: {args.workers}")
+    print("=" * 60)
+
+    start = time.perf_counter()
+    pack_levels = []
+    with ProcessPoolExecutor(max_workers=args.workers) as executor:
+        for number, difficulty in enumerate(difficulties):
+            # 各难度使用不重叠的种子区间
+            base_seed = args.seed + number * args.count * MAX_ATTEMPT_FACTOR
+            levels, stats = compile_difficulty(
+                executor, difficulty, args.count, base_seed, args.workers, args.grid_size
+            )
+            pack_levels.extend((difficulty, generated) for generated in levels)
+            print(
+                f"  {difficulty.value:>6}: {len(levels)} 个关卡 "
+                f"(尝试 {stats['attempted']}, 失败 {stats['failed']}, 对称重复 {stats['duplicates']})"
+            )
+            if len(levels) < args.count:
+                print(f"  ⚠ {difficulty.value}: 只找到 {len(levels)} 个不重复的关卡")
+
+    pack = build_level_pack(pack_levels)
+    if args.format == "json":
+        save_level_pack(args.output, pack)
+    else:
+        write_binary_level_pack(args.output, pack['levels'])
+    elapsed = time.perf_counter() - start
+
+    print("=" * 60)
+    print(f"✓ 已写入 {args.output}: {len(pack_levels)} 个关卡, 用时 {elapsed:.1f}s "
+          f"({len(pack_levels) / elapsed:.0f} 关/秒)")
+    print("=" * 60)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,241 @@
+"""
+无界面自动游玩浸泡测试工具
+
+使用进程池批量生成LevelGeneratorV3关卡，并通过LevelManager.rotate_tile /
+check_win_condition直接游玩（不依赖pygame）。每一步由提示引擎
+（LevelManager.get_hint）选择，因此每个关卡都以最少步数求解。
+
+对每个关卡检查：
+    - unsolvable: 某个需检查的瓦片无法转到可接受角度（accepted_rotations错误）
+    - stuck: 未获胜但提示引擎没有可走的步
+    - move_mismatch: 获胜所用步数与LevelData.optimal_moves不一致
+    - connectivity_mismatch: 初始或获胜状态下ConnectivityChecker的连通结果
+      与旋转匹配胜利规则不一致
+    - generation_failed: 生成器抛出RuntimeError
+
+关卡种子由基础种子顺序派生，报告中的种子可用LevelSeed复现单个关卡。
+
+Usage:
+    python tools/soak_autoplay.py --levels 20000 --workers 8
+    python tools/soak_autoplay.py --difficulty hell --levels 5000 --output soak.json
+
+Author: Circuit Repair Game Team
+Date: 2026-01-23
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+
+# 添加项目根目录到路径
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from src.core.circuit.connectivity_checker import ConnectivityChecker
+from src.core.level.difficulty_config import DifficultyLevel
+from src.core.level.level_generator_v3 import LevelGeneratorV3
+from src.core.level.level_loader import LevelLoader
+from src.core.level.level_manager import LevelManager
+from src.core.level.level_seed import LevelSeed
+
+# 每个任务游玩的关卡数（减少进程间通信开销）
+CHUNK_SIZE = 200
+# 报告中保留的问题关卡数上限
+MAX_REPORTED_ISSUES = 200
+
+
+def play_level(
+    manager: LevelManager,
+    checker: ConnectivityChecker,
+    generated: Dict[str, Any],
+    difficulty: DifficultyLevel
+) -> List[str]:
+    """
+    自动游玩单个关卡
+
+    Args:
+        manager: 关卡管理器（可复用）
+        checker: 连通性检查器（非增量模式）
+        generated: LevelGeneratorV3.generate()的结果
+        difficulty: 难度
+
+    Returns:
+        List[str]: 发现的问题类型，为空表示关卡正常
+    """
+    if not manager.load_generated_data(generated, difficulty):
+        return ['load_failed']
+
+    optimal = manager.get_optimal_moves()
+    if optimal is None:
+        return ['unsolvable']
+
+    issues = []
+    grid = manager.get_grid()
+    if checker.check_connectivity(grid) != (optimal == 0):
+        issues.append('connectivity_mismatch')
+
+    # 每次点击至多减少一步剩余步数，超过上限说明提示引擎出错
+    while not manager.check_win_condition():
+        hint = manager.get_hint()
+        if hint is None or manager.get_move_count() > optimal:
+            issues.append('stuck')
+            return issues
+        manager.rotate_tile(hint.x, hint.y)
+
+    if manager.get_move_count() != optimal:
+        issues.append('move_mismatch')
+    if not checker.check_connectivity(grid) and 'connectivity_mismatch' not in issues:
+        issues.append('connectivity_mismatch')
+    return issues
+
+
+def play_chunk(job: Tuple[str, Optional[int], int, int]) -> Dict[str, Any]:
+    """
+    在工作进程中游玩一批关卡
+
+    Args:
+        job: (难度值, 网格大小或None, 起始种子, 关卡数)
+
+    Returns:
+        Dict: levels, moves, issues（问题关卡列表）, counts（问题类型计数）
+    """
+    # 每个关卡都会输出加载和连通性日志，浸泡测试时关闭
+    logging.disable(logging.ERROR)
+
+    difficulty_value, grid_size, first_seed, count = job
+    difficulty = DifficultyLevel(difficulty_value)
+    manager = LevelManager(LevelLoader())
+    checker = ConnectivityChecker()
+
+    levels = 0
+    moves = 0
+    issues = []
+    counts: Counter = Counter()
+    for seed in range(first_seed, first_seed + count):
+        try:
+            generated = LevelGeneratorV3(difficulty=difficulty, grid_size=grid_size, seed=seed).generate()
+        except RuntimeError:
+            found = ['generation_failed']
+            size = grid_size
+        else:
+            found = play_level(manager, checker, generated, difficulty)
+            size = generated['grid_size']
+            levels += 1
+            moves += manager.get_move_count()
+
+        if found:
+            counts.update(found)
+            issues.append({
+                'difficulty': difficulty_value,
+                'grid_size': size,
+                'seed': seed,
+                'seed_code': LevelSeed(difficulty, size, seed).to_code() if size else None,
+                'issues': found,
+            })
+
+    return {'levels': levels, 'moves': moves, 'issues': issues, 'counts': dict(counts)}
+
+
+def run_soak(
+    difficulties: List[DifficultyLevel],
+    levels: int,
+    base_seed: int,
+    workers: int,
+    grid_size: Optional[int] = None
+) -> Dict[str, Any]:
+    """
+    运行浸泡测试
+
+    Args:
+        difficulties: 难度列表
+        levels: 每个难度游玩的关卡数
+        base_seed: 基础种子（第i个关卡使用base_seed + i）
+        workers: 工作进程数
+        grid_size: 固定网格大小（默认使用难度配置）
+
+    Returns:
+        Dict: 可序列化为JSON的报告
+    """
+    jobs = [
+        (difficulty.value, grid_size, base_seed + offset, min(CHUNK_SIZE, levels - offset))
+        for difficulty in difficulties
+        for offset in range(0, levels, CHUNK_SIZE)
+    ]
+
+    total_levels = 0
+    total_moves = 0
+    issues = []
+    counts: Counter = Counter()
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        for result in executor.map(play_chunk, jobs):
+            total_levels += result['levels']
+            total_moves += result['moves']
+            counts.update(result['counts'])
+            issues.extend(result['issues'])
+    elapsed = time.perf_counter() - start
+
+    levels_per_min = total_levels / elapsed * 60.0 if elapsed > 0 else 0.0
+    return {
+        'levels': total_levels,
+        'moves': total_moves,
+        'workers': workers,
+        'elapsed_sec': elapsed,
+        'levels_per_min': levels_per_min,
+        'levels_per_min_per_core': levels_per_min / workers,
+        'issue_counts': dict(counts),
+        'issue_levels': len(issues),
+        'issues': issues[:MAX_REPORTED_ISSUES],
+        'seed': base_seed,
+        'generator_version': LevelGeneratorV3.GENERATOR_VERSION,
+    }
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """主函数"""
+    parser = argparse.ArgumentParser(description="Auto-play generated levels to find generator bugs")
+    parser.add_argument("--difficulty", action="append", choices=[d.value for d in DifficultyLevel],
+                        help="difficulty to play (repeatable, default: all)")
+    parser.add_argument("--grid-size", type=int, help="fixed grid size (default: difficulty config)")
+    parser.add_argument("--levels", type=int, default=1000,
+                        help="levels per difficulty (default: 1000)")
+    parser.add_argument("--seed", type=int, default=0, help="base seed (default: 0)")
+    parser.add_argument("--workers", type=int, default=os.cpu_count() or 1,
+                        help="worker processes (default: CPU count)")
+    parser.add_argument("--output", help="write the JSON report to this file")
+    args = parser.parse_args(argv)
+
+    report = run_soak(
+        difficulties=[DifficultyLevel(v) for v in (args.difficulty or [d.value for d in DifficultyLevel])],
+        levels=args.levels,
+        base_seed=args.seed,
+        workers=max(1, args.workers),
+        grid_size=args.grid_size
+    )
+
+    print(f"关卡数: {report['levels']}  步数: {report['moves']}  用时: {report['elapsed_sec']:.1f}s")
+    print(f"吞吐量: {report['levels_per_min']:.0f} 关/分钟 "
+          f"({report['levels_per_min_per_core']:.0f} 关/分钟/核)")
+    for issue, count in sorted(report['issue_counts'].items()):
+        print(f"  {issue}: {count}")
+    for entry in report['issues'][:10]:
+        print(f"  - {entry['seed_code']} ({entry['difficulty']}, seed {entry['seed']}): "
+              f"{', '.join(entry['issues'])}")
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"报告已写入: {args.output}")
+
+    return 1 if report['issue_levels'] else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())